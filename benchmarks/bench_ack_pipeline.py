@@ -0,0 +1,174 @@
+"""
+ACK 대응 + 응답 대기 창(파이프라이닝) 벤치마크
+
+펌웨어 시뮬레이터(pty)에 SerialManager + CommandQueueManager를 연결하고 버튼 명령 묶음을 한 번에 넣어 측정합니다.
+- 구성: 기존(ACK 미추적, 50ms 간격 1개씩) / ACK 추적 창 1·4·8
+- 처리 시간: 첫 add_command → 마지막 명령 완료(콜백)까지
+- 지연: 명령별 add_command → 완료 콜백 p50/p95
+- 정확도: 큐가 성공으로 보고한 수 vs 실제 ACK 수신 수 (시뮬레이터 응답 손실/NAK 주입 시)
+  ACK를 추적하는 명령(DSCT FAN)만 셈 - PUMP, AIR 설정 명령은 응답 형식이 문서에 없어 추적하지 않고 쓰기 성공으로 완료
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_ack_pipeline.py [--commands 20] [--rounds 5] [--latency-ms 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.ack_matcher import RESPONSE_ROUTES, parse_response, response_key
+from managers.command_queue_manager import CommandQueueManager
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+# (이름, ACK 추적, 응답 대기 창)
+MODES = [
+    ("기존 (ACK 미추적)", False, 1),
+    ("ACK 추적, 창 1", True, 1),
+    ("ACK 추적, 창 4", True, 4),
+    ("ACK 추적, 창 8", True, 8),
+]
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def _button_commands(count):
+    """버튼 조작 명령 묶음 (DSCT 팬/펌프 속도, AIR 팬 속도)"""
+    commands = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            commands.append(f"$CMD,DSCT,FAN{i % 4 + 1},SPD,{i % 10 + 1}")
+        elif kind == 1:
+            commands.append(f"$CMD,DSCT,PUMP{i % 2 + 1},SPD,{i % 10 + 1}")
+        else:
+            commands.append(f"$CMD,AIR,FSPD,{i % 8 + 1}")
+    return commands
+
+
+def run(mode, config, command_count, rounds):
+    name, ack_tracking, window = mode
+    simulator = FirmwareSimulator(config)
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    queue.ack_tracking = ack_tracking
+    queue.inflight_window = window
+    queue.coalesce_commands = False  # 명령마다 왕복을 재므로 같은 장치 명령 병합 끔
+
+    # 추적 대상 명령의 실제 ACK 수신 수 (큐와 별도로 집계)
+    acks = [0]
+    commands = _button_commands(command_count)
+    tracked = {n for n, command in enumerate(commands) if response_key(command) is not None}
+    tracked_keys = {response_key(commands[n]) for n in tracked}
+
+    def count_ack(line):
+        parsed = parse_response(line)
+        if parsed and parsed[1] and parsed[0] in tracked_keys:
+            acks[0] += 1
+
+    for route in RESPONSE_ROUTES:
+        manager.line_router.subscribe(route, count_ack)
+
+    durations, latencies = [], []
+    reported_ok = reported_failed = 0
+    try:
+        manager.connect_serial(port)
+        _run_until(lambda: False, 0.2)
+
+        for _ in range(rounds):
+            done = {}
+            started = time.monotonic()
+            for n, command in enumerate(commands):
+                queue.add_command(command, callback=lambda ok, _, n=n: done.setdefault(n, (ok, time.monotonic())))
+            _run_until(lambda: len(done) >= command_count, 30.0)
+            durations.append((max(at for _, at in done.values()) - started) * 1000 if done else float('nan'))
+            latencies.extend((at - started) * 1000 for _, at in done.values())
+            reported_ok += sum(1 for n, (ok, _) in done.items() if ok and n in tracked)
+            reported_failed += sum(1 for n, (ok, _) in done.items() if not ok and n in tracked)
+            # 늦게 오는 ACK/EEPROM 라인 정리
+            _run_until(lambda: queue.ack_matcher.in_flight() == 0 and simulator.pending_lines() == 0, 5.0)
+            _run_until(lambda: False, 0.1)
+    finally:
+        manager.disconnect_serial()
+        queue.process_timer.stop()
+        SerialManager.unregister_virtual_port(port)
+        simulator.stop()
+
+    latencies.sort()
+    return {
+        'name': name,
+        'burst_ms': statistics.median(durations),
+        'p50_ms': statistics.median(latencies) if latencies else float('nan'),
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] if latencies else float('nan'),
+        'reported_ok': reported_ok,
+        'reported_failed': reported_failed,
+        'acks': acks[0],
+        'retries': queue.ack_matcher.total_naks + queue.ack_matcher.total_timeouts,
+        'total': len(tracked) * rounds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ACK 대응 + 파이프라이닝 벤치마크')
+    parser.add_argument('--commands', type=int, default=20, help='묶음당 명령 수')
+    parser.add_argument('--rounds', type=int, default=5, help='묶음 반복 횟수')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='시뮬레이터 응답 지연')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    scenarios = [
+        ("정상", SimulatorConfig(latency_ms=args.latency_ms, pt02_interval_sec=0, seed=1)),
+        ("응답 손실 10%", SimulatorConfig(latency_ms=args.latency_ms, pt02_interval_sec=0, drop_rate=0.1, seed=1)),
+        ("NAK 10%", SimulatorConfig(latency_ms=args.latency_ms, pt02_interval_sec=0, nak_rate=0.1, seed=1)),
+    ]
+    failures = 0
+    for title, config in scenarios:
+        print(f"\n[{title}] 명령 {args.commands}개 묶음 × {args.rounds}회, 응답 지연 {args.latency_ms:.0f}ms")
+        print(f"  {'구성':<18} {'묶음(ms)':>9} {'p50(ms)':>8} {'p95(ms)':>8} {'성공 보고':>9} {'실패':>5} {'실제 ACK':>9} {'재시도':>6}")
+        for mode in MODES:
+            r = run(mode, config, args.commands, args.rounds)
+            print(f"  {r['name']:<18} {r['burst_ms']:9.1f} {r['p50_ms']:8.1f} {r['p95_ms']:8.1f} "
+                  f"{r['reported_ok']:>5}/{r['total']:<4} {r['reported_failed']:>4} {r['acks']:>9} {r['retries']:>6}")
+            # ACK 추적 모드는 성공 보고 수가 실제 ACK 수를 넘으면 안 됨
+            if mode[1] and r['reported_ok'] > r['acks']:
+                failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""
+명령 송신 간격 자동 조절(AIMD) 벤치마크
+
+펌웨어 시뮬레이터(pty)에 SerialManager + CommandQueueManager를 연결하고 버튼 명령 묶음을 반복해서 넣습니다.
+- 구성: 기존(ACK 미추적) / ACK 추적 고정(응답 대기 창만) / ACK 추적 + 간격 자동 조절
+  (모든 구성이 계열별 하한 = 펌웨어 최소 명령 간격 200ms를 지킴, 간격을 응답에 맞춰 늘리는 것은 자동 조절뿐)
+- 시나리오: 정상 펌웨어 / 처리 한계가 있는 펌웨어(busy_gap_ms보다 빨리 오면 NAK BUSY) / 도중에 느려지는 펌웨어
+- 측정: 묶음 처리 시간(중앙값), 실패 보고 수, 펌웨어가 보낸 NAK 수, 마지막 계열별 송신 간격,
+        펌웨어가 받은 연속 DSCT 명령 사이 최소 간격 (자동 조절은 펌웨어 최소 명령 간격 200ms 이상이어야 함)
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_adaptive_pacing.py [--commands 20] [--rounds 8] [--latency-ms 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.command_pacer import FIRMWARE_MIN_INTERVAL_MS
+from managers.command_queue_manager import CommandQueueManager
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+# (이름, ACK 추적, 간격 자동 조절)
+MODES = [
+    ("기존 (ACK 미추적)", False, False),
+    ("ACK 추적, 고정", True, False),
+    ("ACK 추적, 자동 조절", True, True),
+]
+
+# 처리 한계 시나리오의 시스템별 최소 처리 간격 (ms) - 문서의 최소 간격(200ms)보다 느린 펌웨어
+BUSY_GAP_MS = {'AIR': 300.0, 'DSCT': 250.0}
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def _button_commands(count):
+    """버튼 조작 명령 묶음 (DSCT 팬/펌프 속도, AIR 팬 속도)"""
+    commands = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            commands.append(f"$CMD,DSCT,FAN{i % 4 + 1},SPD,{i % 10 + 1}")
+        elif kind == 1:
+            commands.append(f"$CMD,DSCT,PUMP{i % 2 + 1},SPD,{i % 10 + 1}")
+        else:
+            commands.append(f"$CMD,AIR,FSPD,{i % 8 + 1}")
+    return commands
+
+
+def run(mode, config, command_count, rounds, busy_from_round=None):
+    """
+    한 구성 측정
+
+    Args:
+        busy_from_round: 이 회차부터 시뮬레이터에 처리 한계(BUSY_GAP_MS) 적용 (None이면 config 그대로)
+    """
+    name, ack_tracking, adaptive = mode
+    simulator = FirmwareSimulator(config)
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    queue.ack_tracking = ack_tracking
+    queue.adaptive_pacing = adaptive
+    queue.coalesce_commands = False  # 명령마다 응답을 재므로 같은 장치 명령 병합 끔
+
+    durations = []
+    failed = 0
+    received = []  # 시뮬레이터가 받은 DSCT 명령 시각
+    simulator.command_listener = lambda at, line: received.append(at) if line.startswith("$CMD,DSCT,") else None
+    try:
+        manager.connect_serial(port)
+        _run_until(lambda: False, 0.2)
+
+        for round_index in range(rounds):
+            if busy_from_round is not None and round_index == busy_from_round:
+                simulator.config.busy_gap_ms = dict(BUSY_GAP_MS)
+            done = {}
+            started = time.monotonic()
+            for n, command in enumerate(_button_commands(command_count)):
+                queue.add_command(command, callback=lambda ok, _, n=n: done.setdefault(n, (ok, time.monotonic())))
+            _run_until(lambda: len(done) >= command_count, 60.0)
+            durations.append((max(at for _, at in done.values()) - started) * 1000 if done else float('nan'))
+            failed += sum(1 for ok, _ in done.values() if not ok)
+            # 늦게 오는 ACK/EEPROM 라인 정리
+            _run_until(lambda: queue.ack_matcher.in_flight() == 0 and simulator.pending_lines() == 0, 5.0)
+            _run_until(lambda: False, 0.1)
+    finally:
+        manager.disconnect_serial()
+        queue.process_timer.stop()
+        SerialManager.unregister_virtual_port(port)
+        simulator.stop()
+
+    pacing = queue.get_queue_info()['pacing']
+    gaps = [(b - a) * 1000 for a, b in zip(received, received[1:])]
+    return {
+        'name': name,
+        'burst_ms': statistics.median(durations),
+        'last_burst_ms': durations[-1],
+        'failed': failed,
+        'naks': simulator.stats['naks_sent'],
+        'total': command_count * rounds,
+        'min_gap_ms': min(gaps) if gaps else float('nan'),
+        'intervals': " / ".join(f"{family} {info['interval_ms']:.0f}ms" for family, info in pacing.items())
+                     if pacing else "-",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='명령 송신 간격 자동 조절 벤치마크')
+    parser.add_argument('--commands', type=int, default=20, help='묶음당 명령 수')
+    parser.add_argument('--rounds', type=int, default=8, help='묶음 반복 횟수')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='시뮬레이터 응답 지연')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    def config(**kwargs):
+        return SimulatorConfig(latency_ms=args.latency_ms, pt02_interval_sec=0, seed=1, **kwargs)
+
+    gaps = ", ".join(f"{k} {v:.0f}ms" for k, v in BUSY_GAP_MS.items())
+    scenarios = [
+        ("정상 펌웨어", config(), None),
+        (f"처리 한계 ({gaps})", config(busy_gap_ms=dict(BUSY_GAP_MS)), None),
+        (f"도중에 처리 한계 발생 ({args.rounds // 2}회차부터)", config(), args.rounds // 2),
+    ]
+    failures = 0
+    for title, sim_config, busy_from in scenarios:
+        print(f"\n[{title}] 명령 {args.commands}개 묶음 × {args.rounds}회, 응답 지연 {args.latency_ms:.0f}ms")
+        print(f"  {'구성':<18} {'묶음 중앙값(ms)':>14} {'마지막 묶음(ms)':>14} {'실패':>6} {'NAK':>5} "
+              f"{'DSCT 최소 간격':>12}  최종 송신 간격")
+        results = {}
+        for mode in MODES:
+            r = run(mode, sim_config, args.commands, args.rounds, busy_from)
+            results[mode[0]] = r
+            print(f"  {r['name']:<18} {r['burst_ms']:14.1f} {r['last_burst_ms']:14.1f} "
+                  f"{r['failed']:>3}/{r['total']:<3} {r['naks']:>5} {r['min_gap_ms']:10.1f}ms  {r['intervals']}")
+        # 자동 조절은 처리 한계 상황에서 고정 구성보다 실패가 많으면 안 되고, 펌웨어 최소 간격을 지켜야 함
+        adaptive = results[MODES[2][0]]
+        if adaptive['failed'] > results[MODES[1][0]]['failed'] or adaptive['min_gap_ms'] < FIRMWARE_MIN_INTERVAL_MS * 0.95:
+            failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""
+asyncio 코어 벤치마크 (QThread/QTimer 스택과 비교)
+
+1) 유휴 시 깨어남 횟수 (연결 + 스케줄링 중, 주기가 길어 요청이 없는 구간)
+   - Qt 스택: 명령 큐 50ms 타이머 + 스케줄러 100ms 상태 머신 타이머
+   - asyncio 코어 단독: 셀렉터 대기 반환 횟수
+   - asyncio 코어 + Qt 브리지: 브리지가 asyncio 루프를 실행한 횟수
+2) 명령 지연: add_command() → 펌웨어 시뮬레이터 수신 (pty, 명령 간격보다 넓게 띄워서 1개씩)
+3) 가상 시간: 소켓 쌍 위의 가상 펌웨어(FirmwareSimulator.handle_command)로 30초 주기 스케줄링 하루치 실행
+   - 정상 응답 / DSCT 무응답(타임아웃 경로) 두 경우의 주기 수, 타임아웃 수, 실제 소요 시간
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_async_core.py [--idle 2] [--commands 30] [--hours 24]
+"""
+
+import argparse
+import asyncio
+import os
+import selectors
+import shutil
+import socket
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.async_core import AsyncUnit
+from managers.async_serial_transport import AsyncSerialTransport
+from managers.command_queue_manager import CommandQueueManager
+from managers.line_framer import LineFramer, decode_line
+from managers.sensor_scheduler import SensorScheduler
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from test.virtual_time_loop import VirtualTimeEventLoop
+from utils.log_manager import get_log_manager
+from utils.qt_asyncio import QtAsyncioBridge
+
+IDLE_CYCLE_SEC = 3600.0     # 유휴 측정 중에는 주기 요청이 없도록
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def _qt_sleep(seconds):
+    """Qt 이벤트 루프를 seconds 동안 실행 (확인용 타이머 없이)"""
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+
+
+def _start_simulator():
+    simulator = FirmwareSimulator(SimulatorConfig(latency_ms=5, pt02_interval_sec=0, scan_line_interval_ms=5))
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+    received = {}
+    simulator.command_listener = lambda at, line: received.setdefault(line, at)
+    return simulator, port, received
+
+
+def _stop_simulator(simulator):
+    SerialManager.unregister_virtual_port(simulator.port)
+    simulator.stop()
+
+
+# ==================== Qt 스택 ====================
+def bench_qt_stack(idle_sec, command_count, gap_sec):
+    simulator, port, received = _start_simulator()
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    scheduler = SensorScheduler(manager)
+    try:
+        manager.connect_serial(port)
+        scheduler.cycle_interval = IDLE_CYCLE_SEC
+        scheduler.start_scheduling()
+        _qt_sleep(0.3)
+
+        ticks = [0]
+        count = lambda: ticks.__setitem__(0, ticks[0] + 1)  # noqa: E731
+        queue.process_timer.timeout.connect(count)
+        scheduler.main_timer.timeout.connect(count)
+        _qt_sleep(idle_sec)
+        queue.process_timer.timeout.disconnect(count)
+        scheduler.main_timer.timeout.disconnect(count)
+
+        latencies = []
+        for i in range(command_count):
+            command = f"$CMD,DSCT,FAN1,SPD,{i}"
+            started = time.monotonic()
+            queue.add_command(command)
+            if _run_until(lambda: command in received, 2.0):
+                latencies.append((received[command] - started) * 1000)
+            _qt_sleep(gap_sec)
+        return ticks[0] / idle_sec, latencies
+    finally:
+        scheduler.stop_scheduling()
+        manager.disconnect_serial()
+        queue.process_timer.stop()
+        _stop_simulator(simulator)
+
+
+# ==================== asyncio 코어 ====================
+class _CountingSelector(selectors.DefaultSelector):
+    """셀렉터 대기 반환 횟수 (= 이벤트 루프가 깨어난 횟수)"""
+
+    wakeups = 0
+
+    def select(self, timeout=None):
+        events = super().select(timeout)
+        self.wakeups += 1
+        return events
+
+
+async def _measure_async(unit, received, idle_sec, command_count, gap_sec, wakeup_counter):
+    task = asyncio.ensure_future(unit.run())
+    await asyncio.sleep(0.3)
+
+    before = wakeup_counter()
+    await asyncio.sleep(idle_sec)
+    wakeups = wakeup_counter() - before
+
+    latencies = []
+    for i in range(command_count):
+        command = f"$CMD,DSCT,FAN1,SPD,{i}"
+        started = time.monotonic()
+        unit.send_command(command)
+        deadline = started + 2.0
+        while command not in received and time.monotonic() < deadline:
+            await asyncio.sleep(0.001)
+        if command in received:
+            latencies.append((received[command] - started) * 1000)
+        await asyncio.sleep(gap_sec)
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return wakeups / idle_sec, latencies
+
+
+def bench_async_standalone(idle_sec, command_count, gap_sec, data_dir):
+    simulator, port, received = _start_simulator()
+    selector = _CountingSelector()
+    loop = asyncio.SelectorEventLoop(selector)
+    try:
+        unit = AsyncUnit(port, data_dir=data_dir, cycle_interval=IDLE_CYCLE_SEC)
+        return loop.run_until_complete(
+            _measure_async(unit, received, idle_sec, command_count, gap_sec, lambda: selector.wakeups))
+    finally:
+        loop.close()
+        _stop_simulator(simulator)
+
+
+def bench_async_bridge(idle_sec, command_count, gap_sec, data_dir):
+    simulator, port, received = _start_simulator()
+    bridge = QtAsyncioBridge()
+    bridge.start()
+    try:
+        unit = AsyncUnit(port, data_dir=data_dir, cycle_interval=IDLE_CYCLE_SEC)
+        task = bridge.create_task(
+            _measure_async(unit, received, idle_sec, command_count, gap_sec, lambda: bridge.total_steps))
+        _run_until(task.done, idle_sec + command_count * (gap_sec + 2.0) + 5.0)
+        return task.result()
+    finally:
+        bridge.stop()
+        _stop_simulator(simulator)
+
+
+# ==================== 가상 시간 ====================
+class _SocketTransport(AsyncSerialTransport):
+    """소켓 쌍 한쪽을 포트로 쓰는 전송 계층"""
+
+    def __init__(self, sock):
+        super().__init__("socketpair")
+        self._sock = sock
+
+    def _open_port(self):
+        return self._sock
+
+
+async def _virtual_firmware(sock, simulator, latency, ignore_prefix=None):
+    """명령을 받아 FirmwareSimulator.handle_command() 응답을 가상 시간으로 예약 전송"""
+    loop = asyncio.get_running_loop()
+    framer = LineFramer()
+    while True:
+        data = await loop.sock_recv(sock, 4096)
+        if not data:
+            return
+        for raw in framer.feed(data):
+            line = decode_line(raw)
+            if ignore_prefix and line.startswith(ignore_prefix):
+                continue
+            for offset, response in simulator.handle_command(line):
+                loop.call_later(latency + offset, sock.send, (response + "\r\n").encode('ascii'))
+
+
+def bench_virtual_time(hours, cycle_sec, data_dir, ignore_prefix=None):
+    loop = VirtualTimeEventLoop()
+    port_sock, firmware_sock = socket.socketpair()
+    firmware_sock.setblocking(False)
+    simulator = FirmwareSimulator(SimulatorConfig(seed=1))
+    unit = AsyncUnit("socketpair", data_dir=data_dir, cycle_interval=cycle_sec,
+                     transport=_SocketTransport(port_sock))
+
+    async def main():
+        firmware = asyncio.ensure_future(_virtual_firmware(firmware_sock, simulator, 0.02, ignore_prefix))
+        task = asyncio.ensure_future(unit.run())
+        await asyncio.sleep(hours * 3600)
+        task.cancel()
+        firmware.cancel()
+        await asyncio.gather(task, firmware, return_exceptions=True)
+
+    started = time.perf_counter()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+        firmware_sock.close()
+    return {
+        'virtual_s': loop.time(),
+        'wall_s': time.perf_counter() - started,
+        'cycles': unit.scheduler.total_cycles,
+        'timeouts': unit.scheduler.total_timeouts,
+        'rx_lines': unit.transport.rx_lines,
+    }
+
+
+def _summary(latencies):
+    if not latencies:
+        return "-"
+    latencies = sorted(latencies)
+    return f"p50 {statistics.median(latencies):6.2f}  p95 {latencies[int(len(latencies) * 0.95) - 1]:6.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='asyncio 코어 벤치마크')
+    parser.add_argument('--idle', type=float, default=2.0, help='유휴 측정 시간 (초)')
+    parser.add_argument('--commands', type=int, default=30, help='명령 지연 측정 횟수')
+    parser.add_argument('--gap', type=float, default=0.12, help='명령 사이 간격 (초)')
+    parser.add_argument('--hours', type=float, default=24.0, help='가상 시간 실행 길이 (시간)')
+    parser.add_argument('--cycle', type=float, default=30.0, help='가상 시간 스케줄링 주기 (초)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    data_dir = tempfile.mkdtemp(prefix="async_core_")
+    try:
+        rows = [
+            ("Qt 스택 (QThread + QTimer)", bench_qt_stack(args.idle, args.commands, args.gap)),
+            ("asyncio 코어 (단독)", bench_async_standalone(args.idle, args.commands, args.gap, data_dir)),
+            ("asyncio 코어 + Qt 브리지", bench_async_bridge(args.idle, args.commands, args.gap, data_dir)),
+        ]
+        print(f"유휴 깨어남 ({args.idle:.0f}초) / 명령 지연 add_command → 시뮬레이터 수신 (ms, {args.commands}회)")
+        for name, (wakeups, latencies) in rows:
+            print(f"  {name:<28} {wakeups:7.1f} 회/s   {_summary(latencies)}   ({len(latencies)}/{args.commands})")
+
+        print(f"\n가상 시간: {args.hours:.0f}시간, 주기 {args.cycle:.0f}초 (응답 타임아웃 10초)")
+        failures = 0
+        for name, ignore in (("정상 응답", None), ("DSCT 무응답", "$CMD,DSCT,TH")):
+            r = bench_virtual_time(args.hours, args.cycle, data_dir, ignore)
+            print(f"  {name:<10} 가상 {r['virtual_s']:8.0f}초 → 실제 {r['wall_s']:6.2f}초, "
+                  f"주기 {r['cycles']}회, 타임아웃 {r['timeouts']}회, 수신 {r['rx_lines']}라인")
+            failures += 0 if r['cycles'] > 0 else 1
+        return 1 if failures or not all(latencies for _, (_, latencies) in rows) else 0
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+센서 이력 바이너리 저장소 벤치마크 (한 달 치 CSV 다시 파싱 vs .bin memmap + searchsorted)
+
+임시 data 폴더에 DSCT 한 달 치(센서 12개, --interval-sec마다 스캔) 날짜별 CSV를 만든 뒤
+utils.binary_store.import_csv()로 .bin을 만들고 같은 질의를 비교합니다.
+- 질의 1: ID07, 15일째 1시간
+- 질의 2: 센서 전체, 15일째 하루 평균 온도
+- 질의 3: ID07, 한 달 전체 평균 온도
+- CSV: 기간에 걸친 날짜 파일을 csv.reader로 읽어 시각/센서로 거르기 (분석 스크립트가 하던 방식)
+- .bin: query() (날짜 파일 memmap, ts searchsorted로 범위, 센서는 배열 비교)
+- 측정: 질의 시간 중앙값(ms), 레코드 수/평균 일치, 파일 크기, 가져오기 속도
+- BinaryLogWriter(센서 매니저 기록 경로)로 하루를 기록한 파일이 가져오기 결과와 같은 바이트인지 확인
+
+사용법:
+    python benchmarks/bench_binary_store.py [--days 30] [--interval-sec 10] [--repeat 5]
+"""
+
+import argparse
+import csv
+import glob
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.binary_store import BinaryLogWriter, csv_files, day_path, import_csv, query, sensor_number
+from utils.csv_layout import LONG_FIELDNAMES, TIMESTAMP_FORMAT
+from utils.log_manager import get_log_manager
+
+START_DAY = date(2026, 9, 1)
+
+
+def _day_rows(day, interval_sec):
+    base = datetime.combine(day, datetime.min.time())
+    for step in range(86400 // interval_sec):
+        stamp = base + timedelta(seconds=step * interval_sec)
+        for sensor in range(1, 13):
+            yield stamp, f"ID{sensor:02d}", round(20 + (step + sensor * 7) % 100 / 10, 1), round(40 + step % 50 / 10, 1)
+
+
+def generate_csv(data_dir, days, interval_sec):
+    for offset in range(days):
+        day = START_DAY + timedelta(days=offset)
+        with open(os.path.join(data_dir, f"DSCT_{day.isoformat()}.csv"), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(LONG_FIELDNAMES)
+            writer.writerows((stamp.strftime(TIMESTAMP_FORMAT), sensor_id, temp, humi)
+                             for stamp, sensor_id, temp, humi in _day_rows(day, interval_sec))
+
+
+def csv_query(data_dir, start, end, sensor_id=None):
+    """CSV 다시 파싱: 기간에 걸친 날짜 파일을 읽어 온도 목록"""
+    start_text, end_text = start.strftime(TIMESTAMP_FORMAT), end.strftime(TIMESTAMP_FORMAT)
+    temps = []
+    day = start.date()
+    while day <= end.date():
+        for path in sorted(glob.glob(os.path.join(data_dir, f"DSCT_{day.isoformat()}*.csv"))):
+            with open(path, newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                next(reader)
+                for row in reader:
+                    if start_text <= row[0] < end_text and (sensor_id is None or row[1] == sensor_id):
+                        temps.append(float(row[2]))
+        day += timedelta(days=1)
+    return temps
+
+
+def _median_ms(func, repeat):
+    times, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='센서 이력 바이너리 저장소 벤치마크')
+    parser.add_argument('--days', type=int, default=30, help='데이터 일수')
+    parser.add_argument('--interval-sec', type=int, default=10, help='DSCT 스캔 간격 (초)')
+    parser.add_argument('--repeat', type=int, default=5, help='질의 반복 횟수 (중앙값)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    mid = datetime.combine(START_DAY + timedelta(days=min(14, args.days - 1)), datetime.min.time())
+    month_end = datetime.combine(START_DAY + timedelta(days=args.days), datetime.min.time())
+    queries = [
+        ("ID07, 1시간", mid + timedelta(hours=12), mid + timedelta(hours=13), "ID07"),
+        ("전체, 하루", mid, mid + timedelta(days=1), None),
+        (f"ID07, {args.days}일", datetime.combine(START_DAY, datetime.min.time()), month_end, "ID07"),
+    ]
+
+    with tempfile.TemporaryDirectory(prefix='aircon_bin_') as data_dir:
+        generate_csv(data_dir, args.days, args.interval_sec)
+        csv_bytes = sum(os.path.getsize(path) for path in csv_files(data_dir))
+
+        started = time.perf_counter()
+        created = import_csv(csv_files(data_dir))
+        import_sec = time.perf_counter() - started
+        records = sum(created.values())
+        bin_bytes = sum(os.path.getsize(path) for path in created)
+
+        # 센서 매니저 기록 경로(struct)와 가져오기(numpy) 결과가 같은 바이트인지 (첫날)
+        with tempfile.TemporaryDirectory(prefix='aircon_bin_live_') as live_dir:
+            writer = BinaryLogWriter(live_dir, "DSCT")
+            for stamp, sensor_id, temp, humi in _day_rows(START_DAY, args.interval_sec):
+                writer.write_record((sensor_number(sensor_id), temp, humi), stamp)
+            writer.close()
+            with open(day_path(live_dir, "DSCT", START_DAY.isoformat()), 'rb') as f:
+                live = f.read()
+        with open(day_path(data_dir, "DSCT", START_DAY.isoformat()), 'rb') as f:
+            same_bytes = live == f.read()
+
+        print(f"DSCT {args.days}일 x 센서 12개, {args.interval_sec}초 간격: {records:,}레코드")
+        print(f"  크기: CSV {csv_bytes / 1e6:.1f}MB → .bin {bin_bytes / 1e6:.1f}MB ({bin_bytes / csv_bytes:.2f}배), "
+              f"가져오기 {records / import_sec:,.0f} rows/s")
+        print(f"  기록 경로(BinaryLogWriter)와 가져오기 결과 같은 바이트: {'예' if same_bytes else '아니오'}")
+        print(f"  {'질의':<12} {'레코드':>9} {'CSV(ms)':>9} {'.bin(ms)':>9} {'배율':>8} {'평균 일치':>8}")
+        ok = same_bytes
+        for name, start, end, sensor_id in queries:
+            csv_ms, temps = _median_ms(lambda: csv_query(data_dir, start, end, sensor_id), args.repeat)
+            bin_ms, result = _median_ms(lambda: query(data_dir, "DSCT", start, end, sensor_id), args.repeat)
+            same = len(result) == len(temps) and abs(float(result['temp'].mean()) - statistics.fmean(temps)) < 1e-3
+            ok = ok and same and bin_ms < csv_ms
+            print(f"  {name:<12} {len(result):>9,} {csv_ms:9.1f} {bin_ms:9.2f} {csv_ms / bin_ms:7.0f}x "
+                  f"{'예' if same else '아니오':>8}")
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
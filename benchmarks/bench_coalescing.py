@@ -0,0 +1,223 @@
+"""
+설정값 명령 병합(last-writer-wins) 벤치마크
+
+펌웨어 시뮬레이터(pty)에 SerialManager + CommandQueueManager를 연결하고 속도 버튼 연타를 흉내 냅니다.
+- 연타: DSCT FAN1~4 SPD, PUMP1 SPD, AIR FSPD 값을 tap 간격마다 1씩 올려 큐에 추가 (+ FAN1 ON/OFF 토글)
+- 시나리오: 정상 펌웨어 / RELOAD 대기로 큐 일시 중지 중 연타 / 처리 한계가 있는 펌웨어(busy_gap_ms)
+- 측정: 추가한 명령 수, 실제 전송(시뮬레이터 수신) 수, 마지막 연타 → 최종 값 반영까지 시간, 최종 상태 일치 여부
+- 상대 이동 명령 확인: 큐 일시 중지 중 OA 댐퍼 1단계 명령($CMD,AIR,ALTDMP,OPEN,1 등)을 연타해도 병합되지 않고
+  연타 횟수만큼 전송되어 댐퍼 위치가 그만큼 움직이는지 (coalesce_key가 None인지도 확인)
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_coalescing.py [--taps 40] [--tap-ms 30]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.command_queue_manager import CommandQueueManager, coalesce_key
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+# 연타 대상 (명령 접두사, 시뮬레이터 상태 (시스템, 키), 최대값)
+TARGETS = [
+    ("$CMD,DSCT,FAN1,SPD,", ('DSCT', 'FAN1_SPD'), 8),
+    ("$CMD,DSCT,FAN2,SPD,", ('DSCT', 'FAN2_SPD'), 8),
+    ("$CMD,DSCT,FAN3,SPD,", ('DSCT', 'FAN3_SPD'), 8),
+    ("$CMD,DSCT,FAN4,SPD,", ('DSCT', 'FAN4_SPD'), 8),
+    ("$CMD,DSCT,PUMP1,SPD,", ('DSCT', 'PUMP1_SPD'), 8),
+    ("$CMD,AIR,FSPD,", ('AIR', 'FSPD'), 8),
+]
+
+# 상대 이동 명령 (명령, 시뮬레이터 상태 키, 1회 이동량) - speed_manager의 OA.DAMP 숫자 버튼
+STEP_COMMANDS = [
+    ("$CMD,AIR,ALTDMP,OPEN,1", 'ALTDMP', 1),
+    ("$CMD,AIR,ARTDMP,OPEN,1", 'ARTDMP', 1),
+    ("$CMD,AIR,ALTDMP,CLOSE,1", 'ALTDMP', -1),
+]
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def _state(simulator, key):
+    system, name = key
+    return (simulator.dsct_state if system == 'DSCT' else simulator.air_state).get(name)
+
+
+def run(coalesce, config, taps, tap_ms, pause_sec):
+    simulator = FirmwareSimulator(config)
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    queue.coalesce_commands = coalesce
+
+    expected = {}
+    try:
+        manager.connect_serial(port)
+        _run_until(lambda: False, 0.2)
+        base_received = simulator.stats['commands_received']
+
+        if pause_sec:
+            queue.pause_queue()
+            QTimer.singleShot(int(pause_sec * 1000), queue.resume_queue)
+
+        # 연타: tap마다 대상 1개 값 증가 (대상을 돌아가며), 4번째 tap마다 FAN1 ON/OFF 토글
+        added = [0]
+        fan_on = [False]
+
+        def tap(n):
+            prefix, key, top = TARGETS[n % len(TARGETS)]
+            value = expected.get(key, 0) % top + 1
+            expected[key] = value
+            queue.add_command(f"{prefix}{value}")
+            added[0] += 1
+            if n % 4 == 0:
+                fan_on[0] = not fan_on[0]
+                queue.add_command(f"$CMD,DSCT,FAN1,{'ON' if fan_on[0] else 'OFF'}")
+                expected[('DSCT', 'FAN1')] = 'ON' if fan_on[0] else 'OFF'
+                added[0] += 1
+
+        for n in range(taps):
+            tap(n)
+            _run_until(lambda: False, tap_ms / 1000.0)
+        last_tap = time.monotonic()
+
+        settled = _run_until(lambda: all(_state(simulator, key) == value for key, value in expected.items())
+                             and queue.ack_matcher.in_flight() == 0, 30.0)
+        settle_ms = (time.monotonic() - last_tap) * 1000
+        _run_until(lambda: simulator.pending_lines() == 0, 2.0)
+    finally:
+        manager.disconnect_serial()
+        queue.process_timer.stop()
+        SerialManager.unregister_virtual_port(port)
+        simulator.stop()
+
+    return {
+        'added': added[0],
+        'wire': simulator.stats['commands_received'] - base_received,
+        'coalesced': queue.total_coalesced,
+        'settle_ms': settle_ms,
+        'correct': settled,
+    }
+
+
+def run_steps(config, taps):
+    """큐 일시 중지 중 상대 이동 명령 연타 → 재개 후 전송 수와 댐퍼 위치 확인 (병합 켬)"""
+    simulator = FirmwareSimulator(config)
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+    received = []
+    simulator.command_listener = lambda _, line: received.append(line)
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    queue.coalesce_commands = True
+
+    expected = {}
+    try:
+        manager.connect_serial(port)
+        _run_until(lambda: False, 0.2)
+        queue.pause_queue()
+        # 열기 taps회 (ALTDMP, ARTDMP 번갈아), 마지막에 ALTDMP 닫기 1회
+        sequence = [STEP_COMMANDS[n % 2] for n in range(taps)] + [STEP_COMMANDS[2]]
+        for command, key, delta in sequence:
+            queue.add_command(command)
+            expected[key] = max(0, min(10, expected.get(key, 0) + delta))
+        queue.resume_queue()
+        settled = _run_until(lambda: len(received) >= len(sequence) and queue.ack_matcher.in_flight() == 0
+                             and all(simulator.air_state[key] == value for key, value in expected.items()), 10.0)
+        _run_until(lambda: False, 0.2)
+    finally:
+        manager.disconnect_serial()
+        queue.process_timer.stop()
+        SerialManager.unregister_virtual_port(port)
+        simulator.stop()
+
+    return {
+        'added': len(sequence),
+        'wire': len(received),
+        'coalesced': queue.total_coalesced,
+        'correct': settled and len(received) == len(sequence) and queue.total_coalesced == 0,
+        'state': {key: simulator.air_state[key] for key in expected},
+        'expected': expected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='설정값 명령 병합 벤치마크')
+    parser.add_argument('--taps', type=int, default=40, help='연타 횟수')
+    parser.add_argument('--tap-ms', type=float, default=30.0, help='연타 간격 (ms)')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='시뮬레이터 응답 지연')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    def config(**kwargs):
+        return SimulatorConfig(latency_ms=args.latency_ms, pt02_interval_sec=0, seed=1, **kwargs)
+
+    scenarios = [
+        ("정상 펌웨어", config(), 0),
+        ("RELOAD 대기(큐 일시 중지 1초) 중 연타", config(), 1.0),
+        ("처리 한계 (AIR 60ms, DSCT 25ms)", config(busy_gap_ms={'AIR': 60.0, 'DSCT': 25.0}), 0),
+    ]
+    failures = 0
+    for title, sim_config, pause_sec in scenarios:
+        print(f"\n[{title}] 연타 {args.taps}회, 간격 {args.tap_ms:.0f}ms")
+        print(f"  {'구성':<10} {'추가':>5} {'전송':>5} {'병합':>5} {'반영(ms)':>9}  최종 상태")
+        for coalesce in (False, True):
+            r = run(coalesce, sim_config, args.taps, args.tap_ms, pause_sec)
+            name = "병합" if coalesce else "병합 안 함"
+            print(f"  {name:<10} {r['added']:>5} {r['wire']:>5} {r['coalesced']:>5} {r['settle_ms']:9.1f}  "
+                  f"{'일치' if r['correct'] else '불일치'}")
+            if not r['correct']:
+                failures += 1
+
+    # 상대 이동 명령은 병합 키가 없어야 하고, 연타 횟수만큼 전송되어야 함
+    keys_none = all(coalesce_key(command) is None for command, _, _ in STEP_COMMANDS)
+    steps = min(args.taps, 8)
+    r = run_steps(config(), steps)
+    print(f"\n[상대 이동 명령 (OA 댐퍼 1단계)] 큐 일시 중지 중 {r['added']}회, 병합 켬")
+    print(f"  병합 키 없음: {'예' if keys_none else '아니오'}, 추가 {r['added']}, 전송 {r['wire']}, "
+          f"병합 {r['coalesced']}, 댐퍼 위치 {r['state']} (기대 {r['expected']})  "
+          f"{'일치' if r['correct'] else '불일치'}")
+    if not (keys_none and r['correct']):
+        failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""
+명령 묶음(add_batch) 벤치마크 - AUTO 탭 SAVE (TEMPSET, CO2SET, PM25SET, SEMITIME)
+
+펌웨어 시뮬레이터(pty)에 SerialManager + CommandQueueManager를 연결해서 측정합니다.
+1) 완료 시간: SAVE 클릭 → 마지막 설정값 ACK 수신
+   - 기존 (큐 없음): 200ms QTimer 연쇄로 직접 전송
+   - 묶음: add_batch() → 완료 콜백
+   묶음 SAVE 명령 사이 최소 간격 (펌웨어 최소 명령 간격 200ms 이상이어야 함 - CHANGELOG v3.12)
+   - 송신: 큐의 command_sent 시각 (200ms 이상)
+   - 수신: 시뮬레이터가 받은 시각 (pty 전달 지연 편차가 있으므로 bench_adaptive_pacing처럼 95% 이상)
+2) 섞임: 다른 NORMAL 버튼 명령(DSCT FAN 속도)이 20ms마다 들어오고 펌웨어가 NAK를 섞어 보낼 때
+   - 개별 추가 (이전 _queue_save_commands): 명령마다 add_command(), 재시도는 NORMAL 대기열 뒤로
+   - 묶음: add_batch()
+   시뮬레이터가 받은 순서에서 첫 SAVE 명령 ~ 마지막 SAVE 명령 사이에 끼어든 다른 명령 수,
+   SAVE 명령 순서가 뒤바뀐 횟수(재시도한 앞 명령이 뒤 명령보다 늦게 도착)
+3) RELOAD 중 정지: HIGH 묶음 RELOAD(상태 라인이 느리게 오는 펌웨어)를 보낸 직후 HIGH 정지 명령 추가
+   정지 명령 ACK가 RELOAD 완료보다 먼저 오는지 (묶음이 아닌 HIGH 명령은 묶음을 기다리지 않음)
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_command_batch.py [--trials 20] [--nak-rate 0.15]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.command_pacer import FIRMWARE_MIN_INTERVAL_MS
+from managers.command_queue_manager import CommandPriority, CommandQueueManager
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+SAVE_COMMANDS = [
+    "$CMD,AIR,TEMPSET,250,20",
+    "$CMD,AIR,CO2SET,1000,100",
+    "$CMD,AIR,PM25SET,35,5",
+    "$CMD,AIR,SEMITIME,30",
+]
+LEGACY_DELAY_MS = 200
+RELOAD_COMMAND = "$CMD,DSCT,RELOAD"
+STOP_COMMAND = "$CMD,DSCT,FAN1,OFF"
+RELOAD_LINE_INTERVAL_MS = 40  # DSCT RELOAD 응답 약 1.1초
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+class Rig:
+    """시뮬레이터 + 시리얼 + 명령 큐"""
+
+    def __init__(self, nak_rate=0.0, seed=1, line_interval_ms=5.0):
+        self.simulator = FirmwareSimulator(SimulatorConfig(latency_ms=10, pt02_interval_sec=0,
+                                                           line_interval_ms=line_interval_ms,
+                                                           nak_rate=nak_rate, seed=seed))
+        self.port = self.simulator.start()
+        SerialManager.register_virtual_port(self.port, "Firmware simulator")
+        self.received = []  # 시뮬레이터가 받은 명령 (순서대로)
+        self.received_at = []  # (받은 시각, 명령)
+        self.simulator.command_listener = self._on_command
+
+        self.manager = SerialManager()
+        self.queue = CommandQueueManager(self.manager)
+        self.manager.set_command_queue(self.queue)
+        self.acks = []  # (수신 시각, AIRCON_ACK 라인)
+        self.sent_at = []  # (큐 송신 시각, 명령)
+        self.queue.command_sent.connect(lambda command: self.sent_at.append((time.monotonic(), command)))
+        self.manager.line_router.subscribe("AIRCON_ACK", lambda line: self.acks.append((time.monotonic(), line)))
+        self.manager.connect_serial(self.port)
+        _run_until(lambda: False, 0.2)
+
+    def _on_command(self, at, line):
+        self.received.append(line)
+        self.received_at.append((at, line))
+
+    def close(self):
+        self.manager.disconnect_serial()
+        self.queue.process_timer.stop()
+        SerialManager.unregister_virtual_port(self.port)
+        self.simulator.stop()
+
+
+def bench_completion(trials):
+    """SAVE 완료 시간 (ms): 기존 200ms 연쇄 / 묶음, 묶음 SAVE 명령 사이 송신/수신 간격 (ms)"""
+    rig = Rig()
+    legacy, batch, sent_gaps, received_gaps = [], [], [], []
+    try:
+        for _ in range(trials):
+            # 기존: AutoManager._send_next_save_command (큐를 거치지 않고 200ms마다 직접 전송)
+            since = len(rig.acks)
+            started = time.monotonic()
+            for index, command in enumerate(SAVE_COMMANDS):
+                QTimer.singleShot(index * LEGACY_DELAY_MS,
+                                  lambda command=command: rig.manager.send_serial_command(command))
+            if _run_until(lambda: len(rig.acks) - since >= len(SAVE_COMMANDS), 3.0):
+                legacy.append((rig.acks[-1][0] - started) * 1000)
+            _run_until(lambda: False, 0.05)
+
+            done = []
+            since, sent_since = len(rig.received_at), len(rig.sent_at)
+            started = time.monotonic()
+            rig.queue.add_batch(SAVE_COMMANDS, callback=lambda success, _: done.append((time.monotonic(), success)))
+            if _run_until(lambda: done, 3.0) and done[0][1]:
+                batch.append((done[0][0] - started) * 1000)
+            for times, gaps in ((rig.received_at[since:], received_gaps), (rig.sent_at[sent_since:], sent_gaps)):
+                save_times = [at for at, line in times if line in SAVE_COMMANDS]
+                gaps.extend((later - earlier) * 1000 for earlier, later in zip(save_times, save_times[1:]))
+            _run_until(lambda: False, 0.05)
+    finally:
+        rig.close()
+    return legacy, batch, sent_gaps, received_gaps
+
+
+def bench_interleave(trials, nak_rate, use_batch):
+    """다른 NORMAL 명령 + NAK 속에서 SAVE: (끼어든 명령 수 목록, 순서 바뀐 횟수, 실패 수)"""
+    rig = Rig(nak_rate=nak_rate, seed=7)
+    tick = [0]
+
+    def feed():
+        tick[0] += 1
+        rig.queue.add_command(f"$CMD,DSCT,FAN{tick[0] % 4 + 1},SPD,{tick[0] % 8 + 1}")
+
+    feeder = QTimer()
+    feeder.timeout.connect(feed)
+    foreign, reordered, failed = [], 0, 0
+    try:
+        feeder.start(20)
+        for _ in range(trials):
+            _run_until(lambda: False, 0.1)
+            since = len(rig.received)
+            results = []
+            if use_batch:
+                rig.queue.add_batch(SAVE_COMMANDS, callback=lambda success, _: results.extend([success] * len(SAVE_COMMANDS)))
+            else:
+                for command in SAVE_COMMANDS:
+                    rig.queue.add_command(command, callback=lambda success, _: results.append(success))
+            _run_until(lambda: len(results) >= len(SAVE_COMMANDS), 5.0)
+            failed += results.count(False)
+
+            lines = rig.received[since:]
+            positions = [i for i, line in enumerate(lines) if line in SAVE_COMMANDS]
+            if positions:
+                span = lines[positions[0]:positions[-1] + 1]
+                foreign.append(sum(1 for line in span if line not in SAVE_COMMANDS))
+                # 각 SAVE 명령이 마지막으로 도착한 순서가 원래 순서와 다르면 순서 바뀜
+                last = {line: i for i, line in enumerate(lines) if line in SAVE_COMMANDS}
+                order = sorted(last, key=last.get)
+                if order != [command for command in SAVE_COMMANDS if command in last]:
+                    reordered += 1
+    finally:
+        feeder.stop()
+        rig.close()
+    return foreign, reordered, failed
+
+
+def bench_reload_stop(trials):
+    """RELOAD 묶음 중 HIGH 정지 명령: [(정지 ACK까지 ms, RELOAD 완료까지 ms), ...]"""
+    rig = Rig(line_interval_ms=RELOAD_LINE_INTERVAL_MS)
+    timings = []
+    try:
+        for _ in range(trials):
+            reloaded, stopped = [], []
+            started = time.monotonic()
+            rig.queue.add_batch([RELOAD_COMMAND], CommandPriority.HIGH, max_retries=1, origin="reload", ack_timeout=15.0,
+                                callback=lambda success, _: reloaded.append((time.monotonic(), success)))
+            _run_until(lambda: RELOAD_COMMAND in rig.received, 1.0)
+            rig.queue.add_command(STOP_COMMAND, CommandPriority.HIGH, origin="button",
+                                  callback=lambda success, _: stopped.append((time.monotonic(), success)))
+            if _run_until(lambda: reloaded and stopped, 5.0) and reloaded[0][1] and stopped[0][1]:
+                timings.append(((stopped[0][0] - started) * 1000, (reloaded[0][0] - started) * 1000))
+            rig.received.clear()
+            _run_until(lambda: False, 0.05)
+    finally:
+        rig.close()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='명령 묶음 벤치마크')
+    parser.add_argument('--trials', type=int, default=20, help='SAVE 반복 횟수')
+    parser.add_argument('--nak-rate', type=float, default=0.15, help='섞임 측정 시 NAK 비율')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    legacy, batch, sent_gaps, received_gaps = bench_completion(args.trials)
+    print(f"SAVE 완료 시간 ({args.trials}회, 응답 지연 10ms, 클릭 → 마지막 ACK)")
+    print(f"  {'구성':<22} {'완료':>7} {'p50(ms)':>8} {'최대(ms)':>9}")
+    for name, values in ((f"기존 ({LEGACY_DELAY_MS}ms 연쇄)", legacy), ("묶음 (add_batch)", batch)):
+        p50 = statistics.median(values) if values else float('nan')
+        peak = max(values) if values else float('nan')
+        print(f"  {name:<22} {len(values):>3}/{args.trials:<3} {p50:8.1f} {peak:9.1f}")
+    min_sent = min(sent_gaps) if sent_gaps else float('nan')
+    min_received = min(received_gaps) if received_gaps else float('nan')
+    print(f"  묶음 SAVE 명령 최소 간격: 송신 {min_sent:.1f}ms, 시뮬레이터 수신 {min_received:.1f}ms "
+          f"(펌웨어 최소 {FIRMWARE_MIN_INTERVAL_MS:.0f}ms)")
+
+    print(f"\n섞임 ({args.trials}회, NORMAL 버튼 명령 20ms마다, NAK {args.nak_rate * 100:.0f}%)")
+    print(f"  {'구성':<22} {'끼어든 명령(합계)':>15} {'섞인 SAVE':>9} {'순서 바뀜':>9} {'실패':>5}")
+    interleave = {}
+    for use_batch in (False, True):
+        name = "묶음 (add_batch)" if use_batch else "개별 추가 (add_command)"
+        foreign, reordered, failed = bench_interleave(args.trials, args.nak_rate, use_batch)
+        interleave[use_batch] = (foreign, reordered)
+        mixed = sum(1 for count in foreign if count)
+        print(f"  {name:<22} {sum(foreign):>15} {mixed:>5}/{len(foreign):<3} {reordered:>9} {failed:>5}")
+
+    reload_trials = max(1, args.trials // 4)
+    timings = bench_reload_stop(reload_trials)
+    ahead = sum(1 for stop_ms, reload_ms in timings if stop_ms < reload_ms)
+    print(f"\nRELOAD 중 정지 ({reload_trials}회, 상태 라인 {RELOAD_LINE_INTERVAL_MS}ms 간격)")
+    if timings:
+        print(f"  정지 ACK p50 {statistics.median(t[0] for t in timings):.1f}ms, "
+              f"RELOAD 완료 p50 {statistics.median(t[1] for t in timings):.1f}ms, "
+              f"정지가 먼저: {ahead}/{reload_trials}")
+    else:
+        print("  완료된 회차 없음")
+
+    # 묶음은 모두 끝나고 SAVE 명령이 펌웨어 최소 간격 이상 떨어져 나가야 하며,
+    # 다른 명령이 끼어들거나 순서가 바뀌지 않아야 함
+    foreign, reordered = interleave[True]
+    ok = (len(batch) == args.trials and sent_gaps and min_sent >= FIRMWARE_MIN_INTERVAL_MS
+          and min_received >= FIRMWARE_MIN_INTERVAL_MS * 0.95
+          and sum(foreign) == 0 and reordered == 0 and ahead == reload_trials)
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+센서 CSV 레이아웃 벤치마크 (long: 센서마다 1행 vs wide: 스캔마다 1행)
+
+DSCT 스캔 라인(센서 12개 + SEQUENTIAL SCAN COMPLETE)을 SensorManager.parse_sensor_data()에 넣어
+임시 data 폴더에 기록하며 비교합니다 (5스캔마다 센서 1개 타임아웃).
+- 기록: 스캔당 파일 크기(bytes), 스캔당 write 시스템 호출 (/proc/self/io syscw), 행 수
+- 읽기: 파일 → (스캔 수 x 센서 12개 x 온/습도) 배열
+  - long: csv.reader로 한 줄씩 읽어 스캔별로 모으기 (센서 ID가 앞 행보다 커지지 않으면 새 스캔)
+  - wide: numpy.loadtxt 한 번 (빈 칸은 nan)
+- 변환기: long 파일 → long_to_wide() / wide 파일 → wide_to_long() 결과 값이 서로 같은지 확인
+
+사용법:
+    python benchmarks/bench_csv_layout.py [--scans 2000]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PyQt5.QtCore import QCoreApplication
+
+from managers.sensor_manager import SensorManager
+from utils.csv_layout import LAYOUT_LONG, LAYOUT_WIDE, long_to_wide, wide_to_long
+from utils.log_manager import get_log_manager
+
+SENSOR_IDS = [f"ID{i:02d}" for i in range(1, 13)]
+
+
+def _read_syscw():
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                if line.startswith('syscw:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def _scan_lines(scans):
+    """DSCT 스캔 라인 (5스캔마다 센서 1개 타임아웃)"""
+    lines = []
+    for scan in range(scans):
+        errors = 0
+        for index, sensor_id in enumerate(SENSOR_IDS):
+            if scan % 5 == 0 and index == scan % 12:
+                lines.append(f"[DSCT] {sensor_id},Sensor Check TIMEOUT!")
+                errors += 1
+            else:
+                lines.append(f"[DSCT] {sensor_id},TEMP: {20 + (scan + index) % 100 / 10}, HUMI: {40 + scan % 50 / 10}")
+        lines.append(f"[DSCT] SEQUENTIAL SCAN COMPLETE: Total: 12, Success: {12 - errors}, "
+                     f"Error: {errors}, Time: {1180 + scan % 40}ms")
+    return lines
+
+
+def load_long(path):
+    """long CSV → (스캔, 센서, 2) 배열 (한 줄씩 읽어 스캔별로 모으기)"""
+    column = {sensor_id: i for i, sensor_id in enumerate(SENSOR_IDS)}
+    scans, current, last_sensor = [], {}, None
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader)
+        for _, sensor_id, temp, humi in reader:
+            if current and sensor_id <= last_sensor:
+                scans.append(current)
+                current = {}
+            current[sensor_id] = (float(temp), float(humi))
+            last_sensor = sensor_id
+    if current:
+        scans.append(current)
+    values = np.full((len(scans), len(SENSOR_IDS), 2), np.nan)
+    for row, readings in enumerate(scans):
+        for sensor_id, pair in readings.items():
+            values[row, column[sensor_id]] = pair
+    return values
+
+
+def load_wide(path):
+    """wide CSV → (스캔, 센서, 2) 배열 (numpy.loadtxt 한 번)"""
+    table = np.loadtxt(path, delimiter=',', skiprows=1, usecols=range(1, 1 + 2 * len(SENSOR_IDS)),
+                       converters=lambda text: float(text) if text else np.nan, ndmin=2)
+    return table.reshape(len(table), len(SENSOR_IDS), 2)
+
+
+def run(layout, lines, data_dir):
+    manager = SensorManager(data_dir=data_dir)
+    manager.csv_flush_timer.stop()
+    manager.csv_writer.close()
+    manager.csv_layout = layout
+    manager.csv_writer, manager.csv_flush_timer = manager._create_csv_writer()
+
+    syscw = _read_syscw()
+    started = time.perf_counter()
+    for line in lines:
+        manager.parse_sensor_data(line)
+    manager.csv_writer.close()
+    elapsed = time.perf_counter() - started
+    writes = _read_syscw() - syscw
+
+    path = manager.csv_writer.current_path()
+    started = time.perf_counter()
+    values = load_long(path) if layout == LAYOUT_LONG else load_wide(path)
+    load_ms = (time.perf_counter() - started) * 1000
+    return {
+        'path': path,
+        'lines_per_s': len(lines) / elapsed,
+        'bytes': os.path.getsize(path),
+        'rows': manager.csv_writer.rows_written,
+        'writes': writes,
+        'load_ms': load_ms,
+        'values': values,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='센서 CSV 레이아웃 벤치마크')
+    parser.add_argument('--scans', type=int, default=2000, help='DSCT 스캔 수')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    lines = _scan_lines(args.scans)
+    with tempfile.TemporaryDirectory(prefix='aircon_layout_') as data_dir:
+        results = {layout: run(layout, lines, data_dir) for layout in (LAYOUT_LONG, LAYOUT_WIDE)}
+
+        # 변환기: long → wide, wide → long 결과가 반대쪽 기록 결과와 같은 값인지
+        converted_wide = os.path.join(data_dir, 'converted_wide.csv')
+        converted_long = os.path.join(data_dir, 'converted_long.csv')
+        long_to_wide(results[LAYOUT_LONG]['path'], converted_wide, SENSOR_IDS)
+        wide_to_long(results[LAYOUT_WIDE]['path'], converted_long)
+        same_wide = np.array_equal(load_wide(converted_wide), results[LAYOUT_WIDE]['values'], equal_nan=True)
+        same_long = np.array_equal(load_long(converted_long), results[LAYOUT_LONG]['values'], equal_nan=True)
+
+    print(f"DSCT {args.scans}스캔 (센서 12개, 5스캔마다 타임아웃 1개) → SensorManager.parse_sensor_data()")
+    print(f"  {'레이아웃':<8} {'행':>7} {'bytes/스캔':>10} {'write/스캔':>10} {'lines/s':>9} {'읽기(ms)':>9}")
+    for layout, r in results.items():
+        print(f"  {layout:<8} {r['rows']:>7} {r['bytes'] / args.scans:10.1f} {r['writes'] / args.scans:10.3f} "
+              f"{r['lines_per_s']:9.0f} {r['load_ms']:9.1f}")
+    long, wide = results[LAYOUT_LONG], results[LAYOUT_WIDE]
+    print(f"  wide/long: 크기 {wide['bytes'] / long['bytes']:.2f}배, write {wide['writes'] / max(long['writes'], 1):.2f}배, "
+          f"읽기 {wide['load_ms'] / long['load_ms']:.2f}배")
+    print(f"  변환 결과 일치: long→wide {'예' if same_wide else '아니오'}, wide→long {'예' if same_long else '아니오'}")
+
+    ok = (same_wide and same_long and wide['rows'] == args.scans
+          and wide['bytes'] < long['bytes'] and wide['writes'] < long['writes'])
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
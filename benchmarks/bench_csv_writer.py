@@ -0,0 +1,168 @@
+"""
+센서 CSV 기록 벤치마크 (행마다 열기 vs CsvLogWriter)
+
+DSCT 스캔(센서 12개) 행을 임시 data 폴더에 기록하며 비교합니다.
+- 기존: SensorManager._save_to_csv() 이전 구현 (행마다 _get_csv_filename()의 exists/getsize 분할 파일 확인,
+        헤더 확인 exists, open/close)
+- 기록기: SensorManager._save_to_csv() → CsvLogWriter (파일 핸들 유지, flush_rows개마다 write 1회)
+- 분할 파일: 오늘 날짜 DSCT_*.csv와 _001이 이미 10MB(희소 파일)인 상태 → 기존 방식은 행마다 3개 파일 확인
+- 측정: rows/s, 행당 파일 시스템 호출 (stat: exists/getsize, open, write 시스템 호출 - /proc/self/io syscw)
+- 두 방식의 결과 파일 내용이 같은지 확인
+
+사용법:
+    python benchmarks/bench_csv_writer.py [--scans 2000]
+"""
+
+import argparse
+import builtins
+import csv
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication
+
+from managers.sensor_manager import SensorManager
+from utils.log_manager import get_log_manager
+
+SHARD_BYTES = 10 * 1024 * 1024
+
+
+def legacy_save_to_csv(data_dir, sensor_id, data):
+    """기존 SensorManager._save_to_csv() (행마다 파일명 확인 + 열기)"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    base_filename = f'DSCT_{today}'
+    file_index = 0
+    while True:
+        if file_index == 0:
+            filename = os.path.join(data_dir, f'{base_filename}.csv')
+        else:
+            filename = os.path.join(data_dir, f'{base_filename}_{file_index:03d}.csv')
+        if not os.path.exists(filename):
+            break
+        if os.path.getsize(filename) < SHARD_BYTES:
+            break
+        file_index += 1
+
+    file_exists = os.path.exists(filename)
+    with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=['timestamp', 'sensor_id', 'temperature', 'humidity'])
+        if not file_exists:
+            writer.writeheader()
+        writer.writerow({
+            'timestamp': data['last_update'].strftime('%Y-%m-%d %H:%M:%S'),
+            'sensor_id': sensor_id,
+            'temperature': data['temp'],
+            'humidity': data['humi']
+        })
+
+
+class SyscallCounter:
+    """stat/open 호출 수와 write 시스템 호출 수 (/proc/self/io syscw)"""
+
+    def __enter__(self):
+        self.stat = self.open = 0
+        self._stat, self._open = os.stat, builtins.open
+
+        def counted_stat(*args, **kwargs):
+            self.stat += 1
+            return self._stat(*args, **kwargs)
+
+        def counted_open(*args, **kwargs):
+            self.open += 1
+            return self._open(*args, **kwargs)
+
+        os.stat, builtins.open = counted_stat, counted_open
+        self._syscw = self._read_syscw()
+        return self
+
+    def __exit__(self, *exc):
+        self.write = self._read_syscw() - self._syscw
+        os.stat, builtins.open = self._stat, self._open
+
+    def _read_syscw(self):
+        try:
+            with self._open('/proc/self/io') as f:
+                for line in f:
+                    if line.startswith('syscw:'):
+                        return int(line.split()[1])
+        except OSError:
+            pass
+        return 0
+
+
+def _prepare(data_dir):
+    """오늘 날짜 DSCT 분할 파일 2개를 10MB 희소 파일로 만들어 둠"""
+    os.makedirs(data_dir, exist_ok=True)
+    today = datetime.now().strftime('%Y-%m-%d')
+    for name in (f'DSCT_{today}.csv', f'DSCT_{today}_001.csv'):
+        with open(os.path.join(data_dir, name), 'wb') as f:
+            f.truncate(SHARD_BYTES)
+    return os.path.join(data_dir, f'DSCT_{today}_002.csv')
+
+
+def _rows(scans, stamp):
+    for scan in range(scans):
+        for sensor in range(1, 13):
+            yield f"ID{sensor:02d}", {'temp': 20 + (scan + sensor) % 100 / 10, 'humi': 40 + scan % 50 / 10,
+                                      'status': 'active', 'last_update': stamp}
+
+
+def run(scans, legacy, stamp):
+    with tempfile.TemporaryDirectory(prefix='aircon_csv_') as data_dir:
+        target = _prepare(data_dir)
+        manager = None if legacy else SensorManager(data_dir=data_dir)
+        rows = list(_rows(scans, stamp))
+        with SyscallCounter() as counter:
+            started = time.perf_counter()
+            for sensor_id, data in rows:
+                if legacy:
+                    legacy_save_to_csv(data_dir, sensor_id, data)
+                else:
+                    manager._save_to_csv(sensor_id, data)
+            if manager:
+                manager.csv_writer.close()
+            elapsed = time.perf_counter() - started
+        with open(target, 'rb') as f:
+            content = f.read()
+    count = len(rows)
+    return {
+        'rows_per_s': count / elapsed,
+        'stat': counter.stat / count,
+        'open': counter.open / count,
+        'write': counter.write / count,
+        'content': content,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='센서 CSV 기록 벤치마크')
+    parser.add_argument('--scans', type=int, default=2000, help='DSCT 스캔 수 (스캔당 12행)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    print(f"DSCT {args.scans}스캔 x 12행, 오늘 날짜 분할 파일 2개(10MB) 존재")
+    print(f"  {'구성':<24} {'rows/s':>10} {'stat/행':>8} {'open/행':>8} {'write/행':>9}")
+    results = {}
+    stamp = datetime.now().replace(microsecond=0)  # 두 방식의 결과 파일 비교용 같은 시각
+    for legacy in (True, False):
+        name = "기존 (행마다 열기)" if legacy else "CsvLogWriter"
+        r = run(args.scans, legacy, stamp)
+        results[legacy] = r
+        print(f"  {name:<24} {r['rows_per_s']:10.0f} {r['stat']:8.2f} {r['open']:8.3f} {r['write']:9.3f}")
+
+    same = results[True]['content'] == results[False]['content']
+    print(f"  결과 파일 동일: {'예' if same else '아니오'} ({len(results[False]['content'])} bytes)")
+    ok = same and results[False]['rows_per_s'] > results[True]['rows_per_s']
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+헤드리스 모드 vs GUI 시작 시간/메모리 벤치마크
+
+각 모드를 새 파이썬 프로세스로 실행하여 프로세스 생성부터 준비 완료(READY 출력)까지의 시간과
+자식 프로세스 최대 RSS(wait4)를 측정합니다. 두 모드 모두 같은 펌웨어 시뮬레이터 pty를 사용합니다.
+- GUI: QApplication(offscreen) + ControlWindow 생성/표시
+- 헤드리스: QCoreApplication + HeadlessNode (시뮬레이터 연결, 스케줄러 시작까지 포함)
+
+헤드리스 프로세스에서 PyQt5.QtWidgets, ui.main_window가 로드되지 않았는지도 확인합니다.
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_headless.py [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+_GUI_CHILD = """
+import sys
+from PyQt5 import QtWidgets
+from managers.serial_manager import SerialManager
+SerialManager.register_virtual_port(sys.argv[1], "Benchmark simulator")
+app = QtWidgets.QApplication(sys.argv)
+from ui.main_window import ControlWindow
+window = ControlWindow()
+window.show()
+app.processEvents()
+print("READY", flush=True)
+"""
+
+_HEADLESS_CHILD = """
+import sys
+from PyQt5.QtCore import QCoreApplication
+from managers.serial_manager import SerialManager
+SerialManager.register_virtual_port(sys.argv[1], "Benchmark simulator")
+app = QCoreApplication(sys.argv)
+from headless import HeadlessNode
+node = HeadlessNode(ports=[sys.argv[1]], status_interval=0)
+node.start()
+app.processEvents()
+connected = node.registry.get_unit("unit1").is_connected()
+widgets = [name for name in ("PyQt5.QtWidgets", "ui.main_window") if name in sys.modules]
+print("READY", connected, ",".join(widgets) or "-", flush=True)
+node.stop()
+"""
+
+
+def _run_child(code, port):
+    """자식 프로세스 실행, (READY까지 시간 s, 최대 RSS MB, READY 줄) 반환"""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", code, port], cwd=REPO_ROOT, env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    ready_line = ""
+    ready_time = None
+    for line in process.stdout:
+        if line.startswith("READY"):
+            ready_time = time.perf_counter() - started
+            ready_line = line.strip()
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # Linux ru_maxrss 단위는 KB
+    return ready_time, usage.ru_maxrss / 1024.0, ready_line
+
+
+def main():
+    parser = argparse.ArgumentParser(description='헤드리스 모드 vs GUI 시작 시간/메모리 벤치마크')
+    parser.add_argument('--runs', type=int, default=5, help='모드별 실행 횟수 (중앙값 사용)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    simulator = FirmwareSimulator(SimulatorConfig(pt02_interval_sec=0))
+    port = simulator.start()
+    results = {}
+    try:
+        for label, code in (("GUI", _GUI_CHILD), ("headless", _HEADLESS_CHILD)):
+            times, rss, lines = [], [], []
+            for _ in range(args.runs):
+                ready_time, max_rss, line = _run_child(code, port)
+                if ready_time is None:
+                    print(f"{label}: READY 출력 없음 (실행 실패)")
+                    return 1
+                times.append(ready_time)
+                rss.append(max_rss)
+                lines.append(line)
+            results[label] = (statistics.median(times), statistics.median(rss), lines[-1])
+    finally:
+        simulator.stop()
+
+    gui_time, gui_rss, _ = results["GUI"]
+    print(f"{'mode':<10} {'startup(ms)':>12} {'max RSS(MB)':>12}")
+    for label, (startup, rss, _) in results.items():
+        print(f"{label:<10} {startup * 1000:>12.0f} {rss:>12.1f}")
+    headless_time, headless_rss, line = results["headless"]
+    print(f"\n헤드리스: 시작 {headless_time / gui_time * 100:.0f}%, RSS {headless_rss / gui_rss * 100:.0f}% (GUI 대비)")
+
+    _, connected, widgets = line.split()
+    print(f"헤드리스 시뮬레이터 연결: {connected}, 로드된 위젯 모듈: {widgets}")
+    return 0 if connected == "True" and widgets == "-" else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""
+핫플러그 감시 + 자동 재연결 벤치마크
+
+1) 포트 목록 비용 (GUI 스레드 기준)
+   - 기존: 매초 serial.tools.list_ports.comports() 열거
+   - 변경: PortWatcher 캐시를 읽는 get_available_ports()
+2) 장치 추가/제거 감지 지연: 임시 디렉터리를 inotify로 감시하며 ttyUSB* 파일 생성/삭제
+3) 자동 재연결: 링크 경로(link_path)를 쓰는 펌웨어 시뮬레이터를 중지(분리) → 재시작(재삽입)하며
+   - 끊김 감지 지연 (중지 → connection_lost)
+   - 재연결 지연 (재시작 → connection_restored), 시도 횟수
+   - 끊긴 동안 큐에 넣은 명령이 재연결 후 모두 전달되는지, 스케줄러가 재개되는지
+4) 쓰기 실패: 포트 write()가 오류(EIO)를 내도록 주입하고 명령 전송 (ACK 추적 DSCT / 추적 안 함 AIR)
+   - 쓰기 스레드 오류로 끊김 감지 → 자동 재연결, 실패한 명령이 재전송되어 펌웨어에 도착하는지
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_hotplug.py [--outages 0.2,1,3] [--iterations 200]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import serial.tools.list_ports
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.command_queue_manager import CommandQueueManager
+from managers.port_watcher import PortWatcher
+from managers.sensor_scheduler import SensorScheduler, SchedulerState
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+# 쓰기 실패 주입 명령 (ACK 추적 / 추적 안 함)
+WRITE_FAILURE_COMMANDS = ["$CMD,DSCT,FAN2,SPD,5", "$CMD,AIR,FSPD,3"]
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def bench_enumeration(manager, iterations):
+    """포트 목록 1회 비용 (ms)"""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        serial.tools.list_ports.comports()
+    comports_ms = (time.perf_counter() - started) / iterations * 1000
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        manager.get_available_ports()
+    cached_ms = (time.perf_counter() - started) / iterations * 1000
+    return comports_ms, cached_ms
+
+
+def bench_detection(trials):
+    """inotify 감지 지연 (파일 생성/삭제 → 재열거 완료, ms 목록)"""
+    watch_dir = tempfile.mkdtemp(prefix="hotplug_")
+    watcher = PortWatcher(watch_dir=watch_dir)
+    watcher.start()
+    latencies = []
+    try:
+        if not watcher.use_inotify:
+            return watcher.get_stats()['mode'], []
+        for i in range(trials):
+            path = os.path.join(watch_dir, f"ttyUSB{i}")
+            for action in (lambda: open(path, 'w').close(), lambda: os.unlink(path)):
+                before = watcher.total_refreshes
+                started = time.perf_counter()
+                action()
+                if _run_until(lambda: watcher.total_refreshes > before, 2.0):
+                    latencies.append((time.perf_counter() - started) * 1000)
+        return 'inotify', latencies
+    finally:
+        watcher.stop()
+        os.rmdir(watch_dir)
+
+
+def bench_reconnect(outages, commands_per_outage):
+    """시뮬레이터 분리/재삽입 반복"""
+    link_path = os.path.join(tempfile.mkdtemp(prefix="hotplug_"), "ttySIM0")
+    simulator = FirmwareSimulator(SimulatorConfig(latency_ms=5, pt02_interval_sec=0, link_path=link_path))
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    queue.coalesce_commands = False  # 끊긴 동안 넣은 명령이 모두 전달되는지 확인하므로 병합 끔
+    scheduler = SensorScheduler(manager)
+    scheduler.cycle_interval = 3600  # 주기 요청 없이 상태 전환만 확인
+
+    events = {}
+    manager.connection_lost.connect(lambda _: events.__setitem__('lost', time.perf_counter()))
+    manager.connection_restored.connect(lambda _: events.__setitem__('restored', time.perf_counter()))
+
+    received = []
+    simulator.command_listener = lambda _, line: received.append(line)
+
+    results = []
+    try:
+        manager.connect_serial(port)
+        scheduler.start_scheduling()
+
+        for n, outage in enumerate(outages):
+            events.clear()
+            simulator.stop()
+            unplugged = time.perf_counter()
+            detected = _run_until(lambda: 'lost' in events, 5.0)
+            paused = scheduler.current_state == SchedulerState.PAUSED
+
+            # 끊긴 동안 명령 추가 (재연결 후 전달되어야 함)
+            expected = [f"$CMD,DSCT,FAN1,SPD,{n}{i}" for i in range(commands_per_outage)]
+            for command in expected:
+                queue.add_command(command)
+
+            _run_until(lambda: False, outage)
+            replugged = time.perf_counter()
+            simulator.start()
+            restored = _run_until(lambda: 'restored' in events, 30.0)
+            delivered = _run_until(lambda: all(c in received for c in expected), 5.0)
+
+            results.append({
+                'outage_s': outage,
+                'detect_ms': (events['lost'] - unplugged) * 1000 if detected else None,
+                'restore_ms': (events['restored'] - replugged) * 1000 if restored else None,
+                'attempts': manager.reconnect_attempts,
+                'delivered': sum(1 for c in expected if c in received),
+                'expected': len(expected),
+                'scheduler': f"{'paused' if paused else '-'}→{scheduler.current_state.value}",
+                'ok': detected and restored and delivered,
+            })
+    finally:
+        scheduler.stop_scheduling()
+        manager.disconnect_serial()
+        simulator.stop()
+        SerialManager.unregister_virtual_port(port)
+        os.rmdir(os.path.dirname(link_path))
+    return results
+
+
+def bench_write_failure():
+    """쓰기 스레드 write() 오류 주입: [(명령, 끊김 감지, 재연결, 재전송 도착, 도착까지 ms), ...]"""
+    link_path = os.path.join(tempfile.mkdtemp(prefix="hotplug_"), "ttySIM0")
+    simulator = FirmwareSimulator(SimulatorConfig(latency_ms=5, pt02_interval_sec=0, link_path=link_path))
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+
+    events = {}
+    manager.connection_lost.connect(lambda _: events.__setitem__('lost', True))
+    manager.connection_restored.connect(lambda _: events.__setitem__('restored', True))
+    received = []
+    simulator.command_listener = lambda _, line: received.append(line)
+
+    results = []
+    try:
+        manager.connect_serial(port)
+        for command in WRITE_FAILURE_COMMANDS:
+            events.clear()
+            connection = manager.shinho_serial_connection
+            original_write = connection.write
+            failing = [command]
+
+            def write(data, original_write=original_write, failing=failing):
+                if failing and data.decode('ascii').rstrip() == failing[0]:
+                    failing.pop()
+                    raise serial.SerialException("write failed: [Errno 5] Input/output error")
+                return original_write(data)
+
+            connection.write = write
+            started = time.perf_counter()
+            queue.add_command(command)
+            detected = _run_until(lambda: 'lost' in events, 5.0)
+            restored = _run_until(lambda: 'restored' in events, 10.0)
+            delivered = _run_until(lambda: command in received, 5.0)
+            results.append((command, detected, restored, delivered,
+                            (time.perf_counter() - started) * 1000 if delivered else None))
+    finally:
+        manager.disconnect_serial()
+        simulator.stop()
+        SerialManager.unregister_virtual_port(port)
+        os.rmdir(os.path.dirname(link_path))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='핫플러그 감시 + 자동 재연결 벤치마크')
+    parser.add_argument('--iterations', type=int, default=200, help='포트 목록 비용 측정 반복 횟수')
+    parser.add_argument('--trials', type=int, default=20, help='감지 지연 측정 횟수')
+    parser.add_argument('--outages', default="0.2,1,3", help='분리 유지 시간 목록 (초)')
+    parser.add_argument('--commands', type=int, default=5, help='끊긴 동안 큐에 넣을 명령 수')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    manager = SerialManager()
+    comports_ms, cached_ms = bench_enumeration(manager, args.iterations)
+    print("포트 목록 (GUI 스레드 1회 비용)")
+    print(f"  comports() 열거:            {comports_ms:8.3f} ms  (기존: 1초마다)")
+    print(f"  get_available_ports() 캐시: {cached_ms:8.4f} ms  (변경: 핫플러그 이벤트 시에만 열거)")
+    print(f"  감시 방식: {manager.port_watcher.get_stats()['mode']}")
+
+    mode, latencies = bench_detection(args.trials)
+    if latencies:
+        latencies.sort()
+        print(f"\n장치 추가/제거 감지 ({mode}, 디바운스 {PortWatcher.DEBOUNCE_SEC * 1000:.0f}ms 포함, {len(latencies)}회)")
+        print(f"  p50 {latencies[len(latencies) // 2]:.1f} ms, max {latencies[-1]:.1f} ms")
+    else:
+        print(f"\n장치 추가/제거 감지: inotify 사용 불가 ({mode}, {PortWatcher.POLL_INTERVAL_SEC:.0f}초 주기)")
+
+    outages = [float(x) for x in args.outages.split(",") if x]
+    results = bench_reconnect(outages, args.commands)
+    print("\n자동 재연결 (시뮬레이터 중지 → 재시작)")
+    print(f"{'outage(s)':>9} {'detect(ms)':>11} {'restore(ms)':>12} {'attempts':>9} {'delivered':>10}  scheduler")
+    failures = 0
+    for r in results:
+        failures += 0 if r['ok'] else 1
+        detect = f"{r['detect_ms']:.1f}" if r['detect_ms'] is not None else "-"
+        restore = f"{r['restore_ms']:.1f}" if r['restore_ms'] is not None else "-"
+        print(f"{r['outage_s']:>9.1f} {detect:>11} {restore:>12} {r['attempts']:>9} "
+              f"{r['delivered']:>5}/{r['expected']:<4}  {r['scheduler']}")
+
+    print("\n쓰기 실패 (write() EIO 1회 주입 → 끊김 처리, 재연결 후 재전송)")
+    print(f"{'명령':<22} {'끊김 감지':>9} {'재연결':>7} {'재전송 도착':>11} {'도착(ms)':>9}")
+    for command, detected, restored, delivered, elapsed_ms in bench_write_failure():
+        failures += 0 if detected and restored and delivered else 1
+        elapsed = f"{elapsed_ms:.1f}" if elapsed_ms is not None else "-"
+        print(f"{command:<22} {'예' if detected else '아니오':>9} {'예' if restored else '아니오':>7} "
+              f"{'예' if delivered else '아니오':>11} {elapsed:>9}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
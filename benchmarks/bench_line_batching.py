@@ -0,0 +1,124 @@
+"""
+스레드 간 라인 전달 벤치마크 (라인 단위 data_received vs 묶음 lines_received)
+
+작업 스레드에서 수신 라인을 GUI 스레드로 넘기는 두 가지 방식을 비교합니다.
+- line:  라인마다 큐 이벤트 1회 (기존 SerialReaderThread.data_received 방식, 묶음 크기 1)
+- batch: 묶음마다 큐 이벤트 1회 (lines_received, 묶음 크기별)
+
+두 방식 모두 읽기 스레드와 같은 디코딩 전 bytes 라인을 SerialManager._on_thread_lines_received()로 넘겨
+같은 분배 경로(LineRouter.dispatch_raw_lines → 구독 핸들러)를 거치므로 차이는 큐 이벤트 수뿐입니다.
+GUI 스레드에서 소비된 CPU 시간을 1000 라인 기준으로 환산해 출력합니다.
+소비자는 라우터 경로(DSCT/AIR/PT02/[DSCT]/EEPROM_ACK)에 등록한 RELOAD/PT02 핸들러의 문자열 검사를 흉내 냅니다.
+
+사용법:
+    python benchmarks/bench_line_batching.py [--lines 20000] [--batch-sizes 8,16,64]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QObject, pyqtSignal
+
+from managers.serial_manager import SerialManager
+from utils.log_manager import get_log_manager
+
+
+# 소비자를 등록할 라우터 경로 (_sample_lines의 모든 라인)
+CONSUMER_ROUTES = ("DSCT", "AIR", "PT02", "[DSCT]", "EEPROM_ACK")
+
+
+class _Emitter(QObject):
+    """작업 스레드 쪽 시그널 발생기"""
+    lines = pyqtSignal(list)
+
+
+class _Consumer:
+    """기존 구독자들의 라인별 검사 흉내 (parse_reload_response, _handle_pt02_data)"""
+
+    def __init__(self):
+        self.count = 0
+        self.matched = 0
+
+    def on_line(self, data):
+        self.count += 1
+        if "EEPROM_ACK,RELOAD,START" in data or "DSCT_ACK,RELOAD,COMPLETE" in data:
+            self.matched += 1
+        elif data.startswith("DSCT,") or data.startswith("AIR,"):
+            self.matched += 1
+        if data.startswith("PT02 "):
+            self.matched += 1
+
+
+def _sample_lines(count):
+    base = [b"DSCT,FAN1,ON", b"DSCT,FAN1,SPD,3", b"AIR,FAN,ON", b"PT02 587,0,13.3,10.9",
+            b"[DSCT] ID01,TEMP: 23.5,HUMI: 45.0", b"EEPROM_ACK,RELOAD,START"]
+    return [base[i % len(base)] for i in range(count)]
+
+
+def _run(app, lines, batch_size):
+    manager = SerialManager()
+    consumer = _Consumer()
+    emitter = _Emitter()
+
+    # 두 경로 모두 큐 이벤트 → _on_thread_lines_received → 라우터 분배 (묶음 크기만 다름)
+    emitter.lines.connect(manager._on_thread_lines_received)
+    for route in CONSUMER_ROUTES:
+        manager.line_router.subscribe(route, consumer.on_line)
+    size = max(1, batch_size)
+
+    def produce():
+        for i in range(0, len(lines), size):
+            emitter.lines.emit(lines[i:i + size])
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    producer.join()  # 모든 이벤트가 큐에 쌓인 뒤 GUI 스레드 처리 시간만 측정
+
+    cpu_start = time.thread_time()
+    wall_start = time.perf_counter()
+    while consumer.count < len(lines):
+        app.processEvents()
+    cpu = time.thread_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return cpu, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description='라인 묶음 전달 벤치마크')
+    parser.add_argument('--lines', type=int, default=20000, help='전달할 라인 수')
+    parser.add_argument('--batch-sizes', default='8,16,64', help='비교할 묶음 크기 (쉼표 구분)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "WARNING"})
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    lines = _sample_lines(args.lines)
+    scale = 1000.0 / args.lines
+
+    print(f"{'mode':<10} {'GUI CPU ms/1000 lines':>22} {'wall ms/1000 lines':>19} {'saved':>8}")
+    with contextlib.redirect_stdout(io.StringIO()):
+        baseline_cpu, baseline_wall = _run(app, lines, 1)
+    print(f"{'line':<10} {baseline_cpu * 1000 * scale:>22.2f} {baseline_wall * 1000 * scale:>19.2f} {'-':>8}")
+
+    ok = True
+    for size in [int(x) for x in args.batch_sizes.split(',')]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            cpu, wall = _run(app, lines, size)
+        saved = (baseline_cpu - cpu) * 1000 * scale
+        # 같은 분배 경로이므로 묶음은 라인 단위보다 GUI 스레드 CPU가 적어야 함
+        ok = ok and cpu < baseline_cpu
+        print(f"{'batch/' + str(size):<10} {cpu * 1000 * scale:>22.2f} "
+              f"{wall * 1000 * scale:>19.2f} {saved:>7.2f}ms")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+라인 프레이머 퍼즈 + 처리량 벤치마크
+
+펌웨어 시뮬레이터 응답(ACK, RELOAD, TH 스캔, SOL, GETSET, PT02)으로 만든 바이트 스트림을
+임의의 바이트 경계에서 잘라 LineFramer에 넣고 다음을 확인/측정합니다.
+
+퍼즈:
+- 어떤 경계로 잘라도 원래 라인 목록과 정확히 같은 라인만 나오는지 (반쪽 라인 없음)
+- 줄바꿈 없는 꼬리가 다음 feed()까지 보관되는지, 상한을 넘으면 폐기되는지
+- 비교용으로 기존 readline(timeout) 방식처럼 읽기 경계를 라인 끝으로 취급할 때 깨지는 라인 수
+
+처리량:
+- 프레이머 MB/s, lines/s
+- 분배: 전체 디코딩 후 dispatch_lines() vs bytes 분류 후 필요한 라인만 디코딩하는 dispatch_raw_lines()
+
+사용법:
+    python benchmarks/bench_line_framer.py [--iterations 300] [--megabytes 8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from managers.line_framer import LineFramer, decode_line
+from managers.line_router import LineRouter
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+_COMMANDS = [
+    "$CMD,DSCT,FAN1,ON", "$CMD,DSCT,FAN1,SPD,3", "$CMD,DSCT,PUMP1,ON", "$CMD,DSCT,DMP1_OPEN,2",
+    "$CMD,DSCT,RELOAD", "$CMD,DSCT,TH", "$CMD,DSCT,SOL1,ON", "$CMD,AIR,FAN,ON", "$CMD,AIR,FSPD,5",
+    "$CMD,AIR,ALTDMP,OPEN,2", "$CMD,AIR,RELOAD", "$CMD,AIR,TH", "$CMD,AIR,GETSET", "$CMD,AIR,TEMPSET,250,20",
+]
+
+
+def _simulator_lines(seed):
+    """시뮬레이터 응답 라인 목록"""
+    simulator = FirmwareSimulator(SimulatorConfig(seed=seed, sensor_timeout_rate=0.1))
+    lines = []
+    for command in _COMMANDS:
+        lines.extend(line for _, line in simulator.handle_command(command))
+        lines.append(simulator.make_pt02_line())
+    return lines
+
+
+def _random_chunks(data, rng):
+    """임의 경계로 자르기 (1바이트 조각 포함)"""
+    chunks = []
+    i = 0
+    max_size = rng.choice([1, 3, 17, 64, 512, 4096])
+    while i < len(data):
+        size = rng.randint(1, max_size)
+        chunks.append(data[i:i + size])
+        i += size
+    return chunks
+
+
+def fuzz(iterations, seed):
+    """퍼즈 검증, (실패 수, readline 방식 깨진 라인 수 합계) 반환"""
+    rng = random.Random(seed)
+    failures = 0
+    broken_legacy = 0
+
+    for n in range(iterations):
+        lines = _simulator_lines(seed + n)
+        rng.shuffle(lines)
+        stream = "".join(line + "\r\n" for line in lines).encode('ascii')
+        expected = [line.encode('ascii') for line in lines]
+
+        framer = LineFramer()
+        got = []
+        chunks = _random_chunks(stream, rng)
+        for chunk in chunks:
+            got.extend(framer.feed(memoryview(chunk)))
+        if got != expected or framer.pending_bytes() != 0:
+            failures += 1
+            print(f"  [실패] 반복 {n}: 기대 {len(expected)}줄, 결과 {len(got)}줄, 남은 바이트 {framer.pending_bytes()}")
+
+        # 기존 readline(timeout) 방식: 읽기 경계가 라인 중간이면 반쪽 라인이 그대로 나옴
+        legacy = []
+        for chunk in chunks:
+            legacy.extend(part.strip() for part in chunk.split(b'\n') if part.strip())
+        valid = set(expected)
+        broken_legacy += sum(1 for line in legacy if line not in valid)
+
+    # 꼬리 보관
+    framer = LineFramer()
+    tail_ok = framer.feed(b"PT02 587,0,") == [] and framer.pending_bytes() == 11
+    tail_ok = tail_ok and framer.feed(b"13.3,10.9\r\n") == [b"PT02 587,0,13.3,10.9"]
+    if not tail_ok:
+        failures += 1
+        print("  [실패] 부분 라인 보관")
+
+    # 상한 초과 폐기
+    framer = LineFramer(max_pending=1024)
+    framer.feed(b"x" * 2000)
+    if framer.pending_bytes() != 0 or framer.discarded_bytes != 2000 or framer.feed(b"OK\n") != [b"OK"]:
+        failures += 1
+        print("  [실패] 줄바꿈 없는 데이터 폐기")
+
+    return failures, broken_legacy
+
+
+def _make_router():
+    """실제 앱과 같은 경로 구성 (T/H 센서 콜백 비활성 상태: [DSCT]/[AIRCON] 스캔 라인은 미등록)"""
+    router = LineRouter()
+
+    def handler(_):
+        pass
+
+    for route in ("EEPROM_ACK,RELOAD", "DSCT_ACK,RELOAD", "AIRCON_ACK,RELOAD", "DSCT", "AIR", "DSCT,SOL"):
+        router.subscribe(route, handler)
+    router.subscribe("PT02", handler, batch=True)
+    return router
+
+
+def throughput(megabytes, seed):
+    """처리량 측정"""
+    lines = _simulator_lines(seed)
+    # 스캔 라인 비중이 큰 실제 부하 형태로 반복
+    block = "".join(line + "\r\n" for line in lines).encode('ascii')
+    stream = block * max(1, int(megabytes * 1024 * 1024 / len(block)))
+    chunks = [stream[i:i + 4096] for i in range(0, len(stream), 4096)]
+
+    framer = LineFramer()
+    started = time.perf_counter()
+    raw_lines = []
+    for chunk in chunks:
+        raw_lines.extend(framer.feed(chunk))
+    framer_time = time.perf_counter() - started
+
+    router = _make_router()
+    batches = [raw_lines[i:i + 64] for i in range(0, len(raw_lines), 64)]
+    started = time.perf_counter()
+    for batch in batches:
+        router.dispatch_lines([line for line in map(decode_line, batch) if line])
+    eager_time = time.perf_counter() - started
+
+    router = _make_router()
+    started = time.perf_counter()
+    for batch in batches:
+        router.dispatch_raw_lines(batch)
+    lazy_time = time.perf_counter() - started
+    unmatched = router.route_counts.get("(unmatched)", 0)
+
+    return {
+        'mb': len(stream) / (1024 * 1024),
+        'lines': len(raw_lines),
+        'framer_mb_s': len(stream) / (1024 * 1024) / framer_time,
+        'framer_lines_s': len(raw_lines) / framer_time,
+        'eager_ns': eager_time / len(raw_lines) * 1e9,
+        'lazy_ns': lazy_time / len(raw_lines) * 1e9,
+        'unmatched_ratio': unmatched / len(raw_lines),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='라인 프레이머 퍼즈 + 처리량 벤치마크')
+    parser.add_argument('--iterations', type=int, default=300, help='퍼즈 반복 횟수')
+    parser.add_argument('--megabytes', type=float, default=8.0, help='처리량 측정 스트림 크기')
+    parser.add_argument('--seed', type=int, default=1, help='난수 시드')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "WARNING"})
+
+    print(f"퍼즈: {args.iterations}회, 임의 바이트 경계")
+    failures, broken_legacy = fuzz(args.iterations, args.seed)
+    print(f"  LineFramer 실패: {failures}")
+    print(f"  readline(timeout) 방식이었다면 깨진 라인: {broken_legacy}")
+
+    r = throughput(args.megabytes, args.seed)
+    print(f"\n처리량: {r['mb']:.1f}MB, {r['lines']:,}줄 (4096바이트 읽기 단위)")
+    print(f"  프레이머: {r['framer_mb_s']:.1f} MB/s, {r['framer_lines_s']:,.0f} lines/s")
+    print(f"  경로 미등록 라인 비율: {r['unmatched_ratio'] * 100:.0f}%")
+    print(f"  분배 (전체 디코딩 + dispatch_lines):      {r['eager_ns']:>7.0f} ns/line")
+    print(f"  분배 (bytes 분류 + dispatch_raw_lines):   {r['lazy_ns']:>7.0f} ns/line")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+수신 라인 분배 마이크로벤치마크 (전체 구독자 순회 vs LineRouter)
+
+- fanout: 모든 라인을 모든 구독자에게 전달하고 각 구독자가 부분 문자열 검사 수행
+          (기존 data_received → parse_reload_response, _handle_pt02_data, 레거시 콜백 구조)
+- router: 선두 토큰으로 1회 분류 후 등록된 경로의 핸들러만 호출
+
+구독자 수를 늘려가며 라인당 처리 비용(ns)을 비교합니다.
+fanout은 구독자 × 패턴 수에 비례하고, router는 구독자 수와 무관하게 거의 일정합니다.
+
+사용법:
+    python benchmarks/bench_line_router.py [--lines 50000] [--handlers 3,10,30]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from managers.line_router import LineRouter
+from utils.log_manager import get_log_manager
+
+
+def _sample_lines(count):
+    base = [
+        "[DSCT] ID01,TEMP: 23.5,HUMI: 45.0",
+        "[AIR] ID02,TEMP: 28.8, HUMI: 68.6",
+        "[DSCT] SEQUENTIAL SCAN COMPLETE: Total: 12, Success: 12, Error: 0, Time: 7470ms",
+        "PT02 587,0,13.3,10.9",
+        "DSCT_ACK,FAN1,SPD,1500 mV",
+        "DSCT,FAN1,ON",
+        "AIR,FAN,ON",
+        "EEPROM_ACK,RELOAD,START",
+        "DSCT_ACK,RELOAD,COMPLETE",
+        "DSCT,SOL All Open OK!",
+    ]
+    return [base[i % len(base)] for i in range(count)]
+
+
+class _Sink:
+    def __init__(self):
+        self.hits = 0
+
+    def __call__(self, data):
+        self.hits += 1
+
+
+def _build_fanout(extra):
+    """기존 구조: 구독자마다 자체 패턴 검사"""
+    sink = _Sink()
+
+    def reload_parser(data):
+        # parse_sol_response + parse_reload_response 검사 순서 재현
+        if "DSCT,SOL,All Opening!" in data or "DSCT,SOL All Open OK!" in data:
+            sink(data)
+        elif "DSCT,SOL,All Closing!" in data or "DSCT,SOL All Close OK!" in data:
+            sink(data)
+        if "EEPROM_ACK,RELOAD,START" in data:
+            sink(data)
+        elif "DSCT_ACK,RELOAD,COMPLETE" in data:
+            sink(data)
+        elif data.startswith("DSCT,"):
+            sink(data)
+        if "EEPROM_ACK,RELOAD,START" in data:
+            sink(data)
+        elif "AIRCON_ACK,RELOAD,COMPLETE" in data:
+            sink(data)
+        elif data.startswith("AIR,"):
+            sink(data)
+
+    def pt02_handler(data):
+        if data.startswith("PT02 ") or data.startswith("PT02\t"):
+            sink(data)
+
+    def legacy_callbacks(data):
+        if '[DSCT]' in data:
+            sink(data)
+        elif '[AIR]' in data or '[AIRCON]' in data:
+            sink(data)
+
+    subscribers = [reload_parser, pt02_handler, legacy_callbacks]
+    for i in range(extra):
+        token = f"X{i:03d}_ACK"
+
+        def extra_handler(data, token=token):
+            if data.startswith(token + ",") or f"[{token}]" in data or f"{token} " in data:
+                sink(data)
+        subscribers.append(extra_handler)
+
+    def dispatch_lines(lines):
+        for data in lines:
+            for subscriber in subscribers:
+                subscriber(data)
+    return dispatch_lines
+
+
+def _build_router(extra):
+    """LineRouter 구조: 경로별 핸들러만 호출"""
+    sink = _Sink()
+    router = LineRouter()
+    for route in ("EEPROM_ACK,RELOAD", "DSCT_ACK,RELOAD", "AIRCON_ACK,RELOAD",
+                  "DSCT", "AIR", "DSCT,SOL", "[DSCT]", "[AIR]", "[AIRCON]"):
+        router.subscribe(route, sink)
+    router.subscribe("PT02", lambda lines: None, batch=True)
+    for i in range(extra):
+        router.subscribe(f"X{i:03d}_ACK", sink)
+    return router.dispatch_lines
+
+
+def _measure(dispatch, lines, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        dispatch(lines)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(lines) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description='수신 라인 분배 마이크로벤치마크')
+    parser.add_argument('--lines', type=int, default=50000, help='라인 수')
+    parser.add_argument('--handlers', default='3,10,30', help='구독자 수 (쉼표 구분, 최소 3)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최소값 사용)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "WARNING"})
+
+    lines = _sample_lines(args.lines)
+    print(f"{'handlers':>8} {'fanout ns/line':>15} {'router ns/line':>15} {'speedup':>8}")
+    for count in [int(x) for x in args.handlers.split(',')]:
+        extra = max(0, count - 3)
+        fanout = _measure(_build_fanout(extra), lines, args.repeat)
+        routed = _measure(_build_router(extra), lines, args.repeat)
+        print(f"{count:>8} {fanout:>15.0f} {routed:>15.0f} {fanout / routed:>7.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+로그 호출 비용 벤치마크 (print vs log_manager)
+
+수신 라인마다 로그를 남기는 상황에서 호출 스레드가 로그 1건에 쓰는 시간을 비교합니다.
+출력 대상은 느린 tty/journald를 흉내 내기 위해 쓰기마다 지연을 주는 스트림을 사용합니다.
+
+사용법:
+    python benchmarks/bench_logging.py [--lines 20000] [--write-delay-us 50]
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.log_manager import LogManager, CategoryLogger
+
+
+class _SlowStream:
+    """쓰기마다 지연이 발생하는 출력 스트림"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로그 호출 비용 벤치마크')
+    parser.add_argument('--lines', type=int, default=20000, help='로그 라인 수')
+    parser.add_argument('--write-delay-us', type=float, default=50.0, help='출력 쓰기당 지연 (마이크로초)')
+    parser.add_argument('--rate-limit', type=float, default=20.0, help='RX 초당 출력 제한 (0이면 제한 없음)')
+    args = parser.parse_args()
+
+    delay = args.write_delay_us / 1e6
+    lines = [f"[DSCT] ID{(i % 12) + 1:02d},TEMP: 23.5,HUMI: 45.0" for i in range(args.lines)]
+
+    # print (동기 출력)
+    stream = _SlowStream(delay)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(stream):
+        for line in lines:
+            print(f"[READER_THREAD] 수신된 데이터: '{line}'")
+    print_time = time.perf_counter() - start
+
+    # log_manager (링 버퍼 + 싱크 스레드)
+    log_stream = _SlowStream(delay)
+    manager = LogManager(stream=log_stream)
+    manager.set_rate_limit("RX", args.rate_limit)
+    logger = CategoryLogger(manager, "RX", "RX")
+    start = time.perf_counter()
+    for line in lines:
+        logger.info("%s", line)
+    log_time = time.perf_counter() - start
+    manager.shutdown()
+
+    scale = 1e6 / args.lines
+    print(f"{'method':<12} {'caller us/line':>15} {'stream writes':>14}")
+    print(f"{'print':<12} {print_time * scale:>15.2f} {stream.writes:>14}")
+    print(f"{'log_manager':<12} {log_time * scale:>15.2f} {log_stream.writes:>14}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+여러 장비 동시 연결 벤치마크 (ConnectionRegistry)
+
+장비 수(N)별로 펌웨어 시뮬레이터 N개를 띄우고 한 프로세스의 ConnectionRegistry로 모두 연결하여 측정합니다.
+- 명령 처리량: 장비마다 명령 M개를 큐에 넣고 모든 시뮬레이터가 받을 때까지 시간 → 합계 commands/s
+- 수신 처리량: 장비마다 [DSCT] 스캔 라인 L개를 한 번에 주입하고 장비별 센서 매니저 파싱(+CSV)까지 시간 → 합계 lines/s
+- 장비 ID 태깅: registry.subscribe() 핸들러가 받은 장비 ID별 라인 수가 주입한 수와 같은지 (섞임 없음)
+- CSV: data/<장비 ID>/DSCT_*.csv 로 장비별 분리 저장 확인
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_multi_unit.py [--units 1,2,4] [--commands 100] [--lines 3000]
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.connection_registry import ConnectionRegistry
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def _scan_line(i):
+    sensor = (i % 12) + 1
+    return f"[DSCT] ID{sensor:02d},TEMP: {20 + i % 10}.{i % 10},HUMI: {40 + i % 20}.0\r\n"
+
+
+def run(unit_count, command_count, line_count, data_root):
+    simulators = []
+    registry = ConnectionRegistry(data_root=data_root)
+    received = Counter()
+    tagged = Counter()
+    registry.subscribe("[DSCT]", lambda unit_id, _: tagged.update((unit_id,)))
+
+    try:
+        for n in range(unit_count):
+            simulator = FirmwareSimulator(SimulatorConfig(latency_ms=5, pt02_interval_sec=0, seed=n))
+            port = simulator.start()
+            SerialManager.register_virtual_port(port, f"Simulator {n}")
+            unit_id = f"unit{n + 1}"
+            simulator.command_listener = lambda _, line, unit_id=unit_id: received.update((unit_id,))
+            simulators.append(simulator)
+            registry.add_unit(unit_id, port)
+
+        if not all(registry.connect_all(start_scheduler=False).values()):
+            raise RuntimeError("시뮬레이터 연결 실패")
+        _run_until(lambda: False, 0.3)
+
+        # 명령 처리량 (장비별 큐 + 쓰기 스레드, 명령마다 전송을 세므로 병합 끔)
+        for unit_id in registry.unit_ids():
+            registry.get_unit(unit_id).command_queue.coalesce_commands = False
+        started = time.perf_counter()
+        for unit_id in registry.unit_ids():
+            for i in range(command_count):
+                registry.send_command(unit_id, f"$CMD,DSCT,FAN1,SPD,{i % 10}")
+        total_commands = unit_count * command_count
+        _run_until(lambda: sum(received.values()) >= total_commands, 120.0)
+        command_time = time.perf_counter() - started
+        # 마지막 명령의 ACK가 주입 라인과 섞이지 않도록 응답 대기/시뮬레이터 출력이 끝날 때까지 대기
+        queues = [registry.get_unit(unit_id).command_queue for unit_id in registry.unit_ids()]
+        _run_until(lambda: all(queue.ack_matcher.in_flight() == 0 for queue in queues)
+                   and all(simulator.pending_lines() == 0 for simulator in simulators), 5.0)
+
+        # 수신 처리량 (장비별 읽기 스레드 + GUI 스레드 분배/파싱/CSV)
+        block = "".join(_scan_line(i) for i in range(line_count)).encode('ascii')
+        parsed = {unit_id: registry.get_unit(unit_id).sensor_manager for unit_id in registry.unit_ids()}
+        before = {unit_id: tagged[unit_id] for unit_id in parsed}
+        feeders = [threading.Thread(target=simulator.write_raw, args=(block,), daemon=True) for simulator in simulators]
+        started = time.perf_counter()
+        for feeder in feeders:
+            feeder.start()
+        total_lines = unit_count * line_count
+        _run_until(lambda: sum(tagged[u] - before[u] for u in parsed) >= total_lines, 120.0)
+        rx_time = time.perf_counter() - started
+
+        tagging_ok = all(tagged[u] - before[u] == line_count for u in parsed)
+        csv_ok = all(glob.glob(os.path.join(data_root, unit_id, "DSCT_*.csv")) for unit_id in parsed)
+        return {
+            'units': unit_count,
+            'commands_per_s': sum(received.values()) / command_time,
+            'commands_ok': sum(received.values()) == total_commands,
+            'lines_per_s': sum(tagged[u] - before[u] for u in parsed) / rx_time,
+            'tagging_ok': tagging_ok,
+            'csv_ok': csv_ok,
+        }
+    finally:
+        registry.close()
+        for simulator in simulators:
+            SerialManager.unregister_virtual_port(simulator.port)
+            simulator.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='여러 장비 동시 연결 벤치마크')
+    parser.add_argument('--units', default="1,2,4", help='장비 수 목록')
+    parser.add_argument('--commands', type=int, default=100, help='장비당 명령 수')
+    parser.add_argument('--lines', type=int, default=3000, help='장비당 주입 스캔 라인 수')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    print(f"{'units':>5} {'commands/s':>11} {'lines/s':>9}  check")
+    failures = 0
+    for unit_count in [int(x) for x in args.units.split(",") if x]:
+        data_root = tempfile.mkdtemp(prefix="multi_unit_")
+        try:
+            r = run(unit_count, args.commands, args.lines, data_root)
+        finally:
+            shutil.rmtree(data_root, ignore_errors=True)
+        ok = r['commands_ok'] and r['tagging_ok'] and r['csv_ok']
+        failures += 0 if ok else 1
+        check = "OK" if ok else f"commands={r['commands_ok']} tagging={r['tagging_ok']} csv={r['csv_ok']}"
+        print(f"{r['units']:>5} {r['commands_per_s']:>11.1f} {r['lines_per_s']:>9.0f}  {check}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+명령 큐 우선순위별 지연 히스토그램 벤치마크
+
+1) 기록 비용: LatencyHistogram.record() / stats() 1회 시간
+2) 정확도: 지수 분포 표본의 p50/p95/p99를 정렬로 구한 실제 값과 비교 (상대 오차)
+3) 혼합 부하: 펌웨어 시뮬레이터(pty)에 LOW 센서 요청(GETSET)을 계속 쌓고, NORMAL 버튼 명령과
+   HIGH 명령을 섞어 넣은 뒤 get_queue_info()['latency']로 우선순위별 대기/ACK 지연 출력
+   → HIGH 대기가 LOW 대기열 길이와 관계없이 짧은지 확인
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_queue_latency.py [--seconds 5] [--samples 200000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.command_queue_manager import CommandQueueManager, CommandPriority
+from managers.queue_metrics import LatencyHistogram
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+# 혼합 부하 틱(40ms)마다 NORMAL/HIGH 버튼 명령을 넣을 확률
+NORMAL_RATE = 0.07
+HIGH_RATE = 0.05
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def bench_cost(samples):
+    rng = random.Random(1)
+    values = [rng.expovariate(1 / 5.0) for _ in range(samples)]
+    histogram = LatencyHistogram(window_sec=60)
+    now = time.monotonic()
+    started = time.perf_counter()
+    for value in values:
+        histogram.record(value, now)
+    record_ns = (time.perf_counter() - started) / samples * 1e9
+
+    started = time.perf_counter()
+    for _ in range(100):
+        stats = histogram.stats(now)
+    stats_us = (time.perf_counter() - started) / 100 * 1e6
+
+    values.sort()
+    errors = {}
+    for percentile in (50, 95, 99):
+        exact = values[max(0, -(-samples * percentile // 100) - 1)]
+        errors[percentile] = (stats[f'p{percentile}_ms'], exact, abs(stats[f'p{percentile}_ms'] - exact) / exact * 100)
+    return record_ns, stats_us, len(histogram._slots[-1][1]), errors
+
+
+def bench_mixed_load(seconds):
+    simulator = FirmwareSimulator(SimulatorConfig(latency_ms=10, pt02_interval_sec=0, seed=1))
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    queue.coalesce_commands = False  # 같은 명령을 반복해서 넣으므로 병합 끔
+
+    rng = random.Random(1)
+    peak_low = [0]
+
+    def feed():
+        # 매 틱: LOW 센서 요청 2개 (최소 명령 간격 50ms보다 빠르게 쌓임), 가끔 NORMAL/HIGH
+        # DSCT 버튼 명령은 초당 약 3개 (펌웨어 최소 명령 간격 200ms = 초당 5개 이하)
+        queue.add_command("$CMD,AIR,GETSET", CommandPriority.LOW)
+        queue.add_command("$CMD,AIR,GETSET", CommandPriority.LOW)
+        if rng.random() < NORMAL_RATE:
+            queue.add_command(f"$CMD,DSCT,FAN{rng.randint(1, 4)},SPD,{rng.randint(1, 8)}", CommandPriority.NORMAL)
+        if rng.random() < HIGH_RATE:
+            queue.add_command(f"$CMD,DSCT,FAN{rng.randint(1, 4)},{rng.choice(('ON', 'OFF'))}", CommandPriority.HIGH)
+        peak_low[0] = max(peak_low[0], len(queue.low_queue))
+
+    feeder = QTimer()
+    feeder.timeout.connect(feed)
+    try:
+        manager.connect_serial(port)
+        _run_until(lambda: False, 0.2)
+        queue.metrics.reset()
+        feeder.start(40)
+        _run_until(lambda: False, seconds)
+        feeder.stop()
+        latency = queue.get_queue_info()['latency']
+        backlog = len(queue.low_queue)
+    finally:
+        feeder.stop()
+        manager.disconnect_serial()
+        queue.process_timer.stop()
+        SerialManager.unregister_virtual_port(port)
+        simulator.stop()
+    return latency, peak_low[0], backlog
+
+
+def _fmt(value):
+    return "-" if value is None else f"{value:.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='명령 큐 지연 히스토그램 벤치마크')
+    parser.add_argument('--seconds', type=float, default=5.0, help='혼합 부하 시간 (초)')
+    parser.add_argument('--samples', type=int, default=200000, help='기록 비용 측정 표본 수')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    record_ns, stats_us, buckets, errors = bench_cost(args.samples)
+    print(f"기록 비용 ({args.samples}개, 지수 분포 평균 5ms)")
+    print(f"  record(): {record_ns:.0f} ns/회, stats(): {stats_us:.1f} us/회, 사용 버킷 {buckets}개")
+    for percentile, (estimated, exact, error) in errors.items():
+        print(f"  p{percentile}: 히스토그램 {estimated:.3f}ms / 실제 {exact:.3f}ms (오차 {error:.1f}%)")
+
+    if os.name != 'posix':
+        print("\n혼합 부하 측정은 pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 0 if all(error < 7 for _, _, error in errors.values()) else 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    latency, peak_low, backlog = bench_mixed_load(args.seconds)
+    print(f"\n혼합 부하 {args.seconds:.0f}초 (40ms마다 LOW GETSET 2개 + NORMAL {NORMAL_RATE:.0%} + HIGH {HIGH_RATE:.0%}, "
+          f"응답 지연 10ms)")
+    print(f"  LOW 대기열 최대 {peak_low}개, 종료 시 {backlog}개")
+    print(f"  {'우선순위':<8} {'구간':<5} {'건수':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'최대':>8}  (ms)")
+    for priority in ('HIGH', 'NORMAL', 'LOW'):
+        for metric in ('wait', 'send', 'ack'):
+            stats = latency.get(priority, {}).get(metric)
+            if not stats:
+                continue
+            print(f"  {priority:<10} {metric:<6} {stats['count']:>6} {_fmt(stats['p50_ms']):>8} "
+                  f"{_fmt(stats['p95_ms']):>8} {_fmt(stats['p99_ms']):>8} {_fmt(stats['max_ms']):>8}")
+
+    # HIGH 대기 p99가 LOW 대기 p50보다 짧아야 함 (LOW 요청 뒤에 밀리지 않음)
+    high = latency.get('HIGH', {}).get('wait')
+    low = latency.get('LOW', {}).get('wait')
+    ok = high and low and high['p99_ms'] < low['p50_ms'] and all(error < 7 for _, _, error in errors.values())
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
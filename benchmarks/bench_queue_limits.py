@@ -0,0 +1,158 @@
+"""
+명령 대기열 상한/만료 벤치마크 (연결 끊김 중 쌓인 명령의 재연결 후 처리)
+
+펌웨어 시뮬레이터(pty)를 띄워 두고 SerialManager를 연결하지 않은 채 outage 동안 명령을 쌓은 뒤 연결합니다.
+- 쌓는 명령: LOW $CMD,AIR,TH (센서 요청) 50ms마다, NORMAL 버튼 명령 150ms마다
+- 구성: 무제한(기존, 상한/만료 없음) / 기본 설정(LOW 20개 drop_oldest + 만료, NORMAL 100개 reject_new)
+- 측정: 재연결 후 실제 전송 수, 보낸 TH의 대기 시간(추가 → 전송) 최대, 큐를 다 비우기까지 시간,
+        버린 명령 수(만료, 초과로 오래된 LOW 삭제), 거부된 NORMAL 수
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_queue_limits.py [--outage-sec 4] [--ttl-sec 2]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.command_queue_manager import CommandQueueManager, CommandPriority, DEFAULT_QUEUE_LIMITS
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def run(limited, outage_sec, ttl_sec):
+    simulator = FirmwareSimulator(SimulatorConfig(latency_ms=5, pt02_interval_sec=0, seed=1))
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+    received = []
+    simulator.command_listener = lambda at, line: received.append(line)
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    queue.coalesce_commands = False  # 버튼 명령 수 그대로 쌓이도록 병합 끔
+    if limited:
+        queue.queue_limits = dict(DEFAULT_QUEUE_LIMITS)
+        capacity, overflow, _ = queue.queue_limits[CommandPriority.LOW]
+        queue.queue_limits[CommandPriority.LOW] = (capacity, overflow, ttl_sec)
+    else:
+        queue.queue_limits = {priority: (0, overflow, 0) for priority, (_, overflow, _) in DEFAULT_QUEUE_LIMITS.items()}
+
+    results = {'th_ages': [], 'rejected': 0, 'pending': 0}
+
+    def on_done(added_at, sensor=False):
+        def callback(success, _):
+            if success and sensor:
+                results['th_ages'].append((time.monotonic() - added_at) * 1000)
+            results['pending'] -= 1
+        return callback
+
+    tick = [0]
+
+    def feed():
+        tick[0] += 1
+        results['pending'] += 1
+        queue.add_command("$CMD,AIR,TH", CommandPriority.LOW, callback=on_done(time.monotonic(), sensor=True))
+        if tick[0] % 3 == 0:
+            results['pending'] += 1
+            if not queue.add_command(f"$CMD,DSCT,FAN{tick[0] % 4 + 1},SPD,{tick[0] % 8 + 1}",
+                                     callback=on_done(time.monotonic())):
+                results['rejected'] += 1
+
+    feeder = QTimer()
+    feeder.timeout.connect(feed)
+    try:
+        # 끊긴 상태에서 명령 쌓기 (NORMAL 상한을 넘기도록 마지막에 버튼 명령 150개 추가)
+        feeder.start(50)
+        _run_until(lambda: False, outage_sec)
+        feeder.stop()
+        for n in range(150):
+            results['pending'] += 1
+            if not queue.add_command(f"$CMD,DSCT,PUMP{n % 2 + 1},SPD,{n % 10 + 1}", callback=on_done(time.monotonic())):
+                results['rejected'] += 1
+        backlog = len(queue.low_queue) + len(queue.normal_queue)
+
+        connected = time.monotonic()
+        manager.connect_serial(port)
+        _run_until(lambda: results['pending'] <= 0, 60.0)
+        drain_ms = (time.monotonic() - connected) * 1000
+        _run_until(lambda: simulator.pending_lines() == 0, 2.0)
+    finally:
+        feeder.stop()
+        manager.disconnect_serial()
+        queue.process_timer.stop()
+        SerialManager.unregister_virtual_port(port)
+        simulator.stop()
+
+    th_ages = results['th_ages']
+    return {
+        'backlog': backlog,
+        'wire': len(received),
+        'th_sent': received.count("$CMD,AIR,TH"),
+        'max_age_ms': max(th_ages) if th_ages else float('nan'),
+        'drain_ms': drain_ms,
+        'expired': queue.total_expired,
+        'overflow': queue.total_dropped - results['rejected'],
+        'rejected': results['rejected'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='명령 대기열 상한/만료 벤치마크')
+    parser.add_argument('--outage-sec', type=float, default=4.0, help='연결 끊김 시간 (초)')
+    parser.add_argument('--ttl-sec', type=float, default=2.0, help='LOW 명령 만료 시간 (기본 설정은 10초)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    print(f"끊김 {args.outage_sec:.0f}초 동안 LOW TH 50ms마다 + NORMAL 150ms마다, 끝에 NORMAL 150개 → 연결")
+    print(f"  {'구성':<26} {'대기열':>6} {'전송':>5} {'TH 전송':>7} {'TH 최대 대기(ms)':>16} {'비우기(ms)':>10} "
+          f"{'만료':>5} {'초과':>5} {'거부':>5}")
+    results = {}
+    for limited in (False, True):
+        name = f"상한+만료 (LOW TTL {args.ttl_sec:.0f}초)" if limited else "무제한 (기존)"
+        r = run(limited, args.outage_sec, args.ttl_sec)
+        results[limited] = r
+        print(f"  {name:<26} {r['backlog']:>6} {r['wire']:>5} {r['th_sent']:>7} {r['max_age_ms']:16.0f} "
+              f"{r['drain_ms']:10.0f} {r['expired']:>5} {r['overflow']:>5} {r['rejected']:>5}")
+
+    # 상한을 두면 재연결 후 전송 수와 비우는 시간이 줄고, 만료 시간보다 오래된 TH는 나가지 않아야 함
+    limited, unlimited = results[True], results[False]
+    ok = (limited['wire'] < unlimited['wire'] and limited['drain_ms'] < unlimited['drain_ms']
+          and (limited['th_sent'] == 0 or limited['max_age_ms'] <= args.ttl_sec * 1000 + 100))
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+명령 큐 스케줄링 벤치마크 (우선순위 순 vs EDF)
+
+펌웨어 시뮬레이터(pty)에 SerialManager + CommandQueueManager를 연결하고, NORMAL 버튼 명령을
+DSCT 송신 간격(펌웨어 최소 명령 간격 200ms)보다 조금 빠르게 계속 넣어 NORMAL 대기열이 비지 않게 만든 뒤
+LOW 센서 요청을 섞습니다.
+- button: NORMAL $CMD,DSCT,FANn,SPD,m (병합 끔) 180ms마다
+- sensor: LOW $CMD,AIR,TH 540ms마다 (origin="sensor")
+- 측정: 출처별 전송 수, 마감 초과 수(첫 전송 기준), 만료로 버린 수, sensor 큐 대기 p50/최대
+
+우선순위 순이면 NORMAL 대기열이 빌 때까지 LOW는 나가지 못하고 만료(LOW 10초)되거나 끝까지 남고,
+EDF면 LOW 요청도 마감 시각 순서로 차례가 와야 함.
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_queue_scheduling.py [--seconds 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.command_queue_manager import (CommandQueueManager, CommandPriority, DEFAULT_DEADLINES_MS,
+                                            SCHEDULE_EDF, SCHEDULE_PRIORITY)
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+BUTTON_INTERVAL_MS = 180  # 버튼 명령 간격 (DSCT 송신 간격 200ms보다 빠르게)
+SENSOR_EVERY = 3          # 버튼 명령 몇 개마다 센서 요청 1개
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(2)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def run(scheduling, seconds):
+    simulator = FirmwareSimulator(SimulatorConfig(latency_ms=10, pt02_interval_sec=0, seed=1))
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    queue.coalesce_commands = False  # 버튼 명령이 그대로 쌓이도록 병합 끔
+    queue.scheduling = scheduling
+
+    sensor_waits = []
+    tick = [0]
+
+    def on_sensor(added_at):
+        def callback(success, _):
+            if success:
+                sensor_waits.append((time.monotonic() - added_at) * 1000)
+        return callback
+
+    def feed():
+        tick[0] += 1
+        queue.add_command(f"$CMD,DSCT,FAN{tick[0] % 4 + 1},SPD,{tick[0] % 8 + 1}", origin="button")
+        if tick[0] % SENSOR_EVERY == 0:
+            queue.add_command("$CMD,AIR,TH", CommandPriority.LOW, callback=on_sensor(time.monotonic()),
+                              origin="sensor")
+
+    feeder = QTimer()
+    feeder.timeout.connect(feed)
+    try:
+        manager.connect_serial(port)
+        _run_until(lambda: False, 0.2)
+        feeder.start(BUTTON_INTERVAL_MS)
+        _run_until(lambda: False, seconds)
+        feeder.stop()
+        info = queue.get_queue_info()
+    finally:
+        feeder.stop()
+        manager.disconnect_serial()
+        queue.process_timer.stop()
+        SerialManager.unregister_virtual_port(port)
+        simulator.stop()
+
+    sensor_waits.sort()
+    return {
+        'deadlines': info['deadlines'],
+        'low_left': info['low_queue_size'],
+        'normal_left': info['normal_queue_size'],
+        'sensor_p50_ms': sensor_waits[len(sensor_waits) // 2] if sensor_waits else float('nan'),
+        'sensor_max_ms': sensor_waits[-1] if sensor_waits else float('nan'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='명령 큐 스케줄링 벤치마크')
+    parser.add_argument('--seconds', type=float, default=8.0, help='부하 시간 (초)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    print(f"{args.seconds:.0f}초 동안 NORMAL button {BUTTON_INTERVAL_MS}ms마다 + "
+          f"LOW sensor(TH) {BUTTON_INTERVAL_MS * SENSOR_EVERY}ms마다, 응답 지연 10ms")
+    print(f"  {'방식':<9} {'출처':<7} {'전송':>5} {'마감 초과':>9} {'버림':>5} {'sensor 대기 p50/최대(ms)':>24} {'남은 LOW':>8}")
+    results = {}
+    for scheduling in (SCHEDULE_PRIORITY, SCHEDULE_EDF):
+        r = run(scheduling, args.seconds)
+        results[scheduling] = r
+        for index, origin in enumerate(('button', 'sensor')):
+            stats = r['deadlines'].get(origin, {'sent': 0, 'missed': 0, 'dropped': 0})
+            extra = (f"{r['sensor_p50_ms']:11.0f}/{r['sensor_max_ms']:<12.0f} {r['low_left']:>8}"
+                     if origin == 'sensor' else "")
+            print(f"  {scheduling if index == 0 else '':<9} {origin:<7} {stats['sent']:>5} {stats['missed']:>9} "
+                  f"{stats['dropped']:>5} {extra}")
+
+    # EDF면 sensor 요청이 굶지 않고 (대부분 전송), 우선순위 순보다 많이 나가야 함
+    # (NORMAL 대기열이 계속 밀려 있으므로 끝나기 전 LOW 마감 여유 안에 추가한 요청은 아직 차례가 아닐 수 있어 제외)
+    priority_sent = results[SCHEDULE_PRIORITY]['deadlines'].get('sensor', {}).get('sent', 0)
+    edf = results[SCHEDULE_EDF]
+    edf_sensor = edf['deadlines'].get('sensor', {'sent': 0})
+    due_ms = args.seconds * 1000 - DEFAULT_DEADLINES_MS[CommandPriority.LOW]
+    requested = int(due_ms / BUTTON_INTERVAL_MS) // SENSOR_EVERY
+    ok = edf_sensor['sent'] > priority_sent and edf_sensor['sent'] >= requested * 0.8
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+명령 큐 처리 시점 벤치마크 (50ms 주기 타이머 vs 이벤트 기반)
+
+펌웨어 시뮬레이터(pty)에 SerialManager + CommandQueueManager를 연결해서 측정합니다.
+- 기존: 50ms 주기 타이머로만 큐 처리 (add_command 직후 처리 안 함)
+- 이벤트 기반: add_command/ACK/재개 시 바로 처리, 간격이 남았을 때만 단발 타이머
+- 유휴: 빈 큐 상태에서 큐 처리 타이머가 깨어난 횟수 (초당)
+- 비상 명령: 빈 큐에 HIGH 명령 추가 → 시뮬레이터 수신까지 (p50/p95/최대)
+- 간격 대기 중 명령: ACK 미추적 명령(GETSET) 2개를 연달아 추가했을 때 수신 간격 (최소 명령 간격 유지 확인)
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_queue_wakeup.py [--idle-sec 3] [--commands 40]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.command_queue_manager import CommandQueueManager, CommandPriority
+from managers.serial_manager import SerialManager
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.log_manager import get_log_manager
+
+LEGACY_INTERVAL_MS = 50
+
+
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(1)
+    if not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def _qt_sleep(seconds):
+    """Qt 이벤트 루프를 seconds 동안 실행 (확인용 타이머 없이)"""
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+
+
+def _legacy_polling(queue):
+    """기존 방식 재현: 즉시 처리 시그널을 끊고 50ms 주기 타이머로만 처리"""
+    queue._wakeup_requested.disconnect(queue._process_queue)
+    timer = QTimer()
+    timer.timeout.connect(queue._process_queue)
+    timer.start(LEGACY_INTERVAL_MS)
+    return timer
+
+
+def _percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[max(0, int(len(ordered) * ratio) - 1)]
+
+
+def run(legacy, idle_sec, command_count):
+    simulator = FirmwareSimulator(SimulatorConfig(latency_ms=5, pt02_interval_sec=0, seed=1))
+    port = simulator.start()
+    SerialManager.register_virtual_port(port, "Firmware simulator")
+    received = []  # (수신 시각, 명령)
+    simulator.command_listener = lambda at, line: received.append((at, line))
+
+    def arrival(command, since):
+        """since번째 이후 수신한 command의 수신 시각 (아직 없으면 None)"""
+        return next((at for at, line in received[since:] if line == command), None)
+
+    manager = SerialManager()
+    queue = CommandQueueManager(manager)
+    manager.set_command_queue(queue)
+    queue.coalesce_commands = False  # 같은 장치 명령을 연달아 넣으므로 병합 끔
+    poll_timer = _legacy_polling(queue) if legacy else None
+    wake_timer = poll_timer or queue.process_timer
+
+    try:
+        manager.connect_serial(port)
+        _run_until(lambda: False, 0.2)
+
+        # 유휴 중 깨어난 횟수
+        ticks = [0]
+        count = lambda: ticks.__setitem__(0, ticks[0] + 1)  # noqa: E731
+        wake_timer.timeout.connect(count)
+        _qt_sleep(idle_sec)
+        wake_timer.timeout.disconnect(count)
+
+        # 빈 큐에 HIGH 명령 (응답을 받은 뒤 임의 간격을 두고 다음 명령)
+        latencies = []
+        for i in range(command_count):
+            command = f"$CMD,DSCT,FAN1,SPD,{i % 10 + 1}"
+            since = len(received)
+            started = time.monotonic()
+            queue.add_command(command, CommandPriority.HIGH)
+            if _run_until(lambda: arrival(command, since) is not None, 2.0):
+                latencies.append((arrival(command, since) - started) * 1000)
+            _run_until(lambda: queue.ack_matcher.in_flight() == 0, 2.0)
+            _qt_sleep(0.013 + (i % 7) * 0.005)
+
+        # ACK 미추적 명령(GETSET) 2개 연속: 두 번째는 최소 명령 간격 뒤에 나가야 함
+        gaps = []
+        command = "$CMD,AIR,GETSET"
+        for _ in range(5):
+            since = len(received)
+            queue.add_command(command)
+            queue.add_command(command)
+            if _run_until(lambda: sum(1 for _, line in received[since:] if line == command) >= 2, 2.0):
+                first, second = [at for at, line in received[since:] if line == command][:2]
+                gaps.append((second - first) * 1000)
+            _qt_sleep(0.1)
+    finally:
+        if poll_timer:
+            poll_timer.stop()
+        manager.disconnect_serial()
+        queue.process_timer.stop()
+        SerialManager.unregister_virtual_port(port)
+        simulator.stop()
+
+    return {
+        'wakeups_per_s': ticks[0] / idle_sec,
+        'p50_ms': statistics.median(latencies) if latencies else float('nan'),
+        'p95_ms': _percentile(latencies, 0.95) if latencies else float('nan'),
+        'max_ms': max(latencies) if latencies else float('nan'),
+        'delivered': len(latencies),
+        'gap_ms': statistics.median(gaps) if gaps else float('nan'),
+        'min_interval_ms': queue.min_command_interval * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='명령 큐 처리 시점 벤치마크')
+    parser.add_argument('--idle-sec', type=float, default=3.0, help='유휴 측정 시간 (초)')
+    parser.add_argument('--commands', type=int, default=40, help='HIGH 명령 수')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    print(f"유휴 {args.idle_sec:.0f}초, 빈 큐에 HIGH 명령 {args.commands}개 (add_command → 시뮬레이터 수신)")
+    print(f"  {'구성':<22} {'유휴 처리':>10} {'p50(ms)':>8} {'p95(ms)':>8} {'최대(ms)':>9} {'수신':>7} {'GETSET 간격(ms)':>15}")
+    results = {}
+    for legacy in (True, False):
+        name = f"기존 ({LEGACY_INTERVAL_MS}ms 주기)" if legacy else "이벤트 기반"
+        r = run(legacy, args.idle_sec, args.commands)
+        results[legacy] = r
+        print(f"  {name:<22} {r['wakeups_per_s']:7.1f}회/s {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} {r['max_ms']:9.2f} "
+              f"{r['delivered']:>3}/{args.commands:<3} {r['gap_ms']:15.1f}")
+
+    # 이벤트 기반은 유휴 중 깨어나지 않고, 최소 명령 간격은 지켜야 함
+    event = results[False]
+    ok = (event['wakeups_per_s'] == 0 and event['delivered'] == args.commands
+          and event['gap_ms'] >= event['min_interval_ms'] * 0.9)
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
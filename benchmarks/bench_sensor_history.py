@@ -0,0 +1,210 @@
+"""
+센서 최근 이력 링 버퍼 벤치마크 (CSV 다시 읽기 / deque vs SensorHistoryBuffer)
+
+DSCT 센서 12개를 --interval-sec마다 --hours시간 기록한 뒤 (기본 36시간 → 4MB 버퍼는 약 30시간이라 한 바퀴 이상 돎)
+"센서별 최근 N분 최소/최대/평균"을 세 방식으로 구해 비교합니다.
+- CSV: 날짜별 long CSV를 csv.reader로 읽어 시각으로 거르기 (지금까지 최근 이력을 보던 방식)
+- deque: 센서별 collections.deque(maxlen=capacity)에 (ts, temp, humi) tuple, 파이썬 루프로 계산
+- 링 버퍼: SensorHistoryBuffer.window_stats() (센서별 searchsorted + 센서 전체를 모아 numpy 축소)
+측정: 질의 시간 중앙값(ms), 값 1개 기록 시간(us), 메모리 (링 버퍼 nbytes vs deque tracemalloc),
+      결과 일치 (float32 반올림 허용), 한 바퀴 돈 뒤 series()가 마지막 capacity개와 같은지, window()가 복사 없는 view인지,
+      SensorManager.parse_sensor_data() 1줄 처리 시간 (버퍼 켬/끔)
+
+사용법:
+    python benchmarks/bench_sensor_history.py [--hours 36] [--interval-sec 10] [--memory-mb 4] [--repeat 5]
+"""
+
+import argparse
+import csv
+import glob
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PyQt5.QtCore import QCoreApplication
+
+from utils.csv_layout import LONG_FIELDNAMES, TIMESTAMP_FORMAT
+from utils.log_manager import get_log_manager
+from utils.sensor_history import SensorHistoryBuffer
+
+SENSOR_IDS = [f"ID{i:02d}" for i in range(1, 13)]
+START = datetime(2026, 9, 1)
+WINDOWS_MIN = (10, 60, 360)
+
+
+def generate_rows(hours, interval_sec):
+    """(datetime, sensor_id, temp, humi) - 스캔마다 센서 12개"""
+    rows = []
+    for step in range(hours * 3600 // interval_sec):
+        stamp = START + timedelta(seconds=step * interval_sec)
+        for sensor in range(1, 13):
+            rows.append((stamp, f"ID{sensor:02d}", round(20 + (step + sensor * 7) % 100 / 10, 1),
+                         round(40 + step % 50 / 10, 1)))
+    return rows
+
+
+def write_csv(data_dir, rows):
+    by_day = {}
+    for row in rows:
+        by_day.setdefault(row[0].date(), []).append(row)
+    for day, day_rows in by_day.items():
+        with open(os.path.join(data_dir, f"DSCT_{day.isoformat()}.csv"), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(LONG_FIELDNAMES)
+            writer.writerows((stamp.strftime(TIMESTAMP_FORMAT), sensor_id, temp, humi)
+                             for stamp, sensor_id, temp, humi in day_rows)
+
+
+def csv_stats(data_dir, now, minutes):
+    """CSV 다시 읽기: 기간에 걸친 날짜 파일에서 센서별 (min, max, mean, count)"""
+    since = now - timedelta(minutes=minutes)
+    since_text, now_text = since.strftime(TIMESTAMP_FORMAT), now.strftime(TIMESTAMP_FORMAT)
+    temps = {sensor_id: [] for sensor_id in SENSOR_IDS}
+    day = since.date()
+    while day <= now.date():
+        for path in sorted(glob.glob(os.path.join(data_dir, f"DSCT_{day.isoformat()}*.csv"))):
+            with open(path, newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                next(reader)
+                for row in reader:
+                    if since_text <= row[0] <= now_text:
+                        temps[row[1]].append(float(row[2]))
+        day += timedelta(days=1)
+    return {sensor_id: (min(v), max(v), statistics.fmean(v), len(v)) for sensor_id, v in temps.items()}
+
+
+def deque_stats(history, now_ts, minutes):
+    """deque 기준선: 센서별 최근 값을 뒤에서부터 훑기"""
+    since = now_ts - minutes * 60
+    stats = {}
+    for sensor_id, samples in history.items():
+        temps = []
+        for ts, temp, _ in reversed(samples):
+            if ts < since:
+                break
+            temps.append(temp)
+        stats[sensor_id] = (min(temps), max(temps), statistics.fmean(temps), len(temps))
+    return stats
+
+
+def _median_ms(func, repeat):
+    times, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times), result
+
+
+def _same(a, b):
+    return all(x[3] == y[3] and all(abs(p - q) < 1e-3 for p, q in zip(x[:3], y[:3]))
+               for x, y in ((a[k], b[k]) for k in SENSOR_IDS))
+
+
+def manager_line_us(data_dir, enabled, lines):
+    """SensorManager.parse_sensor_data() 1줄 처리 시간 (CSV 기록 포함)"""
+    from managers.sensor_manager import SensorManager
+    from utils.csv_writer import close_all_writers
+
+    manager = SensorManager(data_dir=data_dir)
+    if not enabled:
+        manager.history = None
+    started = time.perf_counter()
+    for line in lines:
+        manager.parse_sensor_data(line)
+    elapsed = time.perf_counter() - started
+    close_all_writers()
+    return elapsed / len(lines) * 1e6, manager
+
+
+def main():
+    parser = argparse.ArgumentParser(description='센서 최근 이력 링 버퍼 벤치마크')
+    parser.add_argument('--hours', type=int, default=36, help='기록 시간')
+    parser.add_argument('--interval-sec', type=int, default=10, help='DSCT 스캔 간격 (초)')
+    parser.add_argument('--memory-mb', type=float, default=4, help='링 버퍼 메모리 상한 (history_buffer.max_memory_mb)')
+    parser.add_argument('--repeat', type=int, default=5, help='질의 반복 횟수 (중앙값)')
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    rows = generate_rows(args.hours, args.interval_sec)
+    now = rows[-1][0]
+    now_ts = now.timestamp()
+    stamps = {stamp: stamp.timestamp() for stamp in {row[0] for row in rows}}
+
+    buffer = SensorHistoryBuffer.for_memory("DSCT", SENSOR_IDS, args.memory_mb)
+    capacity = buffer.capacity
+
+    started = time.perf_counter()
+    for stamp, sensor_id, temp, humi in rows:
+        buffer.append(sensor_id, stamps[stamp], (temp, humi))
+    ring_append_us = (time.perf_counter() - started) / len(rows) * 1e6
+
+    tracemalloc.start()
+    history = {sensor_id: deque(maxlen=capacity) for sensor_id in SENSOR_IDS}
+    started = time.perf_counter()
+    for stamp, sensor_id, temp, humi in rows:
+        history[sensor_id].append((stamps[stamp], temp, humi))
+    deque_append_us = (time.perf_counter() - started) / len(rows) * 1e6
+    deque_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # 한 바퀴 돈 뒤 내용/순서, view 여부
+    ts, temps = buffer.series("ID07", "temp")
+    expected = [row for row in rows if row[1] == "ID07"][-capacity:]
+    wrapped = len(rows) // len(SENSOR_IDS) > capacity
+    series_ok = (len(ts) == len(expected) and np.array_equal(ts, [stamps[row[0]] for row in expected])
+                 and np.allclose(temps, [row[2] for row in expected], atol=1e-4))
+    window_ts, window_temps = buffer.window("ID07", 360, "temp", now_ts)
+    zero_copy = (np.shares_memory(window_temps, buffer._values) and np.shares_memory(window_ts, buffer._ts)
+                 and window_temps.flags.c_contiguous)
+
+    print(f"DSCT 센서 12개 x {args.hours}시간, {args.interval_sec}초 간격: {len(rows):,}값")
+    print(f"  링 버퍼: 센서당 {capacity:,}개 (약 {capacity * args.interval_sec / 3600:.1f}시간), "
+          f"{buffer.nbytes / 1024 / 1024:.2f}MB (상한 {args.memory_mb}MB), 한 바퀴 이상: {'예' if wrapped else '아니오'}")
+    print(f"  deque 같은 개수: {deque_bytes / 1024 / 1024:.2f}MB ({deque_bytes / buffer.nbytes:.1f}배)")
+    print(f"  기록 1개: 링 버퍼 {ring_append_us:.2f}us, deque {deque_append_us:.2f}us")
+    print(f"  series() 마지막 capacity개 일치: {'예' if series_ok else '아니오'}, "
+          f"window() 복사 없는 연속 view: {'예' if zero_copy else '아니오'}")
+
+    ok = series_ok and zero_copy and wrapped and buffer.nbytes <= args.memory_mb * 1024 * 1024
+    with tempfile.TemporaryDirectory(prefix='aircon_hist_') as data_dir:
+        write_csv(data_dir, rows)
+        print(f"  {'최근 N분 (센서 12개)':<18} {'값/센서':>8} {'CSV(ms)':>9} {'deque(ms)':>10} {'링(ms)':>8} "
+              f"{'CSV 대비':>9} {'일치':>4}")
+        for minutes in WINDOWS_MIN:
+            csv_ms, expected_stats = _median_ms(lambda: csv_stats(data_dir, now, minutes), args.repeat)
+            deque_ms, deque_result = _median_ms(lambda: deque_stats(history, now_ts, minutes), args.repeat)
+            ring_ms, ring_result = _median_ms(lambda: buffer.window_stats(minutes, "temp", now_ts), args.repeat)
+            same = _same(ring_result, expected_stats) and _same(deque_result, expected_stats)
+            # 짧은 구간(값 수십 개)은 deque 파이썬 루프가 numpy 호출 비용보다 쌀 수 있어 가장 긴 구간만 비교
+            ok = ok and same and ring_ms < csv_ms and (minutes != WINDOWS_MIN[-1] or ring_ms < deque_ms)
+            print(f"  {f'{minutes}분':<18} {ring_result['ID07'][3]:>8,} {csv_ms:9.1f} {deque_ms:10.2f} "
+                  f"{ring_ms:8.3f} {csv_ms / ring_ms:8.0f}x {'예' if same else '아니오':>4}")
+
+    # 센서 매니저 기록 경로 비용 (버퍼 켬/끔)
+    lines = [f"[DSCT] {sensor_id},TEMP: {temp}, HUMI: {humi}" for _, sensor_id, temp, humi in rows[:24000]]
+    with tempfile.TemporaryDirectory(prefix='aircon_hist_mgr_') as data_dir:
+        off_us, _ = manager_line_us(data_dir, False, lines)
+    with tempfile.TemporaryDirectory(prefix='aircon_hist_mgr_') as data_dir:
+        on_us, manager = manager_line_us(data_dir, True, lines)
+    recorded = manager.history is not None and len(manager.history) == len(lines)
+    ok = ok and recorded
+    print(f"  parse_sensor_data() 1줄: 버퍼 끔 {off_us:.1f}us, 켬 {on_us:.1f}us (+{on_us - off_us:.1f}us), "
+          f"버퍼에 {len(manager.history) if manager.history is not None else 0:,}값 기록")
+
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
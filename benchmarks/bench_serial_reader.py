@@ -0,0 +1,132 @@
+"""
+시리얼 읽기 스레드 벤치마크 (select 방식 vs 기존 10ms 폴링 방식)
+
+가상 터미널(pty) 쌍을 만들어 master 쪽에서 펌웨어처럼 라인을 쏟아내고,
+slave 쪽을 SerialReaderThread로 읽어 다음을 측정합니다.
+- 처리량: N개 라인 버스트를 모두 수신하는 데 걸린 시간 (lines/s)
+- 유휴 CPU: 수신 데이터가 없을 때 프로세스 CPU 사용률 (%)
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_serial_reader.py [--lines 1000] [--idle-seconds 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+import tty
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import serial
+from PyQt5.QtCore import QCoreApplication, Qt
+
+from managers.serial_reader_thread import SerialReaderThread, READ_MODE_SELECT, READ_MODE_POLL
+from utils.log_manager import get_log_manager
+
+
+class _PtySerialManager:
+    """SerialReaderThread가 요구하는 최소 인터페이스만 구현한 pty 기반 매니저"""
+
+    def __init__(self, slave_name):
+        self.shinho_serial_connection = serial.Serial(slave_name, baudrate=115200, timeout=0.1)
+
+    def is_connected(self):
+        return self.shinho_serial_connection is not None and self.shinho_serial_connection.is_open
+
+    def close(self):
+        self.shinho_serial_connection.close()
+
+
+def _sample_lines(count):
+    """RELOAD/스캔 버스트와 비슷한 형태의 라인 생성"""
+    lines = []
+    for i in range(count):
+        sensor = (i % 12) + 1
+        lines.append(f"[DSCT] ID{sensor:02d},TEMP: {20 + i % 10}.5,HUMI: {40 + i % 20}.0\r\n")
+    return "".join(lines).encode('ascii')
+
+
+def _run_mode(read_mode, line_count, idle_seconds):
+    master_fd, slave_fd = os.openpty()
+    tty.setraw(slave_fd)
+    slave_name = os.ttyname(slave_fd)
+    manager = _PtySerialManager(slave_name)
+
+    received = []
+    done = threading.Event()
+
+    def on_lines(lines):
+        received.extend(lines)
+        if len(received) >= line_count:
+            done.set()
+
+    reader = SerialReaderThread(manager, read_mode=read_mode)
+    reader.lines_received.connect(on_lines, Qt.DirectConnection)
+
+    result = {'mode': read_mode}
+    with contextlib.redirect_stdout(io.StringIO()):
+        reader.start_reading()
+        time.sleep(0.2)
+
+        # 유휴 CPU 측정
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        time.sleep(idle_seconds)
+        idle_cpu = time.process_time() - cpu_start
+        idle_wall = time.perf_counter() - wall_start
+        result['idle_cpu_percent'] = 100.0 * idle_cpu / idle_wall
+
+        # 버스트 처리량 측정
+        payload = _sample_lines(line_count)
+        writer = threading.Thread(target=os.write, args=(master_fd, payload))
+        start = time.perf_counter()
+        writer.start()
+        finished = done.wait(timeout=max(30.0, line_count * 0.05))
+        elapsed = time.perf_counter() - start
+        writer.join(timeout=1.0)
+
+        reader.stop_reading()
+
+    manager.close()
+    os.close(master_fd)
+    os.close(slave_fd)
+
+    result['lines'] = len(received)
+    result['elapsed_s'] = elapsed
+    result['lines_per_s'] = len(received) / elapsed if elapsed > 0 else 0.0
+    result['complete'] = finished
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시리얼 읽기 스레드 벤치마크')
+    parser.add_argument('--lines', type=int, default=1000, help='버스트 라인 수')
+    parser.add_argument('--idle-seconds', type=float, default=3.0, help='유휴 CPU 측정 시간')
+    parser.add_argument('--modes', default=f'{READ_MODE_POLL},{READ_MODE_SELECT}',
+                        help='측정할 방식 (쉼표 구분)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "WARNING"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    print(f"{'mode':<8} {'lines':>7} {'time(s)':>9} {'lines/s':>10} {'idle CPU%':>10}")
+    for mode in args.modes.split(','):
+        r = _run_mode(mode.strip(), args.lines, args.idle_seconds)
+        flag = '' if r['complete'] else '  (timeout)'
+        print(f"{r['mode']:<8} {r['lines']:>7} {r['elapsed_s']:>9.3f} "
+              f"{r['lines_per_s']:>10.1f} {r['idle_cpu_percent']:>10.2f}{flag}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
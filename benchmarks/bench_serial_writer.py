@@ -0,0 +1,113 @@
+"""
+시리얼 쓰기 스레드 벤치마크 (쓰기 스레드 vs GUI 스레드 직접 write())
+
+pty 출력 버퍼를 미리 채우고 master 쪽을 보레이트 속도로만 읽어 혼잡한 USB 어댑터를 흉내내고,
+SerialManager.send_serial_command()를 연속 호출할 때 호출 스레드(GUI 스레드)가 막히는 시간을 측정합니다.
+- 직접 쓰기: 쓰기 스레드 없이 send_data()가 포트에 바로 write()
+- 쓰기 스레드: send_data()는 송신 큐에 추가만 하고 반환
+
+사용법 (POSIX 전용):
+    python benchmarks/bench_serial_writer.py [--commands 250] [--baudrate 115200]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import tty
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication
+
+from managers.serial_manager import SerialManager
+from utils.log_manager import get_log_manager
+
+
+def _drain(master_fd, bytes_per_s, stop):
+    """보레이트 속도로만 master 쪽을 읽기 (혼잡한 어댑터)"""
+    chunk = max(1, int(bytes_per_s * 0.01))
+    while not stop.is_set():
+        try:
+            os.read(master_fd, chunk)
+        except BlockingIOError:
+            pass
+        except OSError:
+            return
+        time.sleep(0.01)
+
+
+def _run(use_writer_thread, command_count, baudrate):
+    master_fd, slave_fd = os.openpty()
+    tty.setraw(slave_fd)
+    os.set_blocking(master_fd, False)
+    port = os.ttyname(slave_fd)
+    SerialManager.register_virtual_port(port, "bench")
+
+    manager = SerialManager()
+    manager.connect_serial(port)
+    if not use_writer_thread:
+        manager._stop_writer_thread()
+
+    # 출력 버퍼를 미리 채워 혼잡 상태로 시작
+    os.set_blocking(slave_fd, False)
+    try:
+        while True:
+            os.write(slave_fd, b"#" * 4096)
+    except BlockingIOError:
+        pass
+
+    stop = threading.Event()
+    drainer = threading.Thread(target=_drain, args=(master_fd, baudrate / 10.0, stop), daemon=True)
+    drainer.start()
+
+    worst = 0.0
+    started = time.perf_counter()
+    for i in range(command_count):
+        t0 = time.perf_counter()
+        manager.send_serial_command(f"$CMD,DSCT,FAN1,SPD,{i % 10}")
+        worst = max(worst, time.perf_counter() - t0)
+    blocked = time.perf_counter() - started
+
+    # 쓰기 스레드가 큐를 비울 때까지 대기 후 통계 수집
+    deadline = time.monotonic() + 60.0
+    while manager.writer_thread and manager.get_tx_stats()['queued'] and time.monotonic() < deadline:
+        time.sleep(0.05)
+    stats = manager.get_tx_stats()
+    stop.set()
+    manager.disconnect_serial()
+    SerialManager.unregister_virtual_port(port)
+    drainer.join(timeout=1.0)
+    os.close(master_fd)
+    os.close(slave_fd)
+    return blocked, worst, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시리얼 쓰기 스레드 벤치마크')
+    parser.add_argument('--commands', type=int, default=250, help='연속 전송 명령 수')
+    parser.add_argument('--baudrate', type=int, default=115200, help='흉내낼 어댑터 보레이트')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "ERROR"})
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    print(f"{'path':<14} {'GUI blocked(s)':>15} {'worst call(ms)':>15}")
+    for label, use_writer in (("direct", False), ("writer thread", True)):
+        blocked, worst, stats = _run(use_writer, args.commands, args.baudrate)
+        print(f"{label:<14} {blocked:>15.3f} {worst * 1000:>15.2f}")
+        if stats:
+            print(f"  쓰기 지연 평균 {stats['avg_latency_ms']}ms, 최대 {stats['max_latency_ms']}ms, "
+                  f"{stats['writes']}건 기록 / 거부 {stats['rejected']}건")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+SQLite 저장 백엔드 벤치마크 (날짜별 CSV 분할 파일 대비 쓰기 증폭, 질의 지연)
+
+1) 쓰기: DSCT 스캔 라인(센서 12개 + SEQUENTIAL SCAN COMPLETE)을 SensorManager.parse_sensor_data()에 넣어 비교
+   - CSV (기존 long, CsvLogWriter)
+   - SQLite 행마다 커밋 (sqlite_max_pending_rows=1)
+   - SQLite 스캔마다 커밋 (기본)
+   - SQLite 10스캔마다 커밋 (sqlite_scans_per_commit=10)
+   측정: 행당 write 바이트 (/proc/self/io wchar - 체크포인트 스레드 포함, 닫을 때 TRUNCATE 체크포인트까지),
+        행당 write 시스템 호출, 최종 파일 크기, CSV 대비 배율
+2) 질의: DSCT 한 달 치(센서 12개, --interval-sec마다 스캔)를 날짜별 CSV와 SQLite에 같은 값으로 저장한 뒤
+   - 기간: ID07, 15일째 1시간
+   - 최신값: 센서 12개 최신값 (CSV는 마지막 날짜 파일을 읽어 센서별 마지막 행)
+   - 집계: ID07, 한 달 1시간 평균 (CSV는 파일 전체를 읽어 파이썬에서 묶기)
+   결과(개수, 값)가 같은지 확인
+
+사용법:
+    python benchmarks/bench_sqlite_store.py [--scans 2000] [--days 30] [--interval-sec 10] [--repeat 3]
+"""
+
+import argparse
+import csv
+import glob
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QCoreApplication
+
+from managers.sensor_manager import SensorManager
+from utils.csv_layout import LONG_FIELDNAMES, TIMESTAMP_FORMAT
+from utils.log_manager import get_log_manager
+from utils.sensor_storage import SqliteHistoryDB, SqliteStorage
+
+SENSOR_IDS = [f"ID{i:02d}" for i in range(1, 13)]
+START_DAY = date(2026, 9, 1)
+
+
+def _read_io():
+    """(wchar, syscw) - 이 프로세스의 write 바이트/시스템 호출 누계"""
+    values = {}
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                values[key] = int(value)
+    except OSError:
+        pass
+    return values.get('wchar', 0), values.get('syscw', 0)
+
+
+def _dir_bytes(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+# ==================== 1) 쓰기 ====================
+def _scan_lines(scans):
+    lines = []
+    for scan in range(scans):
+        for index, sensor_id in enumerate(SENSOR_IDS):
+            lines.append(f"[DSCT] {sensor_id},TEMP: {20 + (scan + index) % 100 / 10}, HUMI: {40 + scan % 50 / 10}")
+        lines.append(f"[DSCT] SEQUENTIAL SCAN COMPLETE: Total: 12, Success: 12, Error: 0, Time: {1180 + scan % 40}ms")
+    return lines
+
+
+def run_write(name, lines, rows):
+    with tempfile.TemporaryDirectory(prefix='aircon_sqlite_w_') as data_dir:
+        manager = SensorManager(data_dir=data_dir)
+        if name != 'csv':
+            manager.csv_files = False
+            manager.storages = [SqliteStorage(data_dir, "DSCT", {
+                "sqlite_checkpoint_sec": 0.5,
+                "sqlite_max_pending_rows": 1 if name == 'sqlite_row' else 500,
+                "sqlite_scans_per_commit": 10 if name == 'sqlite_10scans' else 1,
+            })]
+        wchar, syscw = _read_io()
+        started = time.perf_counter()
+        for line in lines:
+            manager.parse_sensor_data(line)
+        manager.csv_writer.close()
+        for storage in manager.storages:
+            storage.close()
+        elapsed = time.perf_counter() - started
+        wchar_end, syscw_end = _read_io()
+        return {
+            'bytes_per_row': (wchar_end - wchar) / rows,
+            'writes_per_row': (syscw_end - syscw) / rows,
+            'disk_per_row': _dir_bytes(data_dir) / rows,
+            'lines_per_s': len(lines) / elapsed,
+        }
+
+
+# ==================== 2) 질의 ====================
+def _day_scans(day, interval_sec):
+    base = datetime.combine(day, datetime.min.time())
+    for step in range(86400 // interval_sec):
+        stamp = base + timedelta(seconds=step * interval_sec)
+        yield stamp, [(sensor_id, round(20 + (step + n * 7) % 100 / 10, 1), round(40 + step % 50 / 10, 1))
+                      for n, sensor_id in enumerate(SENSOR_IDS, 1)]
+
+
+def build_month(data_dir, days, interval_sec):
+    """날짜별 CSV + SQLite (스캔마다 트랜잭션) → SQLite 저장 rows/s"""
+    storage = SqliteStorage(data_dir, "DSCT", {"sqlite_checkpoint_sec": 1.0})
+    elapsed = 0.0
+    for offset in range(days):
+        day = START_DAY + timedelta(days=offset)
+        scans = list(_day_scans(day, interval_sec))
+        with open(os.path.join(data_dir, f"DSCT_{day.isoformat()}.csv"), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(LONG_FIELDNAMES)
+            for stamp, readings in scans:
+                text = stamp.strftime(TIMESTAMP_FORMAT)
+                writer.writerows((text, sensor_id, temp, humi) for sensor_id, temp, humi in readings)
+        started = time.perf_counter()
+        for stamp, readings in scans:
+            for sensor_id, temp, humi in readings:
+                storage.add_reading(stamp, sensor_id, (temp, humi))
+            storage.end_scan()
+        elapsed += time.perf_counter() - started
+    started = time.perf_counter()
+    storage.close()
+    elapsed += time.perf_counter() - started
+    return storage.db, storage.db.rows_written / elapsed
+
+
+def _csv_rows(data_dir, day):
+    for path in sorted(glob.glob(os.path.join(data_dir, f"DSCT_{day.isoformat()}*.csv"))):
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader)
+            yield from reader
+
+
+def _days(start, end):
+    day = start.date()
+    while day <= end.date():
+        yield day
+        day += timedelta(days=1)
+
+
+def csv_range(data_dir, start, end, sensor_id):
+    start_text, end_text = start.strftime(TIMESTAMP_FORMAT), end.strftime(TIMESTAMP_FORMAT)
+    return [float(row[2]) for day in _days(start, end) for row in _csv_rows(data_dir, day)
+            if start_text <= row[0] < end_text and row[1] == sensor_id]
+
+
+def csv_latest(data_dir, last_day):
+    latest = {}
+    for row in _csv_rows(data_dir, last_day):
+        latest[row[1]] = float(row[2])
+    return latest
+
+
+def csv_hourly(data_dir, start, end, sensor_id):
+    start_text, end_text = start.strftime(TIMESTAMP_FORMAT), end.strftime(TIMESTAMP_FORMAT)
+    buckets = defaultdict(list)
+    for day in _days(start, end):
+        for row in _csv_rows(data_dir, day):
+            if start_text <= row[0] < end_text and row[1] == sensor_id:
+                buckets[row[0][:13]].append(float(row[2]))
+    return [statistics.fmean(values) for _, values in sorted(buckets.items())]
+
+
+def _median_ms(func, repeat):
+    times, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times), result
+
+
+def run_queries(db: SqliteHistoryDB, data_dir, days, repeat):
+    mid = datetime.combine(START_DAY + timedelta(days=min(14, days - 1)), datetime.min.time())
+    month_start = datetime.combine(START_DAY, datetime.min.time())
+    month_end = month_start + timedelta(days=days)
+    last_day = START_DAY + timedelta(days=days - 1)
+
+    cases = [
+        ("기간 ID07 1시간",
+         lambda: csv_range(data_dir, mid + timedelta(hours=12), mid + timedelta(hours=13), "ID07"),
+         lambda: [row[2] for row in db.query_range("DSCT", mid + timedelta(hours=12), mid + timedelta(hours=13), "ID07")]),
+        ("최신값 12개",
+         lambda: csv_latest(data_dir, last_day),
+         lambda: {sensor_id: row[1] for sensor_id, row in db.latest("DSCT").items()}),
+        (f"집계 ID07 {days}일/1시간",
+         lambda: csv_hourly(data_dir, month_start, month_end, "ID07"),
+         lambda: [row[3] for row in db.aggregate("DSCT", month_start, month_end, 3600, "ID07")]),
+    ]
+    results = []
+    for name, csv_query, sqlite_query in cases:
+        csv_ms, expected = _median_ms(csv_query, repeat)
+        sqlite_ms, actual = _median_ms(sqlite_query, repeat)
+        if isinstance(expected, dict):
+            same = expected.keys() == actual.keys() and all(abs(expected[k] - actual[k]) < 1e-9 for k in expected)
+        else:
+            same = len(expected) == len(actual) and all(abs(a - b) < 1e-9 for a, b in zip(expected, actual))
+        results.append((name, len(actual), csv_ms, sqlite_ms, same))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite 저장 백엔드 벤치마크')
+    parser.add_argument('--scans', type=int, default=2000, help='쓰기: DSCT 스캔 수')
+    parser.add_argument('--days', type=int, default=30, help='질의: 데이터 일수')
+    parser.add_argument('--interval-sec', type=int, default=10, help='질의: DSCT 스캔 간격 (초)')
+    parser.add_argument('--repeat', type=int, default=3, help='질의 반복 횟수 (중앙값)')
+    args = parser.parse_args()
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 오류만 출력
+    get_log_manager().configure({"level": "ERROR"})
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    lines = _scan_lines(args.scans)
+    rows = args.scans * len(SENSOR_IDS)
+    print(f"쓰기: DSCT {args.scans}스캔 x 12행 → SensorManager.parse_sensor_data() (닫기까지)")
+    print(f"  {'구성':<22} {'write B/행':>10} {'CSV 대비':>8} {'write/행':>9} {'디스크 B/행':>11} {'lines/s':>9}")
+    writes = {}
+    for name, label in (('csv', "CSV (날짜별 분할)"), ('sqlite_row', "SQLite 행마다 커밋"), ('sqlite_scan', "SQLite 스캔마다 커밋"),
+                        ('sqlite_10scans', "SQLite 10스캔마다 커밋")):
+        r = writes[name] = run_write(name, lines, rows)
+        print(f"  {label:<22} {r['bytes_per_row']:10.1f} {r['bytes_per_row'] / writes['csv']['bytes_per_row']:7.1f}x "
+              f"{r['writes_per_row']:9.3f} {r['disk_per_row']:11.1f} {r['lines_per_s']:9.0f}")
+
+    with tempfile.TemporaryDirectory(prefix='aircon_sqlite_q_') as data_dir:
+        db, insert_rate = build_month(data_dir, args.days, args.interval_sec)
+        csv_bytes = sum(os.path.getsize(path) for path in glob.glob(os.path.join(data_dir, "DSCT_*.csv")))
+        db_bytes = os.path.getsize(db.path)
+        print(f"\n질의: DSCT {args.days}일 x 센서 12개, {args.interval_sec}초 간격 ({db.rows_written:,}행, "
+              f"스캔마다 트랜잭션 {insert_rate:,.0f} rows/s)")
+        print(f"  크기: CSV {csv_bytes / 1e6:.1f}MB, SQLite {db_bytes / 1e6:.1f}MB (인덱스 2개 포함)")
+        print(f"  {'질의':<20} {'결과':>7} {'CSV(ms)':>9} {'SQLite(ms)':>10} {'배율':>7} {'일치':>4}")
+        queries = run_queries(db, data_dir, args.days, args.repeat)
+        for name, count, csv_ms, sqlite_ms, same in queries:
+            print(f"  {name:<20} {count:>7,} {csv_ms:9.1f} {sqlite_ms:10.2f} {csv_ms / sqlite_ms:6.0f}x "
+                  f"{'예' if same else '아니오':>4}")
+        db.close()
+
+    # 커밋을 묶을수록 쓰기가 적고, 질의 결과가 같고 CSV보다 빨라야 함
+    ok = (writes['sqlite_10scans']['bytes_per_row'] < writes['sqlite_scan']['bytes_per_row']
+          < writes['sqlite_row']['bytes_per_row']
+          and all(same and sqlite_ms < csv_ms for _, _, csv_ms, sqlite_ms, same in queries))
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,565 @@
+"""
+종단 간(end-to-end) 시리얼 성능 벤치마크
+
+펌웨어 시뮬레이터(test/firmware_simulator.py)의 pty에 실제 SerialManager, CommandQueueManager,
+SensorScheduler, 센서 매니저(DSCT/AIRCON/PT02)를 연결하고 헤드리스 Qt 이벤트 루프에서 측정합니다.
+
+측정 항목:
+- command_latency: 명령 큐 추가 → 시뮬레이터 수신(전선 도착)까지 지연, 우선순위별 p50/p95/p99/max
+                   (쓰기 스레드의 write 지연/bytes/s 포함)
+- reload: RELOAD 명령 큐 추가 → *_ACK,RELOAD,COMPLETE 수신까지 시간
+- rx_capacity: 단계별 라인 속도로 [DSCT] 스캔 라인 주입, 손실·지연 없이 처리 가능한 최대 lines/s
+- csv: 센서 매니저 파싱 + CSV 기록 rows/s
+- process: 유휴 CPU%, 구간별 CPU%, RSS
+
+결과는 JSON으로 저장되며 --compare로 이전 결과와 비교할 수 있습니다.
+--cpu-quota를 주면 자신을 자식 프로세스로 다시 실행하여 CPU 1개에 고정하고
+SIGSTOP/SIGCONT 듀티 사이클로 CPU 할당량을 제한합니다 (라즈베리파이 근사, 시뮬레이터 포함).
+
+사용법 (POSIX 전용):
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --compare before.json
+    python benchmarks/run_benchmarks.py --cpu-quota 0.3
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from managers.serial_manager import SerialManager
+from managers.command_queue_manager import CommandQueueManager, CommandPriority
+from managers.sensor_manager import SensorManager
+from managers.air_sensor_manager import AirSensorManager
+from managers.pt02_sensor_manager import PT02SensorManager
+from managers.sensor_scheduler import SensorScheduler
+from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+from utils.csv_cleaner import CSVCleaner
+from utils.log_manager import get_log_manager
+
+# CPU 할당량 모드에서 자식 프로세스 표시용 환경 변수
+_THROTTLED_ENV = "AIRCON_BENCH_THROTTLED"
+
+DEFAULT_RX_RATES = "250,500,1000,2000,4000,8000,16000,32000,64000"
+
+
+# ==================== 공통 도구 ====================
+def _run_until(condition, timeout):
+    """조건이 참이 되거나 시간이 다 될 때까지 Qt 이벤트 루프 실행, 조건 충족 여부 반환"""
+    loop = QEventLoop()
+    deadline = time.monotonic() + timeout
+
+    def check():
+        if condition() or time.monotonic() >= deadline:
+            loop.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check)
+    timer.start(5)
+    check()
+    if time.monotonic() < deadline and not condition():
+        loop.exec_()
+    timer.stop()
+    return condition()
+
+
+def _spin(seconds):
+    """지정 시간 동안 Qt 이벤트 루프 실행"""
+    _run_until(lambda: False, seconds)
+
+
+def _percentiles(values):
+    """지연 목록(ms) 요약"""
+    if not values:
+        return {'count': 0}
+    ordered = sorted(values)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        'count': len(ordered),
+        'p50_ms': round(pick(0.50), 2),
+        'p95_ms': round(pick(0.95), 2),
+        'p99_ms': round(pick(0.99), 2),
+        'max_ms': round(ordered[-1], 2),
+        'mean_ms': round(sum(ordered) / len(ordered), 2),
+    }
+
+
+def _rss_mb():
+    """현재 RSS (MB)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return round(int(line.split()[1]) / 1024.0, 1)
+    except OSError:
+        pass
+    return None
+
+
+class _CpuMeter:
+    """구간 CPU 사용률 측정"""
+
+    def __init__(self):
+        self.cpu = time.process_time()
+        self.wall = time.perf_counter()
+
+    def percent(self):
+        wall = time.perf_counter() - self.wall
+        return round(100.0 * (time.process_time() - self.cpu) / wall, 1) if wall > 0 else 0.0
+
+
+# ==================== 실행 환경 ====================
+class _Harness:
+    """시뮬레이터 + 실제 매니저 스택"""
+
+    def __init__(self, args, data_dir):
+        self.simulator = FirmwareSimulator(SimulatorConfig(
+            latency_ms=args.latency_ms,
+            line_interval_ms=args.line_interval_ms,
+            scan_line_interval_ms=args.scan_interval_ms,
+            pt02_interval_sec=0,
+            sol_delay_sec=1.0,
+            seed=args.seed,
+        ))
+        port = self.simulator.start()
+        SerialManager.register_virtual_port(port, "Benchmark simulator")
+
+        self.serial_manager = SerialManager()
+        self.command_queue = CommandQueueManager(self.serial_manager)
+        self.serial_manager.set_command_queue(self.command_queue)
+        self.command_queue.coalesce_commands = False  # 명령마다 지연을 재므로 병합 끔
+
+        self.sensor_manager = SensorManager(self.serial_manager)
+        self.air_sensor_manager = AirSensorManager(self.serial_manager)
+        self.pt02_sensor_manager = PT02SensorManager()
+        for manager in (self.sensor_manager, self.air_sensor_manager, self.pt02_sensor_manager):
+            # CSV는 임시 디렉터리에 기록
+            manager.data_dir = data_dir
+            manager.csv_cleaner = CSVCleaner(data_dir)
+
+        self.scheduler = SensorScheduler(self.serial_manager)
+        self.scheduler.set_sensor_managers(self.air_sensor_manager, self.sensor_manager)
+
+        if not self.serial_manager.connect_serial(port):
+            raise RuntimeError(f"시뮬레이터 포트 연결 실패: {port}")
+        self.serial_manager.set_sensor_data_callback(self.sensor_manager.parse_sensor_data)
+        self.serial_manager.set_air_sensor_data_callback(self.air_sensor_manager.parse_sensor_data)
+        self.serial_manager.line_router.subscribe("PT02", self.pt02_sensor_manager.parse_pt02_response)
+
+        # 읽기 스레드 시작 대기
+        _spin(0.3)
+
+    def close(self):
+        self.scheduler.stop_scheduling()
+        self.command_queue.process_timer.stop()
+        self.serial_manager.disconnect_serial()
+        SerialManager.unregister_virtual_port(self.simulator.port)
+        self.simulator.stop()
+
+
+# ==================== 시나리오 ====================
+def bench_idle(h, args):
+    """연결 상태 유휴 CPU"""
+    meter = _CpuMeter()
+    _spin(args.idle_seconds)
+    return {'cpu_percent': meter.percent(), 'seconds': args.idle_seconds}
+
+
+def bench_command_latency(h, args):
+    """우선순위별 명령 큐 추가 → 전선 도착 지연 (스케줄러 TH 폴링을 배경 부하로 실행)"""
+    rng = random.Random(args.seed)
+    priorities = [CommandPriority.HIGH, CommandPriority.NORMAL, CommandPriority.LOW]
+    weights = [0.2, 0.5, 0.3]
+
+    enqueued = {}     # 명령 → (우선순위, 추가 시각)
+    arrived = {}      # 명령 → 도착 시각
+
+    def on_command(timestamp, line):
+        if line in enqueued:
+            arrived[line] = timestamp
+
+    h.simulator.command_listener = on_command
+    h.scheduler.cycle_interval = 1.0
+    h.scheduler.start_scheduling()
+
+    meter = _CpuMeter()
+    count = args.commands
+    state = {'index': 0}
+
+    def enqueue_next():
+        i = state['index']
+        if i >= count:
+            return
+        state['index'] = i + 1
+        priority = rng.choices(priorities, weights)[0]
+        # 명령마다 고유한 문자열 (시뮬레이터 설정값 명령)
+        command = f"$CMD,AIR,TEMPSET,{200 + i},20"
+        enqueued[command] = (priority, time.monotonic())
+        h.command_queue.add_command(command, priority)
+        # 큐 처리 타이머와 박자가 맞지 않도록 지수 분포 간격으로 추가 (버튼 입력과 유사)
+        timer.start(int(rng.expovariate(args.cmd_rate) * 1000))
+
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.timeout.connect(enqueue_next)
+    timer.start(0)
+    _run_until(lambda: len(arrived) >= count, count / args.cmd_rate + 15.0)
+    timer.stop()
+
+    h.scheduler.stop_scheduling()
+    h.simulator.command_listener = None
+
+    by_priority = {p.name: [] for p in priorities}
+    for command, (priority, started) in enqueued.items():
+        if command in arrived:
+            by_priority[priority.name].append((arrived[command] - started) * 1000.0)
+
+    result = {name: _percentiles(values) for name, values in by_priority.items()}
+    result['lost'] = len(enqueued) - len(arrived)
+    result['cmd_rate'] = args.cmd_rate
+    result['tx'] = h.serial_manager.get_tx_stats()
+    result['cpu_percent'] = meter.percent()
+    return result
+
+
+def bench_reload(h, args):
+    """RELOAD 명령 큐 추가 → *_ACK,RELOAD,COMPLETE 수신 시간"""
+    router = h.serial_manager.line_router
+    result = {}
+    meter = _CpuMeter()
+
+    for system, route in (("DSCT", "DSCT_ACK,RELOAD"), ("AIR", "AIRCON_ACK,RELOAD")):
+        times = []
+        done = {'flag': False}
+
+        def on_complete(line, done=done):
+            if "COMPLETE" in line:
+                done['flag'] = True
+
+        router.subscribe(route, on_complete)
+        for _ in range(args.reloads):
+            done['flag'] = False
+            started = time.monotonic()
+            h.command_queue.add_command(f"$CMD,{system},RELOAD", CommandPriority.NORMAL)
+            if _run_until(lambda: done['flag'], 10.0):
+                times.append((time.monotonic() - started) * 1000.0)
+        router.unsubscribe(route, on_complete)
+        result[system] = _percentiles(times)
+        result[system]['failed'] = args.reloads - len(times)
+
+    result['cpu_percent'] = meter.percent()
+    return result
+
+
+def _scan_line(i):
+    sensor = (i % 12) + 1
+    return f"[DSCT] ID{sensor:02d},TEMP: {20 + i % 10}.{i % 10},HUMI: {40 + i % 20}.0\r\n"
+
+
+def bench_rx_capacity(h, args):
+    """단계별 속도로 스캔 라인을 주입하여 손실·지연 없이 처리 가능한 최대 lines/s 측정"""
+    received = {'count': 0, 'last': 0.0}
+
+    def on_lines(lines):
+        received['count'] += len(lines)
+        received['last'] = time.monotonic()
+
+    router = h.serial_manager.line_router
+    router.subscribe("[DSCT]", on_lines, batch=True)
+
+    steps = []
+    sustainable = 0
+    for rate in [int(r) for r in args.rx_rates.split(',') if r.strip()]:
+        total = int(rate * args.rx_seconds)
+        received['count'] = 0
+        writer_state = {'end': 0.0}
+
+        def feed(rate=rate, total=total, writer_state=writer_state):
+            # 5ms 단위로 나눠 지정 속도로 쓰기 (pty 버퍼가 차면 쓰기가 블로킹됨 = 역압)
+            chunk = max(1, int(rate * 0.005))
+            start = time.monotonic()
+            sent = 0
+            while sent < total:
+                n = min(chunk, total - sent)
+                h.simulator.write_raw("".join(_scan_line(sent + k) for k in range(n)).encode('ascii'))
+                sent += n
+                delay = start + sent / rate - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            writer_state['end'] = time.monotonic()
+
+        meter = _CpuMeter()
+        started = time.monotonic()
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        _run_until(lambda: received['count'] >= total, args.rx_seconds + 10.0)
+        writer.join(timeout=10.0)
+
+        write_time = writer_state['end'] - started
+        lag = max(0.0, received['last'] - writer_state['end'])
+        achieved = received['count'] / max(1e-6, received['last'] - started)
+        ok = (received['count'] >= total and
+              write_time <= args.rx_seconds * 1.1 and
+              lag <= args.max_lag)
+        steps.append({
+            'offered_lines_per_s': rate,
+            'achieved_lines_per_s': round(achieved, 1),
+            'lines_lost': total - received['count'],
+            'drain_lag_ms': round(lag * 1000.0, 1),
+            'cpu_percent': meter.percent(),
+            'sustained': ok,
+        })
+        if not ok:
+            break
+        sustainable = rate
+
+    router.unsubscribe("[DSCT]", on_lines, batch=True)
+    return {'max_sustainable_lines_per_s': sustainable, 'steps': steps}
+
+
+def bench_csv(h, args):
+    """센서 매니저 파싱 + CSV 기록 rows/s (이벤트 루프 없이 직접 호출)"""
+    count = args.csv_rows
+    result = {}
+
+    lines = [_scan_line(i).strip() for i in range(count)]
+    started = time.perf_counter()
+    for line in lines:
+        h.sensor_manager.parse_sensor_data(line)
+    result['dsct_rows_per_s'] = round(count / (time.perf_counter() - started), 1)
+
+    lines = [f"PT02 {600 + i % 300},{i % 40},{20 + i % 10}.5,{40 + i % 20}.0" for i in range(count)]
+    started = time.perf_counter()
+    for line in lines:
+        h.pt02_sensor_manager.parse_pt02_response(line)
+    result['pt02_rows_per_s'] = round(count / (time.perf_counter() - started), 1)
+    result['rows'] = count
+    return result
+
+
+SCENARIOS = {
+    'idle': bench_idle,
+    'command_latency': bench_command_latency,
+    'reload': bench_reload,
+    'rx_capacity': bench_rx_capacity,
+    'csv': bench_csv,
+}
+
+
+# ==================== 결과 저장/비교 ====================
+def _metadata(args):
+    version = None
+    try:
+        with open(os.path.join(REPO_ROOT, 'CHANGELOG.md'), encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('## v'):
+                    version = line.split()[1]
+                    break
+    except OSError:
+        pass
+
+    commit = None
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except Exception:
+        pass
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'version': version,
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'cpu_quota': args.cpu_quota,
+        'settings': {k: v for k, v in vars(args).items() if k not in ('output', 'compare')},
+    }
+
+
+def _flatten(data, prefix=''):
+    """중첩 결과를 'a.b.c' → 숫자 형태로 평탄화 (비교용)"""
+    flat = {}
+    if isinstance(data, dict):
+        for key, value in data.items():
+            flat.update(_flatten(value, f"{prefix}{key}."))
+    elif isinstance(data, list):
+        for i, value in enumerate(data):
+            flat.update(_flatten(value, f"{prefix}{i}."))
+    elif isinstance(data, (int, float)) and not isinstance(data, bool):
+        flat[prefix[:-1]] = data
+    return flat
+
+
+def _compare(previous, current):
+    """이전 결과 대비 변화가 5% 이상인 항목 출력"""
+    before = _flatten(previous.get('results', {}))
+    after = _flatten(current.get('results', {}))
+    meta = previous.get('meta', {})
+    print(f"\n이전 결과와 비교 ({meta.get('version')} {meta.get('commit')} {meta.get('timestamp')})")
+    print(f"{'metric':<48} {'before':>12} {'after':>12} {'change':>9}")
+    for key in sorted(set(before) & set(after)):
+        old, new = before[key], after[key]
+        if old == new:
+            continue
+        change = (new - old) / abs(old) * 100.0 if old else float('inf')
+        if abs(change) >= 5.0:
+            print(f"{key:<48} {old:>12} {new:>12} {change:>+8.1f}%")
+
+
+def _print_summary(results):
+    print("\n=== 결과 요약 ===")
+    if 'idle' in results:
+        print(f"유휴 CPU: {results['idle']['cpu_percent']}%")
+    if 'command_latency' in results:
+        r = results['command_latency']
+        for name in ('HIGH', 'NORMAL', 'LOW'):
+            s = r.get(name, {})
+            if s.get('count'):
+                print(f"명령 지연 {name:<6}: p50 {s['p50_ms']}ms, p95 {s['p95_ms']}ms, max {s['max_ms']}ms ({s['count']}개)")
+        print(f"명령 손실: {r['lost']}개")
+    if 'reload' in results:
+        for system in ('DSCT', 'AIR'):
+            s = results['reload'].get(system, {})
+            if s.get('count'):
+                print(f"RELOAD {system}: 평균 {s['mean_ms']}ms, 최대 {s['max_ms']}ms (실패 {s['failed']}회)")
+    if 'rx_capacity' in results:
+        r = results['rx_capacity']
+        print(f"최대 지속 수신: {r['max_sustainable_lines_per_s']} lines/s")
+        for step in r['steps']:
+            print(f"  {step['offered_lines_per_s']:>6} → {step['achieved_lines_per_s']:>9} lines/s, "
+                  f"지연 {step['drain_lag_ms']}ms, CPU {step['cpu_percent']}%"
+                  f"{'' if step['sustained'] else '  (한계)'}")
+    if 'csv' in results:
+        r = results['csv']
+        print(f"CSV: DSCT {r['dsct_rows_per_s']} rows/s, PT02 {r['pt02_rows_per_s']} rows/s")
+    if 'process' in results:
+        r = results['process']
+        print(f"RSS: {r['rss_mb']}MB (최대 {r['max_rss_mb']}MB), 전체 CPU {r['cpu_percent']}%")
+
+
+# ==================== CPU 할당량 모드 ====================
+def _run_throttled(quota, period_ms):
+    """자신을 CPU 1개에 고정된 자식 프로세스로 실행하고 듀티 사이클로 CPU 할당량 제한"""
+    env = dict(os.environ, **{_THROTTLED_ENV: "1"})
+
+    def pin_cpu():
+        if hasattr(os, 'sched_setaffinity'):
+            cpus = sorted(os.sched_getaffinity(0))
+            os.sched_setaffinity(0, {cpus[0]})
+
+    child = subprocess.Popen([sys.executable] + sys.argv, env=env, preexec_fn=pin_cpu)
+    run_time = period_ms / 1000.0 * quota
+    stop_time = period_ms / 1000.0 * (1.0 - quota)
+    try:
+        while child.poll() is None:
+            time.sleep(run_time)
+            if child.poll() is not None:
+                break
+            os.kill(child.pid, signal.SIGSTOP)
+            time.sleep(stop_time)
+            os.kill(child.pid, signal.SIGCONT)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if child.poll() is None:
+            os.kill(child.pid, signal.SIGCONT)
+            child.wait()
+    return child.returncode
+
+
+def main():
+    parser = argparse.ArgumentParser(description='종단 간 시리얼 성능 벤치마크')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='실행할 시나리오 (쉼표 구분)')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본값: benchmarks/results/e2e_<시각>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    parser.add_argument('--cpu-quota', type=float, default=None,
+                        help='CPU 할당량 (0~1, 예: 0.3 = CPU 1개의 30%%, 라즈베리파이 근사)')
+    parser.add_argument('--quota-period-ms', type=float, default=20.0, help='할당량 듀티 사이클 주기')
+    parser.add_argument('--seed', type=int, default=1, help='난수 시드')
+    parser.add_argument('--latency-ms', type=float, default=5.0, help='시뮬레이터 응답 지연')
+    parser.add_argument('--line-interval-ms', type=float, default=2.0, help='시뮬레이터 응답 라인 간격')
+    parser.add_argument('--scan-interval-ms', type=float, default=10.0, help='시뮬레이터 스캔 라인 간격')
+    parser.add_argument('--idle-seconds', type=float, default=3.0, help='유휴 CPU 측정 시간')
+    parser.add_argument('--commands', type=int, default=100, help='지연 측정 명령 수')
+    parser.add_argument('--cmd-rate', type=float, default=10.0, help='명령 추가 속도 (개/s)')
+    parser.add_argument('--reloads', type=int, default=5, help='RELOAD 반복 횟수')
+    parser.add_argument('--rx-rates', default=DEFAULT_RX_RATES, help='수신 부하 단계 (lines/s, 쉼표 구분)')
+    parser.add_argument('--rx-seconds', type=float, default=2.0, help='단계별 주입 시간')
+    parser.add_argument('--max-lag', type=float, default=0.5, help='지속 가능 판정 최대 처리 지연 (초)')
+    parser.add_argument('--csv-rows', type=int, default=2000, help='CSV 측정 행 수')
+    args = parser.parse_args()
+
+    if os.name != 'posix':
+        print("pty가 필요하므로 POSIX 환경에서만 실행할 수 있습니다.")
+        return 1
+
+    if args.cpu_quota and not os.environ.get(_THROTTLED_ENV):
+        quota = max(0.05, min(1.0, args.cpu_quota))
+        print(f"CPU 할당량 모드: CPU 1개의 {quota * 100:.0f}% (주기 {args.quota_period_ms:.0f}ms)")
+        return _run_throttled(quota, args.quota_period_ms)
+
+    # 측정 중 로그 출력이 결과에 섞이지 않도록 경고 이상만 출력
+    get_log_manager().configure({"level": "WARNING"})
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    results = {}
+    total = _CpuMeter()
+    with tempfile.TemporaryDirectory(prefix='aircon_bench_') as data_dir:
+        harness = _Harness(args, data_dir)
+        try:
+            for name in [s.strip() for s in args.scenarios.split(',') if s.strip()]:
+                scenario = SCENARIOS.get(name)
+                if not scenario:
+                    print(f"알 수 없는 시나리오: {name}")
+                    continue
+                print(f"[{name}] 실행 중...", flush=True)
+                results[name] = scenario(harness, args)
+        finally:
+            harness.close()
+
+    results['process'] = {
+        'cpu_percent': total.percent(),
+        'rss_mb': _rss_mb(),
+        'max_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1),
+    }
+    report = {'meta': _metadata(args), 'results': results}
+
+    _print_summary(results)
+
+    output = args.output
+    if not output:
+        os.makedirs(os.path.join(REPO_ROOT, 'benchmarks', 'results'), exist_ok=True)
+        output = os.path.join(REPO_ROOT, 'benchmarks', 'results',
+                              f"e2e_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            _compare(json.load(f), report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
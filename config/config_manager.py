@@ -38,6 +38,85 @@ class ConfigManager:
                 "enabled": True,
                 "max_files_per_type": 20  # 각 타입(DSCT, AIRCON)당 최대 20개 파일
             },
+            "csv_logging": {
+                "flush_interval_sec": 5,  # 모아 둔 센서 행을 파일에 기록하는 최대 지연 (0이면 행마다 기록)
+                "flush_rows": 50,         # 이만큼 쌓이면 바로 기록
+                "max_file_mb": 10,        # 이 크기 이상이면 다음 분할 파일 (_001, _002 ...)
+                "layout": "long",         # DSCT/AIRCON 행 형식 - long: 센서마다 1행, wide: 스캔마다 1행 ({prefix}_WIDE_*.csv)
+                "binary_store": "off"     # 바이너리 이력 ({prefix}_YYYY-MM-DD.bin) - off, alongside: CSV와 함께, only: CSV 대신
+            },
+            "storage": {
+                "backends": [],               # 추가 저장 백엔드 (예: ["sqlite"]) - utils/sensor_storage.py
+                "csv_files": True,            # false면 CSV 파일 기록 안 함 (다른 백엔드만 사용)
+                "sqlite_file": "sensor_history.db",  # data 폴더 안 SQLite DB 파일
+                "sqlite_checkpoint_sec": 60,  # WAL 체크포인트 주기 (별도 스레드, 0이면 SQLite 자동 체크포인트)
+                "sqlite_scans_per_commit": 1,  # 스캔 몇 번마다 커밋할지 (늘리면 쓰기 증폭 감소, 최대 지연은 flush_interval_sec)
+                "sqlite_max_pending_rows": 500  # 커밋 전이라도 이만큼 쌓이면 커밋
+            },
+            "history_buffer": {
+                "enabled": True,              # 센서 매니저 최근 이력 메모리 버퍼 (utils/sensor_history.py)
+                "max_memory_mb": 4            # 스트림(DSCT/AIRCON/PT02)마다 버퍼 크기 상한 (MB)
+            },
+            "serial": {
+                "reader_mode": "select",  # select: 수신 시에만 깨어나 일괄 읽기, poll: 10ms 폴링
+                "batch_window_ms": 10,    # 수신 라인 묶음 전송 대기 시간
+                "batch_max_lines": 64,    # 묶음당 최대 라인 수
+                "tx_queue_max": 256,      # 송신 큐 최대 길이 (쓰기 스레드)
+                "auto_reconnect": True,   # 예기치 않은 끊김 시 같은 포트로 자동 재연결
+                "reconnect_initial_ms": 500,  # 첫 재연결 대기 (실패할 때마다 두 배)
+                "reconnect_max_ms": 10000,    # 재연결 대기 상한
+                "ack_tracking": True,     # ACK/NAK로 명령 성공 판정 (끄면 쓰기 성공 = 성공)
+                "inflight_window": 4,     # ACK를 기다리며 연속 전송할 수 있는 명령 수
+                "ack_timeout_ms": 1000,   # 명령별 응답 대기 시간 (초과 시 재시도, RELOAD는 리로드 타임아웃 15초)
+                "adaptive_pacing": True,  # 응답 속도/NAK/타임아웃으로 AIR·DSCT 송신 간격 자동 조절 (ACK 추적 시)
+                "pacing_initial_ms": 200,  # 시작 송신 간격 (펌웨어 최소 명령 간격)
+                "pacing_step_ms": 5,      # 정상 ACK마다 줄이는 간격
+                "pacing_backoff": 2.0,    # NAK/타임아웃/느린 ACK 시 간격 배수
+                "pacing_slow_rtt_ms": 300,  # 이보다 느린 ACK는 과부하로 판단
+                "pacing_limits_ms": {     # 계열별 송신 간격 [하한, 상한] (하한은 200ms 이상 - 펌웨어 최소 명령 간격)
+                    "AIR": [200, 1000],
+                    "DSCT": [200, 1000]
+                },
+                "coalesce_commands": True,  # 전송 전인 같은 장치/기능 명령은 마지막 값만 전송
+                "queue_metrics_window_sec": 60,  # 명령 큐 지연 히스토그램(p50/p95/p99) 집계 구간
+                "queue_capacity": {       # 우선순위별 최대 대기 명령 수 (0이면 무제한)
+                    "HIGH": 50,
+                    "NORMAL": 100,
+                    "LOW": 20
+                },
+                "queue_overflow": {       # 가득 찼을 때: drop_oldest(오래된 명령 삭제) / reject_new(새 명령 거부)
+                    "HIGH": "reject_new",
+                    "NORMAL": "reject_new",
+                    "LOW": "drop_oldest"
+                },
+                "command_ttl_sec": {      # 이 시간이 지나도록 못 보낸 명령은 버림 (0이면 만료 없음)
+                    "HIGH": 0,
+                    "NORMAL": 0,
+                    "LOW": 10
+                },
+                "queue_scheduling": "priority",  # priority(우선순위 순) / edf(HIGH 다음 마감 시각 순, LOW가 굶지 않음)
+                "command_deadline_ms": {  # 우선순위별 마감 여유 (추가 → 첫 전송)
+                    "HIGH": 50,
+                    "NORMAL": 300,
+                    "LOW": 2000
+                },
+                "origin_deadline_ms": {}  # 출처별 마감 여유 (예: {"sensor": 1500}, 우선순위별 값보다 우선)
+            },
+            "units": {},  # 여러 장비 동시 연결 (예: {"unit1": {"port": "/dev/ttyUSB0", "baudrate": 115200}})
+            "logging": {
+                "level": "INFO",              # 기본 로그 레벨 (DEBUG, INFO, WARNING, ERROR, OFF)
+                "categories": {},             # 카테고리별 레벨 (예: {"RX": "WARNING"})
+                "rate_limits": {              # 카테고리별 초당 최대 출력 라인 수 (초과분은 요약)
+                    "RX": 20,
+                    "TX": 20,
+                    "DSCT": 20,
+                    "AIRCON": 20,
+                    "RELOAD": 50
+                },
+                "summary_interval_sec": 10,   # 생략 요약 출력 주기
+                "flush_interval_sec": 0.2,    # 싱크 스레드 출력 주기
+                "buffer_size": 8192           # 링 버퍼 크기 (레코드 수)
+            },
             "last_updated": None
         }
         
@@ -160,6 +239,22 @@ class ConfigManager:
         """모든 센서의 새로고침 간격 반환"""
         return self.settings["refresh_intervals"].copy()
         
+    def get_section(self, section: str) -> Dict[str, Any]:
+        """
+        설정 섹션 반환 (기본값 위에 저장된 값을 덮어쓴 복사본)
+
+        Args:
+            section: 섹션 이름 (예: 'serial')
+
+        Returns:
+            섹션 설정 딕셔너리
+        """
+        merged = dict(self.default_settings.get(section, {}))
+        loaded = self.settings.get(section)
+        if isinstance(loaded, dict):
+            merged.update(loaded)
+        return merged
+
     def get_last_updated(self) -> Optional[str]:
         """마지막 업데이트 시간 반환"""
         return self.settings.get("last_updated")
@@ -0,0 +1,235 @@
+"""
+헤드리스(화면 없는) 실행 모드
+
+위젯 없이 QCoreApplication 이벤트 루프에서 시리얼 I/O, 명령 큐, 센서 스케줄링, 센서/PT02 CSV 기록만 수행합니다.
+X 서버나 위젯 트리가 필요 없으므로 기록 전용 노드(라즈베리파이 등)에서 빠르게 시작하고 메모리를 적게 씁니다.
+PyQt5.QtWidgets와 ui 위젯 모듈은 가져오지 않습니다.
+
+포트 선택 순서:
+1. --port (여러 번 지정 가능, 장비 ID는 unit1, unit2, ...)
+2. 설정 파일의 units 섹션
+3. --simulator로 실행한 펌웨어 시뮬레이터
+4. 처음 발견되는 USB 시리얼 포트 (없으면 장치가 연결될 때까지 대기)
+
+포트가 1개면 CSV는 GUI와 같은 data 폴더에, --port 여러 개나 units 섹션이면 data/<장비 ID>/에 저장됩니다.
+
+--async-core를 지정하면 Qt 이벤트 루프 대신 asyncio 코어(managers/async_core.py)로 실행합니다.
+(읽기/쓰기 스레드와 주기 타이머 없이 이벤트 루프 하나, 센서 매니저/CSV는 동일)
+
+사용법:
+    python main.py --headless [--port /dev/ttyUSB0] [--cycle 30] [--status-interval 60]
+    python main.py --headless --simulator --duration 60
+    python main.py --headless --async-core --port /dev/ttyUSB0
+"""
+
+import asyncio
+import os
+import signal
+import sys
+import time
+from typing import List, Optional
+
+from PyQt5.QtCore import QCoreApplication, QObject, QTimer
+
+from config.config_manager import get_config_manager
+from managers.connection_registry import ConnectionRegistry, DEFAULT_DATA_ROOT
+from managers.port_watcher import get_port_watcher, is_usb_serial
+from utils.log_manager import get_logger
+
+logger = get_logger("HEADLESS")
+
+
+class HeadlessNode(QObject):
+    """위젯 없이 매니저 스택만 실행하는 노드"""
+
+    RETRY_INTERVAL_MS = 5000    # 연결 실패 장비 재시도 주기 (자동 재연결 대기 중인 장비 제외)
+
+    def __init__(self, ports: Optional[List[str]] = None, baudrate: int = 115200,
+                 test_mode: bool = False, scheduling: bool = True,
+                 cycle_interval: Optional[float] = None, status_interval: float = 60.0):
+        super().__init__()
+        self.ports = list(ports or [])
+        self.baudrate = baudrate
+        self.scheduling = scheduling
+        self.cycle_interval = cycle_interval
+        self.status_interval = status_interval
+
+        self.registry = ConnectionRegistry(test_mode=test_mode)
+
+        self._retry_timer = QTimer(self)
+        self._retry_timer.timeout.connect(self._retry_connections)
+        self._status_timer = QTimer(self)
+        self._status_timer.timeout.connect(self.log_status)
+        self._waiting_for_port = False
+
+    def start(self):
+        """장비 등록 및 연결"""
+        started = time.perf_counter()
+        if self.ports:
+            for n, port in enumerate(self.ports):
+                self._add_unit(f"unit{n + 1}", port)
+        elif not self.registry.load_from_config():
+            port = self._first_usb_port()
+            if port:
+                self._add_unit("unit1", port)
+            else:
+                # 장치가 연결되면 그 포트로 시작
+                self._waiting_for_port = True
+                get_port_watcher().ports_changed.connect(self._on_ports_changed)
+                logger.info("연결 가능한 USB 포트 없음, 장치 연결 대기")
+
+        for unit_id in self.registry.unit_ids():
+            self._connect_unit(unit_id)
+
+        self._retry_timer.start(self.RETRY_INTERVAL_MS)
+        if self.status_interval > 0:
+            self._status_timer.start(int(self.status_interval * 1000))
+        logger.info("헤드리스 노드 시작 (장비 %s대, %.0fms)", len(self.registry), (time.perf_counter() - started) * 1000)
+
+    def stop(self):
+        """모든 장비 연결 해제"""
+        self._retry_timer.stop()
+        self._status_timer.stop()
+        self.registry.close()
+        logger.info("헤드리스 노드 종료")
+
+    def log_status(self):
+        """장비별 상태 로그"""
+        for unit_id, status in self.registry.get_status().items():
+            unit = self.registry.get_unit(unit_id)
+            pt02 = unit.pt02_sensor_manager.get_sensor_data()
+            queue = status['queue']
+            logger.info("[%s] %s, 스케줄러 %s, 큐 %s건 (전송 %s/실패 %s), PT02 CO2=%s PM2.5=%s 온도=%s",
+                        unit_id,
+                        "연결됨" if status['connected'] else ("재연결 대기" if status['reconnecting'] else "끊김"),
+                        status['scheduler'],
+                        queue['high_queue_size'] + queue['normal_queue_size'] + queue['low_queue_size'],
+                        queue['total_sent'], queue['total_failed'],
+                        pt02['co2'], pt02['pm25'], pt02['temp'])
+
+    def _add_unit(self, unit_id: str, port: str):
+        # 장비 1대는 GUI와 같은 data 폴더 사용
+        data_dir = DEFAULT_DATA_ROOT if len(self.ports) <= 1 else None
+        unit = self.registry.add_unit(unit_id, port, self.baudrate, data_dir=data_dir)
+        if self.cycle_interval:
+            unit.scheduler.set_cycle_interval(self.cycle_interval)
+
+    def _connect_unit(self, unit_id: str) -> bool:
+        connected = self.registry.connect_unit(unit_id, start_scheduler=self.scheduling)
+        if not connected:
+            logger.warning("[%s] 연결 실패, %s초마다 재시도", unit_id, self.RETRY_INTERVAL_MS // 1000)
+        return connected
+
+    def _retry_connections(self):
+        for unit_id in self.registry.unit_ids():
+            unit = self.registry.get_unit(unit_id)
+            if not unit.is_connected() and not unit.serial_manager.is_reconnecting():
+                self._connect_unit(unit_id)
+
+    @staticmethod
+    def _first_usb_port() -> Optional[str]:
+        ports = [port["device"] for port in get_port_watcher().get_ports() if is_usb_serial(port["device"])]
+        return ports[0] if ports else None
+
+    def _on_ports_changed(self, _ports):
+        if not self._waiting_for_port:
+            return
+        port = self._first_usb_port()
+        if port:
+            self._waiting_for_port = False
+            self._add_unit("unit1", port)
+            self._connect_unit("unit1")
+
+
+def run_headless(args, default_port: Optional[str] = None) -> int:
+    """
+    헤드리스 모드 실행 (main.py --headless)
+
+    Args:
+        args: main.py 명령행 인자
+        default_port: --port가 없을 때 사용할 포트 (시뮬레이터)
+    """
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+    ports = args.port or ([default_port] if default_port else [])
+    cycle = args.cycle or get_config_manager().load_refresh_interval("dsct_sensor")
+    node = HeadlessNode(ports=ports, baudrate=args.baudrate, test_mode=args.test,
+                        scheduling=not args.no_scheduler, cycle_interval=cycle,
+                        status_interval=args.status_interval)
+
+    # SIGINT/SIGTERM으로 정상 종료 (파이썬 시그널 처리를 위해 이벤트 루프를 주기적으로 깨움)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: app.quit())
+    wakeup = QTimer()
+    wakeup.timeout.connect(lambda: None)
+    wakeup.start(250)
+
+    node.start()
+    if args.duration is not None:
+        QTimer.singleShot(int(args.duration * 1000), app.quit)
+    exit_code = app.exec_()
+    node.stop()
+    return exit_code
+
+
+def run_headless_async(args, default_port: Optional[str] = None) -> int:
+    """
+    asyncio 코어로 헤드리스 실행 (main.py --headless --async-core)
+
+    Args:
+        args: main.py 명령행 인자
+        default_port: --port가 없을 때 사용할 포트 (시뮬레이터)
+    """
+    from managers.async_core import AsyncUnit
+
+    cycle = args.cycle or get_config_manager().load_refresh_interval("dsct_sensor")
+
+    def make_units(ports) -> List[AsyncUnit]:
+        multi = len(ports) > 1
+        return [AsyncUnit(port, args.baudrate, unit_id=f"unit{n + 1}" if multi else None,
+                          data_dir=os.path.join(DEFAULT_DATA_ROOT, f"unit{n + 1}") if multi else None,
+                          cycle_interval=cycle, scheduling=not args.no_scheduler)
+                for n, port in enumerate(ports)]
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        if args.duration is not None:
+            loop.call_later(args.duration, stop.set)
+
+        ports = args.port or ([default_port] if default_port else [])
+        while not ports:
+            port = HeadlessNode._first_usb_port()
+            if port:
+                ports = [port]
+                break
+            logger.info("연결 가능한 USB 포트 없음, %s초 후 다시 확인", HeadlessNode.RETRY_INTERVAL_MS // 1000)
+            try:
+                await asyncio.wait_for(stop.wait(), HeadlessNode.RETRY_INTERVAL_MS / 1000.0)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+        units = make_units(ports)
+        tasks = [asyncio.ensure_future(unit.run()) for unit in units]
+        logger.info("헤드리스 노드 시작 (asyncio 코어, 장비 %s대)", len(units))
+
+        while not stop.is_set() and not all(task.done() for task in tasks):
+            try:
+                await asyncio.wait_for(stop.wait(), args.status_interval if args.status_interval > 0 else None)
+            except asyncio.TimeoutError:
+                for unit in units:
+                    status = unit.get_status()
+                    logger.info("[%s] %s, 스케줄러 %s, 전송 %s, 수신 %s라인", unit.unit_id or status['port'],
+                                "연결됨" if status['connected'] else "재연결 대기", status['scheduler'],
+                                status['queue']['total_sent'], status['transport']['rx_lines'])
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("헤드리스 노드 종료")
+
+    asyncio.run(main())
+    return 0
@@ -1,27 +1,78 @@
 import sys
 import argparse
-from PyQt5 import QtCore, QtWidgets
-from PyQt5.QtCore import Qt
-from ui.main_window import ControlWindow  # main_window.py 파일을 사용
 
 if __name__ == '__main__':
     # 명령행 인자 파서 설정
     parser = argparse.ArgumentParser(description='Aircon Remote Control')
     parser.add_argument('--test', action='store_true', 
                        help='테스트 모드로 실행 (가상 센서 데이터 사용)')
+    parser.add_argument('--simulator', action='store_true',
+                       help='펌웨어 시뮬레이터(pty)를 함께 실행하고 포트 목록에 추가')
+    parser.add_argument('--virtual-port', metavar='PATH',
+                       help='외부에서 실행한 시뮬레이터 pty 경로를 포트 목록에 추가')
+
+    # 헤드리스 모드 (위젯 없이 시리얼/스케줄러/CSV 기록만 실행)
+    headless_group = parser.add_argument_group('헤드리스 모드')
+    headless_group.add_argument('--headless', action='store_true',
+                       help='화면 없이 매니저만 실행 (X 서버 불필요)')
+    headless_group.add_argument('--port', action='append', metavar='PATH',
+                       help='연결할 포트 (여러 번 지정 시 장비 여러 대)')
+    headless_group.add_argument('--baudrate', type=int, default=115200,
+                       help='보레이트 (기본값: 115200)')
+    headless_group.add_argument('--cycle', type=float, default=None,
+                       help='센서 스케줄링 주기 (초, 기본값: 설정 파일 refresh_intervals.dsct_sensor)')
+    headless_group.add_argument('--no-scheduler', action='store_true',
+                       help='센서 스케줄링 없이 수신 기록만 수행')
+    headless_group.add_argument('--status-interval', type=float, default=60.0,
+                       help='상태 로그 주기 (초, 0=끔)')
+    headless_group.add_argument('--duration', type=float, default=None,
+                       help='지정 시간(초) 후 종료 (기본값: 종료 신호까지 실행)')
+    headless_group.add_argument('--async-core', action='store_true',
+                       help='Qt 이벤트 루프 대신 asyncio 코어로 실행 (스레드/주기 타이머 없음)')
     args = parser.parse_args()
-    # 고해상도 디스플레이 지원
-    if hasattr(Qt, 'AA_EnableHighDpiScaling'):
-        QtWidgets.QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
-        QtWidgets.QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-
-    QtWidgets.QApplication.setStyle("Fusion")  # 라즈베리파이 스타일 고정
-
-    app = QtWidgets.QApplication(sys.argv)
-    myWindow = ControlWindow(test_mode=args.test)
-    myWindow.setWindowTitle('Aircon Remote control')
-    if args.test:
-        myWindow.setWindowTitle('Aircon Remote control [TEST MODE]')
-    myWindow.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+
+    simulator = None
+    simulator_port = None
+    if args.simulator or args.virtual_port:
+        from managers.serial_manager import SerialManager
+        if args.simulator:
+            from test.firmware_simulator import FirmwareSimulator, SimulatorConfig
+            simulator = FirmwareSimulator(SimulatorConfig(pt02_interval_sec=5.0))
+            simulator_port = simulator.start()
+            SerialManager.register_virtual_port(simulator_port, "Firmware simulator")
+        if args.virtual_port:
+            SerialManager.register_virtual_port(args.virtual_port, "Virtual serial port")
+            simulator_port = simulator_port or args.virtual_port
+
+    if args.headless:
+        # 위젯 모듈을 가져오지 않는 경로
+        if args.async_core:
+            from headless import run_headless_async
+            exit_code = run_headless_async(args, default_port=simulator_port)
+        else:
+            from headless import run_headless
+            exit_code = run_headless(args, default_port=simulator_port)
+    else:
+        from PyQt5 import QtWidgets
+        from PyQt5.QtCore import Qt
+        from ui.main_window import ControlWindow  # main_window.py 파일을 사용
+
+        # 고해상도 디스플레이 지원
+        if hasattr(Qt, 'AA_EnableHighDpiScaling'):
+            QtWidgets.QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+        if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
+            QtWidgets.QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+
+        QtWidgets.QApplication.setStyle("Fusion")  # 라즈베리파이 스타일 고정
+
+        app = QtWidgets.QApplication(sys.argv)
+        myWindow = ControlWindow(test_mode=args.test)
+        myWindow.setWindowTitle('Aircon Remote control')
+        if args.test:
+            myWindow.setWindowTitle('Aircon Remote control [TEST MODE]')
+        myWindow.show()
+        exit_code = app.exec_()
+
+    if simulator:
+        simulator.stop()
+    sys.exit(exit_code)
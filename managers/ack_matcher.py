@@ -0,0 +1,199 @@
+"""
+명령 ACK/NAK 대응 (송신한 명령과 펌웨어 응답 라인 연결)
+
+명령마다 기대 응답 키(시스템, 기능)를 정하고, 응답이 오면 같은 키로 먼저 보낸 명령부터 완료 처리합니다.
+펌웨어는 명령을 받은 순서대로 처리하므로 같은 키의 명령이 여러 개 떠 있어도 FIFO로 대응됩니다.
+
+응답 규칙 (문서화된 형식만 추적 - MESSAGE.md, ref/aircon_dsct_cmd.txt):
+    $CMD,DSCT,FAN1~4,ON/OFF/SPD → DSCT_ACK,FAN1,...     / DSCT_NAK,FAN1,...
+    $CMD,DSCT,SOL1~4,ON/OFF    → DSCT,SOL,All Opening! (밸브 동작 완료 라인은 나중에 따로 옴)
+    $CMD,DSCT,RELOAD           → DSCT_ACK,RELOAD,COMPLETE (상태 라인 전체 뒤, 긴 타임아웃)
+    $CMD,AIR,RELOAD            → AIRCON_ACK,RELOAD,COMPLETE
+    그 밖의 명령               → 추적 안 함 (응답 형식이 문서에 없음 - 형식이 다르면 매번 타임아웃 후 재전송되어
+                                 ALTDMP,OPEN,1 같은 상대 이동 명령이 두 번 적용됨, 쓰기 성공으로 완료)
+                                 예: DSCT DMPn_OPEN/CLOSE, PUMPn, SEMIAUTO, DMPTEST, AIR 설정 명령
+    $CMD,*,TH / $CMD,AIR,GETSET → 추적 안 함 (응답은 센서 매니저/스케줄러가 처리)
+
+사용 예:
+    matcher = AckMatcher(timeout=1.0)
+    if matcher.track(cmd):      # 송신 직후
+        ...
+    result = matcher.on_line("DSCT_ACK,FAN1,ON,OK")   # (cmd, True, rtt) 또는 None
+    expired = matcher.expire()                          # 타임아웃된 명령 목록
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# 응답 라인 선두 토큰 → (시스템, ACK 여부)
+_RESPONSE_HEADS = {
+    'DSCT_ACK': ('DSCT', True),
+    'DSCT_NAK': ('DSCT', False),
+    'AIRCON_ACK': ('AIR', True),
+    'AIRCON_NAK': ('AIR', False),
+}
+
+# 응답 라인을 받기 위한 LineRouter 경로 키
+RESPONSE_ROUTES = tuple(_RESPONSE_HEADS) + ("DSCT,SOL",)
+
+# 시스템별 추적하는 기능 (응답 형식이 문서화된 것만 - 나머지는 응답이 없어도 재전송하지 않음)
+_TRACKED_FUNCTIONS = {
+    'DSCT': {'FAN1', 'FAN2', 'FAN3', 'FAN4', 'SOL1', 'SOL2', 'SOL3', 'SOL4', 'RELOAD'},
+    'AIR': {'RELOAD'},
+}
+
+# 기본값보다 오래 걸리는 응답 (초)
+LONG_RESPONSE_TIMEOUTS = {'RELOAD': 10.0}
+
+
+def response_key(command: str) -> Optional[Tuple[str, str]]:
+    """명령의 기대 응답 키 (시스템, 기능), ACK를 추적하지 않는 명령이면 None"""
+    parts = command.split(',')
+    if len(parts) < 3 or parts[0].strip() != '$CMD':
+        return None
+    system, function = parts[1].strip(), parts[2].strip()
+    if function not in _TRACKED_FUNCTIONS.get(system, ()):
+        return None
+    if system == 'DSCT' and function.startswith('SOL'):
+        return ('DSCT', 'SOL')
+    return (system, function)
+
+
+def parse_response(line: str) -> Optional[Tuple[Tuple[str, str], bool]]:
+    """응답 라인을 (응답 키, ACK 여부)로 분류, 명령 응답이 아니면 None"""
+    fields = line.split(',', 2)
+    if len(fields) < 3:
+        return None
+    head, function = fields[0], fields[1].strip()
+    known = _RESPONSE_HEADS.get(head)
+    if known:
+        return (known[0], function), known[1]
+    if head == 'DSCT' and function == 'SOL':
+        return ('DSCT', 'SOL'), True
+    return None
+
+
+class AckMatcher:
+    """응답 대기 중인 명령 관리"""
+
+    def __init__(self, timeout: float = 1.0):
+        self.timeout = timeout
+        # 응답 키 → [(명령, 송신 시각, 만료 시각), ...] (송신 순서)
+        self._pending: Dict[Tuple[str, str], Deque[Tuple[Any, float, float]]] = {}
+        self._count = 0
+
+        # 통계
+        self.total_acked = 0
+        self.total_naks = 0
+        self.total_timeouts = 0
+        self.total_unmatched = 0
+        self.last_rtt_ms = 0.0
+
+    def track(self, command: Any, now: Optional[float] = None) -> bool:
+        """
+        송신한 명령을 응답 대기 목록에 추가
+
+        Args:
+            command: .command 속성(명령 문자열)이 있는 객체 (Command, .ack_timeout이 있으면 그 시간만큼 대기)
+
+        Returns:
+            추적 여부 (ACK를 기대하지 않는 명령이면 False)
+        """
+        key = response_key(command.command)
+        if key is None:
+            return False
+        now = time.monotonic() if now is None else now
+        timeout = getattr(command, 'ack_timeout', None)
+        if timeout is None:
+            timeout = LONG_RESPONSE_TIMEOUTS.get(key[1], self.timeout)
+        self._pending.setdefault(key, deque()).append((command, now, now + timeout))
+        self._count += 1
+        return True
+
+    def on_line(self, line: str, now: Optional[float] = None) -> Optional[Tuple[Any, bool, float]]:
+        """
+        응답 라인 처리
+
+        Returns:
+            (명령, ACK 여부, 왕복 시간 ms) - 대기 중인 명령과 대응되지 않으면 None
+        """
+        parsed = parse_response(line)
+        if parsed is None:
+            return None
+        key, acked = parsed
+        waiting = self._pending.get(key)
+        if not waiting:
+            self.total_unmatched += 1
+            return None
+
+        command, sent_at, _ = waiting.popleft()
+        if not waiting:
+            del self._pending[key]
+        self._count -= 1
+
+        now = time.monotonic() if now is None else now
+        rtt_ms = (now - sent_at) * 1000
+        if acked:
+            self.total_acked += 1
+            self.last_rtt_ms = rtt_ms
+        else:
+            self.total_naks += 1
+        return command, acked, rtt_ms
+
+    def expire(self, now: Optional[float] = None) -> List[Any]:
+        """만료 시각이 지난 명령을 대기 목록에서 빼서 반환"""
+        now = time.monotonic() if now is None else now
+        expired = []
+        for key in list(self._pending):
+            waiting = self._pending[key]
+            while waiting and waiting[0][2] <= now:
+                expired.append(waiting.popleft()[0])
+            if not waiting:
+                del self._pending[key]
+        self._count -= len(expired)
+        self.total_timeouts += len(expired)
+        return expired
+
+    def next_deadline(self) -> Optional[float]:
+        """가장 이른 만료 시각 (대기 중인 명령이 없으면 None)"""
+        deadlines = [waiting[0][2] for waiting in self._pending.values() if waiting]
+        return min(deadlines) if deadlines else None
+
+    def drain(self) -> List[Any]:
+        """대기 중인 명령 전부를 송신 순서대로 빼서 반환 (연결 끊김 시 재전송용)"""
+        entries = sorted((entry for waiting in self._pending.values() for entry in waiting), key=lambda e: e[1])
+        self._pending.clear()
+        self._count = 0
+        return [entry[0] for entry in entries]
+
+    def discard(self, command: Any) -> bool:
+        """대기 목록에서 명령 하나를 빼기 (쓰기 실패 등 응답을 기다릴 필요가 없어진 경우), 있었는지 반환"""
+        for key, waiting in self._pending.items():
+            for entry in waiting:
+                if entry[0] is command:
+                    waiting.remove(entry)
+                    if not waiting:
+                        del self._pending[key]
+                    self._count -= 1
+                    return True
+        return False
+
+    def pending_commands(self) -> List[Any]:
+        """응답 대기 중인 명령 목록 (키별로 송신 순서)"""
+        return [entry[0] for waiting in self._pending.values() for entry in waiting]
+
+    def in_flight(self) -> int:
+        """응답 대기 중인 명령 수"""
+        return self._count
+
+    def get_stats(self) -> dict:
+        """ACK 통계 반환"""
+        return {
+            'in_flight': self._count,
+            'acked': self.total_acked,
+            'naks': self.total_naks,
+            'timeouts': self.total_timeouts,
+            'unmatched': self.total_unmatched,
+            'last_rtt_ms': round(self.last_rtt_ms, 2),
+        }
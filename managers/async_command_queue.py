@@ -0,0 +1,257 @@
+"""
+asyncio 명령 큐
+
+CommandQueueManager와 같은 우선순위/재시도 규칙을 쓰되 50ms 타이머로 큐를 확인하지 않습니다.
+- 명령이 추가되거나 일시 중지가 풀리면 asyncio.Event로 전송 태스크를 바로 깨움
+- 최소 명령 간격은 남은 시간만큼 asyncio.sleep()
+- 전송 전인 같은 (시스템, 장치, 기능) 설정값 명령은 마지막 값으로 병합 (CommandQueueManager와 같은 규칙)
+- 우선순위별 대기열 상한/만료 시간 (CommandQueueManager와 같은 queue_limits() 설정)
+- 스케줄링 방식(priority/edf)과 출처별 마감 초과 통계 (CommandQueueManager와 같은 service_order() 규칙)
+- 우선순위별 큐 대기(wait)/쓰기(send) 지연 히스토그램 (ACK 추적이 없어 ack 구간은 없음)
+- 연결이 끊기면 전송 계층이 다시 연결될 때까지 대기 (명령은 큐에 유지)
+
+사용 예:
+    queue = AsyncCommandQueue(transport)
+    queue.start()
+    queue.add_command("$CMD,DSCT,FAN1,ON")
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .command_queue_manager import (Command, CommandPriority, DEFAULT_QUEUE_LIMITS, DROP_CLEARED, DROP_EXPIRED,
+                                    DROP_OVERFLOW, DROP_REJECTED, SCHEDULE_PRIORITY, absorb_into, admit, coalesce_into,
+                                    coalesce_key, command_deadline, deadline_budgets, is_expired,
+                                    service_order, take_expired)
+from .queue_metrics import DeadlineStats, QueueMetrics
+from utils.log_manager import get_logger
+
+logger = get_logger("QUEUE", "ASYNC_QUEUE")
+
+
+class AsyncCommandQueue:
+    """asyncio 명령 큐"""
+
+    def __init__(self, transport, min_command_interval: float = 0.05, coalesce_commands: bool = True,
+                 metrics_window_sec: float = 60.0,
+                 limits: Optional[Dict[CommandPriority, Tuple[int, str, float]]] = None,
+                 scheduling: str = SCHEDULE_PRIORITY,
+                 deadlines: Optional[Tuple[Dict[CommandPriority, float], Dict[str, float]]] = None):
+        self.transport = transport
+        self.min_command_interval = min_command_interval
+        self.coalesce_commands = coalesce_commands
+        self.queue_limits = dict(limits or DEFAULT_QUEUE_LIMITS)
+        self.scheduling = scheduling
+        self.deadline_budgets = deadlines or deadline_budgets({})
+
+        # 우선순위별 큐 (높은 우선순위부터 확인)
+        self._queues = {priority: deque() for priority in
+                        (CommandPriority.HIGH, CommandPriority.NORMAL, CommandPriority.LOW)}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        self.is_paused = False
+        self.last_command_time: Optional[float] = None
+
+        # 전송 결과 알림 (선택): on_sent(command), on_failed(command, error)
+        self.on_sent: Optional[Callable[[str], None]] = None
+        self.on_failed: Optional[Callable[[str, str], None]] = None
+        self.on_dropped: Optional[Callable[[str, str], None]] = None  # (command, 사유)
+
+        # 통계
+        self.total_sent = 0
+        self.total_failed = 0
+        self.total_coalesced = 0
+        self.total_expired = 0
+        self.total_dropped = 0
+        self.metrics = QueueMetrics(window_sec=metrics_window_sec)
+        self.deadline_stats = DeadlineStats()
+
+    # ==================== 실행 ====================
+    def start(self):
+        """전송 태스크 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    def stop(self):
+        """전송 태스크 취소 (큐 내용은 유지)"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def run(self):
+        """전송 루프 (취소될 때까지)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self.transport.is_connected():
+                await self.transport.wait_connected()
+                continue
+            # 확인 전에 clear (만료 알림 콜백이 추가한 명령의 깨움을 놓치지 않도록)
+            self._wakeup.clear()
+            command = None if self.is_paused else self._next_command()
+            if command is None:
+                await self._wakeup.wait()
+                continue
+
+            # 최소 명령 간격 (대기 후 다시 확인하므로 그 사이 들어온 HIGH 명령이 먼저 나감)
+            if self.last_command_time is not None:
+                remaining = self.last_command_time + self.min_command_interval - loop.time()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    continue
+
+            self._queues[command.priority].popleft()
+            await self._send_command(command)
+            self.last_command_time = loop.time()
+
+    # ==================== 큐 조작 ====================
+    def add_command(self, command: str, priority: CommandPriority = CommandPriority.NORMAL,
+                    callback: Optional[Callable] = None, ttl: Optional[float] = None,
+                    origin: Optional[str] = None) -> bool:
+        """명령을 큐에 추가 (대기열이 가득 차서 거부하면 False)"""
+        capacity, overflow, default_ttl = self.queue_limits[priority]
+        ttl = default_ttl if ttl is None else ttl
+        origin = origin or priority.name.lower()
+        now = time.time()
+        cmd = Command(command=command, priority=priority, callback=callback, timestamp=now,
+                      key=coalesce_key(command) if self.coalesce_commands else None,
+                      expires_at=now + ttl if ttl > 0 else None, origin=origin,
+                      deadline=command_deadline(self.deadline_budgets, priority, origin, now))
+        queue = self._queues[priority]
+        self._report_dropped(take_expired(queue, now), DROP_EXPIRED)
+        if coalesce_into(queue, cmd) is not None:
+            self.total_coalesced += 1
+        else:
+            accepted, dropped = admit(queue, cmd, capacity, overflow)
+            self._report_dropped(dropped, DROP_OVERFLOW)
+            if not accepted:
+                self._report_dropped([cmd], DROP_REJECTED)
+                return False
+        self._wakeup.set()
+        return True
+
+    def add_urgent_command(self, command: str, callback: Optional[Callable] = None):
+        """긴급 명령 추가 (최우선 처리)"""
+        return self.add_command(command, CommandPriority.HIGH, callback)
+
+    def clear_queue(self, priority: Optional[CommandPriority] = None):
+        """큐 비우기 (비운 명령은 실패 콜백으로 알림)"""
+        cleared: List[Command] = []
+        for key, queue in self._queues.items():
+            if priority is None or key == priority:
+                cleared.extend(queue)
+                queue.clear()
+        self._report_dropped(cleared, DROP_CLEARED)
+
+    def pause_queue(self):
+        """큐 처리 일시 중지"""
+        self.is_paused = True
+
+    def resume_queue(self):
+        """큐 처리 재개"""
+        self.is_paused = False
+        self._wakeup.set()
+
+    def set_command_interval(self, interval: float):
+        """명령 간격 설정 (초)"""
+        self.min_command_interval = max(0.01, min(1.0, interval))
+        self._wakeup.set()
+
+    def _next_command(self) -> Optional[Command]:
+        """다음에 보낼 명령 확인 (큐에서 빼지 않음, 앞쪽의 만료된 명령은 버림)"""
+        now = time.time()
+        for queue in self._queues.values():
+            expired = []
+            while queue and is_expired(queue[0], now):
+                expired.append(queue.popleft())
+            self._report_dropped(expired, DROP_EXPIRED)
+        for priority in service_order(self._queues, self.scheduling):
+            if self._queues[priority]:
+                return self._queues[priority][0]
+        return None
+
+    def _report_dropped(self, commands: List[Command], reason: str):
+        """버린/거부한 명령 알림 (on_dropped, 실패 콜백)"""
+        for cmd in commands:
+            if reason == DROP_EXPIRED:
+                self.total_expired += 1
+            else:
+                self.total_dropped += 1
+            logger.info("명령 %s: %s", reason, cmd.command)
+            self.deadline_stats.record_dropped(cmd.origin or cmd.priority.name.lower())
+            if self.on_dropped:
+                self.on_dropped(cmd.command, reason)
+            if cmd.callback:
+                try:
+                    cmd.callback(False, reason)
+                except Exception as e:
+                    logger.error("실패 콜백 오류: %s", e)
+
+    # ==================== 전송 ====================
+    async def _send_command(self, cmd: Command):
+        started = time.perf_counter()
+        try:
+            success = await self.transport.send_command(cmd.command)
+        except Exception as e:
+            self._handle_send_failure(cmd, str(e))
+            return
+
+        if not success:
+            self._handle_send_failure(cmd)
+            return
+
+        self.metrics.record('send', cmd.priority, (time.perf_counter() - started) * 1000)
+        self.metrics.record('wait', cmd.priority, (time.time() - cmd.timestamp) * 1000)
+        if cmd.retry_count == 0 and cmd.deadline is not None:
+            self.deadline_stats.record_sent(cmd.origin, (time.time() - cmd.deadline) * 1000)
+        self.total_sent += 1
+        if self.on_sent:
+            self.on_sent(cmd.command)
+        if cmd.callback:
+            try:
+                cmd.callback(True, cmd.command)
+            except Exception as e:
+                logger.error("콜백 실행 오류: %s", e)
+
+    def _handle_send_failure(self, cmd: Command, error: str = "전송 실패"):
+        """전송 실패 처리 (CommandQueueManager와 같은 재시도 규칙)"""
+        cmd.retry_count += 1
+        if cmd.retry_count < cmd.max_retries:
+            queue = self._queues[cmd.priority]
+            if absorb_into(queue, cmd):
+                self.total_coalesced += 1
+                return
+            if cmd.priority == CommandPriority.HIGH:
+                queue.appendleft(cmd)
+            else:
+                queue.append(cmd)
+            logger.info("재시도 %s/%s: %s", cmd.retry_count, cmd.max_retries, cmd.command)
+            return
+
+        self.total_failed += 1
+        if self.on_failed:
+            self.on_failed(cmd.command, error)
+        if cmd.callback:
+            try:
+                cmd.callback(False, error)
+            except Exception as e:
+                logger.error("실패 콜백 오류: %s", e)
+
+    def get_queue_info(self) -> Dict[str, Any]:
+        """큐 정보 반환 (CommandQueueManager.get_queue_info()와 같은 키)"""
+        return {
+            'high_queue_size': len(self._queues[CommandPriority.HIGH]),
+            'normal_queue_size': len(self._queues[CommandPriority.NORMAL]),
+            'low_queue_size': len(self._queues[CommandPriority.LOW]),
+            'total_sent': self.total_sent,
+            'total_failed': self.total_failed,
+            'coalesced': self.total_coalesced,
+            'expired': self.total_expired,
+            'dropped': self.total_dropped,
+            'is_processing': self._task is not None and not self._task.done(),
+            'latency': self.metrics.snapshot(),
+            'scheduling': self.scheduling,
+            'deadlines': self.deadline_stats.snapshot(),
+        }
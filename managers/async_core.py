@@ -0,0 +1,120 @@
+"""
+asyncio 코어 (장비 1대의 송수신·명령 큐·센서 스케줄링을 이벤트 루프 하나로 실행)
+
+QThread(읽기/쓰기 스레드)와 주기 QTimer(큐 50ms, 스케줄러 100ms) 대신 코루틴으로 구성합니다.
+- AsyncSerialTransport: 포트 fd를 이벤트 루프에서 직접 감시
+- AsyncCommandQueue: 명령이 들어올 때만 깨어나는 명령 큐
+- AsyncSensorScheduler: 응답 완료/타임아웃/주기를 await로 처리
+- 센서 매니저(DSCT/AIRCON/PT02)는 기존 클래스를 라인 분배기에 그대로 연결 (파싱/CSV 동일)
+
+실행 방식:
+- 단독 (헤드리스): asyncio.run(unit.run()) - main.py --headless --async-core
+- GUI와 함께: utils.qt_asyncio.QtAsyncioBridge로 Qt 이벤트 루프 안에서 같은 루프 구동
+
+연결이 끊기면 serial 설정(auto_reconnect, reconnect_initial_ms, reconnect_max_ms)에 따라
+지수 백오프로 다시 연결하며, 그동안 큐에 넣은 명령은 재연결 후 전송됩니다.
+"""
+
+import asyncio
+from typing import Optional
+
+import serial
+
+from .async_serial_transport import AsyncSerialTransport
+from .async_command_queue import AsyncCommandQueue
+from .command_queue_manager import SCHEDULE_PRIORITY, deadline_budgets, queue_limits
+from .async_sensor_scheduler import AsyncSensorScheduler
+from .sensor_manager import SensorManager
+from .air_sensor_manager import AirSensorManager
+from .pt02_sensor_manager import PT02SensorManager
+from utils.log_manager import get_logger
+
+logger = get_logger("SERIAL", "ASYNC_CORE")
+
+
+class AsyncUnit:
+    """asyncio 코어로 구성한 장비 1대의 스택"""
+
+    def __init__(self, port: str, baudrate: int = 115200, unit_id: Optional[str] = None,
+                 data_dir: Optional[str] = None, cycle_interval: float = 5.0, scheduling: bool = True,
+                 transport: Optional[AsyncSerialTransport] = None):
+        """
+        Args:
+            transport: 미리 만든 전송 계층 (시험용, 지정하면 port/baudrate 무시)
+        """
+        self.unit_id = unit_id
+        self.scheduling = scheduling
+
+        self.transport = transport or AsyncSerialTransport(port, baudrate, unit_id=unit_id)
+        settings = self._serial_settings()
+        self.command_queue = AsyncCommandQueue(
+            self.transport, coalesce_commands=settings.get("coalesce_commands", True),
+            metrics_window_sec=settings.get("queue_metrics_window_sec", 60), limits=queue_limits(settings),
+            scheduling=settings.get("queue_scheduling", SCHEDULE_PRIORITY), deadlines=deadline_budgets(settings))
+        self.scheduler = AsyncSensorScheduler(self.transport, self.command_queue, cycle_interval)
+
+        self.sensor_manager = SensorManager(data_dir=data_dir)
+        self.air_sensor_manager = AirSensorManager(data_dir=data_dir)
+        self.pt02_sensor_manager = PT02SensorManager(data_dir=data_dir)
+
+        # 수신 경로 등록 (SerialManager.set_*_callback()과 같은 경로)
+        router = self.transport.router
+        router.subscribe("[DSCT]", self.sensor_manager.parse_sensor_data)
+        router.subscribe("[AIR]", self.air_sensor_manager.parse_sensor_data)
+        router.subscribe("[AIRCON]", self.air_sensor_manager.parse_sensor_data)
+        router.subscribe("PT02", self.pt02_sensor_manager.parse_pt02_response)
+
+        self.total_reconnects = 0
+
+    async def run(self):
+        """연결 유지 루프: 연결 → 끊김 대기 → 백오프 후 재연결 (취소되거나 재연결 비활성이면 종료)"""
+        settings = self._serial_settings()
+        initial_ms = settings.get("reconnect_initial_ms", 500)
+        max_ms = settings.get("reconnect_max_ms", 10000)
+        delay_ms = initial_ms
+
+        self.command_queue.start()
+        if self.scheduling:
+            self.scheduler.start()
+        try:
+            while True:
+                try:
+                    await self.transport.open()
+                except (serial.SerialException, OSError) as e:
+                    logger.warning("연결 실패: %s (%s), %sms 후 재시도", self.transport.port, e, delay_ms)
+                    await asyncio.sleep(delay_ms / 1000.0)
+                    delay_ms = min(delay_ms * 2, max_ms)
+                    continue
+
+                if self.transport.total_connects > 1:
+                    self.total_reconnects += 1
+                delay_ms = initial_ms
+
+                reason = await self.transport.wait_closed()
+                if reason is None or not settings.get("auto_reconnect", True):
+                    return
+                await asyncio.sleep(delay_ms / 1000.0)
+        finally:
+            self.scheduler.stop()
+            self.command_queue.stop()
+            self.transport.close()
+
+    def send_command(self, command: str, *args, **kwargs) -> bool:
+        """명령 큐에 추가"""
+        return self.command_queue.add_command(command, *args, **kwargs)
+
+    def get_status(self) -> dict:
+        """장비 상태 요약"""
+        return {
+            'port': self.transport.port,
+            'connected': self.transport.is_connected(),
+            'scheduler': self.scheduler.current_state.value,
+            'queue': self.command_queue.get_queue_info(),
+            'transport': self.transport.get_stats(),
+            'data_dir': self.sensor_manager.data_dir,
+        }
+
+    @staticmethod
+    def _serial_settings() -> dict:
+        from config.config_manager import get_config_manager
+        return get_config_manager().get_section("serial")
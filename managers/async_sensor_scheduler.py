@@ -0,0 +1,114 @@
+"""
+asyncio 센서 스케줄러
+
+SensorScheduler의 주기(AIRCON TH → 응답 완료 → DSCT TH → 응답 완료 → 주기 대기)를 코루틴 하나로 실행합니다.
+100ms 상태 머신 타이머 대신
+- 응답 완료: 전송 계층의 expect_line()으로 'SEQUENTIAL SCAN COMPLETE' 라인을 await
+- 응답 타임아웃: asyncio.wait_for(response_timeout)
+- 주기 대기: asyncio.sleep(cycle_interval)
+- 연결 끊김: 전송 계층이 다시 연결될 때까지 await (PAUSED)
+
+센서 라인 파싱/CSV 저장은 라인 분배기에 등록된 센서 매니저가 그대로 처리합니다.
+"""
+
+import asyncio
+from typing import Callable, Optional
+
+from .command_queue_manager import CommandPriority
+from .sensor_scheduler import SchedulerState
+from utils.log_manager import get_logger
+
+logger = get_logger("SCHEDULER", "ASYNC_SCHEDULER")
+
+
+def _is_scan_complete(line: str) -> bool:
+    return "SEQUENTIAL SCAN COMPLETE" in line
+
+
+class AsyncSensorScheduler:
+    """asyncio 센서 스케줄러"""
+
+    def __init__(self, transport, command_queue, cycle_interval: float = 5.0, response_timeout: float = 10.0):
+        self.transport = transport
+        self.command_queue = command_queue
+        self.cycle_interval = cycle_interval
+        self.response_timeout = response_timeout
+        self.aircon_enabled = True
+        self.dsct_enabled = True
+
+        self.current_state = SchedulerState.IDLE
+        self._task: Optional[asyncio.Task] = None
+
+        # 상태 변경 알림 (선택): on_state_changed(state_value)
+        self.on_state_changed: Optional[Callable[[str], None]] = None
+
+        # 통계
+        self.total_cycles = 0
+        self.total_timeouts = 0
+
+    def start(self):
+        """스케줄링 태스크 시작 (실행 중인 이벤트 루프 필요)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+            logger.info("스케줄링 시작 (주기 %s초)", self.cycle_interval)
+
+    def stop(self):
+        """스케줄링 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._set_state(SchedulerState.PAUSED)
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def run(self):
+        """스케줄링 루프 (취소될 때까지)"""
+        while True:
+            if not self.transport.is_connected():
+                self._set_state(SchedulerState.PAUSED)
+                await self.transport.wait_connected()
+                self._set_state(SchedulerState.IDLE)
+
+            try:
+                if self.aircon_enabled:
+                    await self._request("AIRCON", "$CMD,AIR,TH", "[AIRCON]", SchedulerState.AIRCON_WAITING)
+                if self.dsct_enabled:
+                    await self._request("DSCT", "$CMD,DSCT,TH", "[DSCT]", SchedulerState.DSCT_WAITING)
+            except ConnectionError:
+                logger.info("연결 끊김, 스케줄링 일시정지")
+                continue
+
+            self.total_cycles += 1
+            self._set_state(SchedulerState.INTERVAL_WAITING)
+            await asyncio.sleep(self.cycle_interval)
+            self._set_state(SchedulerState.IDLE)
+
+    async def _request(self, name: str, command: str, route: str, waiting_state: SchedulerState):
+        """TH 요청 후 스캔 완료 라인 대기 (타임아웃이면 다음 단계로)"""
+        response = self.transport.expect_line(route, _is_scan_complete)
+        self.command_queue.add_command(command, CommandPriority.LOW, origin="sensor")
+        self._set_state(waiting_state)
+        try:
+            await asyncio.wait_for(response, self.response_timeout)
+            logger.info("%s 응답 완료", name)
+        except asyncio.TimeoutError:
+            self.total_timeouts += 1
+            logger.warning("%s 응답 타임아웃 (%.1f초)", name, self.response_timeout)
+
+    def _set_state(self, new_state: SchedulerState):
+        if self.current_state != new_state:
+            logger.debug("상태 변경: %s → %s", self.current_state.value, new_state.value)
+            self.current_state = new_state
+            if self.on_state_changed:
+                self.on_state_changed(new_state.value)
+
+    def get_status_info(self) -> dict:
+        """현재 상태 정보 반환"""
+        return {
+            'state': self.current_state.value,
+            'is_running': self.is_running(),
+            'cycle_interval': self.cycle_interval,
+            'cycles': self.total_cycles,
+            'timeouts': self.total_timeouts,
+        }
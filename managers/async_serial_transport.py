@@ -0,0 +1,255 @@
+"""
+asyncio 시리얼 전송 계층
+
+읽기/쓰기 스레드 대신 이벤트 루프 하나에서 포트 fd를 감시합니다.
+- 수신: loop.add_reader(fd) → os.read → LineFramer → LineRouter.dispatch_raw_lines
+- 송신: os.write (버퍼가 차면 add_writer로 쓰기 가능해질 때까지 await)
+- 응답 대기: expect_line()/wait_line()이 라인 분배기에 일회성 핸들러를 걸고 Future로 반환
+  → 주기적으로 상태를 확인하지 않고 asyncio.wait_for()로 타임아웃 처리
+- 연결 끊김: 읽기/쓰기 오류나 EOF면 포트를 닫고 wait_closed()가 끊김 사유를 반환
+
+시간은 모두 loop.time() 기준이므로 가상 시간 루프(test/virtual_time_loop.py)에서 그대로 시험할 수 있습니다.
+
+사용 예:
+    transport = AsyncSerialTransport("/dev/ttyUSB0")
+    await transport.open()
+    await transport.send_command("$CMD,DSCT,TH")
+    line = await transport.wait_line("[DSCT]", lambda l: "COMPLETE" in l, timeout=10.0)
+"""
+
+import asyncio
+import os
+from typing import Callable, Optional
+
+import serial
+
+from .line_framer import LineFramer
+from .line_router import LineRouter
+from utils.log_manager import get_logger
+
+logger = get_logger("SERIAL", "ASYNC_TRANSPORT")
+tx_logger = get_logger("TX")
+
+
+class AsyncSerialTransport:
+    """asyncio 시리얼 전송 계층"""
+
+    READ_SIZE = 4096
+
+    def __init__(self, port: str, baudrate: int = 115200,
+                 router: Optional[LineRouter] = None, unit_id: Optional[str] = None):
+        self.port = port
+        self.baudrate = baudrate
+        self.router = router or LineRouter()
+        self.unit_id = unit_id
+
+        self._serial = None
+        self._fd: Optional[int] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._framer = LineFramer()
+        self._connected = asyncio.Event()
+        self._closed: Optional[asyncio.Future] = None
+        self._write_waiter: Optional[asyncio.Future] = None
+
+        # 통계
+        self.rx_bytes = 0
+        self.rx_lines = 0
+        self.tx_bytes = 0
+        self.tx_commands = 0
+        self.write_waits = 0
+        self.total_connects = 0
+
+    # ==================== 연결 ====================
+    async def open(self):
+        """
+        포트 열기 및 수신 감시 시작
+
+        Raises:
+            serial.SerialException, OSError: 포트를 열 수 없는 경우
+        """
+        if self.is_connected():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._serial = self._open_port()
+        self._fd = self._serial.fileno()
+        os.set_blocking(self._fd, False)
+
+        # 이전 연결의 부분 라인 버리기
+        self._framer.reset()
+        self._closed = self._loop.create_future()
+        self._loop.add_reader(self._fd, self._on_readable)
+        self._connected.set()
+        self.total_connects += 1
+        logger.info("연결 성공: %s @ %sbps%s", self.port, self.baudrate,
+                    f" (장비 {self.unit_id})" if self.unit_id else "")
+
+    def _open_port(self):
+        """포트 객체 생성 (fileno(), close() 필요 - 시험용 전송 계층에서 재정의)"""
+        return serial.Serial(port=self.port, baudrate=self.baudrate, timeout=0)
+
+    def close(self):
+        """포트 닫기 (정상 종료, wait_closed()는 None 반환)"""
+        self._shutdown(None)
+
+    def is_connected(self) -> bool:
+        return self._fd is not None
+
+    async def wait_connected(self):
+        """연결될 때까지 대기"""
+        await self._connected.wait()
+
+    async def wait_closed(self) -> Optional[str]:
+        """
+        연결이 끝날 때까지 대기
+
+        Returns:
+            끊김 사유 (close()로 닫았으면 None)
+        """
+        if self._closed is None:
+            return None
+        return await asyncio.shield(self._closed)
+
+    def _shutdown(self, reason: Optional[str]):
+        if self._fd is None:
+            return
+        if reason:
+            logger.warning("연결 끊김 감지: %s (%s)", self.port, reason)
+        self._loop.remove_reader(self._fd)
+        self._loop.remove_writer(self._fd)
+        self._fd = None
+        self._connected.clear()
+        try:
+            self._serial.close()
+        except Exception as e:
+            logger.warning("포트 닫기 오류: %s", e)
+        self._serial = None
+
+        if self._write_waiter and not self._write_waiter.done():
+            self._write_waiter.set_exception(ConnectionError(reason or "연결 해제"))
+        if not self._closed.done():
+            self._closed.set_result(reason)
+
+    # ==================== 수신 ====================
+    def _on_readable(self):
+        try:
+            data = os.read(self._fd, self.READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self._shutdown(f"읽기 오류: {e}")
+            return
+        if not data:
+            self._shutdown("EOF")
+            return
+
+        self.rx_bytes += len(data)
+        lines = self._framer.feed(data)
+        if not lines:
+            return
+        self.rx_lines += len(lines)
+        try:
+            self.router.dispatch_raw_lines(lines)
+        except Exception as e:
+            logger.error("수신 라인 처리 오류: %s", e)
+
+    def expect_line(self, route: str, predicate: Optional[Callable[[str], bool]] = None) -> asyncio.Future:
+        """
+        경로에 일회성 핸들러를 등록하고 조건에 맞는 첫 라인으로 완료되는 Future 반환
+
+        명령을 보내기 전에 호출해야 빠른 응답을 놓치지 않습니다.
+        연결이 끊기면 ConnectionError로 완료되고, 취소하면(wait_for 타임아웃 포함) 핸들러가 제거됩니다.
+        """
+        loop = self._loop or asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def on_line(line):
+            if not future.done() and (predicate is None or predicate(line)):
+                future.set_result(line)
+
+        def on_closed(_):
+            if not future.done():
+                future.set_exception(ConnectionError(f"연결 끊김: {self.port}"))
+
+        closed = self._closed
+        if closed is None or closed.done():
+            on_closed(None)
+            return future
+        self.router.subscribe(route, on_line)
+        closed.add_done_callback(on_closed)
+
+        def cleanup(_):
+            self.router.unsubscribe(route, on_line)
+            closed.remove_done_callback(on_closed)
+
+        future.add_done_callback(cleanup)
+        return future
+
+    async def wait_line(self, route: str, predicate: Optional[Callable[[str], bool]] = None,
+                        timeout: Optional[float] = None) -> str:
+        """
+        조건에 맞는 라인 대기
+
+        Raises:
+            asyncio.TimeoutError: timeout 안에 라인이 오지 않은 경우
+            ConnectionError: 대기 중 연결이 끊긴 경우
+        """
+        return await asyncio.wait_for(self.expect_line(route, predicate), timeout)
+
+    # ==================== 송신 ====================
+    async def write(self, data: bytes):
+        """
+        바이트 전송 (전부 쓸 때까지 대기)
+
+        Raises:
+            ConnectionError: 연결되지 않았거나 쓰기 중 끊긴 경우
+        """
+        view = memoryview(data)
+        while view:
+            if self._fd is None:
+                raise ConnectionError(f"연결되지 않음: {self.port}")
+            try:
+                written = os.write(self._fd, view)
+                view = view[written:]
+            except BlockingIOError:
+                self.write_waits += 1
+                await self._wait_writable()
+            except OSError as e:
+                self._shutdown(f"쓰기 오류: {e}")
+                raise ConnectionError(str(e)) from e
+        self.tx_bytes += len(data)
+
+    async def _wait_writable(self):
+        fd = self._fd
+        self._write_waiter = self._loop.create_future()
+        waiter = self._write_waiter
+        self._loop.add_writer(fd, lambda: waiter.done() or waiter.set_result(None))
+        try:
+            await waiter
+        finally:
+            if self._fd is not None:
+                self._loop.remove_writer(fd)
+            self._write_waiter = None
+
+    async def send_command(self, command: str) -> bool:
+        """시리얼 명령 전송 (종료 문자 자동 추가), 성공 여부 반환"""
+        try:
+            await self.write((command + "\r\n").encode('ascii'))
+        except (ConnectionError, UnicodeEncodeError) as e:
+            tx_logger.error("시리얼 명령 전송 실패: %s (%s)", command, e)
+            return False
+        self.tx_commands += 1
+        tx_logger.info("시리얼 명령 전송: %s (with <CR><LF>)", command)
+        return True
+
+    # ==================== 상태 ====================
+    def get_stats(self) -> dict:
+        """송수신 통계 반환"""
+        return {
+            'connected': self.is_connected(),
+            'connects': self.total_connects,
+            'rx_bytes': self.rx_bytes,
+            'rx_lines': self.rx_lines,
+            'tx_bytes': self.tx_bytes,
+            'tx_commands': self.tx_commands,
+            'write_waits': self.write_waits,
+        }
@@ -3,6 +3,9 @@
 from PyQt5.QtWidgets import QLabel, QPushButton
 from PyQt5.QtCore import Qt, QTimer
 from ui.constants import CMD_PREFIX, TERMINATOR, AIR_SYSTEM
+from utils.log_manager import get_logger
+
+logger = get_logger("AUTO")
 
 
 class AutoModeManager:
@@ -50,7 +53,7 @@ class AutoModeManager:
 
     def log_message(self, message):
         """Send Data 로그에 메시지 기록"""
-        print(f"[AUTO] {message}")
+        logger.info("%s", message)
         if self.SendData_textEdit:
             self.SendData_textEdit.append(f"[AUTO] {message}")
             self.SendData_textEdit.verticalScrollBar().setValue(
@@ -62,7 +65,7 @@ class AutoModeManager:
         full_command = f"{command}{TERMINATOR}"
 
         if self.serial_manager.is_connected():
-            self.serial_manager.shinho_serial_connection.write(full_command.encode())
+            self.serial_manager.send_data(full_command)
             self.log_message(f"TX: {command}")
             return True
         else:
@@ -308,12 +311,34 @@ class AutoModeManager:
         cmd_time = f"{CMD_PREFIX},{AIR_SYSTEM},SEMITIME,{self.semi_time}"
         self._save_command_queue.append(cmd_time)
 
+        # 명령 큐가 있으면 큐에 넣어 송신 간격/ACK 확인을 큐에 맡김
+        command_queue = getattr(self.serial_manager, 'command_queue', None)
+        if command_queue is not None:
+            self._queue_save_commands(command_queue)
+            return
+
         # 명령어 인덱스 초기화 후 순차 전송 시작
         self._save_command_index = 0
         self._send_next_save_command()
 
+    def _queue_save_commands(self, command_queue):
+        """설정값 명령을 하나의 묶음으로 명령 큐에 추가 (중간에 다른 버튼 명령이 끼어들지 않음)"""
+        def on_done(success, results):
+            for command, ok, result in results:
+                if not ok:
+                    self.log_message(f"TX 실패: {command} ({result})")
+            if success:
+                self.log_message("설정값 저장 완료")
+            else:
+                failed = sum(1 for _, ok, _ in results if not ok)
+                self.log_message(f"설정값 저장 실패 ({failed}개)")
+
+        if command_queue.add_batch(self._save_command_queue, callback=on_done, origin="auto") is not None:
+            for cmd in self._save_command_queue:
+                self.log_message(f"TX 대기: {cmd}")
+
     def _send_next_save_command(self):
-        """대기열에서 다음 명령어 전송 (200ms 딜레이)"""
+        """대기열에서 다음 명령어 전송 (명령 큐가 없을 때, 200ms 딜레이)"""
         if self._save_command_index < len(self._save_command_queue):
             cmd = self._save_command_queue[self._save_command_index]
             self.send_command(cmd)
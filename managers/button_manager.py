@@ -1,5 +1,11 @@
 from ui.constants import CMD_PREFIX, TERMINATOR, BUTTON_ON_STYLE, BUTTON_OFF_STYLE
 import time
+from utils.log_manager import get_logger
+
+logger = get_logger("BUTTON")
+reload_logger = get_logger("RELOAD")
+sol_logger = get_logger("SOL")
+test_logger = get_logger("BUTTON", "TEST")
 
 class ButtonManager:
     def __init__(self, serial_manager, SendData_textEdit, ReceiveData_textEdit, test_mode=False):
@@ -54,27 +60,27 @@ class ButtonManager:
                 except TypeError:
                     pass
                 
-                print("연결 중: 버튼=%s, 명령어=%s" % (button.objectName(), commands))
+                logger.info("연결 중: 버튼=%s, 명령어=%s", button.objectName(), commands)
                 
                 # 슬롯 연결
                 button.clicked.connect(
                     lambda checked, b=button, cmds=commands, n=name: self._toggle_button(n, b, cmds)
                 )
         except Exception as e:
-            print("버튼 그룹 추가 중 오류 발생: %s" % e)
+            logger.error("버튼 그룹 추가 중 오류 발생: %s", e)
 
     def _toggle_button(self, group_name, button, commands):
         """버튼 토글 처리"""
-        print("_toggle_button 호출됨: 그룹=%s, 버튼=%s" % (group_name, button.objectName()))
+        logger.info("_toggle_button 호출됨: 그룹=%s, 버튼=%s", group_name, button.objectName())
 
         # SOL1 진행 중이면 중복 클릭 방지
         if group_name == 'sol1' and self.sol_in_progress:
-            print("[SOL] 이미 진행 중 - 클릭 무시")
+            sol_logger.info("이미 진행 중 - 클릭 무시")
             return
 
         # 시리얼 포트 연결 확인
         if not self.serial_manager.is_connected():
-            print("시리얼 포트가 연결되지 않음 - 버튼 동작 차단")
+            logger.warning("시리얼 포트가 연결되지 않음 - 버튼 동작 차단")
             if self.SendData_textEdit:
                 self.SendData_textEdit.append("시리얼 포트가 연결되지 않음 - 버튼 동작 차단")
                 self.SendData_textEdit.verticalScrollBar().setValue(
@@ -153,7 +159,7 @@ class ButtonManager:
             button.setFixedSize(original_size)
             
         except Exception as e:
-            print("버튼 토글 처리 중 오류 발생: %s" % e)
+            logger.error("버튼 토글 처리 중 오류 발생: %s", e)
             if self.SendData_textEdit:
                 self.SendData_textEdit.append("버튼 토글 오류: %s" % e)
 
@@ -162,7 +168,7 @@ class ButtonManager:
         try:
             if callable(command_or_function):
                 # 함수인 경우 호출
-                print("함수 호출: %s" % command_or_function.__name__)
+                logger.info("함수 호출: %s", command_or_function.__name__)
                 command_or_function()
             else:
                 # 문자열 명령어인 경우 기존 로직 사용
@@ -170,7 +176,7 @@ class ButtonManager:
 
                 # SOL1 명령인 경우 Flicker 시작
                 if group_name == 'sol1' and 'SOL1' in command_or_function:
-                    print("[SOL] SOL1 명령 감지 - Flicker 시작")
+                    sol_logger.info("SOL1 명령 감지 - Flicker 시작")
                     self._start_sol_flicker()
                     self._start_sol_timeout_timer()
 
@@ -181,7 +187,7 @@ class ButtonManager:
                         else:
                             self._simulate_sol_close_response()
         except Exception as e:
-            print("명령어 처리 실패: %s" % e)
+            logger.warning("명령어 처리 실패: %s", e)
             if hasattr(self, 'SendData_textEdit') and self.SendData_textEdit:
                 self.SendData_textEdit.append("명령어 처리 실패: %s" % e)
                 self.SendData_textEdit.verticalScrollBar().setValue(
@@ -196,14 +202,14 @@ class ButtonManager:
                 if hasattr(self.serial_manager, 'send_serial_command_with_priority'):
                     from .command_queue_manager import CommandPriority
                     result = self.serial_manager.send_serial_command_with_priority(
-                        command.rstrip(), CommandPriority.HIGH
+                        command.rstrip(), CommandPriority.HIGH, origin="button"
                     )
                 else:
                     # 레거시 전송 방식 (fallback)
                     result = self.serial_manager.send_serial_command(command.rstrip())
                 
                 if result:
-                    print("[BUTTON] HIGH 우선순위 명령 전송: %s" % command)
+                    logger.info("HIGH 우선순위 명령 전송: %s", command)
                     
                     if hasattr(self, 'SendData_textEdit') and self.SendData_textEdit:
                         self.SendData_textEdit.append("%s" % command.rstrip())
@@ -212,14 +218,14 @@ class ButtonManager:
                             self.SendData_textEdit.verticalScrollBar().maximum()
                         )
                 else:
-                    print("명령 전송 실패: %s" % command)
+                    logger.warning("명령 전송 실패: %s", command)
                     if hasattr(self, 'SendData_textEdit') and self.SendData_textEdit:
                         self.SendData_textEdit.append("명령 전송 실패: %s" % command.rstrip())
                         self.SendData_textEdit.verticalScrollBar().setValue(
                             self.SendData_textEdit.verticalScrollBar().maximum()
                         )
             else:
-                print("시리얼 포트 연결되지 않음.")
+                logger.info("시리얼 포트 연결되지 않음.")
                 if hasattr(self, 'SendData_textEdit') and self.SendData_textEdit:
                     self.SendData_textEdit.append("시리얼 포트 연결되지 않음.")
                     # 스크롤을 맨 아래로 이동
@@ -227,7 +233,7 @@ class ButtonManager:
                         self.SendData_textEdit.verticalScrollBar().maximum()
                     )
         except Exception as e:
-            print("명령 전송 실패 - 장치 연결 상태 확인 필요: %s" % e)
+            logger.warning("명령 전송 실패 - 장치 연결 상태 확인 필요: %s", e)
             if hasattr(self, 'SendData_textEdit') and self.SendData_textEdit:
                 self.SendData_textEdit.append("명령 전송 실패 - 장치 연결 상태 확인 필요: %s" % e)
                 # 스크롤을 맨 아래로 이동
@@ -307,12 +313,12 @@ class ButtonManager:
     def handle_dsct_reload(self):
         """DSCT 장비 상태 리로드 요청"""
         if not self.serial_manager.is_connected():
-            print("[RELOAD] 시리얼 연결 안됨 - DSCT 리로드 불가")
+            reload_logger.info("시리얼 연결 안됨 - DSCT 리로드 불가")
             return
 
         # 이미 진행 중이면 무시
         if self.dsct_reload_in_progress:
-            print("[RELOAD] DSCT 리로드 이미 진행 중")
+            reload_logger.info("DSCT 리로드 이미 진행 중")
             return
 
         # 버튼 UI 상태 변경: 진행 중
@@ -323,14 +329,9 @@ class ButtonManager:
         self.dsct_reload_data = []  # 응답 데이터 저장용
         self.dsct_reload_start_time = time.time()  # 시작 시간 기록
 
-        # 명령 전송 (Queue를 거치지 않고 직접 전송)
+        # 명령 전송 (완료 응답까지 다른 명령 차단)
         command = f"{CMD_PREFIX},DSCT,RELOAD"
-        self.serial_manager.send_serial_command(command)
-        print(f"[RELOAD] ⏱️  DSCT 리로드 요청 전송 (직접 전송): {command} (타임아웃: {self.reload_timeout/1000}초)")
-
-        # 명령 전송 후 큐 일시 중지 (다른 명령 차단)
-        if hasattr(self.serial_manager, 'command_queue') and self.serial_manager.command_queue:
-            self.serial_manager.command_queue.pause_queue()
+        self._send_reload_command(command)
 
         # 타임아웃 타이머 시작 (5초)
         self._start_reload_timeout_timer("dsct")
@@ -342,12 +343,12 @@ class ButtonManager:
     def handle_air_reload(self):
         """AIR 장비 상태 리로드 요청"""
         if not self.serial_manager.is_connected():
-            print("[RELOAD] 시리얼 연결 안됨 - AIR 리로드 불가")
+            reload_logger.info("시리얼 연결 안됨 - AIR 리로드 불가")
             return
 
         # 이미 진행 중이면 무시
         if self.air_reload_in_progress:
-            print("[RELOAD] AIR 리로드 이미 진행 중")
+            reload_logger.info("AIR 리로드 이미 진행 중")
             return
 
         # 버튼 UI 상태 변경: 진행 중
@@ -358,14 +359,9 @@ class ButtonManager:
         self.air_reload_data = []  # 응답 데이터 저장용
         self.air_reload_start_time = time.time()  # 시작 시간 기록
 
-        # 명령 전송 (Queue를 거치지 않고 직접 전송)
+        # 명령 전송 (완료 응답까지 다른 명령 차단)
         command = f"{CMD_PREFIX},AIR,RELOAD"
-        self.serial_manager.send_serial_command(command)
-        print(f"[RELOAD] ⏱️  AIR 리로드 요청 전송 (직접 전송): {command} (타임아웃: {self.reload_timeout/1000}초)")
-
-        # 명령 전송 후 큐 일시 중지 (다른 명령 차단)
-        if hasattr(self.serial_manager, 'command_queue') and self.serial_manager.command_queue:
-            self.serial_manager.command_queue.pause_queue()
+        self._send_reload_command(command)
 
         # 타임아웃 타이머 시작 (5초)
         self._start_reload_timeout_timer("air")
@@ -374,62 +370,124 @@ class ButtonManager:
         if self.test_mode:
             self._simulate_air_reload_response()
 
+    def _send_reload_command(self, command):
+        """
+        RELOAD 명령 전송
+
+        명령 큐가 있으면 HIGH 우선순위 묶음으로 넣어 대기 중인 명령 다음 차례에 보내고,
+        완료 응답(ACK)까지 다른 명령을 차단 (ACK 추적을 끈 경우 전송 후 큐 일시 중지).
+        명령 큐가 없으면 직접 전송.
+        """
+        command_queue = getattr(self.serial_manager, 'command_queue', None)
+        if not command_queue:
+            self.serial_manager.send_serial_command(command)
+            reload_logger.info("⏱️  리로드 요청 전송 (직접 전송): %s (타임아웃: %s초)", command, self.reload_timeout/1000)
+            return
+
+        from .command_queue_manager import CommandPriority
+
+        def on_done(success, results):
+            if success and not command_queue.ack_tracking:
+                command_queue.pause_queue()
+            elif not success:
+                reload_logger.warning("리로드 요청 실패: %s (%s)", command, results[0][2])
+
+        # 응답 대기는 리로드 타임아웃과 같게 (ACK 타임아웃이 먼저 나면 완료 전에 실패로 끝남)
+        command_queue.add_batch([command], CommandPriority.HIGH, callback=on_done, max_retries=1,
+                                origin="reload", ack_timeout=self.reload_timeout / 1000)
+        reload_logger.info("⏱️  리로드 요청 대기: %s (타임아웃: %s초)", command, self.reload_timeout/1000)
+
+    def register_routes(self, router):
+        """수신 라인 분배기(LineRouter)에 RELOAD/SOL 핸들러 등록"""
+        router.subscribe("EEPROM_ACK,RELOAD", self._on_reload_start_line)
+        router.subscribe("DSCT_ACK,RELOAD", self._on_dsct_reload_ack_line)
+        router.subscribe("AIRCON_ACK,RELOAD", self._on_air_reload_ack_line)
+        router.subscribe("DSCT", self._on_dsct_state_line)
+        router.subscribe("AIR", self._on_air_state_line)
+        router.subscribe("DSCT,SOL", self.parse_sol_response)
+
     def parse_reload_response(self, data: str):
-        """RELOAD 및 SOL 응답 파싱 및 처리"""
+        """RELOAD 및 SOL 응답 파싱 및 처리 (분배기를 거치지 않는 직접 호출용)"""
         # SOL 응답 파싱 (최우선)
         self.parse_sol_response(data)
 
-        # DSCT 리로드 응답 처리
+        if "EEPROM_ACK,RELOAD,START" in data:
+            self._on_reload_start_line(data)
+        elif "DSCT_ACK,RELOAD,COMPLETE" in data:
+            self._on_dsct_reload_ack_line(data)
+        elif "AIRCON_ACK,RELOAD,COMPLETE" in data:
+            self._on_air_reload_ack_line(data)
+        elif data.startswith("DSCT,"):
+            self._on_dsct_state_line(data)
+        elif data.startswith("AIR,"):
+            self._on_air_state_line(data)
+
+    def _on_reload_start_line(self, data: str):
+        """EEPROM_ACK,RELOAD,START 수신: 진행 중인 RELOAD 데이터 수집 시작"""
+        if "START" not in data:
+            return
+
         if self.dsct_reload_in_progress:
-            if "EEPROM_ACK,RELOAD,START" in data:
-                self.dsct_reload_data = []
-                elapsed = time.time() - self.dsct_reload_start_time if self.dsct_reload_start_time else 0
-                print(f"[RELOAD] ✅ DSCT 데이터 수집 시작 (응답까지: {elapsed:.2f}초)")
-            elif "DSCT_ACK,RELOAD,COMPLETE" in data:
-                elapsed = time.time() - self.dsct_reload_start_time if self.dsct_reload_start_time else 0
-                print(f"[RELOAD] ✅ DSCT 데이터 수집 완료: {len(self.dsct_reload_data)}개 항목 (총 소요: {elapsed:.2f}초)")
-                # 타임아웃 타이머 취소
-                self._cancel_reload_timeout_timer("dsct")
-                self._apply_dsct_reload_state()
-                self.dsct_reload_in_progress = False
-                # 명령 큐 재개
-                if hasattr(self.serial_manager, 'command_queue') and self.serial_manager.command_queue:
-                    self.serial_manager.command_queue.resume_queue()
-                # 버튼 UI 상태 변경: 완료 → 정상
-                self._set_reload_button_state(self.dsct_reload_button, "complete")
-                self._schedule_reload_button_reset(self.dsct_reload_button)
-            elif data.startswith("DSCT,"):
-                # 예: DSCT,FAN4,ON
-                self.dsct_reload_data.append(data.strip())
-                print(f"[RELOAD] 📥 DSCT 데이터 수집: {data.strip()}")
-
-        # AIR 리로드 응답 처리
+            self.dsct_reload_data = []
+            elapsed = time.time() - self.dsct_reload_start_time if self.dsct_reload_start_time else 0
+            reload_logger.info("✅ DSCT 데이터 수집 시작 (응답까지: %.2f초)", elapsed)
+
+        if self.air_reload_in_progress:
+            self.air_reload_data = []
+            elapsed = time.time() - self.air_reload_start_time if self.air_reload_start_time else 0
+            reload_logger.info("✅ AIR 데이터 수집 시작 (응답까지: %.2f초)", elapsed)
+
+    def _on_dsct_reload_ack_line(self, data: str):
+        """DSCT_ACK,RELOAD,COMPLETE 수신: DSCT RELOAD 완료 처리"""
+        if not self.dsct_reload_in_progress or "COMPLETE" not in data:
+            return
+
+        elapsed = time.time() - self.dsct_reload_start_time if self.dsct_reload_start_time else 0
+        reload_logger.info("✅ DSCT 데이터 수집 완료: %s개 항목 (총 소요: %.2f초)", len(self.dsct_reload_data), elapsed)
+        # 타임아웃 타이머 취소
+        self._cancel_reload_timeout_timer("dsct")
+        self._apply_dsct_reload_state()
+        self.dsct_reload_in_progress = False
+        # 명령 큐 재개
+        if hasattr(self.serial_manager, 'command_queue') and self.serial_manager.command_queue:
+            self.serial_manager.command_queue.resume_queue()
+        # 버튼 UI 상태 변경: 완료 → 정상
+        self._set_reload_button_state(self.dsct_reload_button, "complete")
+        self._schedule_reload_button_reset(self.dsct_reload_button)
+
+    def _on_air_reload_ack_line(self, data: str):
+        """AIRCON_ACK,RELOAD,COMPLETE 수신: AIR RELOAD 완료 처리"""
+        if not self.air_reload_in_progress or "COMPLETE" not in data:
+            return
+
+        elapsed = time.time() - self.air_reload_start_time if self.air_reload_start_time else 0
+        reload_logger.info("✅ AIR 데이터 수집 완료: %s개 항목 (총 소요: %.2f초)", len(self.air_reload_data), elapsed)
+        # 타임아웃 타이머 취소
+        self._cancel_reload_timeout_timer("air")
+        self._apply_air_reload_state()
+        self.air_reload_in_progress = False
+        # 명령 큐 재개
+        if hasattr(self.serial_manager, 'command_queue') and self.serial_manager.command_queue:
+            self.serial_manager.command_queue.resume_queue()
+        # 버튼 UI 상태 변경: 완료 → 정상
+        self._set_reload_button_state(self.air_reload_button, "complete")
+        self._schedule_reload_button_reset(self.air_reload_button)
+
+    def _on_dsct_state_line(self, data: str):
+        """DSCT 상태 라인 수집 (예: DSCT,FAN4,ON)"""
+        if self.dsct_reload_in_progress:
+            self.dsct_reload_data.append(data.strip())
+            reload_logger.info("📥 DSCT 데이터 수집: %s", data.strip())
+
+    def _on_air_state_line(self, data: str):
+        """AIR 상태 라인 수집 (예: AIR,FAN,ON)"""
         if self.air_reload_in_progress:
-            if "EEPROM_ACK,RELOAD,START" in data:
-                self.air_reload_data = []
-                elapsed = time.time() - self.air_reload_start_time if self.air_reload_start_time else 0
-                print(f"[RELOAD] ✅ AIR 데이터 수집 시작 (응답까지: {elapsed:.2f}초)")
-            elif "AIRCON_ACK,RELOAD,COMPLETE" in data:
-                elapsed = time.time() - self.air_reload_start_time if self.air_reload_start_time else 0
-                print(f"[RELOAD] ✅ AIR 데이터 수집 완료: {len(self.air_reload_data)}개 항목 (총 소요: {elapsed:.2f}초)")
-                # 타임아웃 타이머 취소
-                self._cancel_reload_timeout_timer("air")
-                self._apply_air_reload_state()
-                self.air_reload_in_progress = False
-                # 명령 큐 재개
-                if hasattr(self.serial_manager, 'command_queue') and self.serial_manager.command_queue:
-                    self.serial_manager.command_queue.resume_queue()
-                # 버튼 UI 상태 변경: 완료 → 정상
-                self._set_reload_button_state(self.air_reload_button, "complete")
-                self._schedule_reload_button_reset(self.air_reload_button)
-            elif data.startswith("AIR,"):
-                # 예: AIR,FAN,ON
-                self.air_reload_data.append(data.strip())
-                print(f"[RELOAD] 📥 AIR 데이터 수집: {data.strip()}")
+            self.air_reload_data.append(data.strip())
+            reload_logger.info("📥 AIR 데이터 수집: %s", data.strip())
 
     def _apply_dsct_reload_state(self):
         """DSCT 리로드 데이터를 UI에 적용"""
-        print(f"[RELOAD] DSCT UI 상태 적용 시작")
+        reload_logger.info("DSCT UI 상태 적용 시작")
         for line in self.dsct_reload_data:
             try:
                 parts = line.split(',')
@@ -440,7 +498,7 @@ class ButtonManager:
 
                 # FAN_ALL 항목 무시 (전체 설정 정보)
                 if function.startswith("FAN_ALL"):
-                    print(f"[RELOAD] FAN_ALL 항목 무시: {line}")
+                    reload_logger.info("FAN_ALL 항목 무시: %s", line)
                     continue
 
                 # FAN1~4 처리
@@ -451,7 +509,7 @@ class ButtonManager:
                         speed = int(values[1])
                         fan_num = function[-1]
                         self._update_dsct_fan_speed(fan_num, speed)
-                        print(f"[RELOAD] DSCT FAN{fan_num} 속도 복원: {speed}")
+                        reload_logger.info("DSCT FAN%s 속도 복원: %s", fan_num, speed)
                     else:
                         # DSCT,FAN1,ON 형식
                         state = values[0]  # ON/OFF
@@ -476,7 +534,7 @@ class ButtonManager:
                     if values[0] == "SPD" and len(values) > 1:
                         # DSCT,PUMP1,SPD,6 형식 → 무시 (PUMP는 ON/OFF만 존재)
                         pump_num = function[-1]
-                        print(f"[RELOAD] PUMP{pump_num},SPD 항목 무시 (ON/OFF만 사용)")
+                        reload_logger.info("PUMP%s,SPD 항목 무시 (ON/OFF만 사용)", pump_num)
                         continue
                     else:
                         # DSCT,PUMP1,ON 형식
@@ -488,7 +546,7 @@ class ButtonManager:
                 # 주의: PUMP는 ON/OFF만 존재하므로 속도 값은 무시함
                 elif function in ["PSPD1", "PSPD2"]:
                     pump_num = function[-1]
-                    print(f"[RELOAD] PUMP{pump_num},PSPD 항목 무시 (ON/OFF만 사용, 구형 프로토콜)")
+                    reload_logger.info("PUMP%s,PSPD 항목 무시 (ON/OFF만 사용, 구형 프로토콜)", pump_num)
                     # speed = int(values[0])
                     # self._update_pump_speed(pump_num, speed)
                     continue
@@ -500,7 +558,7 @@ class ButtonManager:
                         state = values[0]  # ON/OFF
                         self._update_sol_button(sol_num, state)
                     else:
-                        print(f"[RELOAD] SOL{sol_num} 항목 무시 (SOL1만 사용)")
+                        reload_logger.info("SOL%s 항목 무시 (SOL1만 사용)", sol_num)
 
                 # SEMIAUTO 처리 (DESICCANT SEMI AUTO 버튼)
                 elif function == "SEMIAUTO":
@@ -513,13 +571,13 @@ class ButtonManager:
                     self._update_dmptest_button(state)
 
             except Exception as e:
-                print(f"[RELOAD] DSCT 데이터 파싱 오류: {line} - {e}")
+                reload_logger.error("DSCT 데이터 파싱 오류: %s - %s", line, e)
 
-        print("[RELOAD] DSCT UI 상태 적용 완료")
+        reload_logger.info("DSCT UI 상태 적용 완료")
 
     def _apply_air_reload_state(self):
         """AIR 리로드 데이터를 UI에 적용"""
-        print(f"[RELOAD] AIR UI 상태 적용 시작")
+        reload_logger.info("AIR UI 상태 적용 시작")
         for line in self.air_reload_data:
             try:
                 parts = line.split(',')
@@ -581,9 +639,9 @@ class ButtonManager:
                     self._update_air_cluch_button(state)
 
             except Exception as e:
-                print(f"[RELOAD] AIR 데이터 파싱 오류: {line} - {e}")
+                reload_logger.error("AIR 데이터 파싱 오류: %s - %s", line, e)
 
-        print("[RELOAD] AIR UI 상태 적용 완료")
+        reload_logger.info("AIR UI 상태 적용 완료")
 
     # ==================== UI 업데이트 헬퍼 메서드 ====================
     def _set_button_state(self, button, is_on: bool, on_text="ON", off_text="OFF"):
@@ -611,17 +669,17 @@ class ButtonManager:
             # 버튼 UI 업데이트
             self._set_button_state(button, is_on)
             group['active'] = is_on
-            print(f"[RELOAD] DSCT FAN{fan_num} 버튼 상태 업데이트: {state}")
+            reload_logger.info("DSCT FAN%s 버튼 상태 업데이트: %s", fan_num, state)
 
             # OFF로 변경될 때 속도 버튼 초기화
             if was_on and not is_on:
                 self._handle_fan_off_callback(group_name)
-                print(f"[RELOAD] DSCT FAN{fan_num} OFF → 속도 버튼 초기화")
+                reload_logger.info("DSCT FAN%s OFF → 속도 버튼 초기화", fan_num)
 
     def _update_dsct_damper_button(self, dmp_num, position):
         """DSCT DAMPER 버튼 상태 업데이트 (TODO: 구현 필요)"""
         # DAMPER는 현재 숫자 버튼으로 되어 있어 추가 구현 필요
-        print(f"[RELOAD] DSCT DMP{dmp_num} 상태: {position} (UI 업데이트 보류)")
+        reload_logger.info("DSCT DMP%s 상태: %s (UI 업데이트 보류)", dmp_num, position)
 
     def _update_pump_button(self, pump_num, state):
         """PUMP 버튼 상태 업데이트"""
@@ -637,12 +695,12 @@ class ButtonManager:
             # 버튼 UI 업데이트
             self._set_button_state(button, is_on)
             group['active'] = is_on
-            print(f"[RELOAD] PUMP{pump_num} 버튼 상태 업데이트: {state}")
+            reload_logger.info("PUMP%s 버튼 상태 업데이트: %s", pump_num, state)
 
             # OFF로 변경될 때 속도 버튼 초기화 (PUMP는 속도 없지만 콜백 일관성 유지)
             if was_on and not is_on:
                 self._handle_fan_off_callback(group_name)
-                print(f"[RELOAD] PUMP{pump_num} OFF → 상태 초기화")
+                reload_logger.info("PUMP%s OFF → 상태 초기화", pump_num)
 
     def _update_sol_button(self, sol_num, state):
         """SOL 버튼 상태 업데이트"""
@@ -653,7 +711,7 @@ class ButtonManager:
             is_on = (state == "ON")
             self._set_button_state(button, is_on)
             group['active'] = is_on
-            print(f"[RELOAD] SOL{sol_num} 버튼 상태 업데이트: {state}")
+            reload_logger.info("SOL%s 버튼 상태 업데이트: %s", sol_num, state)
 
     def _update_semiauto_button(self, state):
         """DESICCANT SEMI AUTO 버튼 상태 업데이트"""
@@ -668,9 +726,9 @@ class ButtonManager:
                 button.setText("RUN")
                 button.setStyleSheet("font-size: 14px; font-weight: bold;")
 
-            print(f"[RELOAD] DSCT SEMIAUTO 버튼 상태 업데이트: {state}")
+            reload_logger.info("DSCT SEMIAUTO 버튼 상태 업데이트: %s", state)
         else:
-            print(f"[RELOAD] DSCT SEMIAUTO 상태: {state} (버튼 없음)")
+            reload_logger.info("DSCT SEMIAUTO 상태: %s (버튼 없음)", state)
 
     def _update_dmptest_button(self, state):
         """DAMP TEST 버튼 상태 업데이트"""
@@ -685,9 +743,9 @@ class ButtonManager:
                 button.setText("RUN")
                 button.setStyleSheet("font-size: 14px; font-weight: bold;")
 
-            print(f"[RELOAD] DSCT DMPTEST 버튼 상태 업데이트: {state}")
+            reload_logger.info("DSCT DMPTEST 버튼 상태 업데이트: %s", state)
         else:
-            print(f"[RELOAD] DSCT DMPTEST 상태: {state} (버튼 없음)")
+            reload_logger.info("DSCT DMPTEST 상태: %s (버튼 없음)", state)
 
     def _update_air_fan_button(self, group_name, state):
         """AIR FAN 버튼 상태 업데이트 (EVA FAN, CONDENSER FAN)"""
@@ -697,57 +755,57 @@ class ButtonManager:
             is_on = (state == "ON")
             self._set_button_state(button, is_on)
             group['active'] = is_on
-            print(f"[RELOAD] {group_name} 버튼 상태 업데이트: {state}")
+            reload_logger.info("%s 버튼 상태 업데이트: %s", group_name, state)
 
     def _update_air_fan_speed(self, speed):
         """EVA FAN 속도 업데이트"""
         if self.speed_button_manager:
             self.speed_button_manager.current_fan_speed = speed
-            print(f"[RELOAD] EVA FAN 속도 업데이트: {speed}")
+            reload_logger.info("EVA FAN 속도 업데이트: %s", speed)
             # UI 업데이트는 SpeedButtonManager가 관리하므로 값만 설정
         else:
-            print(f"[RELOAD] EVA FAN 속도: {speed} (SpeedButtonManager 없음)")
+            reload_logger.info("EVA FAN 속도: %s (SpeedButtonManager 없음)", speed)
 
     def _update_air_con_fan_speed(self, speed):
         """CONDENSER FAN 속도 업데이트"""
         if self.speed_button_manager:
             self.speed_button_manager.current_con_fan_speed = speed
-            print(f"[RELOAD] CON FAN 속도 업데이트: {speed}")
+            reload_logger.info("CON FAN 속도 업데이트: %s", speed)
         else:
-            print(f"[RELOAD] CON FAN 속도: {speed} (SpeedButtonManager 없음)")
+            reload_logger.info("CON FAN 속도: %s (SpeedButtonManager 없음)", speed)
 
     def _update_dsct_fan_speed(self, fan_num, speed):
         """DSCT FAN 속도 업데이트"""
         if self.speed_button_manager:
             # SpeedButtonManager의 해당 FAN 속도 값 업데이트
             setattr(self.speed_button_manager, f"current_dsct_fan{fan_num}_speed", speed)
-            print(f"[RELOAD] DSCT FAN{fan_num} 속도 업데이트: {speed}")
+            reload_logger.info("DSCT FAN%s 속도 업데이트: %s", fan_num, speed)
 
             # 속도 버튼 UI 업데이트 (새로운 순환 버튼 방식)
             if hasattr(self.speed_button_manager.main_window, f"speedButton_dsct_fan{fan_num}"):
                 speed_button = getattr(self.speed_button_manager.main_window, f"speedButton_dsct_fan{fan_num}")
                 speed_button.setText(str(speed))
         else:
-            print(f"[RELOAD] DSCT FAN{fan_num} 속도: {speed} (SpeedButtonManager 없음)")
+            reload_logger.info("DSCT FAN%s 속도: %s (SpeedButtonManager 없음)", fan_num, speed)
 
     def _update_pump_speed(self, pump_num, speed):
         """PUMP 속도 업데이트"""
         if self.speed_button_manager:
             # SpeedButtonManager의 해당 PUMP 속도 값 업데이트
             setattr(self.speed_button_manager, f"current_pump{pump_num}_speed", speed)
-            print(f"[RELOAD] PUMP{pump_num} 속도 업데이트: {speed}")
+            reload_logger.info("PUMP%s 속도 업데이트: %s", pump_num, speed)
 
             # 속도 버튼 UI 업데이트 (새로운 순환 버튼 방식)
             if hasattr(self.speed_button_manager.main_window, f"speedButton_pump{pump_num}"):
                 speed_button = getattr(self.speed_button_manager.main_window, f"speedButton_pump{pump_num}")
                 speed_button.setText(str(speed))
         else:
-            print(f"[RELOAD] PUMP{pump_num} 속도: {speed} (SpeedButtonManager 없음)")
+            reload_logger.info("PUMP%s 속도: %s (SpeedButtonManager 없음)", pump_num, speed)
 
     def _update_oa_damper_level(self, side, level):
         """OA DAMPER 레벨 업데이트 (left/right)"""
         # TODO: OA DAMPER 3버튼 구조의 숫자 버튼 업데이트 필요
-        print(f"[RELOAD] OA DAMPER ({side}) 레벨: {level} (구현 필요)")
+        reload_logger.info("OA DAMPER (%s) 레벨: %s (구현 필요)", side, level)
 
     def _update_ra_damper_button(self, group_name, state):
         """RA DAMPER 버튼 상태 업데이트"""
@@ -757,7 +815,7 @@ class ButtonManager:
             is_on = (state == "OPEN")
             self._set_button_state(button, is_on, "OPEN", "CLOSE")
             group['active'] = is_on
-            print(f"[RELOAD] {group_name} 버튼 상태 업데이트: {state}")
+            reload_logger.info("%s 버튼 상태 업데이트: %s", group_name, state)
 
     def _update_air_pump_button(self, state):
         """AIR PUMP 버튼 상태 업데이트"""
@@ -768,7 +826,7 @@ class ButtonManager:
             is_on = (state == "ON")
             self._set_button_state(button, is_on)
             group['active'] = is_on
-            print(f"[RELOAD] AIR PUMP 버튼 상태 업데이트: {state}")
+            reload_logger.info("AIR PUMP 버튼 상태 업데이트: %s", state)
 
     def _update_air_cluch_button(self, state):
         """AIR CLUCH 버튼 상태 업데이트"""
@@ -779,7 +837,7 @@ class ButtonManager:
             is_on = (state == "ON")
             self._set_button_state(button, is_on)
             group['active'] = is_on
-            print(f"[RELOAD] AIR CLUCH 버튼 상태 업데이트: {state}")
+            reload_logger.info("AIR CLUCH 버튼 상태 업데이트: %s", state)
 
     # ==================== Reload 버튼 시각적 피드백 ====================
     def _set_reload_button_state(self, button, state):
@@ -805,7 +863,7 @@ class ButtonManager:
                     padding: 5px;
                 }
             """)
-            print(f"[RELOAD] 버튼 상태: 로딩 중")
+            reload_logger.info("버튼 상태: 로딩 중")
 
         elif state == "complete":
             # 완료: 밝은 초록색 + 체크 마크
@@ -821,7 +879,7 @@ class ButtonManager:
                     padding: 5px;
                 }
             """)
-            print(f"[RELOAD] 버튼 상태: 완료")
+            reload_logger.info("버튼 상태: 완료")
 
         elif state == "error":
             # 에러: 빨간색 + X 마크
@@ -837,7 +895,7 @@ class ButtonManager:
                     padding: 5px;
                 }
             """)
-            print(f"[RELOAD] 버튼 상태: 타임아웃 오류")
+            reload_logger.error("버튼 상태: 타임아웃 오류")
 
         elif state == "normal":
             # 정상: 원래 색상 복원 + 활성화
@@ -881,7 +939,7 @@ class ButtonManager:
                     }
                 """)
             button.setEnabled(True)
-            print(f"[RELOAD] 버튼 상태: 정상 복원")
+            reload_logger.info("버튼 상태: 정상 복원")
 
     def _schedule_reload_button_reset(self, button, delay=1000):
         """
@@ -899,7 +957,7 @@ class ButtonManager:
     def _simulate_dsct_reload_response(self):
         """테스트 모드: DSCT RELOAD 더미 응답 시뮬레이션"""
         from PyQt5.QtCore import QTimer
-        print("[TEST] DSCT RELOAD 더미 응답 시뮬레이션 시작")
+        test_logger.info("DSCT RELOAD 더미 응답 시뮬레이션 시작")
 
         # START 신호 (즉시)
         QTimer.singleShot(100, lambda: self.parse_reload_response("EEPROM_ACK,RELOAD,START"))
@@ -940,7 +998,7 @@ class ButtonManager:
     def _simulate_air_reload_response(self):
         """테스트 모드: AIR RELOAD 더미 응답 시뮬레이션"""
         from PyQt5.QtCore import QTimer
-        print("[TEST] AIR RELOAD 더미 응답 시뮬레이션 시작")
+        test_logger.info("AIR RELOAD 더미 응답 시뮬레이션 시작")
 
         # START 신호 (즉시)
         QTimer.singleShot(100, lambda: self.parse_reload_response("EEPROM_ACK,RELOAD,START"))
@@ -986,7 +1044,7 @@ class ButtonManager:
             self.dsct_reload_timer.setSingleShot(True)
             self.dsct_reload_timer.timeout.connect(lambda: self._handle_reload_timeout("dsct"))
             self.dsct_reload_timer.start(self.reload_timeout)
-            print(f"[RELOAD] DSCT 타임아웃 타이머 시작: {self.reload_timeout}ms")
+            reload_logger.info("DSCT 타임아웃 타이머 시작: %sms", self.reload_timeout)
 
         elif reload_type == "air":
             # 기존 타이머가 있으면 중지
@@ -997,7 +1055,7 @@ class ButtonManager:
             self.air_reload_timer.setSingleShot(True)
             self.air_reload_timer.timeout.connect(lambda: self._handle_reload_timeout("air"))
             self.air_reload_timer.start(self.reload_timeout)
-            print(f"[RELOAD] AIR 타임아웃 타이머 시작: {self.reload_timeout}ms")
+            reload_logger.info("AIR 타임아웃 타이머 시작: %sms", self.reload_timeout)
 
     def _cancel_reload_timeout_timer(self, reload_type):
         """
@@ -1008,13 +1066,13 @@ class ButtonManager:
             if self.dsct_reload_timer is not None:
                 self.dsct_reload_timer.stop()
                 self.dsct_reload_timer = None
-                print(f"[RELOAD] DSCT 타임아웃 타이머 취소")
+                reload_logger.info("DSCT 타임아웃 타이머 취소")
 
         elif reload_type == "air":
             if self.air_reload_timer is not None:
                 self.air_reload_timer.stop()
                 self.air_reload_timer = None
-                print(f"[RELOAD] AIR 타임아웃 타이머 취소")
+                reload_logger.info("AIR 타임아웃 타이머 취소")
 
     def _handle_reload_timeout(self, reload_type):
         """
@@ -1022,7 +1080,7 @@ class ButtonManager:
         reload_type: "dsct" 또는 "air"
         """
         if reload_type == "dsct":
-            print(f"[RELOAD] ⚠️ DSCT 리로드 타임아웃! (응답 없음)")
+            reload_logger.warning("⚠️ DSCT 리로드 타임아웃! (응답 없음)")
             # 진행 중 플래그 해제
             self.dsct_reload_in_progress = False
             self.dsct_reload_data = []
@@ -1035,7 +1093,7 @@ class ButtonManager:
             self._schedule_reload_button_reset(self.dsct_reload_button, delay=2000)
 
         elif reload_type == "air":
-            print(f"[RELOAD] ⚠️ AIR 리로드 타임아웃! (응답 없음)")
+            reload_logger.warning("⚠️ AIR 리로드 타임아웃! (응답 없음)")
             # 진행 중 플래그 해제
             self.air_reload_in_progress = False
             self.air_reload_data = []
@@ -1059,10 +1117,10 @@ class ButtonManager:
         # SOL1 버튼 가져오기
         sol1_button = self._get_sol1_button()
         if not sol1_button:
-            print("[SOL] ⚠️ SOL1 버튼을 찾을 수 없음")
+            sol_logger.warning("⚠️ SOL1 버튼을 찾을 수 없음")
             return
 
-        print("[SOL] Flicker 애니메이션 시작")
+        sol_logger.info("Flicker 애니메이션 시작")
         self._sol_flicker_tick()
 
     def _sol_flicker_tick(self):
@@ -1070,7 +1128,7 @@ class ButtonManager:
         from PyQt5.QtCore import QTimer
 
         if not self.sol_in_progress:
-            print("[SOL] Flicker 중지 (진행 중 아님)")
+            sol_logger.info("Flicker 중지 (진행 중 아님)")
             return
 
         sol1_button = self._get_sol1_button()
@@ -1110,7 +1168,7 @@ class ButtonManager:
         """
         from PyQt5.QtCore import QTimer
 
-        print(f"[SOL] Flicker 중지 - 최종 상태: {final_state}")
+        sol_logger.info("Flicker 중지 - 최종 상태: %s", final_state)
 
         # 진행 중 플래그 해제
         self.sol_in_progress = False
@@ -1160,18 +1218,18 @@ class ButtonManager:
         self.sol_timeout_timer.setSingleShot(True)
         self.sol_timeout_timer.timeout.connect(self._handle_sol_timeout)
         self.sol_timeout_timer.start(self.sol_timeout)
-        print(f"[SOL] 타임아웃 타이머 시작: {self.sol_timeout}ms")
+        sol_logger.info("타임아웃 타이머 시작: %sms", self.sol_timeout)
 
     def _cancel_sol_timeout_timer(self):
         """SOL 타임아웃 타이머 취소"""
         if self.sol_timeout_timer is not None:
             self.sol_timeout_timer.stop()
             self.sol_timeout_timer = None
-            print("[SOL] 타임아웃 타이머 취소")
+            sol_logger.info("타임아웃 타이머 취소")
 
     def _handle_sol_timeout(self):
         """SOL 타임아웃 처리"""
-        print("[SOL] ⚠️ 타임아웃! (20초 경과, 응답 없음)")
+        sol_logger.warning("⚠️ 타임아웃! (20초 경과, 응답 없음)")
 
         # Flicker 중지 및 에러 상태 표시
         self.sol_in_progress = False
@@ -1207,7 +1265,7 @@ class ButtonManager:
             sol1_button.setText("OFF")
             if 'sol1' in self.button_groups:
                 self.button_groups['sol1']['active'] = False
-            print("[SOL] 버튼 OFF 상태로 리셋 완료")
+            sol_logger.info("버튼 OFF 상태로 리셋 완료")
 
     def parse_sol_response(self, data: str):
         """
@@ -1221,26 +1279,26 @@ class ButtonManager:
             return  # SOL 동작 중이 아니면 무시
 
         if "DSCT,SOL,All Opening!" in data:
-            print("[SOL] 밸브 열림 시작")
+            sol_logger.info("밸브 열림 시작")
             # 이미 Flicker 중이므로 추가 동작 없음
 
         elif "DSCT,SOL All Open OK!" in data:
-            print("[SOL] ✅ 밸브 열림 완료")
+            sol_logger.info("✅ 밸브 열림 완료")
             self._stop_sol_flicker(final_state='ON')
 
         elif "DSCT,SOL,All Closing!" in data:
-            print("[SOL] 밸브 닫힘 시작")
+            sol_logger.info("밸브 닫힘 시작")
             # 이미 Flicker 중이므로 추가 동작 없음
 
         elif "DSCT,SOL All Close OK!" in data:
-            print("[SOL] ✅ 밸브 닫힘 완료")
+            sol_logger.info("✅ 밸브 닫힘 완료")
             self._stop_sol_flicker(final_state='OFF')
 
     # ==================== 테스트 모드: SOL 더미 응답 ====================
     def _simulate_sol_open_response(self):
         """테스트 모드: SOL OPEN 더미 응답 시뮬레이션 (15초)"""
         from PyQt5.QtCore import QTimer
-        print("[TEST] SOL OPEN 더미 응답 시뮬레이션 시작")
+        test_logger.info("SOL OPEN 더미 응답 시뮬레이션 시작")
 
         # Opening 메시지 (즉시)
         QTimer.singleShot(100, lambda: self.parse_sol_response("DSCT,SOL,All Opening!"))
@@ -1251,7 +1309,7 @@ class ButtonManager:
     def _simulate_sol_close_response(self):
         """테스트 모드: SOL CLOSE 더미 응답 시뮬레이션 (15초)"""
         from PyQt5.QtCore import QTimer
-        print("[TEST] SOL CLOSE 더미 응답 시뮬레이션 시작")
+        test_logger.info("SOL CLOSE 더미 응답 시뮬레이션 시작")
 
         # Closing 메시지 (즉시)
         QTimer.singleShot(100, lambda: self.parse_sol_response("DSCT,SOL,All Closing!"))
@@ -0,0 +1,188 @@
+"""
+명령 송신 간격 자동 조절 (AIMD)
+
+장비 계열(AIR, DSCT)마다 송신 간격을 따로 두고, 펌웨어 응답을 보고 간격을 조절합니다.
+- ACK가 빠르게 오면 평활 왕복 시간마다 한 번 간격을 step_ms씩 줄임 (가법 증가: 송신 속도를 조금씩 올림)
+  → ACK마다 줄이면 응답 대기 창만큼 몰려온 ACK가 직전 감속을 바로 되돌림
+  → 간격 때문에 실제로 송신을 미룬 적이 있을 때만 줄임 (다른 계열 명령 뒤에서 기다리느라
+    저절로 띄엄띄엄 나간 경우에는 펌웨어가 더 빠른 속도를 견디는지 알 수 없음)
+  → 첫 실패 전까지는 줄일 때마다 간격을 backoff로 나눔 (TCP 슬로 스타트처럼 빠르게 하한 근처까지)
+- NAK, 응답 타임아웃, 느린 ACK(slow_rtt_ms 초과)면 간격을 backoff배로 늘림 (승법 감소)
+  → 한 번 밀린 뒤 응답이 몰려와도 계속 늘어나지 않도록 평활 왕복 시간 동안은 한 번만 늘림
+- 간격은 계열별 하한/상한(limits) 안에서만 움직임
+  → 하한은 펌웨어 문서의 최소 명령 간격(200ms, CHANGELOG v3.12) 아래로 내려가지 않음 (설정값이 더 작아도 200ms)
+
+ACK를 추적하지 않는 명령(TH, AIR 설정 등)은 간격을 조절하지 않지만 같은 계열의 하한 간격은 지킵니다 (floor_delay).
+AIR/DSCT가 아닌 명령은 대상이 아닙니다 (family() → None).
+
+사용 예:
+    pacer = CommandPacer(limits={'AIR': (200, 1000), 'DSCT': (200, 2000)})
+    family = pacer.family("$CMD,DSCT,FAN1,ON")     # 'DSCT'
+    if pacer.delay(family) == 0:
+        send(...)
+        pacer.on_sent(family)
+    pacer.on_ack(family, rtt_ms)                    # 또는 pacer.on_failure(family, "NAK")
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+# 펌웨어가 연속 명령 사이에 요구하는 최소 간격 (ms) - 더 빠르면 응답이 씹힘 (CHANGELOG v3.12)
+FIRMWARE_MIN_INTERVAL_MS = 200.0
+
+# 계열별 기본 송신 간격 하한/상한 (ms)
+DEFAULT_LIMITS_MS: Dict[str, Tuple[float, float]] = {
+    'AIR': (FIRMWARE_MIN_INTERVAL_MS, 1000.0),
+    'DSCT': (FIRMWARE_MIN_INTERVAL_MS, 1000.0),
+}
+
+
+class FamilyPace:
+    """장비 계열 1개의 송신 간격 상태"""
+
+    def __init__(self, name: str, min_interval_ms: float, max_interval_ms: float, initial_interval_ms: float):
+        self.name = name
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max(min_interval_ms, max_interval_ms)
+        self.interval_ms = max(self.min_interval_ms, min(self.max_interval_ms, initial_interval_ms))
+        self.last_sent: Optional[float] = None
+        self.srtt_ms = 0.0
+        self.last_backoff: Optional[float] = None
+        self.last_decrease: Optional[float] = None
+        self.limited = False  # 마지막 감소 이후 간격 때문에 송신을 미룬 적이 있는지
+        self.slow_start = True  # 첫 실패 전 (간격을 나눠서 줄임)
+        self.reason = "초기값"
+
+        # 통계
+        self.total_acks = 0
+        self.total_backoffs = 0
+
+    def get_stats(self) -> dict:
+        return {
+            'interval_ms': round(self.interval_ms, 1),
+            'rate_per_s': round(1000.0 / self.interval_ms, 1) if self.interval_ms > 0 else None,
+            'min_ms': self.min_interval_ms,
+            'max_ms': self.max_interval_ms,
+            'srtt_ms': round(self.srtt_ms, 1),
+            'acks': self.total_acks,
+            'backoffs': self.total_backoffs,
+            'reason': self.reason,
+        }
+
+
+class CommandPacer:
+    """장비 계열별 AIMD 송신 간격 조절기"""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None,
+                 initial_interval_ms: float = FIRMWARE_MIN_INTERVAL_MS, step_ms: float = 5.0,
+                 backoff: float = 2.0, slow_rtt_ms: float = 300.0):
+        self.step_ms = step_ms
+        self.backoff = max(1.0, backoff)
+        self.slow_rtt_ms = slow_rtt_ms
+
+        merged = dict(DEFAULT_LIMITS_MS)
+        for name, bounds in (limits or {}).items():
+            # 예전 설정 파일의 하한(AIR 10ms, DSCT 5ms)이 남아 있어도 펌웨어 최소 간격 아래로는 내리지 않음
+            merged[name.upper()] = (max(FIRMWARE_MIN_INTERVAL_MS, float(bounds[0])), float(bounds[1]))
+        self.families: Dict[str, FamilyPace] = {
+            name: FamilyPace(name, low, high, initial_interval_ms) for name, (low, high) in merged.items()
+        }
+
+    def family(self, command: str) -> Optional[str]:
+        """명령의 장비 계열 ($CMD,AIR,... → 'AIR'), 조절 대상이 아니면 None"""
+        parts = command.split(',', 2)
+        if len(parts) < 3 or parts[0].strip() != '$CMD':
+            return None
+        name = parts[1].strip()
+        return name if name in self.families else None
+
+    def interval(self, family: str) -> float:
+        """현재 송신 간격 (초)"""
+        return self.families[family].interval_ms / 1000.0
+
+    def delay(self, family: str, now: Optional[float] = None) -> float:
+        """다음 송신까지 남은 시간 (초, 바로 보낼 수 있으면 0)"""
+        pace = self.families[family]
+        if pace.last_sent is None:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        remaining = pace.last_sent + pace.interval_ms / 1000.0 - now
+        if remaining <= 0:
+            return 0.0
+        pace.limited = True
+        return remaining
+
+    def floor_delay(self, family: str, now: Optional[float] = None) -> float:
+        """하한 간격 기준 다음 송신까지 남은 시간 (초) - 응답으로 조절하지 않는 명령(ACK 미추적)용"""
+        pace = self.families[family]
+        if pace.last_sent is None:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, pace.last_sent + pace.min_interval_ms / 1000.0 - now)
+
+    def on_sent(self, family: str, now: Optional[float] = None):
+        """송신 시각 기록"""
+        self.families[family].last_sent = time.monotonic() if now is None else now
+
+    def on_ack(self, family: str, rtt_ms: float, now: Optional[float] = None) -> bool:
+        """
+        ACK 수신 반영
+
+        Returns:
+            간격이 바뀌었는지 여부
+        """
+        pace = self.families[family]
+        pace.total_acks += 1
+        pace.srtt_ms = rtt_ms if pace.total_acks == 1 else pace.srtt_ms * 0.875 + rtt_ms * 0.125
+        if self.slow_rtt_ms and rtt_ms > self.slow_rtt_ms:
+            return self._back_off(pace, f"응답 지연 {rtt_ms:.0f}ms", now)
+
+        # 간격이 송신을 제한한 경우에만, 왕복 시간마다 한 번 줄임
+        now = time.monotonic() if now is None else now
+        if not pace.limited:
+            return False
+        if pace.last_decrease is not None and now - pace.last_decrease < pace.srtt_ms / 1000.0:
+            return False
+        pace.last_decrease = now
+        pace.limited = False
+
+        previous = pace.interval_ms
+        if pace.slow_start:
+            pace.interval_ms = max(pace.min_interval_ms, pace.interval_ms / self.backoff)
+        else:
+            pace.interval_ms = max(pace.min_interval_ms, pace.interval_ms - self.step_ms)
+        if pace.interval_ms == previous:
+            return False
+        pace.reason = "하한 도달" if pace.interval_ms == pace.min_interval_ms else "응답 정상"
+        return True
+
+    def on_failure(self, family: str, reason: str, now: Optional[float] = None) -> bool:
+        """
+        NAK/응답 타임아웃 반영
+
+        Returns:
+            간격이 바뀌었는지 여부
+        """
+        return self._back_off(self.families[family], reason, now)
+
+    def _back_off(self, pace: FamilyPace, reason: str, now: Optional[float]) -> bool:
+        now = time.monotonic() if now is None else now
+        # 같은 혼잡으로 인한 연속 실패는 한 번만 반영 (평활 왕복 시간 또는 현재 간격 동안)
+        hold = max(pace.srtt_ms, pace.interval_ms) / 1000.0
+        if pace.last_backoff is not None and now - pace.last_backoff < hold:
+            return False
+        pace.last_backoff = now
+        pace.slow_start = False
+        pace.reason = reason
+
+        previous = pace.interval_ms
+        pace.interval_ms = min(pace.max_interval_ms, max(pace.interval_ms * self.backoff,
+                                                          pace.interval_ms + self.step_ms))
+        if pace.interval_ms == previous:
+            return False
+        pace.total_backoffs += 1
+        return True
+
+    def get_stats(self) -> dict:
+        """계열별 송신 간격/속도 반환"""
+        return {name: pace.get_stats() for name, pace in self.families.items()}
@@ -1,14 +1,72 @@
 """
 명령 전송 큐 시스템
 UI hang 방지를 위한 비동기 명령 처리
+
+처리 시점 (주기 타이머 없음):
+- 명령 추가, 큐 재개, 연결(자동 재연결 포함), ACK/NAK 수신, 응답 타임아웃 시 바로 처리
+- 최소 명령 간격이나 계열별 송신 간격이 남았으면 남은 시간만큼 단발 타이머(process_timer) 설정
+- 큐가 비었거나 응답 대기 창이 찼으면 타이머 없이 대기 (유휴 중 깨어나지 않음)
+
+ACK 추적 (serial 설정 ack_tracking, 기본값 켬):
+- 펌웨어가 ACK/NAK로 응답하는 명령은 응답 대기 창(inflight_window)만큼 연속 전송 (파이프라이닝)
+- ACK가 오면 성공(command_acked) 처리 후 바로 다음 명령 전송
+- NAK 또는 응답 타임아웃(ack_timeout_ms, RELOAD는 더 김 - 묶음은 add_batch(ack_timeout=))일 때만 재시도
+- 응답을 추적하지 않는 명령(TH 등)은 기존처럼 최소 명령 간격(50ms)으로 1개씩 전송
+- 쓰기 스레드의 실제 write() 실패(SerialManager.write_failed)도 재시도 경로로 처리
+  (응답 대기 중인 명령은 대기 목록에서 빼서 재시도, 추적하지 않는 명령은 이미 성공 콜백을 불렀으므로 콜백 없이 재전송만)
+
+송신 간격 자동 조절 (serial 설정 adaptive_pacing, ACK 추적 시에만):
+- AIR/DSCT 계열마다 송신 간격을 ACK 왕복 시간, NAK, 타임아웃으로 조절 (command_pacer.py, AIMD)
+- 현재 간격은 pacing_changed 시그널과 get_queue_info()['pacing']으로 확인
+
+설정값 명령 병합 (serial 설정 coalesce_commands):
+- 같은 (시스템, 장치, 기능) 명령이 아직 전송 전이면 새 값으로 교체 (마지막 값만 전송)
+  예: FAN1,SPD,3 → FAN1,SPD,4 → FAN1,SPD,5 연타 시 FAN1,SPD,5 한 번, FAN1,ON → FAN1,OFF는 FAN1,OFF 한 번
+- 교체된 명령의 콜백은 새 명령의 결과로 호출, 절약한 전송 수는 get_queue_info()['coalesced']
+
+대기열 상한과 만료 (serial 설정 queue_capacity, queue_overflow, command_ttl_sec):
+- 우선순위별 최대 대기 명령 수, 가득 차면 drop_oldest(가장 오래된 명령 삭제) 또는 reject_new(새 명령 거부)
+  기본값: LOW 센서 요청은 drop_oldest, NORMAL/HIGH는 reject_new (add_command()가 False 반환)
+- 만료 시각이 지난 명령(기본: LOW 10초 - 센서 스케줄러 응답 대기 시간)은 보내지 않고 버림
+  → 연결이 끊긴 동안 쌓인 $CMD,AIR,TH 등이 재연결 후 한꺼번에 늦게 나가지 않음
+- 버린/거부한 명령은 command_dropped(command, 사유) 시그널과 실패 콜백으로 알림
+
+명령 묶음 (add_batch):
+- 순서가 있는 명령 여러 개를 한꺼번에 받아들이거나(대기열 자리가 모두 있을 때) 모두 거부
+- 묶음의 첫 명령을 보낸 뒤 모든 명령이 끝날(ACK/실패) 때까지 같은 우선순위 이하의 다른 명령은 보내지 않음
+  (더 높은 우선순위 명령은 끼어들 수 있음 - NORMAL 묶음 중 HIGH 정지 명령,
+   HIGH 묶음 중에도 묶음이 아닌 HIGH 명령은 끼어듦 - RELOAD 완료를 기다리는 동안 정지 명령)
+- 묶음 명령은 앞 명령이 끝난(ACK/실패) 뒤 하나씩 보냄 → NAK로 재시도해도 순서가 바뀌지 않음
+- 송신 간격/ACK/재시도는 일반 명령과 같고, 끝나면 callback(전체 성공 여부, [(명령, 성공, 결과), ...]) 한 번 호출
+  예: AUTO 탭 SAVE(TEMPSET, CO2SET, PM25SET, SEMITIME), RELOAD(완료 응답까지 다른 명령 차단)
+
+스케줄링 (serial 설정 queue_scheduling):
+- priority (기본값): HIGH → NORMAL → LOW 순서, 앞 우선순위 대기열이 비어야 다음 대기열 처리
+- edf: HIGH는 항상 먼저, NORMAL/LOW는 대기열 맨 앞 명령의 마감 시각이 이른 쪽부터 (Earliest Deadline First)
+  → 오래 기다린 LOW 센서 요청은 새로 들어오는 NORMAL 명령보다 마감이 빨라져 차례가 옴 (굶지 않음)
+  대기열 안에서는 추가한 순서 유지 (같은 장치 명령 순서가 바뀌지 않도록)
+- 마감 시각 = 추가 시각 + 출처별 여유(origin_deadline_ms) 또는 우선순위별 여유(command_deadline_ms)
+  출처(origin)는 add_command(..., origin="sensor") 등으로 지정, 없으면 우선순위 이름 (high/normal/low)
+- 두 방식 모두 출처별 마감 초과/버림 횟수를 get_queue_info()['deadlines']로 확인 (첫 전송 기준)
+
+지연 통계 (queue_metrics.py):
+- 우선순위별 큐 대기(wait), 쓰기 호출(send), ACK 왕복(ack) 히스토그램 (최근 queue_metrics_window_sec초)
+- get_queue_info()['latency'] → {'HIGH': {'wait': {'count', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}, ...}, ...}
 """
 
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QMutex, QMutexLocker
 from collections import deque
-from typing import Optional, Callable, Any, Dict
+from typing import Optional, Callable, Any, Deque, Dict, List, Tuple
+import math
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
+from .ack_matcher import AckMatcher, LONG_RESPONSE_TIMEOUTS, RESPONSE_ROUTES, response_key
+from .command_pacer import CommandPacer, FIRMWARE_MIN_INTERVAL_MS
+from .queue_metrics import DeadlineStats, QueueMetrics
+from utils.log_manager import get_logger
+
+logger = get_logger("QUEUE")
 
 class CommandPriority(Enum):
     """명령 우선순위"""
@@ -25,6 +83,246 @@ class Command:
     retry_count: int = 0
     max_retries: int = 3
     timestamp: float = 0
+    key: Optional[Tuple[str, str, str]] = None  # 병합 키 (coalesce_key)
+    expires_at: Optional[float] = None  # 만료 시각 (time.time() 기준, None이면 만료 없음)
+    batch: Optional["CommandBatch"] = None  # 속한 명령 묶음 (add_batch)
+    origin: str = ""  # 출처 (sensor, button 등 - 마감 여유/통계 구분)
+    deadline: Optional[float] = None  # 마감 시각 (time.time() 기준, edf 스케줄링 순서)
+    ack_timeout: Optional[float] = None  # 응답 대기 시간 (초, None이면 ack_timeout_ms/명령별 기본값)
+
+
+class CommandBatch:
+    """순서대로, 다른 명령과 섞이지 않게 보내는 명령 묶음"""
+
+    def __init__(self, commands: List[str], priority: CommandPriority, callback: Optional[Callable] = None):
+        self.commands = list(commands)
+        self.priority = priority
+        self.callback = callback
+        # 명령별 결과 (성공 여부, 결과 문자열), 아직 끝나지 않았으면 None
+        self.results: List[Optional[Tuple[bool, str]]] = [None] * len(self.commands)
+
+    def item_callback(self, index: int, on_item_done: Callable[["CommandBatch"], None]) -> Callable:
+        """명령별 콜백 (결과 기록 후 on_item_done(묶음) 호출)"""
+        def callback(success, result):
+            self.results[index] = (success, result)
+            on_item_done(self)
+        return callback
+
+    @property
+    def done(self) -> bool:
+        return all(result is not None for result in self.results)
+
+    @property
+    def success(self) -> bool:
+        return self.done and all(result[0] for result in self.results)
+
+    def item_results(self) -> List[Tuple[str, bool, str]]:
+        """[(명령, 성공 여부, 결과), ...] (끝나지 않은 명령은 (명령, False, '미완료'))"""
+        return [(command, *(result or (False, "미완료"))) for command, result in zip(self.commands, self.results)]
+
+# 대기열이 가득 찼을 때 처리 방식
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_REJECT_NEW = "reject_new"
+
+# 우선순위별 기본 대기열 설정 (최대 대기 수(0이면 무제한), 가득 찼을 때 처리, 만료 시간(초, 0이면 없음))
+DEFAULT_QUEUE_LIMITS: Dict[CommandPriority, Tuple[int, str, float]] = {
+    CommandPriority.HIGH: (50, OVERFLOW_REJECT_NEW, 0),
+    CommandPriority.NORMAL: (100, OVERFLOW_REJECT_NEW, 0),
+    CommandPriority.LOW: (20, OVERFLOW_DROP_OLDEST, 10),
+}
+
+# 명령을 버린 사유 (command_dropped 시그널, 실패 콜백)
+DROP_EXPIRED = "만료"
+DROP_OVERFLOW = "대기열 초과 (오래된 명령 삭제)"
+DROP_REJECTED = "대기열 가득 참"
+DROP_CLEARED = "대기열 비움"
+
+# 쓰기 실패를 알릴 때 찾아볼 최근 추적하지 않는 명령 수 (쓰기 스레드 큐에 남아 있을 수 있는 만큼)
+WRITE_FAILURE_LOOKBACK = 64
+
+
+def queue_limits(settings: dict) -> Dict[CommandPriority, Tuple[int, str, float]]:
+    """serial 설정(queue_capacity, queue_overflow, command_ttl_sec)에서 우선순위별 대기열 설정"""
+    limits = {}
+    for priority, (capacity, overflow, ttl) in DEFAULT_QUEUE_LIMITS.items():
+        limits[priority] = (
+            int(settings.get("queue_capacity", {}).get(priority.name, capacity)),
+            settings.get("queue_overflow", {}).get(priority.name, overflow),
+            float(settings.get("command_ttl_sec", {}).get(priority.name, ttl)),
+        )
+    return limits
+
+
+# 스케줄링 방식
+SCHEDULE_PRIORITY = "priority"
+SCHEDULE_EDF = "edf"
+
+# 우선순위별 기본 마감 여유 (ms) - LOW는 센서 스케줄러 응답 대기(10초)보다 훨씬 짧게
+DEFAULT_DEADLINES_MS: Dict[CommandPriority, float] = {
+    CommandPriority.HIGH: 50,
+    CommandPriority.NORMAL: 300,
+    CommandPriority.LOW: 2000,
+}
+
+
+def deadline_budgets(settings: dict) -> Tuple[Dict[CommandPriority, float], Dict[str, float]]:
+    """serial 설정(command_deadline_ms, origin_deadline_ms)에서 (우선순위별, 출처별) 마감 여유 (초)"""
+    by_priority = {
+        priority: float(settings.get("command_deadline_ms", {}).get(priority.name, default)) / 1000.0
+        for priority, default in DEFAULT_DEADLINES_MS.items()
+    }
+    by_origin = {origin: float(ms) / 1000.0 for origin, ms in settings.get("origin_deadline_ms", {}).items()}
+    return by_priority, by_origin
+
+
+def command_deadline(budgets: Tuple[Dict[CommandPriority, float], Dict[str, float]],
+                     priority: CommandPriority, origin: str, now: float) -> float:
+    """마감 시각 (출처별 여유가 있으면 그 값, 없으면 우선순위별 여유)"""
+    by_priority, by_origin = budgets
+    return now + by_origin.get(origin, by_priority[priority])
+
+
+def service_order(queues: Dict[CommandPriority, Deque[Command]], scheduling: str) -> List[CommandPriority]:
+    """다음 명령을 찾을 우선순위 순서 (edf면 HIGH 다음 NORMAL/LOW는 맨 앞 명령의 마감 시각 순)"""
+    if scheduling != SCHEDULE_EDF:
+        return [CommandPriority.HIGH, CommandPriority.NORMAL, CommandPriority.LOW]
+
+    def head_deadline(priority):
+        queue = queues[priority]
+        if not queue or queue[0].deadline is None:
+            return math.inf
+        return queue[0].deadline
+
+    # 마감이 같으면 NORMAL 먼저 (sorted는 순서 유지)
+    return [CommandPriority.HIGH] + sorted((CommandPriority.NORMAL, CommandPriority.LOW), key=head_deadline)
+
+
+def is_expired(cmd: Command, now: float) -> bool:
+    return cmd.expires_at is not None and now >= cmd.expires_at
+
+
+def take_expired(queue: Deque[Command], now: float) -> List[Command]:
+    """만료된 명령을 큐에서 모두 빼서 반환"""
+    expired = [cmd for cmd in queue if is_expired(cmd, now)]
+    for cmd in expired:
+        queue.remove(cmd)
+    return expired
+
+
+def admit(queue: Deque[Command], cmd: Command, capacity: int, overflow: str) -> Tuple[bool, List[Command]]:
+    """
+    대기열 상한을 지키며 cmd 추가
+
+    Returns:
+        (추가 여부, 자리를 만들려고 버린 명령 목록)
+    """
+    if capacity <= 0 or len(queue) < capacity:
+        queue.append(cmd)
+        return True, []
+    if overflow != OVERFLOW_DROP_OLDEST:
+        return False, []
+    dropped = []
+    while len(queue) >= capacity:
+        dropped.append(queue.popleft())
+    queue.append(cmd)
+    return True, dropped
+
+# 병합하지 않는 기능 (조회/동작 시작 명령 - 보낸 횟수 자체가 의미 있음)
+_NON_COALESCABLE_FUNCTIONS = {'TH', 'GETSET', 'RELOAD', 'SEMIAUTO', 'DMPTEST'}
+
+# 병합하지 않는 방향 인자 ($CMD,AIR,ALTDMP,OPEN,1 = 현재 위치에서 1단계 이동 - 연타 횟수만큼 움직여야 함)
+_STEP_ARGS = {'OPEN', 'CLOSE'}
+
+
+def coalesce_key(command: str) -> Optional[Tuple[str, str, str]]:
+    """
+    설정값 명령의 병합 키 (시스템, 장치, 기능), 병합하지 않는 명령이면 None
+
+    $CMD,DSCT,FAN1,SPD,3      → ('DSCT', 'FAN1', 'SPD')
+    $CMD,DSCT,FAN1,ON / OFF   → ('DSCT', 'FAN1', '')
+    $CMD,DSCT,DMP2_OPEN,4     → ('DSCT', 'DMP2', '')     (OPEN/CLOSE는 같은 댐퍼 위치)
+    $CMD,AIR,CON_SPD,3 / OFF  → ('AIR', 'CON_SPD', '')
+    $CMD,AIR,ALTDMP,OPEN,1    → None                     (상대 이동 명령은 절대 설정값이 아님)
+    """
+    parts = [part.strip() for part in command.split(',')]
+    if len(parts) < 4 or parts[0] != '$CMD' or parts[1] not in ('DSCT', 'AIR'):
+        return None
+    system, function, args = parts[1], parts[2], parts[3:]
+    if function in _NON_COALESCABLE_FUNCTIONS or args[0] in _STEP_ARGS:
+        return None
+    if system == 'DSCT' and function.startswith('SOL'):
+        return (system, 'SOL', '')  # SOL1~4는 한 명령으로 전체 제어
+    if system == 'DSCT' and function.startswith('DMP') and '_' in function:
+        return (system, function.split('_', 1)[0], '')
+    if len(args) > 1 and args[0].isalpha():
+        return (system, function, args[0])
+    return (system, function, '')
+
+
+def target_key(command: str) -> Optional[Tuple[str, str]]:
+    """
+    설정값 명령의 대상 장치 (시스템, 장치), 설정값 명령이 아니면 None
+
+    병합 여부와 관계없이 같은 장치 명령의 송신 순서를 지키는 데 사용 (coalesce_key 앞 두 항목)
+    """
+    key = coalesce_key(command)
+    return key[:2] if key is not None else None
+
+
+def coalesce_into(queue: Deque[Command], cmd: Command) -> Optional[Command]:
+    """
+    같은 키의 대기 중 명령을 cmd로 교체
+
+    같은 장치의 다른 명령이 뒤에 없으면 제자리 교체(대기 순서 유지), 있으면 앞의 명령을 빼고
+    cmd를 뒤에 추가 (예: FAN1,ON → FAN1,SPD,3 → FAN1,OFF 순서가 바뀌지 않도록).
+
+    Returns:
+        교체된 명령 (같은 키가 없으면 None, cmd는 큐에 넣지 않음)
+    """
+    if cmd.key is None:
+        return None
+    for index in range(len(queue) - 1, -1, -1):
+        queued = queue[index]
+        if queued.key != cmd.key:
+            continue
+        device = cmd.key[:2]
+        cmd.callback = _chain_callbacks(queued.callback, cmd.callback)
+        if any(later.key is not None and later.key[:2] == device for later in list(queue)[index + 1:]):
+            del queue[index]
+            queue.append(cmd)
+        else:
+            queue[index] = cmd
+        return queued
+    return None
+
+
+def absorb_into(queue: Deque[Command], cmd: Command) -> bool:
+    """
+    재전송할 cmd보다 새 값의 같은 키 명령이 이미 대기 중이면 cmd를 버리고 콜백만 넘김
+
+    Returns:
+        흡수 여부 (True면 cmd를 다시 큐에 넣지 않음)
+    """
+    if cmd.key is None:
+        return False
+    for queued in queue:
+        if queued.key == cmd.key:
+            queued.callback = _chain_callbacks(cmd.callback, queued.callback)
+            return True
+    return False
+
+
+def _chain_callbacks(first: Optional[Callable], second: Optional[Callable]) -> Optional[Callable]:
+    """교체된 명령의 콜백도 새 명령 결과로 호출"""
+    if first is None:
+        return second
+    if second is None:
+        return first
+
+    def chained(success, result):
+        first(success, result)
+        second(success, result)
+    return chained
 
 class CommandQueueManager(QObject):
     """명령 큐 관리자"""
@@ -32,11 +330,16 @@ class CommandQueueManager(QObject):
     # 시그널 정의
     command_sent = pyqtSignal(str)
     command_failed = pyqtSignal(str, str)  # command, error
+    command_acked = pyqtSignal(str, float)  # command, 왕복 시간(ms)
     queue_status_changed = pyqtSignal(int)  # queue size
+    pacing_changed = pyqtSignal(str, float, str)  # 장비 계열, 송신 간격(ms), 사유
+    command_dropped = pyqtSignal(str, str)  # command, 사유 (만료, 대기열 초과/가득 참)
+    # 처리 요청 (다른 스레드에서 add_command 시 큐 스레드에서 처리되도록 시그널 경유)
+    _wakeup_requested = pyqtSignal()
     
     def __init__(self, serial_manager=None):
         super().__init__()
-        self.serial_manager = serial_manager
+        self.serial_manager = None
         
         # 우선순위별 큐
         self.high_queue = deque()
@@ -46,10 +349,11 @@ class CommandQueueManager(QObject):
         # 스레드 안전성을 위한 뮤텍스
         self.mutex = QMutex()
         
-        # 처리 타이머
+        # 처리 타이머 (명령 간격이 남았을 때만 남은 시간으로 설정되는 단발 타이머)
         self.process_timer = QTimer()
+        self.process_timer.setSingleShot(True)
         self.process_timer.timeout.connect(self._process_queue)
-        self.process_timer.start(50)  # 50ms마다 처리
+        self._wakeup_requested.connect(self._process_queue)
         
         # 상태 관리
         self.is_processing = False
@@ -57,111 +361,437 @@ class CommandQueueManager(QObject):
         self.last_command_time = 0
         self.min_command_interval = 0.05  # 최소 명령 간격 (50ms)
         
+        # ACK 추적 (응답 대기 창, 응답 타임아웃)
+        settings = self._serial_settings()
+        self.ack_tracking = settings.get("ack_tracking", True)
+        self.inflight_window = max(1, settings.get("inflight_window", 4))
+        self.ack_matcher = AckMatcher(timeout=settings.get("ack_timeout_ms", 1000) / 1000.0)
+        self.ack_timer = QTimer()
+        self.ack_timer.setSingleShot(True)
+        self.ack_timer.timeout.connect(self._on_ack_timeout)
+
+        # 송신 간격 자동 조절 (계열별 간격이 남은 동안은 process_timer로 대기)
+        self.adaptive_pacing = settings.get("adaptive_pacing", True)
+        self.pacer = CommandPacer(
+            limits=settings.get("pacing_limits_ms"),
+            initial_interval_ms=settings.get("pacing_initial_ms", FIRMWARE_MIN_INTERVAL_MS),
+            step_ms=settings.get("pacing_step_ms", 5),
+            backoff=settings.get("pacing_backoff", 2.0),
+            slow_rtt_ms=settings.get("pacing_slow_rtt_ms", 300)
+        )
+        self._pacing_reported = {name: pace.interval_ms for name, pace in self.pacer.families.items()}
+
+        # 설정값 명령 병합
+        self.coalesce_commands = settings.get("coalesce_commands", True)
+
+        # 우선순위별 대기열 상한/가득 찼을 때 처리/만료 시간
+        self.queue_limits = queue_limits(settings)
+
+        # 스케줄링 방식, 우선순위별/출처별 마감 여유
+        self.scheduling = settings.get("queue_scheduling", SCHEDULE_PRIORITY)
+        self.deadline_budgets = deadline_budgets(settings)
+
+        # 전송 중인 명령 묶음 (끝날 때까지 같은 우선순위 이하의 다른 명령은 보내지 않음)
+        self._active_batch: Optional[CommandBatch] = None
+
+        # 최근 송신 큐에 넣은 추적하지 않는 명령 (쓰기 스레드가 나중에 write_failed로 알리면 찾아서 재전송)
+        self._recent_untracked: Deque[Command] = deque(maxlen=WRITE_FAILURE_LOOKBACK)
+
         # 통계
         self.total_sent = 0
         self.total_failed = 0
-        
-        print("[QUEUE] 명령 큐 매니저 초기화 완료")
+        self.total_coalesced = 0  # 병합으로 줄어든 전송 수
+        self.total_expired = 0    # 만료로 버린 명령 수
+        self.total_dropped = 0    # 대기열 초과로 버리거나 거부한 명령 수
+        self.metrics = QueueMetrics(window_sec=settings.get("queue_metrics_window_sec", 60))
+        self.deadline_stats = DeadlineStats()
+
+        self.set_serial_manager(serial_manager)
+        logger.info("명령 큐 매니저 초기화 완료")
         
     def set_serial_manager(self, serial_manager):
-        """시리얼 매니저 설정"""
+        """시리얼 매니저 설정 (ACK/NAK 응답 경로 등록)"""
+        if serial_manager is self.serial_manager:
+            return
+        if self.serial_manager is not None and hasattr(self.serial_manager, 'line_router'):
+            for route in RESPONSE_ROUTES:
+                self.serial_manager.line_router.unsubscribe(route, self._on_response_line)
+            if hasattr(self.serial_manager, 'connection_lost'):
+                self.serial_manager.connection_lost.disconnect(self._on_connection_lost)
+            if hasattr(self.serial_manager, 'connected'):
+                self.serial_manager.connected.disconnect(self._on_connected)
+            if hasattr(self.serial_manager, 'write_failed'):
+                self.serial_manager.write_failed.disconnect(self._on_write_failed)
+
         self.serial_manager = serial_manager
-        print("[QUEUE] 시리얼 매니저 설정 완료")
+        if serial_manager is None:
+            return
+        if hasattr(serial_manager, 'line_router'):
+            for route in RESPONSE_ROUTES:
+                serial_manager.line_router.subscribe(route, self._on_response_line)
+        if hasattr(serial_manager, 'connection_lost'):
+            serial_manager.connection_lost.connect(self._on_connection_lost)
+        # 연결(자동 재연결 포함)되면 끊긴 동안 쌓인 명령 처리
+        if hasattr(serial_manager, 'connected'):
+            serial_manager.connected.connect(self._on_connected)
+        # 송신 큐에 넣은 뒤 실제 쓰기가 실패하면 재시도
+        if hasattr(serial_manager, 'write_failed'):
+            serial_manager.write_failed.connect(self._on_write_failed)
+        logger.info("시리얼 매니저 설정 완료")
         
     def add_command(self, command: str, priority: CommandPriority = CommandPriority.NORMAL, 
-                   callback: Optional[Callable] = None) -> bool:
-        """명령을 큐에 추가"""
+                   callback: Optional[Callable] = None, ttl: Optional[float] = None,
+                   origin: Optional[str] = None) -> bool:
+        """
+        명령을 큐에 추가
+
+        Args:
+            ttl: 만료 시간 (초, None이면 우선순위별 설정값, 0이면 만료 없음)
+            origin: 출처 (마감 여유/통계 구분, None이면 우선순위 이름)
+
+        Returns:
+            추가 여부 (대기열이 가득 차서 거부하면 False, 실패 콜백도 호출)
+        """
+        capacity, overflow, default_ttl = self.queue_limits[priority]
+        ttl = default_ttl if ttl is None else ttl
+        origin = origin or priority.name.lower()
+        now = time.time()
         with QMutexLocker(self.mutex):
             cmd = Command(
                 command=command,
                 priority=priority,
                 callback=callback,
-                timestamp=time.time()
+                timestamp=now,
+                key=coalesce_key(command) if self.coalesce_commands else None,
+                expires_at=now + ttl if ttl > 0 else None,
+                origin=origin,
+                deadline=command_deadline(self.deadline_budgets, priority, origin, now)
             )
             
             # 우선순위별로 큐에 추가
-            if priority == CommandPriority.HIGH:
-                self.high_queue.append(cmd)
-            elif priority == CommandPriority.NORMAL:
-                self.normal_queue.append(cmd)
+            queue = self._queue_for(priority)
+            expired = take_expired(queue, now)
+            dropped: List[Command] = []
+
+            # 아직 전송하지 않은 같은 키 명령은 새 값으로 교체
+            superseded = coalesce_into(queue, cmd)
+            if superseded is not None:
+                self.total_coalesced += 1
+                logger.debug("명령 병합: %s → %s", superseded.command, command)
+                accepted = True
             else:
-                self.low_queue.append(cmd)
+                accepted, dropped = admit(queue, cmd, capacity, overflow)
                 
             # 큐 상태 업데이트
             self._update_queue_status()
-            return True
+
+        # 잠금 해제 후 알림 (콜백에서 다시 add_command를 불러도 되도록)
+        self._report_dropped(expired, DROP_EXPIRED)
+        self._report_dropped(dropped, DROP_OVERFLOW)
+        if not accepted:
+            self._report_dropped([cmd], DROP_REJECTED)
+            return False
+
+        # 같은 스레드면 바로 전송, 간격이 남았으면 단발 타이머
+        self._wakeup_requested.emit()
+        return True
+
+    def _report_dropped(self, commands: List[Command], reason: str):
+        """버린/거부한 명령 알림 (command_dropped 시그널, 실패 콜백)"""
+        for cmd in commands:
+            if reason == DROP_EXPIRED:
+                self.total_expired += 1
+                logger.info("만료된 명령 삭제 (%.1f초 대기): %s", time.time() - cmd.timestamp, cmd.command)
+            else:
+                self.total_dropped += 1
+                logger.warning("%s 대기열 %s: %s", cmd.priority.name, reason, cmd.command)
+            self.deadline_stats.record_dropped(cmd.origin or cmd.priority.name.lower())
+            self.command_dropped.emit(cmd.command, reason)
+            if cmd.callback:
+                try:
+                    cmd.callback(False, reason)
+                except Exception as e:
+                    logger.error("실패 콜백 오류: %s", e)
             
+    def _queue_for(self, priority: CommandPriority) -> deque:
+        """우선순위별 큐"""
+        if priority == CommandPriority.HIGH:
+            return self.high_queue
+        if priority == CommandPriority.NORMAL:
+            return self.normal_queue
+        return self.low_queue
+
+    def add_batch(self, commands: List[str], priority: CommandPriority = CommandPriority.NORMAL,
+                  callback: Optional[Callable] = None, max_retries: int = 3,
+                  ttl: Optional[float] = None, origin: Optional[str] = None,
+                  ack_timeout: Optional[float] = None) -> Optional[CommandBatch]:
+        """
+        명령 묶음을 순서대로 큐에 추가 (모두 받아들이거나 모두 거부)
+
+        묶음의 명령은 병합하지 않고, 첫 명령을 보낸 뒤 모두 끝날 때까지 같은 우선순위 이하의
+        다른 명령은 보내지 않습니다.
+
+        Args:
+            callback: callback(전체 성공 여부, [(명령, 성공 여부, 결과), ...]) - 모두 끝나면 한 번 호출
+            max_retries: 명령별 최대 시도 횟수
+            ttl: 만료 시간 (초, None이면 우선순위별 설정값, 0이면 만료 없음)
+            origin: 출처 (마감 여유/통계 구분, None이면 우선순위 이름)
+            ack_timeout: 명령별 응답 대기 시간 (초, None이면 기본값 - RELOAD처럼 오래 걸리는 명령)
+
+        Returns:
+            추가한 묶음 (대기열 자리가 모자라 거부하면 None, callback도 실패로 호출)
+        """
+        batch = CommandBatch(commands, priority, callback)
+        if not batch.commands:
+            self._finish_batch(batch)
+            return batch
+
+        capacity, overflow, default_ttl = self.queue_limits[priority]
+        ttl = default_ttl if ttl is None else ttl
+        origin = origin or priority.name.lower()
+        now = time.time()
+        deadline = command_deadline(self.deadline_budgets, priority, origin, now)
+        items = [
+            Command(command=command, priority=priority,
+                    callback=batch.item_callback(index, self._on_batch_item_done),
+                    max_retries=max_retries, timestamp=now,
+                    expires_at=now + ttl if ttl > 0 else None, batch=batch,
+                    origin=origin, deadline=deadline, ack_timeout=ack_timeout)
+            for index, command in enumerate(batch.commands)
+        ]
+        dropped: List[Command] = []
+        with QMutexLocker(self.mutex):
+            queue = self._queue_for(priority)
+            expired = take_expired(queue, now)
+            room = capacity - len(queue) if capacity > 0 else len(items)
+            accepted = room >= len(items)
+            if not accepted and overflow == OVERFLOW_DROP_OLDEST and len(items) <= capacity:
+                while len(queue) > capacity - len(items):
+                    dropped.append(queue.popleft())
+                accepted = True
+            if accepted:
+                queue.extend(items)
+            self._update_queue_status()
+
+        self._report_dropped(expired, DROP_EXPIRED)
+        self._report_dropped(dropped, DROP_OVERFLOW)
+        if not accepted:
+            logger.warning("%s 대기열 %s: 명령 묶음 %s개", priority.name, DROP_REJECTED, len(items))
+            self.total_dropped += len(items)
+            for index, command in enumerate(batch.commands):
+                batch.results[index] = (False, DROP_REJECTED)
+                self.deadline_stats.record_dropped(origin)
+                self.command_dropped.emit(command, DROP_REJECTED)
+            self._finish_batch(batch)
+            return None
+
+        logger.info("명령 묶음 추가 (%s개): %s", len(items), ", ".join(batch.commands))
+        self._wakeup_requested.emit()
+        return batch
+
+    def _on_batch_item_done(self, batch: CommandBatch):
+        """묶음 명령이 끝났을 때 (성공/최종 실패/삭제) 묶음 전체가 끝났는지 확인"""
+        if not batch.done:
+            return
+        if self._active_batch is batch:
+            self._active_batch = None
+        self._finish_batch(batch)
+
+    def _finish_batch(self, batch: CommandBatch):
+        """묶음 완료 콜백 (전체 성공 여부, 명령별 결과)"""
+        failed = [command for command, success, _ in batch.item_results() if not success]
+        if failed:
+            logger.warning("명령 묶음 실패 %s/%s개: %s", len(failed), len(batch.commands), ", ".join(failed))
+        else:
+            logger.info("명령 묶음 완료 (%s개)", len(batch.commands))
+        if batch.callback:
+            try:
+                batch.callback(not failed, batch.item_results())
+            except Exception as e:
+                logger.error("묶음 콜백 오류: %s", e)
+
     def add_urgent_command(self, command: str, callback: Optional[Callable] = None):
         """긴급 명령 추가 (최우선 처리)"""
         return self.add_command(command, CommandPriority.HIGH, callback)
         
     def clear_queue(self, priority: Optional[CommandPriority] = None):
-        """큐 비우기"""
+        """
+        큐 비우기
+
+        비운 명령은 실패 콜백(DROP_CLEARED)으로 알림 - 묶음 명령이면 묶음도 그 결과로 끝나 묶음 콜백 호출
+        (응답 대기 중인 묶음 명령이 있으면 그 응답 뒤에 끝남)
+        """
         with QMutexLocker(self.mutex):
-            if priority is None:
-                # 모든 큐 비우기
-                self.high_queue.clear()
-                self.normal_queue.clear()
-                self.low_queue.clear()
-            elif priority == CommandPriority.HIGH:
-                self.high_queue.clear()
-            elif priority == CommandPriority.NORMAL:
-                self.normal_queue.clear()
-            else:
-                self.low_queue.clear()
-                
+            priorities = list(CommandPriority) if priority is None else [priority]
+            cleared: List[Command] = []
+            for queued_priority in priorities:
+                queue = self._queue_for(queued_priority)
+                cleared.extend(queue)
+                queue.clear()
             self._update_queue_status()
-            
+
+        self._report_dropped(cleared, DROP_CLEARED)
+        self._wakeup_requested.emit()
+
     def _process_queue(self):
-        """큐 처리 (타이머에서 호출)"""
+        """
+        큐 처리 (명령 추가, ACK 수신, 연결, 단발 타이머 시 호출) - 응답 대기 창이 허용하는 만큼 연속 전송
+
+        다음 명령의 간격이 남았으면 그 시간만큼 process_timer를 설정하고, 그 밖의 대기
+        (빈 큐, 일시 중지, 연결 끊김, 응답 대기 창 가득 참)는 해당 이벤트가 다시 깨움
+        """
         if self.is_processing or self.is_paused:
             return
 
-        # 시리얼 연결 확인
+        # 시리얼 연결 확인 (연결되면 connected 시그널로 다시 호출)
         if not self.serial_manager or not self.serial_manager.is_connected():
+            self.process_timer.stop()
             return
-            
-        # 최소 명령 간격 체크
-        current_time = time.time()
-        if current_time - self.last_command_time < self.min_command_interval:
-            return
-            
-        # 다음 명령 가져오기
-        command = self._get_next_command()
-        if command:
-            self.is_processing = True
-            self._send_command(command)
+
+        self.is_processing = True
+        delay = None
+        try:
+            while (not self.is_paused and self.ack_matcher.in_flight() < self.inflight_window
+                   and self.serial_manager.is_connected()):
+                command = self._peek_next_command()
+                if command is None:
+                    break
+
+                # ACK를 추적하지 않는 명령은 최소 명령 간격으로 (AIR/DSCT 명령은 아래 계열 하한도 적용)
+                tracked = self.ack_tracking and response_key(command.command) is not None
+                current_time = time.time()
+                if not tracked:
+                    remaining = self.last_command_time + self.min_command_interval - current_time
+                    if remaining > 0:
+                        delay = remaining
+                        break
+
+                # 같은 장치의 앞 명령이 응답 대기 중이면 응답(또는 재시도 결정) 뒤에 전송
+                # (앞 명령이 NAK/타임아웃으로 재시도될 때 뒤 명령보다 먼저 나가도록 - ACK/NAK/타임아웃이 다시 깨움)
+                if tracked and self._target_in_flight(command):
+                    break
+
+                # 계열별 송신 간격이 남았으면 그만큼 뒤에 다시 처리
+                # (응답으로 조절하지 않는 AIR/DSCT 명령도 펌웨어 최소 간격인 계열 하한은 지킴 - CHANGELOG v3.12)
+                family = self.pacer.family(command.command)
+                if family:
+                    if self._pacing_family(command):
+                        remaining = self.pacer.delay(family)
+                    else:
+                        remaining = self.pacer.floor_delay(family)
+                    if remaining > 0:
+                        delay = remaining
+                        break
+
+                self._take_command(command)
+                if command.batch is not None and self._active_batch is None:
+                    self._active_batch = command.batch
+                self._send_command(command, tracked)
+                if family:
+                    self.pacer.on_sent(family)
+                self.last_command_time = current_time
+        finally:
             self.is_processing = False
-            self.last_command_time = current_time
+
+        if delay is None:
+            self.process_timer.stop()
+        else:
+            self.process_timer.start(max(1, math.ceil(delay * 1000)))
+
+    def _target_in_flight(self, cmd: Command) -> bool:
+        """cmd와 같은 장치의 설정값 명령이 응답 대기 중인지"""
+        target = target_key(cmd.command)
+        if target is None:
+            return False
+        return any(target_key(pending.command) == target for pending in self.ack_matcher.pending_commands())
+
+    def _pacing_family(self, cmd: Command) -> Optional[str]:
+        """송신 간격 조절 대상 계열 (ACK 추적 중이 아니면 None - 응답으로 조절할 수 없음)"""
+        if not (self.adaptive_pacing and self.ack_tracking) or response_key(cmd.command) is None:
+            return None
+        return self.pacer.family(cmd.command)
+
+    def _peek_next_command(self) -> Optional[Command]:
+        """
+        스케줄링 방식(우선순위/edf)에 따라 다음 명령 확인 (큐에서 빼지 않음, 앞쪽의 만료된 명령은 버림)
+
+        명령 묶음을 보내는 중이면 더 높은 우선순위 명령, 묶음에 속하지 않은 HIGH 명령(정지 등),
+        그 묶음의 다음 명령만 반환하고, 묶음 명령이 응답 대기 중이면 None (ACK 처리가 다시 깨움)
+        """
+        now = time.time()
+        expired = []
+        command = None
+        batch = self._active_batch
+        with QMutexLocker(self.mutex):
+            queues = {priority: self._queue_for(priority) for priority in CommandPriority}
+            for queue in queues.values():
+                while queue and is_expired(queue[0], now):
+                    expired.append(queue.popleft())
+            for priority in service_order(queues, self.scheduling):
+                queue = queues[priority]
+                if batch is not None and priority.value <= batch.priority.value:
+                    if priority == CommandPriority.HIGH:
+                        # HIGH 묶음(RELOAD) 중에도 묶음이 아닌 HIGH 명령(정지 등)은 바로 보냄
+                        command = next((cmd for cmd in queue if cmd.batch is None), None)
+                        if command is not None:
+                            break
+                    # 묶음과 같은 우선순위 이하: 묶음 명령만, 앞 명령이 끝난 뒤 하나씩 (재시도해도 순서 유지)
+                    pending = [cmd for cmd in queues[batch.priority] if cmd.batch is batch]
+                    unfinished = sum(1 for result in batch.results if result is None)
+                    command = pending[0] if pending and len(pending) == unfinished else None
+                    break
+                if queue:
+                    command = queue[0]
+                    break
+        if not expired:
+            return command
+
+        # 실패 콜백이 명령을 추가했을 수 있으므로 다시 확인
+        self._report_dropped(expired, DROP_EXPIRED)
+        self._update_queue_status()
+        return self._peek_next_command()
             
-    def _get_next_command(self) -> Optional[Command]:
-        """우선순위에 따라 다음 명령 가져오기"""
+    def _take_command(self, cmd: Command):
+        """확인한 명령을 큐에서 빼기 (보통 맨 앞, 묶음 전송 중에는 중간일 수 있음)"""
         with QMutexLocker(self.mutex):
-            # 우선순위 순서대로 확인
-            if self.high_queue:
-                return self.high_queue.popleft()
-            elif self.normal_queue:
-                return self.normal_queue.popleft()
-            elif self.low_queue:
-                return self.low_queue.popleft()
-            return None
+            queue = self._queue_for(cmd.priority)
+            if queue and queue[0] is cmd:
+                queue.popleft()
+            else:
+                queue.remove(cmd)
             
-    def _send_command(self, cmd: Command):
-        """실제 명령 전송"""
+    def _send_command(self, cmd: Command, tracked: bool = False):
+        """
+        실제 명령 전송
+
+        Args:
+            tracked: ACK 추적 여부 (True면 ACK 수신 시 성공 콜백, 아니면 쓰기 성공 시)
+        """
         try:
             # 명령 전송
+            started = time.perf_counter()
             success = self.serial_manager.send_serial_command(cmd.command)
             
             if success:
+                self.metrics.record('send', cmd.priority, (time.perf_counter() - started) * 1000)
+                self.metrics.record('wait', cmd.priority, (time.time() - cmd.timestamp) * 1000)
+                if cmd.retry_count == 0 and cmd.deadline is not None:
+                    self.deadline_stats.record_sent(cmd.origin, (time.time() - cmd.deadline) * 1000)
                 self.total_sent += 1
                 self.command_sent.emit(cmd.command)
-                
+
+                if tracked:
+                    self.ack_matcher.track(cmd)
+                    self._arm_ack_timer()
+                    return
+                self._recent_untracked.append(cmd)
+
                 # 콜백 실행
                 if cmd.callback:
                     try:
                         cmd.callback(True, cmd.command)
                     except Exception as e:
-                        print(f"[QUEUE] 콜백 실행 오류: {e}")
+                        logger.error("콜백 실행 오류: %s", e)
                         
             else:
                 # 전송 실패 시 재시도
@@ -177,14 +807,16 @@ class CommandQueueManager(QObject):
         if cmd.retry_count < cmd.max_retries:
             # 재시도 큐에 다시 추가
             with QMutexLocker(self.mutex):
-                if cmd.priority == CommandPriority.HIGH:
-                    self.high_queue.appendleft(cmd)  # 앞쪽에 추가
-                elif cmd.priority == CommandPriority.NORMAL:
-                    self.normal_queue.append(cmd)
-                else:
-                    self.low_queue.append(cmd)
+                if absorb_into(self._queue_for(cmd.priority), cmd):
+                    # 더 새 값이 대기 중이면 예전 값은 재전송하지 않음
+                    self.total_coalesced += 1
+                    logger.info("재시도 생략 (새 값 대기 중): %s", cmd.command)
+                    return
+                # 앞쪽에 추가: 같은 장치의 뒤 명령은 이 명령의 응답을 기다리며 대기 중이므로
+                # 재시도가 먼저 나가 예전 값이 마지막에 적용되지 않음 (묶음 명령도 다음 묶음 명령보다 먼저)
+                self._queue_for(cmd.priority).appendleft(cmd)
                     
-            print(f"[QUEUE] 재시도 {cmd.retry_count}/{cmd.max_retries}: {cmd.command}")
+            logger.info("재시도 %s/%s: %s", cmd.retry_count, cmd.max_retries, cmd.command)
             
         else:
             # 최대 재시도 초과
@@ -196,8 +828,122 @@ class CommandQueueManager(QObject):
                 try:
                     cmd.callback(False, error)
                 except Exception as e:
-                    print(f"[QUEUE] 실패 콜백 오류: {e}")
+                    logger.error("실패 콜백 오류: %s", e)
                     
+    # ==================== ACK 추적 ====================
+    def _on_response_line(self, line: str):
+        """ACK/NAK 응답 라인 수신 (라인 분배기)"""
+        result = self.ack_matcher.on_line(line)
+        if result is None:
+            return
+        cmd, acked, rtt_ms = result
+        family = self._pacing_family(cmd)
+        if acked:
+            self.metrics.record('ack', cmd.priority, rtt_ms)
+            # RELOAD처럼 원래 오래 걸리는 응답은 왕복 시간으로 과부하를 판단하지 않음 (느린 ACK로 간격이 늘어남)
+            if family and not self._long_response(cmd) and self.pacer.on_ack(family, rtt_ms):
+                self._emit_pacing(family)
+            self.command_acked.emit(cmd.command, rtt_ms)
+            if cmd.callback:
+                try:
+                    cmd.callback(True, cmd.command)
+                except Exception as e:
+                    logger.error("콜백 실행 오류: %s", e)
+        else:
+            logger.warning("NAK 수신: %s → %s", cmd.command, line)
+            if family and self.pacer.on_failure(family, "NAK"):
+                self._emit_pacing(family)
+            self._handle_send_failure(cmd, line)
+        self._arm_ack_timer()
+
+        # 응답 대기 창에 자리가 났으므로 바로 다음 명령 전송
+        self._process_queue()
+
+    @staticmethod
+    def _long_response(cmd: Command) -> bool:
+        """응답이 원래 오래 걸리는 명령인지 (RELOAD, 응답 대기 시간을 따로 지정한 명령)"""
+        return cmd.ack_timeout is not None or response_key(cmd.command)[1] in LONG_RESPONSE_TIMEOUTS
+
+    def _on_ack_timeout(self):
+        """응답 타임아웃된 명령 재시도"""
+        for cmd in self.ack_matcher.expire():
+            logger.warning("응답 타임아웃: %s", cmd.command)
+            family = self._pacing_family(cmd)
+            if family and self.pacer.on_failure(family, "응답 시간 초과"):
+                self._emit_pacing(family)
+            self._handle_send_failure(cmd, "응답 시간 초과")
+        self._arm_ack_timer()
+        self._process_queue()
+
+    def _emit_pacing(self, family: str):
+        """송신 간격 변경 알림 (늘어난 경우 사유와 함께 경고 로그)"""
+        pace = self.pacer.families[family]
+        previous = self._pacing_reported.get(family)
+        self._pacing_reported[family] = pace.interval_ms
+        if previous is not None and pace.interval_ms > previous:
+            logger.warning("%s 송신 간격 증가: %.0f → %.0fms (%s)", family, previous, pace.interval_ms, pace.reason)
+        elif pace.interval_ms == pace.min_interval_ms:
+            logger.info("%s 송신 간격 하한 도달: %.0fms", family, pace.interval_ms)
+        self.pacing_changed.emit(family, pace.interval_ms, pace.reason)
+
+    def _arm_ack_timer(self):
+        """가장 이른 응답 만료 시각에 단발 타이머 설정"""
+        deadline = self.ack_matcher.next_deadline()
+        if deadline is None:
+            self.ack_timer.stop()
+            return
+        self.ack_timer.start(max(0, int((deadline - time.monotonic()) * 1000) + 1))
+
+    def _on_connection_lost(self, _port):
+        """연결 끊김: 응답 대기 중인 명령을 재시도 횟수 증가 없이 큐 앞쪽으로 되돌림"""
+        pending = self.ack_matcher.drain()
+        self.ack_timer.stop()
+        self.process_timer.stop()
+        if not pending:
+            return
+        with QMutexLocker(self.mutex):
+            for cmd in reversed(pending):
+                if absorb_into(self._queue_for(cmd.priority), cmd):
+                    self.total_coalesced += 1
+                    continue
+                if cmd.priority == CommandPriority.HIGH:
+                    self.high_queue.appendleft(cmd)
+                elif cmd.priority == CommandPriority.NORMAL:
+                    self.normal_queue.appendleft(cmd)
+                else:
+                    self.low_queue.appendleft(cmd)
+        logger.info("응답 대기 명령 %s개 재전송 대기", len(pending))
+
+    def _on_write_failed(self, command: str, error: str):
+        """
+        쓰기 스레드의 write() 실패: 해당 명령을 재시도 경로로
+
+        응답 대기 중이면 대기 목록에서 빼서 재시도 (연결 끊김으로 이미 되돌린 명령은 대기 목록에 없어 무시),
+        추적하지 않은 명령은 성공 콜백을 이미 불렀으므로 콜백/묶음 없이 재전송만
+        """
+        cmd = next((pending for pending in self.ack_matcher.pending_commands() if pending.command == command), None)
+        if cmd is not None:
+            self.ack_matcher.discard(cmd)
+            self._arm_ack_timer()
+        else:
+            cmd = next((sent for sent in reversed(self._recent_untracked) if sent.command == command), None)
+            if cmd is None:
+                logger.warning("쓰기 실패 (재시도 대상 없음): %s (%s)", command, error)
+                return
+            self._recent_untracked.remove(cmd)
+            cmd = replace(cmd, callback=None, batch=None)
+        self._handle_send_failure(cmd, error)
+        self._process_queue()
+
+    def _on_connected(self, _port):
+        """연결/재연결: 끊긴 동안 쌓인 명령 처리"""
+        self._process_queue()
+
+    @staticmethod
+    def _serial_settings() -> dict:
+        from config.config_manager import get_config_manager
+        return get_config_manager().get_section("serial")
+
     def _update_queue_status(self):
         """큐 상태 업데이트"""
         total_size = len(self.high_queue) + len(self.normal_queue) + len(self.low_queue)
@@ -205,6 +951,7 @@ class CommandQueueManager(QObject):
         
     def get_queue_info(self) -> Dict[str, Any]:
         """큐 정보 반환"""
+        batch = self._active_batch
         with QMutexLocker(self.mutex):
             return {
                 'high_queue_size': len(self.high_queue),
@@ -212,20 +959,33 @@ class CommandQueueManager(QObject):
                 'low_queue_size': len(self.low_queue),
                 'total_sent': self.total_sent,
                 'total_failed': self.total_failed,
-                'is_processing': self.is_processing
+                'coalesced': self.total_coalesced,
+                'expired': self.total_expired,
+                'dropped': self.total_dropped,
+                'is_processing': self.is_processing,
+                'in_flight': self.ack_matcher.in_flight(),
+                'ack': self.ack_matcher.get_stats(),
+                'pacing': self.pacer.get_stats() if self.adaptive_pacing and self.ack_tracking else None,
+                'latency': self.metrics.snapshot(),
+                'scheduling': self.scheduling,
+                'deadlines': self.deadline_stats.snapshot(),
+                # 보내는 중인 명령 묶음 (끝난 명령 수, 전체 수)
+                'batch': (sum(result is not None for result in batch.results), len(batch.commands)) if batch else None,
             }
             
     def set_command_interval(self, interval: float):
         """명령 간격 설정 (초)"""
         self.min_command_interval = max(0.01, min(1.0, interval))
-        print(f"[QUEUE] 명령 간격 설정: {self.min_command_interval}초")
+        logger.info("명령 간격 설정: %s초", self.min_command_interval)
+        self._process_queue()
 
     def pause_queue(self):
         """큐 처리 일시 중지 (RELOAD 등 응답 대기 중)"""
         self.is_paused = True
-        print("[QUEUE] 🛑 큐 처리 일시 중지 (RELOAD 응답 대기)")
+        logger.info("🛑 큐 처리 일시 중지 (RELOAD 응답 대기)")
 
     def resume_queue(self):
         """큐 처리 재개"""
         self.is_paused = False
-        print("[QUEUE] ▶️  큐 처리 재개")
\ No newline at end of file
+        logger.info("▶️  큐 처리 재개")
+        self._process_queue()
\ No newline at end of file
@@ -0,0 +1,264 @@
+"""
+여러 장비 동시 연결 관리 (연결 레지스트리)
+
+한 프로세스에서 여러 AIRCON/DSCT 장비를 감시하기 위해, 장비(unit)마다 독립된 스택을 구성합니다.
+
+장비별 스택 (UnitConnection):
+- SerialManager (읽기/쓰기 스레드, 라인 분배기, 자동 재연결)
+- CommandQueueManager (명령 큐)
+- SensorManager / AirSensorManager / PT02SensorManager (CSV는 data/<장비 ID>/ 에 저장)
+- SensorScheduler
+
+포트마다 읽기·쓰기 스레드가 따로 있으므로 송수신 처리량은 포트 수만큼 늘어납니다.
+수신 라인은 subscribe()로 등록한 핸들러에 handler(unit_id, line) 형태로 장비 ID와 함께 전달됩니다.
+
+설정 파일 예 (config/settings.json):
+    "units": {
+        "unit1": {"port": "/dev/ttyUSB0", "baudrate": 115200},
+        "unit2": {"port": "/dev/ttyUSB1"}
+    }
+
+사용 예:
+    registry = ConnectionRegistry()
+    registry.load_from_config()
+    registry.connect_all()
+    registry.send_command("unit1", "$CMD,DSCT,FAN1,ON")
+"""
+
+import os
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from .serial_manager import SerialManager
+from .command_queue_manager import CommandQueueManager, CommandPriority
+from .sensor_manager import SensorManager
+from .air_sensor_manager import AirSensorManager
+from .pt02_sensor_manager import PT02SensorManager
+from .sensor_scheduler import SensorScheduler
+from utils.log_manager import get_logger
+
+logger = get_logger("SERIAL", "REGISTRY")
+
+# 기본 장비별 데이터 폴더의 상위 폴더
+DEFAULT_DATA_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+class UnitConnection:
+    """장비 1대의 연결 스택"""
+
+    def __init__(self, unit_id: str, port: str, baudrate: int = 115200,
+                 data_dir: Optional[str] = None, test_mode: bool = False):
+        self.unit_id = unit_id
+        self.port = port
+        self.baudrate = baudrate
+        self.data_dir = data_dir or os.path.join(DEFAULT_DATA_ROOT, unit_id)
+
+        self.serial_manager = SerialManager(unit_id=unit_id)
+        self.command_queue = CommandQueueManager(self.serial_manager)
+        self.serial_manager.set_command_queue(self.command_queue)
+
+        self.sensor_manager = SensorManager(self.serial_manager, test_mode, data_dir=self.data_dir)
+        self.air_sensor_manager = AirSensorManager(self.serial_manager, test_mode, data_dir=self.data_dir)
+        self.pt02_sensor_manager = PT02SensorManager(test_mode, data_dir=self.data_dir)
+
+        self.scheduler = SensorScheduler(self.serial_manager, test_mode=test_mode)
+        self.scheduler.set_sensor_managers(self.air_sensor_manager, self.sensor_manager)
+
+        # 수신 경로 등록 (센서 스캔 라인, PT02)
+        self.serial_manager.set_sensor_data_callback(self.sensor_manager.parse_sensor_data)
+        self.serial_manager.set_air_sensor_data_callback(self.air_sensor_manager.parse_sensor_data)
+        self.serial_manager.line_router.subscribe("PT02", self.pt02_sensor_manager.parse_pt02_response)
+
+    def connect(self, start_scheduler: bool = True) -> bool:
+        """포트 연결 (성공 시 센서 스케줄러 시작)"""
+        if not self.serial_manager.connect_serial(self.port, self.baudrate):
+            return False
+        if start_scheduler:
+            self.scheduler.start_scheduling()
+        return True
+
+    def disconnect(self):
+        """스케줄러 중지 후 포트 연결 해제"""
+        self.scheduler.stop_scheduling()
+        self.serial_manager.disconnect_serial()
+
+    def close(self):
+        """연결 해제 및 타이머 정리 (레지스트리에서 제거 시)"""
+        self.disconnect()
+        self.command_queue.process_timer.stop()
+
+    def is_connected(self) -> bool:
+        return bool(self.serial_manager.is_connected())
+
+    def send_command(self, command: str, priority: CommandPriority = CommandPriority.NORMAL,
+                     callback: Optional[Callable] = None) -> bool:
+        """명령 큐에 추가"""
+        return self.command_queue.add_command(command, priority, callback)
+
+    def get_status(self) -> dict:
+        """장비 상태 요약"""
+        return {
+            'port': self.port,
+            'baudrate': self.baudrate,
+            'connected': self.is_connected(),
+            'reconnecting': self.serial_manager.is_reconnecting(),
+            'scheduler': self.scheduler.current_state.value,
+            'queue': self.command_queue.get_queue_info(),
+            'tx': self.serial_manager.get_tx_stats(),
+            'data_dir': self.data_dir,
+        }
+
+
+class ConnectionRegistry(QObject):
+    """여러 장비 연결 관리"""
+
+    # 장비 연결 상태 변경 (장비 ID, 연결 여부)
+    unit_connection_changed = pyqtSignal(str, bool)
+
+    def __init__(self, data_root: Optional[str] = None, test_mode: bool = False):
+        super().__init__()
+        self.data_root = data_root or DEFAULT_DATA_ROOT
+        self.test_mode = test_mode
+        self._units: Dict[str, UnitConnection] = {}
+
+        # 장비 공통 수신 핸들러: (경로, 핸들러, 묶음 여부) → {장비 ID: 장비 ID가 묶인 핸들러}
+        self._subscriptions: Dict[tuple, Dict[str, Callable]] = {}
+
+    # ==================== 장비 관리 ====================
+    def add_unit(self, unit_id: str, port: str, baudrate: int = 115200,
+                 data_dir: Optional[str] = None) -> UnitConnection:
+        """
+        장비 추가 (연결은 connect_unit()/connect_all()에서)
+
+        Args:
+            data_dir: CSV 저장 폴더 (기본값: data_root/<장비 ID>)
+
+        Raises:
+            ValueError: 장비 ID나 포트가 이미 등록된 경우
+        """
+        if unit_id in self._units:
+            raise ValueError(f"이미 등록된 장비 ID: {unit_id}")
+        for unit in self._units.values():
+            if unit.port == port:
+                raise ValueError(f"포트 {port}는 장비 {unit.unit_id}가 사용 중")
+
+        unit = UnitConnection(unit_id, port, baudrate,
+                              data_dir=data_dir or os.path.join(self.data_root, unit_id), test_mode=self.test_mode)
+        unit.serial_manager.connection_lost.connect(lambda _: self.unit_connection_changed.emit(unit_id, False))
+        unit.serial_manager.connection_restored.connect(lambda _: self.unit_connection_changed.emit(unit_id, True))
+        for (route, handler, batch), bound in self._subscriptions.items():
+            bound[unit_id] = self._bind(unit, route, handler, batch)
+
+        self._units[unit_id] = unit
+        logger.info("장비 추가: %s (%s @ %sbps)", unit_id, port, baudrate)
+        return unit
+
+    def remove_unit(self, unit_id: str):
+        """장비 연결 해제 및 제거"""
+        unit = self._units.pop(unit_id, None)
+        if unit is None:
+            return
+        unit.close()
+        for bound in self._subscriptions.values():
+            bound.pop(unit_id, None)
+        logger.info("장비 제거: %s", unit_id)
+
+    def load_from_config(self) -> List[str]:
+        """설정 파일의 units 섹션에서 장비 추가, 추가된 장비 ID 목록 반환"""
+        from config.config_manager import get_config_manager
+        added = []
+        for unit_id, settings in get_config_manager().get_section("units").items():
+            if unit_id in self._units or not isinstance(settings, dict) or not settings.get("port"):
+                continue
+            self.add_unit(unit_id, settings["port"], settings.get("baudrate", 115200))
+            added.append(unit_id)
+        return added
+
+    def get_unit(self, unit_id: str) -> Optional[UnitConnection]:
+        return self._units.get(unit_id)
+
+    def unit_ids(self) -> List[str]:
+        return list(self._units)
+
+    def __len__(self):
+        return len(self._units)
+
+    # ==================== 연결 ====================
+    def connect_unit(self, unit_id: str, start_scheduler: bool = True) -> bool:
+        """장비 1대 연결"""
+        unit = self._units.get(unit_id)
+        if unit is None:
+            logger.error("등록되지 않은 장비: %s", unit_id)
+            return False
+        connected = unit.connect(start_scheduler)
+        self.unit_connection_changed.emit(unit_id, connected)
+        return connected
+
+    def connect_all(self, start_scheduler: bool = True) -> Dict[str, bool]:
+        """모든 장비 연결, 장비별 성공 여부 반환"""
+        return {unit_id: self.connect_unit(unit_id, start_scheduler) for unit_id in self._units}
+
+    def disconnect_all(self):
+        """모든 장비 연결 해제"""
+        for unit_id, unit in self._units.items():
+            unit.disconnect()
+            self.unit_connection_changed.emit(unit_id, False)
+
+    def close(self):
+        """모든 장비 제거 (종료 시)"""
+        for unit_id in list(self._units):
+            self.remove_unit(unit_id)
+
+    # ==================== 송신 ====================
+    def send_command(self, unit_id: str, command: str,
+                     priority: CommandPriority = CommandPriority.NORMAL,
+                     callback: Optional[Callable] = None) -> bool:
+        """장비 1대의 명령 큐에 추가"""
+        unit = self._units.get(unit_id)
+        if unit is None:
+            logger.error("등록되지 않은 장비: %s, 명령 무시: %s", unit_id, command)
+            return False
+        return unit.send_command(command, priority, callback)
+
+    def broadcast(self, command: str, priority: CommandPriority = CommandPriority.NORMAL) -> Dict[str, bool]:
+        """연결된 모든 장비의 명령 큐에 추가"""
+        return {unit_id: unit.send_command(command, priority)
+                for unit_id, unit in self._units.items() if unit.is_connected()}
+
+    # ==================== 수신 ====================
+    def subscribe(self, route: str, handler: Callable, batch: bool = False):
+        """
+        모든 장비(이후 추가되는 장비 포함)의 수신 경로에 핸들러 등록
+
+        Args:
+            route: LineRouter 경로 키 (예: 'PT02', 'DSCT_ACK,RELOAD')
+            handler: batch=False면 handler(unit_id, line), True면 handler(unit_id, lines)
+            batch: 묶음 단위 호출 여부
+        """
+        key = (route, handler, batch)
+        if key in self._subscriptions:
+            return
+        self._subscriptions[key] = {unit_id: self._bind(unit, route, handler, batch)
+                                    for unit_id, unit in self._units.items()}
+
+    def unsubscribe(self, route: str, handler: Callable, batch: bool = False):
+        """subscribe()로 등록한 핸들러 제거"""
+        bound = self._subscriptions.pop((route, handler, batch), {})
+        for unit_id, unit_handler in bound.items():
+            unit = self._units.get(unit_id)
+            if unit:
+                unit.serial_manager.line_router.unsubscribe(route, unit_handler, batch)
+
+    @staticmethod
+    def _bind(unit: UnitConnection, route: str, handler: Callable, batch: bool) -> Callable:
+        """장비 ID를 첫 인자로 묶어 장비의 라인 분배기에 등록"""
+        unit_handler = partial(handler, unit.unit_id)
+        unit.serial_manager.line_router.subscribe(route, unit_handler, batch)
+        return unit_handler
+
+    # ==================== 상태 ====================
+    def get_status(self) -> Dict[str, dict]:
+        """장비별 상태 요약"""
+        return {unit_id: unit.get_status() for unit_id, unit in self._units.items()}
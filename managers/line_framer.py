@@ -0,0 +1,84 @@
+"""
+증분 라인 프레이머 (부분 라인 재조립)
+
+수신 바이트를 내부 bytearray에 누적하고, 줄바꿈('\\n') 경계에서만 라인을 잘라냅니다.
+한 번의 읽기가 라인 중간에서 끝나도 남은 꼬리는 다음 feed()까지 보관되므로
+반쪽 라인이 디코딩·파싱되는 일이 없습니다.
+
+- 라인은 디코딩하지 않은 bytes로 반환 (앞뒤 공백/'\\r' 제거, 빈 라인 제외)
+  → 텍스트가 필요한 경로(LineRouter.dispatch_raw_lines)에서만 디코딩
+- 완성된 라인 구간은 memoryview 슬라이스로 한 번만 복사한 뒤 split
+- 줄바꿈 없이 max_pending 바이트를 넘는 데이터는 쓰레기로 보고 폐기
+
+사용 예:
+    framer = LineFramer()
+    for raw in framer.feed(chunk):
+        ...
+"""
+
+from typing import List
+
+
+class LineFramer:
+    """증분 라인 프레이머"""
+
+    def __init__(self, max_pending: int = 65536):
+        self.max_pending = max_pending
+        self._buffer = bytearray()
+
+        # 통계
+        self.total_bytes = 0
+        self.total_lines = 0
+        self.discarded_bytes = 0
+
+    def feed(self, data) -> List[bytes]:
+        """
+        수신 바이트 추가 후 완성된 라인 목록 반환
+
+        Args:
+            data: bytes, bytearray 또는 memoryview (읽기 버퍼 슬라이스 그대로 전달 가능)
+
+        Returns:
+            완성된 라인(bytes) 목록 - 마지막 줄바꿈 뒤의 부분 라인은 내부에 보관
+        """
+        buffer = self._buffer
+        buffer += data
+        self.total_bytes += len(data)
+
+        last_newline = buffer.rfind(b'\n')
+        if last_newline < 0:
+            if len(buffer) > self.max_pending:
+                self.discarded_bytes += len(buffer)
+                buffer.clear()
+            return []
+
+        # 완성된 구간만 한 번 복사하고 버퍼 앞부분 제거 (꼬리는 유지)
+        with memoryview(buffer) as view:
+            chunk = view[:last_newline].tobytes()
+        del buffer[:last_newline + 1]
+
+        lines = [line for line in (raw.strip() for raw in chunk.split(b'\n')) if line]
+        self.total_lines += len(lines)
+        return lines
+
+    def pending_bytes(self) -> int:
+        """줄바꿈을 기다리는 부분 라인 바이트 수"""
+        return len(self._buffer)
+
+    def reset(self):
+        """부분 라인 버리기 (재연결 시)"""
+        self._buffer.clear()
+
+    def get_stats(self) -> dict:
+        """프레이머 통계 반환"""
+        return {
+            'bytes': self.total_bytes,
+            'lines': self.total_lines,
+            'pending_bytes': len(self._buffer),
+            'discarded_bytes': self.discarded_bytes,
+        }
+
+
+def decode_line(raw: bytes) -> str:
+    """라인 디코딩 (수신 경로 공통 규칙: ASCII, 잘못된 바이트는 무시)"""
+    return raw.decode('ascii', errors='ignore')
@@ -0,0 +1,228 @@
+"""
+수신 라인 분배기 (프로토콜 접두어 기반)
+각 수신 라인을 선두 토큰으로 한 번만 분류하고, 해당 경로에 등록된 핸들러만 호출합니다.
+
+경로 키:
+- 1단계: 선두 토큰
+    '[DSCT] ID01,TEMP: ...'          → '[DSCT]'
+    'PT02 587,0,13.3,10.9'           → 'PT02'
+    'DSCT,FAN1,ON'                   → 'DSCT'
+    'EEPROM_ACK,RELOAD,START'        → 'EEPROM_ACK'
+- 2단계: 선두 토큰 + 두 번째 필드의 첫 단어
+    'DSCT_ACK,RELOAD,COMPLETE'       → 'DSCT_ACK,RELOAD'
+    'DSCT,SOL All Open OK!'          → 'DSCT,SOL'
+- 와일드카드: '*' (모든 라인)
+
+한 라인에 대해 1단계 → 2단계 → 와일드카드 순서로 딕셔너리 조회만 수행합니다.
+묶음 핸들러(batch=True)는 dispatch_lines() 한 번에 해당 경로 라인 목록을 1회 받습니다.
+
+dispatch_raw_lines()는 LineFramer가 만든 디코딩 전 bytes 라인을 받아
+bytes 상태로 분류하고, 등록된 핸들러가 있는 라인만 디코딩합니다.
+"""
+
+import re
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+from .line_framer import decode_line
+from utils.log_manager import get_logger
+
+logger = get_logger("SERIAL", "ROUTER")
+
+# 모든 라인을 받는 경로 키
+ROUTE_ALL = "*"
+_RAW_ROUTE_ALL = ROUTE_ALL.encode('ascii')
+
+# 라인 미분류 시 카운터 키
+ROUTE_UNMATCHED = "(unmatched)"
+
+# 선두 토큰 패턴: '[태그]' 또는 첫 구분자(',', ' ', '\t') 앞까지, 이어서 쉼표 뒤 두 번째 필드의 첫 단어
+_TOKEN_PATTERN = re.compile(r'(\[[^\]]*\]|[^, \t]*)(,([^, ]*))?')
+_RAW_TOKEN_PATTERN = re.compile(_TOKEN_PATTERN.pattern.encode('ascii'))
+
+
+class LineRouter:
+    """수신 라인 분배기"""
+
+    def __init__(self):
+        # 경로 키 → 핸들러 목록
+        self._routes: Dict[str, List[Callable[[str], None]]] = {}
+        # 경로 키 → 묶음 핸들러 목록 (라인 목록을 인자로 받음)
+        self._batch_routes: Dict[str, List[Callable[[List[str]], None]]] = {}
+        # bytes 경로 키 → 경로 키 (디코딩 전 라인 분류용)
+        self._raw_keys: Dict[bytes, str] = {}
+
+        # 경로별 통계
+        self.route_counts = defaultdict(int)
+        self.handler_errors = defaultdict(int)
+        self.total_lines = 0
+
+    # ==================== 등록 ====================
+    def subscribe(self, route: str, handler: Callable, batch: bool = False):
+        """
+        경로에 핸들러 등록 (같은 핸들러 중복 등록 무시)
+
+        Args:
+            route: 경로 키 (예: 'PT02', 'DSCT_ACK,RELOAD', '*')
+            handler: batch=False면 handler(line), True면 handler(lines)
+            batch: 묶음 단위 호출 여부
+        """
+        table = self._batch_routes if batch else self._routes
+        handlers = table.setdefault(route, [])
+        if handler not in handlers:
+            handlers.append(handler)
+        self._raw_keys[route.encode('ascii')] = route
+
+    def unsubscribe(self, route: str, handler: Callable, batch: bool = False):
+        """경로에서 핸들러 제거"""
+        table = self._batch_routes if batch else self._routes
+        handlers = table.get(route)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del table[route]
+                if route not in self._routes and route not in self._batch_routes:
+                    self._raw_keys.pop(route.encode('ascii'), None)
+
+    def get_routes(self) -> List[str]:
+        """등록된 경로 키 목록 반환"""
+        return sorted(set(self._routes) | set(self._batch_routes))
+
+    # ==================== 분류 ====================
+    @staticmethod
+    def classify(line: str) -> Tuple[str, Optional[str]]:
+        """
+        라인을 (1단계 키, 2단계 키)로 분류
+
+        Returns:
+            (head, sub) - sub는 쉼표 뒤 두 번째 필드가 없으면 None
+        """
+        head, comma, sub = _TOKEN_PATTERN.match(line).group(1, 2, 3)
+        if comma and sub:
+            return head, f"{head},{sub}"
+        return head, None
+
+    # ==================== 분배 ====================
+    def dispatch(self, line: str) -> int:
+        """
+        라인 1개 분배 (묶음 핸들러에는 1개짜리 목록으로 전달)
+
+        Returns:
+            호출된 핸들러 수
+        """
+        return self.dispatch_lines([line])
+
+    def dispatch_lines(self, lines: List[str]) -> int:
+        """라인 묶음 분배, 호출된 핸들러 총 수 반환"""
+        routes = self._routes
+        batch_routes = self._batch_routes
+        counts = self.route_counts
+        match = _TOKEN_PATTERN.match
+        pending = {}
+        called = 0
+
+        for line in lines:
+            head, comma, sub = match(line).group(1, 2, 3)
+            keys = (head, f"{head},{sub}", ROUTE_ALL) if comma and sub else (head, ROUTE_ALL)
+            matched = False
+
+            for key in keys:
+                handlers = routes.get(key)
+                if batch_routes and key in batch_routes:
+                    pending.setdefault(key, []).append(line)
+                elif not handlers:
+                    continue
+
+                matched = True
+                counts[key] += 1
+                if handlers:
+                    for handler in handlers:
+                        try:
+                            handler(line)
+                        except Exception as e:
+                            self.handler_errors[key] += 1
+                            logger.error("핸들러 오류 (%s): %s", key, e)
+                        called += 1
+
+            if not matched:
+                counts[ROUTE_UNMATCHED] += 1
+
+        self.total_lines += len(lines)
+        if pending:
+            called += self._flush_batches(pending)
+        return called
+
+    def dispatch_raw_lines(self, raw_lines: List[bytes]) -> int:
+        """
+        디코딩 전 라인 묶음 분배 (LineFramer 출력)
+
+        bytes 상태로 분류하여 등록된 경로가 있는 라인만 한 번 디코딩하고, 나머지는 카운트만 합니다.
+
+        Returns:
+            호출된 핸들러 총 수
+        """
+        raw_keys = self._raw_keys
+        routes = self._routes
+        batch_routes = self._batch_routes
+        counts = self.route_counts
+        match = _RAW_TOKEN_PATTERN.match
+        wildcard = ROUTE_ALL if _RAW_ROUTE_ALL in raw_keys else None
+        pending = {}
+        called = 0
+
+        for raw in raw_lines:
+            head, comma, sub = match(raw).group(1, 2, 3)
+            head_key = raw_keys.get(head)
+            sub_key = raw_keys.get(head + b',' + sub) if comma and sub else None
+            if head_key is None and sub_key is None and wildcard is None:
+                counts[ROUTE_UNMATCHED] += 1
+                continue
+
+            line = decode_line(raw)
+            for key in (head_key, sub_key, wildcard):
+                if key is None:
+                    continue
+                counts[key] += 1
+                if key in batch_routes:
+                    pending.setdefault(key, []).append(line)
+                handlers = routes.get(key)
+                if handlers:
+                    for handler in handlers:
+                        try:
+                            handler(line)
+                        except Exception as e:
+                            self.handler_errors[key] += 1
+                            logger.error("핸들러 오류 (%s): %s", key, e)
+                        called += 1
+
+        self.total_lines += len(raw_lines)
+        if pending:
+            called += self._flush_batches(pending)
+        return called
+
+    def _flush_batches(self, pending: dict) -> int:
+        """모아둔 경로별 라인 목록을 묶음 핸들러에 전달"""
+        called = 0
+        for key, lines in pending.items():
+            for handler in tuple(self._batch_routes.get(key, ())):
+                try:
+                    handler(lines)
+                except Exception as e:
+                    self.handler_errors[key] += 1
+                    logger.error("묶음 핸들러 오류 (%s): %s", key, e)
+                called += 1
+        return called
+
+    # ==================== 통계 ====================
+    def get_stats(self) -> dict:
+        """경로별 통계 반환"""
+        return {
+            'total_lines': self.total_lines,
+            'routes': dict(self.route_counts),
+            'errors': dict(self.handler_errors),
+        }
+
+    def reset_stats(self):
+        """통계 초기화"""
+        self.route_counts.clear()
+        self.handler_errors.clear()
+        self.total_lines = 0
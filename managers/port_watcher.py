@@ -0,0 +1,235 @@
+"""
+시리얼 포트 핫플러그 감시 (이벤트 기반 포트 목록 캐시)
+
+GUI 스레드에서 매초 comports()를 호출하는 대신, 백그라운드 스레드가 포트 목록을 캐시하고
+장치가 추가/제거될 때만 다시 열거합니다.
+
+- Linux: inotify로 /dev의 ttyUSB*/ttyACM* 생성·삭제·속성 변경 감지
+  (udev가 노드 생성 후 권한을 바꾸므로 짧게 모아서 한 번만 열거)
+- 그 외(inotify 사용 불가): poll_interval 간격으로 백그라운드에서 열거
+- 목록이 바뀌면 ports_changed(list) 시그널 발생 (수신 슬롯은 GUI 스레드에서 실행)
+
+사용 예:
+    watcher = get_port_watcher()
+    watcher.ports_changed.connect(on_ports_changed)
+    ports = watcher.get_ports()
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from typing import Dict, List, Optional
+
+import serial.tools.list_ports
+from PyQt5.QtCore import QObject, pyqtSignal
+from utils.log_manager import get_logger
+
+logger = get_logger("SERIAL", "PORT_WATCHER")
+
+# inotify 상수 (<sys/inotify.h>)
+_IN_ATTRIB = 0x00000004
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_CREATE | _IN_DELETE | _IN_ATTRIB | _IN_MOVED_FROM | _IN_MOVED_TO
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+# 감시 대상 장치 이름 접두어
+SERIAL_DEVICE_PREFIXES = (b"ttyUSB", b"ttyACM")
+
+
+def is_usb_serial(device: str) -> bool:
+    """USB 시리얼 포트 여부 (Linux: ttyUSB*, ttyACM* / Windows: COM*, 모두 USB일 가능성 높음)"""
+    return 'ttyUSB' in device or 'ttyACM' in device or device.startswith('COM')
+
+
+def _open_inotify(watch_dir: str) -> Optional[int]:
+    """inotify fd 열기 (사용 불가하면 None)"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(watch_dir), _WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (AttributeError, OSError):
+        return None
+
+
+class PortWatcher(QObject):
+    """시리얼 포트 핫플러그 감시"""
+
+    # 포트 목록 변경 시그널 ([{"device": ..., "description": ...}, ...])
+    ports_changed = pyqtSignal(list)
+
+    DEBOUNCE_SEC = 0.2          # 이벤트를 모아서 열거하는 시간 (udev 권한 변경 대기)
+    POLL_INTERVAL_SEC = 2.0     # inotify 사용 불가 시 열거 주기
+
+    def __init__(self, watch_dir: str = "/dev"):
+        super().__init__()
+        self.watch_dir = watch_dir
+        self.use_inotify = False
+        self._ports: List[Dict[str, str]] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+
+        # 통계
+        self.total_events = 0
+        self.total_refreshes = 0
+        self.last_refresh_ms = 0.0
+
+    def start(self):
+        """감시 스레드 시작 (최초 목록은 호출 스레드에서 한 번 열거)"""
+        if self._running:
+            return
+        self.refresh()
+
+        inotify_fd = _open_inotify(self.watch_dir) if os.name == 'posix' else None
+        self.use_inotify = inotify_fd is not None
+        self._wake_r, self._wake_w = os.pipe()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, args=(inotify_fd,), name="PortWatcher", daemon=True)
+        self._thread.start()
+        logger.info("포트 감시 시작 (%s)", f"inotify: {self.watch_dir}" if self.use_inotify else
+                    f"{self.POLL_INTERVAL_SEC:.0f}초 폴링")
+
+    def stop(self):
+        """감시 스레드 중지"""
+        if not self._running:
+            return
+        self._running = False
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._wake_r = self._wake_w = None
+        logger.info("포트 감시 중지")
+
+    def get_ports(self) -> List[Dict[str, str]]:
+        """캐시된 포트 목록 반환 (열거 없음)"""
+        with self._lock:
+            return list(self._ports)
+
+    def refresh(self) -> bool:
+        """
+        포트 목록 즉시 다시 열거
+
+        Returns:
+            목록이 바뀌었는지 여부 (바뀌면 ports_changed 발생)
+        """
+        started = time.perf_counter()
+        try:
+            ports = [{"device": port.device, "description": port.description}
+                     for port in serial.tools.list_ports.comports()]
+        except Exception as e:
+            logger.warning("포트 열거 실패: %s", e)
+            return False
+        ports.sort(key=lambda port: port["device"])
+        self.last_refresh_ms = (time.perf_counter() - started) * 1000
+        self.total_refreshes += 1
+
+        with self._lock:
+            changed = ports != self._ports
+            self._ports = ports
+        if changed:
+            logger.info("포트 목록 변경: %s", [port["device"] for port in ports] or '없음')
+            self.ports_changed.emit(list(ports))
+        return changed
+
+    def _run(self, inotify_fd: Optional[int]):
+        """감시 스레드 메인 루프"""
+        try:
+            if inotify_fd is not None:
+                self._run_inotify(inotify_fd)
+            else:
+                self._run_poll()
+        finally:
+            if inotify_fd is not None:
+                os.close(inotify_fd)
+
+    def _run_poll(self):
+        """주기 열거 루프"""
+        while self._running:
+            readable, _, _ = select.select([self._wake_r], [], [], self.POLL_INTERVAL_SEC)
+            if readable or not self._running:
+                break
+            self.refresh()
+
+    def _run_inotify(self, inotify_fd: int):
+        """inotify 이벤트 루프 (관련 이벤트가 오면 DEBOUNCE_SEC 동안 모은 뒤 1회 열거)"""
+        deadline = None
+        while self._running:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([inotify_fd, self._wake_r], [], [], timeout)
+            if self._wake_r in readable or not self._running:
+                break
+
+            if inotify_fd in readable and self._read_events(inotify_fd) and deadline is None:
+                deadline = time.monotonic() + self.DEBOUNCE_SEC
+
+            if deadline is not None and time.monotonic() >= deadline:
+                deadline = None
+                self.refresh()
+
+    def _read_events(self, inotify_fd: int) -> bool:
+        """대기 중인 inotify 이벤트 읽기, 시리얼 장치 관련 이벤트가 있었는지 반환"""
+        relevant = False
+        while True:
+            try:
+                data = os.read(inotify_fd, 4096)
+            except BlockingIOError:
+                return relevant
+            if not data:
+                return relevant
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length].rstrip(b"\0")
+                offset += _EVENT_HEADER.size + length
+                if mask & _IN_Q_OVERFLOW or name.startswith(SERIAL_DEVICE_PREFIXES):
+                    self.total_events += 1
+                    relevant = True
+
+    def get_stats(self) -> dict:
+        """감시 통계 반환"""
+        return {
+            'mode': 'inotify' if self.use_inotify else 'poll',
+            'ports': len(self._ports),
+            'events': self.total_events,
+            'refreshes': self.total_refreshes,
+            'last_refresh_ms': round(self.last_refresh_ms, 2),
+        }
+
+
+# 전역 포트 감시자
+_port_watcher = None
+
+
+def get_port_watcher() -> PortWatcher:
+    """전역 포트 감시자 반환 (최초 호출 시 감시 시작)"""
+    global _port_watcher
+    if _port_watcher is None:
+        _port_watcher = PortWatcher()
+        _port_watcher.start()
+    return _port_watcher
@@ -1,9 +1,15 @@
 # PT02 센서 데이터 관리 매니저 클래스
 # 1분 주기 PT02 센서 데이터(온도, CO2, PM2.5)를 CSV 파일로 저장
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from datetime import datetime
 import os
-import csv
+from utils.csv_writer import CsvLogWriter
+from utils.sensor_history import create_history_buffer
+from utils.sensor_storage import create_storages, csv_files_enabled, storage_settings
+from utils.log_manager import get_logger
+
+logger = get_logger("PT02")
+pt02_test_logger = get_logger("PT02", "PT02 TEST")
 
 
 class PT02SensorManager(QObject):
@@ -12,10 +18,10 @@ class PT02SensorManager(QObject):
     # 센서 데이터 업데이트 시그널
     sensor_data_updated = pyqtSignal(dict)  # {temp, co2, pm25, humidity, timestamp}
 
-    def __init__(self, test_mode=False):
+    def __init__(self, test_mode=False, data_dir=None):
         super().__init__()
         self.test_mode = test_mode
-        print(f"[PT02] PT02SensorManager 초기화 - test_mode: {test_mode}")
+        logger.info("PT02SensorManager 초기화 - test_mode: %s", test_mode)
 
         # 센서 데이터 저장소
         self.sensor_data = {
@@ -29,7 +35,8 @@ class PT02SensorManager(QObject):
 
         # CSV 저장 설정
         self.csv_enabled = True
-        self.data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+        # data_dir: 장비별 저장 위치 (기본값: 프로젝트 data 폴더)
+        self.data_dir = data_dir or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
         self._ensure_data_directory()
 
         # CSV 정리기 초기화
@@ -37,6 +44,17 @@ class PT02SensorManager(QObject):
         self.csv_cleaner = CSVCleaner(self.data_dir)
         self.save_count = 0  # 저장 횟수 카운터 (50회마다 정리 - 1분 주기이므로 약 50분)
 
+        # 추가 저장 백엔드 (binary, sqlite - csv_logging.binary_store, storage.backends) + CSV 파일 기록 여부
+        csv_settings, storage_config = storage_settings()
+        self.storages = create_storages(self.data_dir, "PT02", csv_settings, storage_config)
+        self.csv_files = csv_files_enabled(csv_settings, storage_config)
+
+        # CSV 기록기 (파일 핸들 유지, 행을 모아 기록) + 행이 더 오지 않을 때 남은 행 기록용 단발 타이머
+        self.csv_writer, self.csv_flush_timer = self._create_csv_writer()
+
+        # 최근 이력 메모리 버퍼 (고정 크기 numpy 링 버퍼, history_buffer.max_memory_mb, 꺼져 있으면 None)
+        self.history = create_history_buffer("PT02", [None])
+
         # 테스트 모드용 더미 데이터 생성기
         if self.test_mode:
             from test.dummy_pt02_generator import DummyPT02Generator
@@ -46,36 +64,37 @@ class PT02SensorManager(QObject):
         """데이터 디렉토리 확인 및 생성"""
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
-            print(f"[PT02] 데이터 디렉토리 생성: {self.data_dir}")
+            logger.info("데이터 디렉토리 생성: %s", self.data_dir)
+
+    def _csv_settings(self):
+        """csv_logging 설정 섹션"""
+        from config.config_manager import get_config_manager
+        return get_config_manager().get_section("csv_logging")
+
+    def _create_csv_writer(self):
+        """csv_logging 설정으로 CSV 기록기와 flush 타이머 생성"""
+        settings = self._csv_settings()
+        writer = CsvLogWriter(
+            self.data_dir, "PT02", ['timestamp', 'temperature', 'co2', 'pm25', 'humidity'],
+            flush_interval_sec=settings.get("flush_interval_sec", 5),
+            flush_rows=settings.get("flush_rows", 50),
+            max_bytes=int(settings.get("max_file_mb", 10) * 1024 * 1024)
+        )
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(int(writer.flush_interval_sec * 1000))
+        timer.timeout.connect(writer.flush)
+        for storage in self.storages:
+            timer.timeout.connect(storage.flush)
+        return writer, timer
 
     def _get_csv_filename(self):
-        """현재 날짜와 파일 크기를 고려하여 CSV 파일명 생성
+        """현재 기록 중인 CSV 파일명
 
         파일명 형식: PT02_YYYY-MM-DD.csv
         10MB 초과 시: PT02_YYYY-MM-DD_001.csv, PT02_YYYY-MM-DD_002.csv, ...
         """
-        today = datetime.now().strftime('%Y-%m-%d')
-        base_filename = f'PT02_{today}'
-
-        # 기존 파일들 확인
-        file_index = 0
-        while True:
-            if file_index == 0:
-                filename = os.path.join(self.data_dir, f'{base_filename}.csv')
-            else:
-                filename = os.path.join(self.data_dir, f'{base_filename}_{file_index:03d}.csv')
-
-            # 파일이 없으면 이 파일명 사용
-            if not os.path.exists(filename):
-                return filename
-
-            # 파일 크기 확인 (10MB = 10 * 1024 * 1024 bytes)
-            file_size = os.path.getsize(filename)
-            if file_size < 10 * 1024 * 1024:  # 10MB 미만이면 이 파일 사용
-                return filename
-
-            # 10MB 이상이면 다음 인덱스로
-            file_index += 1
+        return self.csv_writer.current_path()
 
     def save_sensor_data(self, temp, co2, pm25, humidity=None):
         """센서 데이터를 내부 저장소에 저장하고 CSV에 기록
@@ -98,6 +117,10 @@ class PT02SensorManager(QObject):
             'last_update': timestamp
         }
 
+        # 최근 이력 버퍼 (CSV 로깅 여부와 무관)
+        if self.history is not None:
+            self.history.append(None, timestamp, (temp, co2, pm25, humidity))
+
         # CSV 파일에 저장
         self._save_to_csv(temp, co2, pm25, humidity, timestamp)
 
@@ -111,39 +134,32 @@ class PT02SensorManager(QObject):
         self.sensor_data_updated.emit(self.sensor_data.copy())
 
         if humidity is not None:
-            print(f"[PT02] 데이터 저장: 온도={temp}°C, CO2={co2}ppm, PM2.5={pm25}µg/m³, 습도={humidity}%")
+            logger.info("데이터 저장: 온도=%s°C, CO2=%sppm, PM2.5=%sµg/m³, 습도=%s%%", temp, co2, pm25, humidity)
         else:
-            print(f"[PT02] 데이터 저장: 온도={temp}°C, CO2={co2}ppm, PM2.5={pm25}µg/m³")
+            logger.info("데이터 저장: 온도=%s°C, CO2=%sppm, PM2.5=%sµg/m³", temp, co2, pm25)
 
     def _save_to_csv(self, temp, co2, pm25, humidity, timestamp):
-        """센서 데이터를 CSV 파일로 저장"""
+        """센서 데이터를 CSV 기록기에 추가 (flush_rows개 또는 flush_interval_sec마다 파일에 기록)"""
         if not self.csv_enabled:
             return
 
-        # 적절한 파일명 가져오기
-        filename = self._get_csv_filename()
-
-        # 파일이 없으면 헤더 작성
-        file_exists = os.path.exists(filename)
-
-        try:
-            with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['timestamp', 'temperature', 'co2', 'pm25', 'humidity']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                if not file_exists:
-                    writer.writeheader()
-                    print(f"[PT02] 새 CSV 파일 생성: {filename}")
-
-                writer.writerow({
-                    'timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                    'temperature': temp,
-                    'co2': co2,
-                    'pm25': pm25,
-                    'humidity': humidity if humidity is not None else ''
-                })
-        except Exception as e:
-            print(f"[PT02] CSV 저장 오류: {e}")
+        # 저장 백엔드: 측정 1회 = 스캔 1회
+        for storage in self.storages:
+            storage.add_reading(timestamp, None, (temp, co2, pm25, humidity))
+            storage.end_scan()
+        if self.csv_files:
+            self.csv_writer.write_row([
+                timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                temp,
+                co2,
+                pm25,
+                humidity if humidity is not None else ''
+            ], timestamp)
+
+        # 남은 행은 flush_interval_sec 뒤 기록 (1분 주기라 대부분 타이머로 기록)
+        pending = self.csv_writer.pending or any(storage.pending for storage in self.storages)
+        if pending and not self.csv_flush_timer.isActive():
+            self.csv_flush_timer.start()
 
     def _cleanup_old_csv_files(self):
         """오래된 CSV 파일 정리 (PT02 파일만)"""
@@ -152,9 +168,9 @@ class PT02SensorManager(QObject):
             # PT02 파일은 max_files=30 (약 1달치)
             deleted_files = self._cleanup_pt02_files(max_files=30)
             if deleted_files:
-                print(f"[PT02] CSV 정리 완료: {len(deleted_files)}개 파일 삭제")
+                logger.info("CSV 정리 완료: %s개 파일 삭제", len(deleted_files))
         except Exception as e:
-            print(f"[PT02] CSV 정리 중 오류: {e}")
+            logger.error("CSV 정리 중 오류: %s", e)
 
     def _cleanup_pt02_files(self, max_files=30):
         """PT02 CSV 파일만 정리"""
@@ -175,10 +191,10 @@ class PT02SensorManager(QObject):
                 filepath, _ = pt02_files.pop(0)
                 os.remove(filepath)
                 deleted.append(filepath)
-                print(f"[PT02] 오래된 파일 삭제: {filepath}")
+                logger.info("오래된 파일 삭제: %s", filepath)
 
         except Exception as e:
-            print(f"[PT02] 파일 정리 중 오류: {e}")
+            logger.error("파일 정리 중 오류: %s", e)
 
         return deleted
 
@@ -205,7 +221,7 @@ class PT02SensorManager(QObject):
                 return self._parse_aircon_format(data)
 
         except Exception as e:
-            print(f"[PT02] 응답 파싱 오류: {e}")
+            logger.error("응답 파싱 오류: %s", e)
 
         return False
 
@@ -230,7 +246,7 @@ class PT02SensorManager(QObject):
                 return True
 
         except Exception as e:
-            print(f"[PT02] PT02 형식 파싱 오류: {e}, data='{data}'")
+            logger.error("PT02 형식 파싱 오류: %s, data='%s'", e, data)
 
         return False
 
@@ -254,18 +270,18 @@ class PT02SensorManager(QObject):
                 return True
 
         except Exception as e:
-            print(f"[PT02] AIRCON 형식 파싱 오류: {e}")
+            logger.error("AIRCON 형식 파싱 오류: %s", e)
 
         return False
 
     def generate_test_data(self):
         """테스트 모드용 더미 데이터 생성"""
         if not self.test_mode:
-            print("[PT02] 테스트 모드가 아닙니다")
+            logger.info("테스트 모드가 아닙니다")
             return
 
         if not hasattr(self, 'dummy_generator'):
-            print("[PT02] ERROR: dummy_generator 없음!")
+            logger.error("dummy_generator 없음!")
             return
 
         try:
@@ -274,10 +290,10 @@ class PT02SensorManager(QObject):
 
             # 데이터 저장
             self.save_sensor_data(data['temp'], data['co2'], data['pm25'])
-            print(f"[PT02 TEST] 더미 데이터: 온도={data['temp']}°C, CO2={data['co2']}ppm, PM2.5={data['pm25']}µg/m³")
+            pt02_test_logger.info("더미 데이터: 온도=%s°C, CO2=%sppm, PM2.5=%sµg/m³", data['temp'], data['co2'], data['pm25'])
 
         except Exception as e:
-            print(f"[PT02 TEST] 더미 데이터 생성 오류: {e}")
+            pt02_test_logger.error("더미 데이터 생성 오류: %s", e)
 
     def get_sensor_data(self):
         """현재 센서 데이터 반환"""
@@ -300,15 +316,16 @@ class PT02SensorManager(QObject):
             'status': 'unknown',
             'last_update': None
         }
-        print("[PT02] 센서 데이터 초기화")
+        logger.info("센서 데이터 초기화")
 
     def enable_csv_logging(self, enabled=True):
         """CSV 로깅 활성화/비활성화"""
         self.csv_enabled = enabled
-        print(f"[PT02] CSV 로깅: {'활성화' if enabled else '비활성화'}")
+        logger.info("CSV 로깅: %s", '활성화' if enabled else '비활성화')
 
     def get_csv_file_info(self):
-        """현재 CSV 파일 정보 반환"""
+        """현재 CSV 파일 정보 반환 (모아 둔 행을 먼저 기록)"""
+        self.csv_writer.flush()
         filename = self._get_csv_filename()
         if os.path.exists(filename):
             size = os.path.getsize(filename)
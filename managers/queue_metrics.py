@@ -0,0 +1,183 @@
+"""
+명령 큐 지연 히스토그램
+
+우선순위(HIGH/NORMAL/LOW)마다 세 구간의 지연을 따로 모읍니다.
+- wait: add_command → 시리얼 쓰기 (큐 대기, 재시도 시 처음 추가한 시각부터)
+- send: send_serial_command() 호출 시간 (쓰기 스레드 큐에 넣기까지)
+- ack:  시리얼 쓰기 → ACK 수신 (ACK 추적 명령만)
+
+히스토그램은 HDR 방식의 로그-선형 버킷 (마이크로초 단위):
+- 32us 미만은 1us 버킷 그대로, 그 이상은 2의 거듭제곱 구간을 16칸으로 나눔 → 상대 오차 약 6% 이내
+- 값 범위와 관계없이 버킷 수가 작고(60초까지 400개 미만) 기록은 O(1)
+
+최근 window_sec 동안의 값만 보도록 시간 조각(slot) 여러 개에 나눠 기록하고,
+오래된 조각은 통째로 버립니다 (p50/p95/p99/최대는 남은 조각을 합쳐 계산).
+
+마감 시각 통계 (DeadlineStats): 명령 출처(origin)별로 첫 전송이 마감 시각을 넘긴 횟수와
+보내지 못하고 버린(만료/대기열 초과) 횟수를 셉니다.
+
+사용 예:
+    metrics = QueueMetrics(window_sec=60)
+    metrics.record('wait', CommandPriority.HIGH, 0.4)
+    metrics.snapshot()['HIGH']['wait']   # {'count': 1, 'p50_ms': 0.4, ...}
+
+    deadlines = DeadlineStats()
+    deadlines.record_sent('sensor', late_ms=120.0)
+    deadlines.snapshot()['sensor']       # {'sent': 1, 'missed': 1, 'dropped': 0, 'max_late_ms': 120.0}
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+SUB_BUCKET_BITS = 5                      # 정밀 구간 32us
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+METRICS = ('wait', 'send', 'ack')
+PERCENTILES = (50, 95, 99)
+
+
+def bucket_index(value_us: int) -> int:
+    """값(us)의 버킷 번호"""
+    if value_us < (1 << SUB_BUCKET_BITS):
+        return max(0, value_us)
+    exponent = value_us.bit_length() - SUB_BUCKET_BITS
+    return (1 << SUB_BUCKET_BITS) + (exponent - 1) * SUB_BUCKET_HALF + (value_us >> exponent) - SUB_BUCKET_HALF
+
+
+def bucket_value(index: int) -> float:
+    """버킷 대표값(us, 구간 중앙)"""
+    if index < (1 << SUB_BUCKET_BITS):
+        return float(index)
+    exponent, sub = divmod(index - (1 << SUB_BUCKET_BITS), SUB_BUCKET_HALF)
+    exponent += 1
+    low = (sub + SUB_BUCKET_HALF) << exponent
+    return low + ((1 << exponent) - 1) / 2.0
+
+
+class LatencyHistogram:
+    """최근 window_sec 동안의 지연 히스토그램 (slots개 시간 조각)"""
+
+    def __init__(self, window_sec: float = 60.0, slots: int = 6):
+        self.window_sec = window_sec
+        self.slot_sec = window_sec / max(1, slots)
+        # (조각 시작 시각, 버킷별 개수, 최대값 us)
+        self._slots: Deque[Tuple[float, Dict[int, int], int]] = deque()
+
+    def record(self, value_ms: float, now: Optional[float] = None):
+        """지연 1건 기록 (ms)"""
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+        if not self._slots or now - self._slots[-1][0] >= self.slot_sec:
+            self._slots.append((now, {}, 0))
+        start, counts, peak = self._slots[-1]
+        value_us = max(0, int(value_ms * 1000))
+        index = bucket_index(value_us)
+        counts[index] = counts.get(index, 0) + 1
+        if value_us > peak:
+            self._slots[-1] = (start, counts, value_us)
+
+    def stats(self, now: Optional[float] = None) -> dict:
+        """건수, 백분위수(p50/p95/p99), 최대값 (ms, 기록이 없으면 None)"""
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+        merged: Dict[int, int] = {}
+        peak = 0
+        for _, counts, slot_peak in self._slots:
+            for index, count in counts.items():
+                merged[index] = merged.get(index, 0) + count
+            peak = max(peak, slot_peak)
+
+        total = sum(merged.values())
+        result = {'count': total}
+        ordered = sorted(merged.items())
+        for percentile in PERCENTILES:
+            result[f'p{percentile}_ms'] = self._percentile(ordered, total, percentile, peak)
+        result['max_ms'] = round(peak / 1000.0, 3) if total else None
+        return result
+
+    @staticmethod
+    def _percentile(ordered, total, percentile, peak) -> Optional[float]:
+        if not total:
+            return None
+        rank = max(1, -(-total * percentile // 100))  # 올림
+        seen = 0
+        for index, count in ordered:
+            seen += count
+            if seen >= rank:
+                # 버킷 중앙값이 실제 최대값을 넘지 않도록
+                return round(min(bucket_value(index), peak) / 1000.0, 3)
+        return round(peak / 1000.0, 3)
+
+    def _expire(self, now: float):
+        while self._slots and now - self._slots[0][0] >= self.window_sec:
+            self._slots.popleft()
+
+    def reset(self):
+        self._slots.clear()
+
+
+class QueueMetrics:
+    """우선순위별 wait/send/ack 지연 히스토그램"""
+
+    def __init__(self, window_sec: float = 60.0, slots: int = 6):
+        self.window_sec = window_sec
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._slots = slots
+
+    def record(self, metric: str, priority, value_ms: float, now: Optional[float] = None):
+        """
+        지연 기록
+
+        Args:
+            metric: 'wait', 'send', 'ack'
+            priority: CommandPriority (또는 이름 문자열)
+        """
+        key = (getattr(priority, 'name', str(priority)), metric)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram(self.window_sec, self._slots)
+        histogram.record(value_ms, now)
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Dict[str, dict]]:
+        """{우선순위: {metric: stats}} (기록이 없는 우선순위/구간은 빠짐)"""
+        result: Dict[str, Dict[str, dict]] = {}
+        for (priority, metric), histogram in sorted(self._histograms.items()):
+            stats = histogram.stats(now)
+            if stats['count']:
+                result.setdefault(priority, {})[metric] = stats
+        return result
+
+    def reset(self):
+        self._histograms.clear()
+
+
+class DeadlineStats:
+    """출처(origin)별 마감 시각 초과 통계"""
+
+    def __init__(self):
+        self._origins: Dict[str, Dict[str, float]] = {}
+
+    def _entry(self, origin: str) -> Dict[str, float]:
+        entry = self._origins.get(origin)
+        if entry is None:
+            entry = self._origins[origin] = {'sent': 0, 'missed': 0, 'dropped': 0, 'max_late_ms': 0.0}
+        return entry
+
+    def record_sent(self, origin: str, late_ms: float):
+        """첫 전송 기록 (late_ms: 마감 시각을 넘긴 시간, 0 이하면 제때 전송)"""
+        entry = self._entry(origin)
+        entry['sent'] += 1
+        if late_ms > 0:
+            entry['missed'] += 1
+            entry['max_late_ms'] = max(entry['max_late_ms'], round(late_ms, 1))
+
+    def record_dropped(self, origin: str):
+        """보내지 못하고 버린 명령 기록 (만료, 대기열 초과/거부)"""
+        self._entry(origin)['dropped'] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """{출처: {'sent', 'missed', 'dropped', 'max_late_ms'}}"""
+        return {origin: dict(entry) for origin, entry in sorted(self._origins.items())}
+
+    def reset(self):
+        self._origins.clear()
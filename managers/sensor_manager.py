@@ -3,7 +3,15 @@ from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from datetime import datetime
 import re
 import os
-import csv
+from utils.csv_layout import LAYOUT_WIDE, TIMESTAMP_FORMAT, layout_stream, normalize_layout, wide_row
+from utils.csv_writer import CsvLogWriter
+from utils.sensor_history import create_history_buffer
+from utils.sensor_storage import create_storages, csv_files_enabled, storage_settings
+from utils.log_manager import get_logger
+
+logger = get_logger("DSCT")
+dsct_rx_logger = get_logger("DSCT", "DSCT RX")
+dsct_test_logger = get_logger("DSCT", "DSCT TEST")
 
 class SensorManager(QObject):
     """DSCT 온습도 센서 12개의 데이터를 관리하는 매니저 클래스"""
@@ -12,11 +20,11 @@ class SensorManager(QObject):
     sensor_data_updated = pyqtSignal(str, dict)  # sensor_id, data
     all_sensors_updated = pyqtSignal(dict)  # all sensor data
     
-    def __init__(self, serial_manager=None, test_mode=False):
+    def __init__(self, serial_manager=None, test_mode=False, data_dir=None):
         super().__init__()
         self.serial_manager = serial_manager
         self.test_mode = test_mode  # 테스트 모드 플래그
-        print(f"[DSCT] SensorManager 초기화 - test_mode: {test_mode}")
+        logger.info("SensorManager 초기화 - test_mode: %s", test_mode)
         
         # 12개 센서 데이터 저장소
         self.sensor_data = {}
@@ -44,39 +52,55 @@ class SensorManager(QObject):
         
         # CSV 저장 설정
         self.csv_enabled = True
-        self.data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+        # data_dir: 장비별 저장 위치 (기본값: 프로젝트 data 폴더)
+        self.data_dir = data_dir or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
         self._ensure_data_directory()
         
         # CSV 정리기 초기화
         from utils.csv_cleaner import CSVCleaner
         self.csv_cleaner = CSVCleaner(self.data_dir)
         self.save_count = 0  # 저장 횟수 카운터 (20회마다 정리)
+
+        # CSV 레이아웃 (long: 센서마다 1행, wide: 스캔 완료 시 1행) + wide용 이번 스캔 값 {sensor_id: (temp, humi)}
+        csv_settings, storage_config = storage_settings()
+        self.csv_layout = normalize_layout(csv_settings.get("layout"))
+        self.scan_readings = {}
+
+        # 추가 저장 백엔드 (binary, sqlite - csv_logging.binary_store, storage.backends) + CSV 파일 기록 여부
+        self.storages = create_storages(self.data_dir, "DSCT", csv_settings, storage_config)
+        self.csv_files = csv_files_enabled(csv_settings, storage_config)
+
+        # CSV 기록기 (파일 핸들 유지, 행을 모아 기록) + 행이 더 오지 않을 때 남은 행 기록용 단발 타이머
+        self.csv_writer, self.csv_flush_timer = self._create_csv_writer()
+
+        # 최근 이력 메모리 버퍼 (센서별 고정 크기 numpy 링 버퍼, history_buffer.max_memory_mb, 꺼져 있으면 None)
+        self.history = create_history_buffer("DSCT", self.sensor_data)
         
     def set_serial_manager(self, serial_manager):
         """시리얼 매니저 설정 (자동 요청 제거, 스케줄러가 관리)"""
         self.serial_manager = serial_manager
-        print("[DSCT] 시리얼 매니저 설정 완료 (스케줄러 관리 모드)")
+        logger.info("시리얼 매니저 설정 완료 (스케줄러 관리 모드)")
         
         
     def request_sensor_data(self):
         """센서 데이터 요청 (테스트 모드 지원)"""
-        print(f"[DSCT] request_sensor_data() 호출됨 - test_mode: {self.test_mode}")
+        logger.info("request_sensor_data() 호출됨 - test_mode: %s", self.test_mode)
         if self.test_mode:
-            print("[DSCT] 테스트 모드: 더미 센서 데이터 생성")
+            logger.info("테스트 모드: 더미 센서 데이터 생성")
             self._generate_test_data()
             return
             
         if not self.serial_manager or not self.serial_manager.is_connected():
-            print("[DSCT] 시리얼 연결되지 않음")
+            logger.info("시리얼 연결되지 않음")
             return
             
-        print("[DSCT] 센서 데이터 요청 전송: $CMD,DSCT,TH")
+        logger.info("센서 데이터 요청 전송: $CMD,DSCT,TH")
         self.serial_manager.send_serial_command("$CMD,DSCT,TH")
             
     def _generate_test_data(self):
         """테스트 모드용 더미 데이터 생성"""
         if not hasattr(self, 'dummy_generator'):
-            print("[DSCT] ERROR: dummy_generator 없음!")
+            logger.error("dummy_generator 없음!")
             return
             
         try:
@@ -98,7 +122,7 @@ class SensorManager(QObject):
                     # CSV 저장
                     self._save_to_csv(sensor_id, self.sensor_data[sensor_id])
                     
-                    print(f"[DSCT TEST] {sensor_id} 더미 데이터: {sensor_data['temp']}°C, {sensor_data['humi']}%")
+                    dsct_test_logger.info("%s 더미 데이터: %s°C, %s%%", sensor_id, sensor_data['temp'], sensor_data['humi'])
                 else:
                     self.sensor_data[sensor_id] = {
                         'temp': None,
@@ -106,17 +130,20 @@ class SensorManager(QObject):
                         'status': 'timeout',
                         'last_update': sensor_data['timestamp']
                     }
-                    print(f"[DSCT TEST] {sensor_id} 타임아웃 시뮬레이션")
+                    dsct_test_logger.warning("%s 타임아웃 시뮬레이션", sensor_id)
                 
                 # 개별 센서 업데이트 시그널
                 self.sensor_data_updated.emit(sensor_id, self.sensor_data[sensor_id])
             
+            # 스캔 완료 (wide 레이아웃이면 1행 기록)
+            self._save_scan_to_csv(errors=sum(1 for data in all_data if data['status'] != 'active'))
+
             # 전체 센서 업데이트 시그널
             self.all_sensors_updated.emit(self.sensor_data.copy())
-            print(f"[DSCT TEST] 전체 센서 데이터 업데이트 완료: {len(self.sensor_data)}개")
+            dsct_test_logger.info("전체 센서 데이터 업데이트 완료: %s개", len(self.sensor_data))
             
         except Exception as e:
-            print(f"[DSCT TEST] 더미 데이터 생성 오류: {e}")
+            dsct_test_logger.error("더미 데이터 생성 오류: %s", e)
 
     def parse_sensor_data(self, data):
         """시리얼 데이터 파싱"""
@@ -127,7 +154,7 @@ class SensorManager(QObject):
             temp = float(match.group(2))
             humi = float(match.group(3))
             
-            print(f"[DSCT RX] {sensor_id} 센서 데이터 파싱 성공: 온도={temp}°C, 습도={humi}%")
+            dsct_rx_logger.info("%s 센서 데이터 파싱 성공: 온도=%s°C, 습도=%s%%", sensor_id, temp, humi)
             
             self.sensor_data[sensor_id] = {
                 'temp': temp,
@@ -154,7 +181,7 @@ class SensorManager(QObject):
         if timeout_match:
             sensor_id = timeout_match.group(1)
             
-            print(f"[DSCT RX] {sensor_id} 센서 타임아웃 파싱")
+            dsct_rx_logger.warning("%s 센서 타임아웃 파싱", sensor_id)
             
             self.sensor_data[sensor_id] = {
                 'temp': None,
@@ -175,8 +202,9 @@ class SensorManager(QObject):
             error = complete_match.group(3)
             time_ms = complete_match.group(4)
             
-            print(f"[DSCT RX] 스캔 완료: 총 {total}개, 성공 {success}개, 오류 {error}개, 소요시간 {time_ms}ms")
+            dsct_rx_logger.info("스캔 완료: 총 %s개, 성공 %s개, 오류 %s개, 소요시간 %sms", total, success, error, time_ms)
             
+            self._save_scan_to_csv(int(time_ms), int(error))
             self.is_scanning = False
             # 전체 센서 데이터 업데이트 시그널
             self.all_sensors_updated.emit(self.sensor_data)
@@ -184,73 +212,95 @@ class SensorManager(QObject):
             
         # 기타 메시지 로그
         if '[DSCT]' in data:
-            print(f"[DSCT RX] 기타 메시지: {data}")
+            dsct_rx_logger.info("기타 메시지: %s", data)
         else:
-            print(f"[DSCT RX] 파싱되지 않은 데이터: {data}")
+            dsct_rx_logger.info("파싱되지 않은 데이터: %s", data)
     
     def _ensure_data_directory(self):
         """데이터 디렉토리 확인 및 생성"""
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
     
+    def _csv_settings(self):
+        """csv_logging 설정 섹션"""
+        from config.config_manager import get_config_manager
+        return get_config_manager().get_section("csv_logging")
+
+    def _create_csv_writer(self):
+        """csv_logging 설정으로 CSV 기록기와 flush 타이머 생성 (wide면 DSCT_WIDE_*.csv)"""
+        settings = self._csv_settings()
+        prefix, fieldnames = layout_stream("DSCT", self.csv_layout, self.sensor_data)
+        writer = CsvLogWriter(
+            self.data_dir, prefix, fieldnames,
+            flush_interval_sec=settings.get("flush_interval_sec", 5),
+            flush_rows=settings.get("flush_rows", 50),
+            max_bytes=int(settings.get("max_file_mb", 10) * 1024 * 1024)
+        )
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(int(writer.flush_interval_sec * 1000))
+        timer.timeout.connect(writer.flush)
+        for storage in self.storages:
+            timer.timeout.connect(storage.flush)
+        return writer, timer
+
     def _get_csv_filename(self):
-        """현재 날짜와 파일 크기를 고려하여 CSV 파일명 생성"""
-        today = datetime.now().strftime('%Y-%m-%d')
-        base_filename = f'DSCT_{today}'
-        
-        # 기존 파일들 확인
-        file_index = 0
-        while True:
-            if file_index == 0:
-                filename = os.path.join(self.data_dir, f'{base_filename}.csv')
-            else:
-                filename = os.path.join(self.data_dir, f'{base_filename}_{file_index:03d}.csv')
-            
-            # 파일이 없으면 이 파일명 사용
-            if not os.path.exists(filename):
-                return filename
-            
-            # 파일 크기 확인 (10MB = 10 * 1024 * 1024 bytes)
-            file_size = os.path.getsize(filename)
-            if file_size < 10 * 1024 * 1024:  # 10MB 미만이면 이 파일 사용
-                return filename
-            
-            # 10MB 이상이면 다음 인덱스로
-            file_index += 1
+        """현재 기록 중인 CSV 파일명 (날짜별, 10MB마다 _001, _002 ...)"""
+        return self.csv_writer.current_path()
     
     def _save_to_csv(self, sensor_id, data):
-        """센서 데이터를 CSV 파일로 저장"""
-        if not self.csv_enabled or data['status'] != 'active':
+        """센서 데이터를 최근 이력 버퍼와 CSV 기록기에 추가 (flush_rows개 또는 flush_interval_sec마다 파일에 기록)"""
+        if data['status'] != 'active':
             return
-            
-        # 적절한 파일명 가져오기
-        filename = self._get_csv_filename()
-        
-        # 파일이 없으면 헤더 작성
-        file_exists = os.path.exists(filename)
-        
-        with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['timestamp', 'sensor_id', 'temperature', 'humidity']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            if not file_exists:
-                writer.writeheader()
-            
-            writer.writerow({
-                'timestamp': data['last_update'].strftime('%Y-%m-%d %H:%M:%S'),
-                'sensor_id': sensor_id,
-                'temperature': data['temp'],
-                'humidity': data['humi']
-            })
+        # 최근 이력 버퍼는 CSV 로깅 여부와 무관하게 기록
+        if self.history is not None:
+            self.history.append(sensor_id, data['last_update'], (data['temp'], data['humi']))
+        if not self.csv_enabled:
+            return
+
+        for storage in self.storages:
+            storage.add_reading(data['last_update'], sensor_id, (data['temp'], data['humi']))
+
+        if self.csv_files:
+            if self.csv_layout == LAYOUT_WIDE:
+                # 스캔 완료 시 _save_scan_to_csv()가 한 행으로 기록
+                self.scan_readings[sensor_id] = (data['temp'], data['humi'])
+            else:
+                self.csv_writer.write_row([
+                    data['last_update'].strftime(TIMESTAMP_FORMAT),
+                    sensor_id,
+                    data['temp'],
+                    data['humi']
+                ], data['last_update'])
+        self._schedule_csv_flush()
+
+    def _save_scan_to_csv(self, scan_ms='', errors=''):
+        """스캔 완료: 저장 백엔드에 스캔 경계 알림, wide 레이아웃이면 이번 스캔에서 모은 값으로 1행 기록"""
+        readings, self.scan_readings = self.scan_readings, {}
+        for storage in self.storages:
+            storage.end_scan()
+        if not self.csv_enabled or self.csv_layout != LAYOUT_WIDE or not self.csv_files:
+            return
+
+        now = datetime.now()
+        self.csv_writer.write_row(
+            wide_row(now.strftime(TIMESTAMP_FORMAT), readings, list(self.sensor_data), scan_ms, errors), now)
+        self._schedule_csv_flush()
+
+    def _schedule_csv_flush(self):
+        """남은 행은 flush_interval_sec 뒤 기록 (그 전에 더 쌓이면 write_row가 기록)"""
+        pending = self.csv_writer.pending or any(storage.pending for storage in self.storages)
+        if pending and not self.csv_flush_timer.isActive():
+            self.csv_flush_timer.start()
     
     def _cleanup_old_csv_files(self):
         """오래된 CSV 파일 정리 (DSCT 파일만)"""
         try:
             dsct_deleted, _ = self.csv_cleaner.auto_cleanup(max_files=20)
             if dsct_deleted:
-                print(f"[DSCT] CSV 정리 완료: {len(dsct_deleted)}개 파일 삭제")
+                logger.info("CSV 정리 완료: %s개 파일 삭제", len(dsct_deleted))
         except Exception as e:
-            print(f"[DSCT] CSV 정리 중 오류: {e}")
+            logger.error("CSV 정리 중 오류: %s", e)
     
     def _generate_dummy_data(self):
         """테스트 모드: 더미 데이터 생성 및 처리"""
@@ -286,6 +336,7 @@ class SensorManager(QObject):
             self.sensor_data_updated.emit(sensor_id, self.sensor_data[sensor_id])
         
         # 스캔 완료 처리
+        self._save_scan_to_csv(errors=sum(1 for data in all_data if data['status'] != 'active'))
         self.is_scanning = False
         self.all_sensors_updated.emit(self.sensor_data)
             
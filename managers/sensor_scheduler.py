@@ -3,6 +3,9 @@ from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from enum import Enum
 from datetime import datetime
 import time
+from utils.log_manager import get_logger
+
+logger = get_logger("SCHEDULER")
 
 class SchedulerState(Enum):
     """스케줄러 상태 정의"""
@@ -60,8 +63,11 @@ class SensorScheduler(QObject):
         # 연결 상태 체크 최적화 (시간 기반 - 5초마다)
         self.last_connection_check_time = 0
         self.connection_check_interval = 5.0
+
+        # 연결 끊김/자동 재연결 시그널 연결
+        self._connect_serial_signals(serial_manager)
         
-        print("[SCHEDULER] 센서 스케줄러 초기화 완료")
+        logger.info("센서 스케줄러 초기화 완료")
         
     def set_sensor_managers(self, aircon_manager, dsct_manager):
         """센서 매니저들 설정"""
@@ -77,10 +83,14 @@ class SensorScheduler(QObject):
             self.dsct_manager.sensor_data_updated.connect(self._on_dsct_sensor_updated)
             self.dsct_manager.all_sensors_updated.connect(self._on_dsct_all_updated)
             
-        print("[SCHEDULER] 센서 매니저들 연결 완료")
+        logger.info("센서 매니저들 연결 완료")
         
     def set_serial_manager(self, serial_manager):
         """시리얼 매니저 설정"""
+        if serial_manager is not self.serial_manager:
+            # 이전 매니저의 끊김/재연결 시그널은 해제 (재연결·교체 뒤 두 매니저에서 중복 수신 방지)
+            self._disconnect_serial_signals(self.serial_manager)
+            self._connect_serial_signals(serial_manager)
         self.serial_manager = serial_manager
         
         # 센서 매니저들에도 전달
@@ -89,28 +99,28 @@ class SensorScheduler(QObject):
         if self.dsct_manager:
             self.dsct_manager.set_serial_manager(serial_manager)
             
-        print("[SCHEDULER] 시리얼 매니저 설정 완료")
+        logger.info("시리얼 매니저 설정 완료")
         
     def start_scheduling(self):
         """스케줄링 시작"""
         if self.is_running:
-            print("[SCHEDULER] 이미 실행 중입니다")
+            logger.info("이미 실행 중입니다")
             return
             
         # 테스트 모드에서는 시리얼 연결 확인 건너뜀
         if not self.test_mode:
             if not self.serial_manager or not self.serial_manager.is_connection_healthy():
-                print("[SCHEDULER] 시리얼 연결 상태 불량, 스케줄링 시작 실패")
+                logger.warning("시리얼 연결 상태 불량, 스케줄링 시작 실패")
                 return
         else:
-            print("[SCHEDULER] 테스트 모드: 시리얼 연결 없이 스케줄링 시작")
+            logger.info("테스트 모드: 시리얼 연결 없이 스케줄링 시작")
             
         self.is_running = True
         self._set_state(SchedulerState.IDLE)
         self.main_timer.start(100)  # 100ms마다 상태 머신 처리
         self.last_cycle_time = time.time()
         
-        print("[SCHEDULER] 스케줄링 시작")
+        logger.info("스케줄링 시작")
         
     def stop_scheduling(self):
         """스케줄링 중지"""
@@ -119,7 +129,7 @@ class SensorScheduler(QObject):
         self.timeout_timer.stop()
         self._set_state(SchedulerState.PAUSED)
         
-        print("[SCHEDULER] 스케줄링 중지")
+        logger.info("스케줄링 중지")
         
     def pause_scheduling(self):
         """스케줄링 일시정지"""
@@ -127,20 +137,45 @@ class SensorScheduler(QObject):
             self.main_timer.stop()
             self.timeout_timer.stop()
             self._set_state(SchedulerState.PAUSED)
-            print("[SCHEDULER] 스케줄링 일시정지")
+            logger.info("스케줄링 일시정지")
             
     def resume_scheduling(self):
         """스케줄링 재개"""
         if self.is_running and self.current_state == SchedulerState.PAUSED:
             self._set_state(SchedulerState.IDLE)
             self.main_timer.start(100)
-            print("[SCHEDULER] 스케줄링 재개")
+            logger.info("스케줄링 재개")
+            
+    def _connect_serial_signals(self, serial_manager):
+        """끊기면 바로 일시정지, 자동 재연결되면 재개"""
+        if serial_manager is None or not hasattr(serial_manager, 'connection_lost'):
+            return
+        serial_manager.connection_lost.connect(self._on_connection_lost)
+        serial_manager.connection_restored.connect(self._on_connection_restored)
+
+    def _disconnect_serial_signals(self, serial_manager):
+        """_connect_serial_signals()로 연결한 시그널 해제"""
+        if serial_manager is None or not hasattr(serial_manager, 'connection_lost'):
+            return
+        try:
+            serial_manager.connection_lost.disconnect(self._on_connection_lost)
+            serial_manager.connection_restored.disconnect(self._on_connection_restored)
+        except TypeError:
+            pass
+
+    def _on_connection_lost(self, port):
+        logger.info("연결 끊김 (%s), 스케줄링 일시정지", port)
+        self.pause_scheduling()
+
+    def _on_connection_restored(self, port):
+        logger.info("재연결됨 (%s), 스케줄링 재개", port)
+        self.resume_scheduling()
             
     def manual_request_aircon(self):
         """수동 AIRCON 데이터 요청 (LOW 우선순위)"""
         if self.test_mode and self.aircon_manager:
             # 테스트 모드: 센서 매니저 직접 호출
-            print("[SCHEDULER] 테스트 모드: 수동 AIRCON 센서 매니저 직접 호출")
+            logger.info("테스트 모드: 수동 AIRCON 센서 매니저 직접 호출")
             self.aircon_manager.request_sensor_data()
             return
             
@@ -149,22 +184,22 @@ class SensorScheduler(QObject):
                 from .command_queue_manager import CommandPriority
                 command = "$CMD,AIR,TH"
                 result = self.serial_manager.send_serial_command_with_priority(
-                    command, CommandPriority.LOW
+                    command, CommandPriority.LOW, origin="sensor"
                 )
                 if result:
-                    print(f"[SCHEDULER] 수동 AIRCON 데이터 요청 전송 (LOW 우선순위): {command}")
+                    logger.info("수동 AIRCON 데이터 요청 전송 (LOW 우선순위): %s", command)
                 else:
-                    print("[SCHEDULER] 수동 AIRCON 요청 전송 실패")
+                    logger.warning("수동 AIRCON 요청 전송 실패")
             except Exception as e:
-                print(f"[SCHEDULER] 수동 AIRCON 요청 오류: {e}")
+                logger.error("수동 AIRCON 요청 오류: %s", e)
         else:
-            print("[SCHEDULER] 시리얼 매니저 미설정")
+            logger.info("시리얼 매니저 미설정")
             
     def manual_request_dsct(self):
         """수동 DSCT 데이터 요청 (LOW 우선순위)"""
         if self.test_mode and self.dsct_manager:
             # 테스트 모드: 센서 매니저 직접 호출
-            print("[SCHEDULER] 테스트 모드: 수동 DSCT 센서 매니저 직접 호출")
+            logger.info("테스트 모드: 수동 DSCT 센서 매니저 직접 호출")
             self.dsct_manager.request_sensor_data()
             return
             
@@ -173,16 +208,16 @@ class SensorScheduler(QObject):
                 from .command_queue_manager import CommandPriority
                 command = "$CMD,DSCT,TH"
                 result = self.serial_manager.send_serial_command_with_priority(
-                    command, CommandPriority.LOW
+                    command, CommandPriority.LOW, origin="sensor"
                 )
                 if result:
-                    print(f"[SCHEDULER] 수동 DSCT 데이터 요청 전송 (LOW 우선순위): {command}")
+                    logger.info("수동 DSCT 데이터 요청 전송 (LOW 우선순위): %s", command)
                 else:
-                    print("[SCHEDULER] 수동 DSCT 요청 전송 실패")
+                    logger.warning("수동 DSCT 요청 전송 실패")
             except Exception as e:
-                print(f"[SCHEDULER] 수동 DSCT 요청 오류: {e}")
+                logger.error("수동 DSCT 요청 오류: %s", e)
         else:
-            print("[SCHEDULER] 시리얼 매니저 미설정")
+            logger.info("시리얼 매니저 미설정")
             
     def set_cycle_interval(self, seconds):
         """주기 간격 설정 (최소 5초, 최대 300초)"""
@@ -193,18 +228,18 @@ class SensorScheduler(QObject):
         self.cycle_interval = max(min_interval, min(max_interval, seconds))
         
         if seconds < min_interval:
-            print(f"[SCHEDULER] 경고: 요청된 간격 {seconds}초가 최소값보다 작아 {min_interval}초로 설정됨")
+            logger.warning("요청된 간격 %s초가 최소값보다 작아 %s초로 설정됨", seconds, min_interval)
         elif seconds > max_interval:
-            print(f"[SCHEDULER] 경고: 요청된 간격 {seconds}초가 최대값보다 커서 {max_interval}초로 설정됨")
+            logger.warning("요청된 간격 %s초가 최대값보다 커서 %s초로 설정됨", seconds, max_interval)
         
-        print(f"[SCHEDULER] 주기 간격 설정: {self.cycle_interval}초")
+        logger.info("주기 간격 설정: %s초", self.cycle_interval)
         
     def _set_state(self, new_state):
         """상태 변경"""
         if self.current_state != new_state:
             old_state = self.current_state
             self.current_state = new_state
-            print(f"[SCHEDULER] 상태 변경: {old_state.value} → {new_state.value}")
+            logger.info("상태 변경: %s → %s", old_state.value, new_state.value)
             self.state_changed.emit(new_state.value)
             
     def _process_state_machine(self):
@@ -219,7 +254,7 @@ class SensorScheduler(QObject):
             if current_time - self.last_connection_check_time >= self.connection_check_interval:
                 self.last_connection_check_time = current_time
                 if not self.serial_manager or not self.serial_manager.is_connection_healthy():
-                    print("[SCHEDULER] 연결 상태 불량, 스케줄링 일시정지")
+                    logger.info("연결 상태 불량, 스케줄링 일시정지")
                     self.pause_scheduling()
                     return
             
@@ -229,7 +264,7 @@ class SensorScheduler(QObject):
                 return
                 
             # 새 주기 시작
-            print(f"[SCHEDULER] 새 주기 시작 - 간격: {self.cycle_interval}초")
+            logger.info("새 주기 시작 - 간격: %s초", self.cycle_interval)
             if self.aircon_enabled:
                 self._start_aircon_request()
             elif self.dsct_enabled:
@@ -257,14 +292,14 @@ class SensorScheduler(QObject):
         elif self.current_state == SchedulerState.INTERVAL_WAITING:
             # 주기 간격 대기 완료 후 새 주기 시작
             self.last_cycle_time = current_time
-            print(f"[SCHEDULER] 주기 대기 완료, 다음 주기까지 {self.cycle_interval}초 대기")
+            logger.info("주기 대기 완료, 다음 주기까지 %s초 대기", self.cycle_interval)
             self._set_state(SchedulerState.IDLE)
             
     def _start_aircon_request(self):
         """AIRCON 데이터 요청 시작 (LOW 우선순위)"""
         if self.test_mode and self.aircon_manager:
             # 테스트 모드: 센서 매니저 직접 호출
-            print("[SCHEDULER] 테스트 모드: AIRCON 센서 매니저 직접 호출")
+            logger.info("테스트 모드: AIRCON 센서 매니저 직접 호출")
             self.aircon_manager.request_sensor_data()
             self._move_to_dsct()
             return
@@ -274,28 +309,28 @@ class SensorScheduler(QObject):
                 from .command_queue_manager import CommandPriority
                 command = "$CMD,AIR,TH"
                 result = self.serial_manager.send_serial_command_with_priority(
-                    command, CommandPriority.LOW
+                    command, CommandPriority.LOW, origin="sensor"
                 )
                 if result:
                     self._set_state(SchedulerState.AIRCON_WAITING)
                     self.current_request_start_time = time.time()
                     self.timeout_timer.start(int(self.response_timeout * 1000))
-                    print(f"[SCHEDULER] AIRCON 데이터 요청 전송 (LOW 우선순위): {command}")
+                    logger.info("AIRCON 데이터 요청 전송 (LOW 우선순위): %s", command)
                 else:
-                    print("[SCHEDULER] AIRCON 요청 전송 실패, DSCT로 이동")
+                    logger.warning("AIRCON 요청 전송 실패, DSCT로 이동")
                     self._move_to_dsct()
             except Exception as e:
-                print(f"[SCHEDULER] AIRCON 요청 오류: {e}")
+                logger.error("AIRCON 요청 오류: %s", e)
                 self._move_to_dsct()
         else:
-            print("[SCHEDULER] 시리얼 매니저 미설정, DSCT로 이동")
+            logger.info("시리얼 매니저 미설정, DSCT로 이동")
             self._move_to_dsct()
         
     def _start_dsct_request(self):
         """DSCT 데이터 요청 시작 (LOW 우선순위)"""
         if self.test_mode and self.dsct_manager:
             # 테스트 모드: 센서 매니저 직접 호출
-            print("[SCHEDULER] 테스트 모드: DSCT 센서 매니저 직접 호출")
+            logger.info("테스트 모드: DSCT 센서 매니저 직접 호출")
             self.dsct_manager.request_sensor_data()
             self._set_state(SchedulerState.INTERVAL_WAITING)
             return
@@ -305,21 +340,21 @@ class SensorScheduler(QObject):
                 from .command_queue_manager import CommandPriority
                 command = "$CMD,DSCT,TH"
                 result = self.serial_manager.send_serial_command_with_priority(
-                    command, CommandPriority.LOW
+                    command, CommandPriority.LOW, origin="sensor"
                 )
                 if result:
                     self._set_state(SchedulerState.DSCT_WAITING)
                     self.current_request_start_time = time.time()
                     self.timeout_timer.start(int(self.response_timeout * 1000))
-                    print(f"[SCHEDULER] DSCT 데이터 요청 전송 (LOW 우선순위): {command}")
+                    logger.info("DSCT 데이터 요청 전송 (LOW 우선순위): %s", command)
                 else:
-                    print("[SCHEDULER] DSCT 요청 전송 실패, 주기 대기로 이동")
+                    logger.warning("DSCT 요청 전송 실패, 주기 대기로 이동")
                     self._set_state(SchedulerState.INTERVAL_WAITING)
             except Exception as e:
-                print(f"[SCHEDULER] DSCT 요청 오류: {e}")
+                logger.error("DSCT 요청 오류: %s", e)
                 self._set_state(SchedulerState.INTERVAL_WAITING)
         else:
-            print("[SCHEDULER] 시리얼 매니저 미설정, 주기 대기로 이동")
+            logger.info("시리얼 매니저 미설정, 주기 대기로 이동")
             self._set_state(SchedulerState.INTERVAL_WAITING)
         
     def _move_to_dsct(self):
@@ -335,10 +370,10 @@ class SensorScheduler(QObject):
         elapsed = current_time - (self.current_request_start_time or current_time)
         
         if self.current_state == SchedulerState.AIRCON_WAITING:
-            print(f"[SCHEDULER] AIRCON 응답 타임아웃 ({elapsed:.1f}초), DSCT로 이동")
+            logger.warning("AIRCON 응답 타임아웃 (%.1f초), DSCT로 이동", elapsed)
             self._move_to_dsct()
         elif self.current_state == SchedulerState.DSCT_WAITING:
-            print(f"[SCHEDULER] DSCT 응답 타임아웃 ({elapsed:.1f}초), 주기 대기로 이동")
+            logger.warning("DSCT 응답 타임아웃 (%.1f초), 주기 대기로 이동", elapsed)
             self._set_state(SchedulerState.INTERVAL_WAITING)
             
     def _on_aircon_sensor_updated(self, sensor_id, data):
@@ -347,10 +382,10 @@ class SensorScheduler(QObject):
         
     def _on_aircon_all_updated(self, all_data):
         """AIRCON 전체 센서 업데이트 완료"""
-        print(f"[SCHEDULER] AIRCON 응답 완료, {len(all_data)}개 센서 → UI로 시그널 전송")
+        logger.info("AIRCON 응답 완료, %s개 센서 → UI로 시그널 전송", len(all_data))
         self.timeout_timer.stop()
         self.aircon_all_sensors_updated.emit(all_data)
-        print("[SCHEDULER] AIRCON aircon_all_sensors_updated 시그널 전송 완료")
+        logger.info("AIRCON aircon_all_sensors_updated 시그널 전송 완료")
         self._move_to_dsct()
         
     def _on_dsct_sensor_updated(self, sensor_id, data):
@@ -359,10 +394,10 @@ class SensorScheduler(QObject):
         
     def _on_dsct_all_updated(self, all_data):
         """DSCT 전체 센서 업데이트 완료"""
-        print(f"[SCHEDULER] DSCT 응답 완료, {len(all_data)}개 센서 → UI로 시그널 전송")
+        logger.info("DSCT 응답 완료, %s개 센서 → UI로 시그널 전송", len(all_data))
         self.timeout_timer.stop()
         self.dsct_all_sensors_updated.emit(all_data)
-        print("[SCHEDULER] DSCT dsct_all_sensors_updated 시그널 전송 완료")
+        logger.info("DSCT dsct_all_sensors_updated 시그널 전송 완료")
         self._set_state(SchedulerState.INTERVAL_WAITING)
         
     def get_status_info(self):
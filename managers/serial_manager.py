@@ -1,16 +1,51 @@
 import os
 import serial
-import serial.tools.list_ports
 import time
+from collections import deque
 from typing import Optional, List, Dict
-from PyQt5.QtCore import QObject, pyqtSignal, QSocketNotifier
+from PyQt5.QtCore import QObject, Qt, pyqtSignal, QSocketNotifier, QTimer
+from .line_framer import LineFramer, decode_line
+from .line_router import LineRouter
+from .port_watcher import get_port_watcher, is_usb_serial
+from utils.log_manager import get_logger
+
+logger = get_logger("SERIAL")
+read_logger = get_logger("RX", "READ")
+interrupt_logger = get_logger("RX", "INTERRUPT")
+tx_logger = get_logger("TX")
 
 class SerialManager(QObject):
-    # 데이터 수신 시그널
+    # 데이터 수신 시그널 (라인 단위, 기존 슬롯 호환용)
     data_received = pyqtSignal(str)
+    # 라인 묶음 수신 시그널 (RELOAD/스캔 버스트를 이벤트 루프 1회에 처리)
+    lines_received = pyqtSignal(list)
+    # 예기치 않은 연결 끊김 (포트 경로) - 자동 재연결 대기 시작
+    connection_lost = pyqtSignal(str)
+    # 자동 재연결 성공 (포트 경로)
+    connection_restored = pyqtSignal(str)
+    # 연결 성공 (포트 경로, 수동 연결과 자동 재연결 모두)
+    connected = pyqtSignal(str)
+    # 쓰기 스레드의 실제 write() 실패 (명령 문자열, 오류 메시지) - 명령 큐가 재시도
+    write_failed = pyqtSignal(str, str)
+
+    # 가상 포트 목록 (펌웨어 시뮬레이터 pty 등, USB 포트와 함께 표시)
+    virtual_ports: Dict[str, str] = {}
+
+    @classmethod
+    def register_virtual_port(cls, device: str, description: str = "Virtual serial port"):
+        """가상 포트 등록 (포트 목록/연결 검사에 포함)"""
+        cls.virtual_ports[device] = description
+        logger.info("가상 포트 등록: %s (%s)", device, description)
+
+    @classmethod
+    def unregister_virtual_port(cls, device: str):
+        """가상 포트 등록 해제"""
+        cls.virtual_ports.pop(device, None)
     
-    def __init__(self):
+    def __init__(self, unit_id: Optional[str] = None):
         super().__init__()
+        # 장비 ID (여러 장비 동시 연결 시 로그/수신 라인 구분, 단일 장비면 None)
+        self.unit_id = unit_id
         # 시리얼 연결 객체, 연결 전이나 연결 해제 시 None으로, 연결 성공 시 Serial 객체로 설정 
         self.shinho_serial_connection: Optional[serial.Serial] = None
         self.supported_baudrates = [9600, 14400, 19200, 28800, 38400, 57600, 115200]
@@ -28,10 +63,37 @@ class SerialManager(QObject):
         
         # 명령 큐 매니저 연결용
         self.command_queue = None
+
+        # 수신 라인 분배기 (접두어 기준 1회 분류 후 등록된 핸들러만 호출)
+        self.line_router = LineRouter()
+
+        # 직접 읽기 경로(read_data, 인터럽트 방식)용 라인 프레이머와 완성 라인 대기열
+        self._framer = LineFramer()
+        self._ready_lines = deque()
         
         # 읽기 스레드 (지연 초기화)
         self.reader_thread = None
 
+        # 쓰기 스레드 (모든 송신은 이 스레드 경유, 지연 초기화)
+        self.writer_thread = None
+
+        # 현재 연결 정보 (자동 재연결 대상)
+        self.current_port: Optional[str] = None
+        self.current_baudrate = 115200
+
+        # 포트 목록 캐시 (핫플러그 이벤트 기반, 장치 제거 감지)
+        self.port_watcher = get_port_watcher()
+        self.port_watcher.ports_changed.connect(self._on_ports_changed)
+
+        # 자동 재연결 (지수 백오프)
+        self._reconnect_timer = QTimer(self)
+        self._reconnect_timer.setSingleShot(True)
+        self._reconnect_timer.timeout.connect(self._attempt_reconnect)
+        self._reconnect_target = None  # (포트, 보레이트), 재연결 대기 중이 아니면 None
+        self._reconnect_delay_ms = 0
+        self.reconnect_attempts = 0
+        self.total_reconnects = 0
+
     def get_available_ports(self, usb_only: bool = True) -> List[Dict[str, str]]:
         """연결 가능한 시리얼 포트 목록을 반환하는 함수
 
@@ -42,28 +104,17 @@ class SerialManager(QObject):
         Returns:
             포트 정보 리스트 [{"device": "/dev/ttyUSB0", "description": "..."}]
         """
-        ports = serial.tools.list_ports.comports()
+        # 포트 감시자의 캐시 사용 (열거는 핫플러그 이벤트 시 백그라운드에서만 수행)
+        ports = self.port_watcher.get_ports()
+        virtual = [{"device": device, "description": description}
+                   for device, description in self.virtual_ports.items()]
 
         if usb_only:
             # USB 시리얼 포트만 필터링 (/dev/ttyUSB*, /dev/ttyACM*, COM* 등)
-            filtered_ports = []
-            for port in ports:
-                device = port.device
-                # Linux: ttyUSB*, ttyACM* (USB-시리얼 어댑터)
-                # Windows: COM* (모두 USB일 가능성 높음)
-                if ('ttyUSB' in device or 'ttyACM' in device or
-                    device.startswith('COM')):
-                    filtered_ports.append({
-                        "device": port.device,
-                        "description": port.description,
-                    })
-            return filtered_ports
+            return [port for port in ports if is_usb_serial(port["device"])] + virtual
         else:
             # 모든 포트 반환
-            return [{
-                "device": port.device,
-                "description": port.description,
-            } for port in ports]
+            return ports + virtual
         
     def connect_serial(self, port: str, baudrate: int = 115200) -> bool:
         """지정된 포트와 보레이트로 시리얼 연결 시도하는 함수"""
@@ -71,13 +122,19 @@ class SerialManager(QObject):
             # 기존 연결 해제
             self.disconnect_serial()
 
-            # USB 시리얼 포트 존재 여부 확인
+            # USB 시리얼 포트 존재 여부 확인 (캐시에 없으면 한 번 다시 열거)
             available_ports = [p["device"] for p in self.get_available_ports(usb_only=True)]
+            if port not in available_ports and self.port_watcher.refresh():
+                available_ports = [p["device"] for p in self.get_available_ports(usb_only=True)]
             if port not in available_ports:
-                print(f"[SERIAL] 오류: USB 시리얼 포트 '{port}'가 존재하지 않습니다.")
-                print(f"[SERIAL] 사용 가능한 USB 포트: {available_ports if available_ports else '없음'}")
+                logger.error("USB 시리얼 포트 '%s'가 존재하지 않습니다.", port)
+                logger.info("사용 가능한 USB 포트: %s", available_ports if available_ports else '없음')
                 return False
 
+            # 이전 연결의 부분 라인 버리기
+            self._framer.reset()
+            self._ready_lines.clear()
+
             # 새 연결 시도
             self.shinho_serial_connection = serial.Serial(
                 port=port,
@@ -87,7 +144,7 @@ class SerialManager(QObject):
 
             # 연결 후 실제로 포트가 열렸는지 확인
             if not self.shinho_serial_connection.is_open:
-                print(f"[SERIAL] 오류: 포트 '{port}' 열기 실패")
+                logger.error("포트 '%s' 열기 실패", port)
                 self.shinho_serial_connection = None
                 return False
 
@@ -98,24 +155,29 @@ class SerialManager(QObject):
                     self.socket_notifier = QSocketNotifier(fd, QSocketNotifier.Read)
                     self.socket_notifier.activated.connect(self._on_data_ready)
                     self.socket_notifier.setEnabled(True)
-                    print(f"[SERIAL] 인터럽트 방식 활성화 (fd: {fd})")
+                    logger.info("인터럽트 방식 활성화 (fd: %s)", fd)
                 except Exception as e:
-                    print(f"[SERIAL] 인터럽트 방식 설정 실패, 폴링 방식 유지: {e}")
+                    logger.warning("인터럽트 방식 설정 실패, 폴링 방식 유지: %s", e)
             else:
-                print("[SERIAL] 인터럽트 방식 비활성화됨, 폴링 방식 사용")
+                logger.info("인터럽트 방식 비활성화됨, 폴링 방식 사용")
 
-            print(f"[SERIAL] 연결 성공: {port} @ {baudrate}bps")
+            logger.info("연결 성공: %s @ %sbps%s", port, baudrate, f" (장비 {self.unit_id})" if self.unit_id else "")
+            self.current_port = port
+            self.current_baudrate = baudrate
+            self.connection_healthy = True
 
-            # 읽기 스레드 시작
+            # 읽기/쓰기 스레드 시작
             self._start_reader_thread()
+            self._start_writer_thread()
 
+            self.connected.emit(port)
             return True
         except serial.SerialException as e:
-            print(f"[SERIAL] 시리얼 연결 오류: {e}")
+            logger.error("시리얼 연결 오류: %s", e)
             self.shinho_serial_connection = None
             return False
         except Exception as e:
-            print(f"[SERIAL] 연결 오류: {e}")
+            logger.error("연결 오류: %s", e)
             self.shinho_serial_connection = None
             return False
         
@@ -124,31 +186,32 @@ class SerialManager(QObject):
         return self.shinho_serial_connection and self.shinho_serial_connection.is_open
         
     def send_data(self, data: str) -> bool:
-        """데이터 전송 함수"""
+        """
+        데이터 전송 함수 (모든 송신 경로의 단일 진입점)
+
+        쓰기 스레드가 실행 중이면 송신 큐에 넣고 즉시 반환합니다 (실제 쓰기 실패는 write_failed/로그로 보고).
+        """
         try:
             if not self.shinho_serial_connection or not self.shinho_serial_connection.is_open:
                 raise Exception("Serial port is not connected")
-            
+
+            if self.writer_thread and self.writer_thread.is_running:
+                return self.writer_thread.enqueue(data)
+
+            # 쓰기 스레드 시작 실패 시 직접 쓰기
             self.shinho_serial_connection.write(data.encode('ascii'))
             return True
         except Exception as e:
-            print("Error sending serial data:", e)
+            logger.error("Error sending serial data: %s", e)
             return False 
 
     def read_data(self) -> Optional[str]:
-        """데이터 읽기 함수 (비블로킹)"""
+        """데이터 읽기 함수 (비블로킹, 완성된 라인 1개 반환)"""
         try:
-            if not self.shinho_serial_connection or not self.shinho_serial_connection.is_open:
-                return None
-
-            # 대기 중인 데이터만 읽기 (논블로킹)
-            if self.shinho_serial_connection.in_waiting > 0:
-                data = self.shinho_serial_connection.readline()
-                if data:
-                    return data.decode('ascii', errors='ignore').strip()
+            return self._read_available_data()
         except Exception as e:
-            print(f"[READ ERROR] {e}")
-        return None 
+            read_logger.error("%s", e)
+        return None
 
     def _on_data_ready(self):
         """인터럽트 핸들러: 데이터 수신 가능할 때 호출"""
@@ -167,7 +230,7 @@ class SerialManager(QObject):
                     break
                     
                 processed_count += 1
-                print(f"[INTERRUPT] 수신된 데이터 ({processed_count}): '{data}'")
+                interrupt_logger.debug("수신된 데이터 (%s): '%s'", processed_count, data)
                 
                 # 시그널 발생
                 self.data_received.emit(data)
@@ -179,71 +242,65 @@ class SerialManager(QObject):
                 #     self.air_sensor_data_callback(data)
             
             if processed_count >= max_iterations:
-                print(f"[INTERRUPT WARNING] 최대 반복 횟수 도달: {max_iterations}")
+                interrupt_logger.warning("최대 반복 횟수 도달: %s", max_iterations)
                 
         except Exception as e:
-            print(f"[INTERRUPT ERROR] 데이터 처리 오류: {e}")
+            interrupt_logger.error("데이터 처리 오류: %s", e)
         finally:
             # 소켓 알림자 재활성화
             if self.socket_notifier and self.shinho_serial_connection and self.shinho_serial_connection.is_open:
                 self.socket_notifier.setEnabled(True)
 
     def _read_available_data(self) -> Optional[str]:
-        """사용 가능한 데이터 즉시 읽기 (논블로킹)"""
+        """
+        사용 가능한 데이터 즉시 읽기 (논블로킹)
+
+        대기 중인 바이트 전체를 프레이머에 넣고 완성된 라인만 1개씩 반환합니다.
+        줄바꿈이 아직 오지 않은 부분 라인은 다음 호출까지 보관됩니다.
+        """
         try:
-            if not self.shinho_serial_connection or not self.shinho_serial_connection.is_open:
-                return None
-            
-            # 대기 중인 바이트 수 확인
-            waiting_bytes = self.shinho_serial_connection.in_waiting
-            if waiting_bytes == 0:
-                return None
-            
-            print(f"[READ] 대기 중인 바이트: {waiting_bytes}")
-            
-            # 논블로킹 읽기: 타임아웃을 매우 짧게 설정
-            original_timeout = self.shinho_serial_connection.timeout
-            self.shinho_serial_connection.timeout = 0.01  # 10ms
-            
-            try:
-                raw_data = self.shinho_serial_connection.readline()
-            finally:
-                # 타임아웃 복원
-                self.shinho_serial_connection.timeout = original_timeout
-                
-            if not raw_data:
-                return None
-            
-            print(f"[READ] 원본 바이트: {raw_data}")
-                
-            # 디코딩
-            try:
-                decoded = raw_data.decode('ascii').strip()
-                if decoded:
-                    return decoded
-                else:
+            if not self._ready_lines:
+                if not self.shinho_serial_connection or not self.shinho_serial_connection.is_open:
                     return None
-            except UnicodeDecodeError:
-                try:
-                    decoded = raw_data.decode('utf-8').strip()
-                    if decoded:
-                        return decoded
-                    else:
-                        return None
-                except:
+
+                # 대기 중인 바이트 수 확인
+                waiting_bytes = self.shinho_serial_connection.in_waiting
+                if waiting_bytes == 0:
                     return None
-                    
+
+                read_logger.debug("대기 중인 바이트: %s", waiting_bytes)
+                raw_data = self.shinho_serial_connection.read(waiting_bytes)
+                read_logger.debug("원본 바이트: %s", raw_data)
+                self._ready_lines.extend(self._framer.feed(raw_data))
+
+            while self._ready_lines:
+                decoded = decode_line(self._ready_lines.popleft())
+                if decoded:
+                    return decoded
+            return None
+
         except Exception as e:
-            print(f"[READ ERROR] {e}")
+            read_logger.error("%s", e)
             return None
 
     def disconnect_serial(self) -> None:
-        """시리얼 포트 닫기 함수, 연결 종료"""
-        # 읽기 스레드 중지 (예외 발생해도 계속 진행)
+        """시리얼 포트 닫기 함수, 연결 종료 (사용자 요청이므로 자동 재연결도 취소)"""
+        self._cancel_reconnect()
+        self._close_port()
+        self.current_port = None
+
+    def _close_port(self) -> None:
+        """읽기/쓰기 스레드 중지 및 포트 닫기"""
+        # 읽기/쓰기 스레드 중지 (예외 발생해도 계속 진행)
         try:
             self._stop_reader_thread()
         except Exception as e:
-            print(f"[SERIAL] 읽기 스레드 중지 중 오류 (무시됨): {e}")
+            logger.warning("읽기 스레드 중지 중 오류 (무시됨): %s", e)
+        writer_thread = self.writer_thread
+        try:
+            self._stop_writer_thread()
+        except Exception as e:
+            logger.warning("쓰기 스레드 중지 중 오류 (무시됨): %s", e)
 
         # 소켓 알림자 해제 (예외 발생해도 계속 진행)
         try:
@@ -251,9 +308,9 @@ class SerialManager(QObject):
                 self.socket_notifier.setEnabled(False)
                 self.socket_notifier.deleteLater()
                 self.socket_notifier = None
-                print("[SERIAL] 인터럽트 방식 해제")
+                logger.info("인터럽트 방식 해제")
         except Exception as e:
-            print(f"[SERIAL] 소켓 알림자 해제 중 오류 (무시됨): {e}")
+            logger.warning("소켓 알림자 해제 중 오류 (무시됨): %s", e)
             self.socket_notifier = None
 
         # 시리얼 연결 해제
@@ -261,14 +318,18 @@ class SerialManager(QObject):
             if self.shinho_serial_connection:
                 if self.shinho_serial_connection.is_open:
                     self.shinho_serial_connection.close()
-                    print("[SERIAL] 포트 연결 해제 완료")
+                    logger.info("포트 연결 해제 완료")
                 else:
-                    print("[SERIAL] 포트가 이미 닫혀있음")
+                    logger.info("포트가 이미 닫혀있음")
         except Exception as e:
-            print(f"[SERIAL] 포트 닫기 중 오류 (무시됨): {e}")
+            logger.warning("포트 닫기 중 오류 (무시됨): %s", e)
         finally:
             # 연결 객체 초기화 (항상 실행)
             self.shinho_serial_connection = None
+
+        # write()에서 블로킹되어 있던 쓰기 스레드는 포트가 닫히면서 빠져나옴
+        if writer_thread and writer_thread.isRunning():
+            writer_thread.wait(1000)
     
     def is_connection_healthy(self) -> bool:
         """연결 상태가 건강한지 확인 (포트 열림 상태만 체크)"""
@@ -280,35 +341,44 @@ class SerialManager(QObject):
             full_command = command + "\r\n"
             result = self.send_data(full_command)
             if result:
-                print("[TX] 시리얼 명령 전송: %s (with <CR><LF>)" % command)
+                tx_logger.info("시리얼 명령 전송: %s (with <CR><LF>)", command)
             else:
-                print("[TX ERROR] 시리얼 명령 전송 실패:", command)
+                tx_logger.error("시리얼 명령 전송 실패: %s", command)
             return result
         else:
-            print("[TX ERROR] 시리얼 연결 안됨, 명령 전송 실패:", command)
+            tx_logger.error("시리얼 연결 안됨, 명령 전송 실패: %s", command)
         return False
     
     def set_sensor_data_callback(self, callback):
-        """센서 데이터 수신 콜백 설정"""
+        """센서 데이터 수신 콜백 설정 ([DSCT] 경로)"""
+        if self.sensor_data_callback:
+            self.line_router.unsubscribe("[DSCT]", self.sensor_data_callback)
         self.sensor_data_callback = callback
+        if callback:
+            self.line_router.subscribe("[DSCT]", callback)
     
     def set_air_sensor_data_callback(self, callback):
-        """AIR 센서 데이터 수신 콜백 설정"""
+        """AIR 센서 데이터 수신 콜백 설정 ([AIR], [AIRCON] 경로)"""
+        for route in ("[AIR]", "[AIRCON]"):
+            if self.air_sensor_data_callback:
+                self.line_router.unsubscribe(route, self.air_sensor_data_callback)
+            if callback:
+                self.line_router.subscribe(route, callback)
         self.air_sensor_data_callback = callback
     
     def set_command_queue(self, queue_manager):
         """큐 매니저 설정"""
         self.command_queue = queue_manager
-        print("[SERIAL] 명령 큐 매니저 설정 완료")
+        logger.info("명령 큐 매니저 설정 완료")
 
-    def send_serial_command_with_priority(self, command, priority=None):
-        """우선순위를 가진 시리얼 명령 전송 (큐 경유)"""
+    def send_serial_command_with_priority(self, command, priority=None, origin=None):
+        """우선순위를 가진 시리얼 명령 전송 (큐 경유, origin: 출처 - 마감 여유/통계 구분)"""
         if self.command_queue:
             # 큐를 통해 전송
             from .command_queue_manager import CommandPriority
             if priority is None:
                 priority = CommandPriority.NORMAL
-            return self.command_queue.add_command(command, priority)
+            return self.command_queue.add_command(command, priority, origin=origin)
         else:
             # 기존 방식 (fallback)
             return self.send_serial_command(command)
@@ -319,42 +389,190 @@ class SerialManager(QObject):
             # 기존 스레드 정리
             self._stop_reader_thread()
             
-            # 새 읽기 스레드 생성
-            from .serial_reader_thread import SerialReaderThread
-            self.reader_thread = SerialReaderThread(self)
+            # 새 읽기 스레드 생성 (읽기 방식은 설정 파일의 serial.reader_mode)
+            from .serial_reader_thread import SerialReaderThread, READ_MODE_SELECT
+            from config.config_manager import get_config_manager
+            serial_settings = get_config_manager().get_section("serial")
+            self.reader_thread = SerialReaderThread(
+                self,
+                read_mode=serial_settings.get("reader_mode", READ_MODE_SELECT),
+                batch_window_ms=serial_settings.get("batch_window_ms", 10),
+                batch_max_lines=serial_settings.get("batch_max_lines", 64)
+            )
             
-            # 스레드의 data_received 시그널을 메인 시그널에 연결
-            self.reader_thread.data_received.connect(self._on_thread_data_received)
+            # 스레드의 lines_received 시그널을 메인 시그널에 연결
+            self.reader_thread.lines_received.connect(self._on_thread_lines_received)
+            self.reader_thread.port_lost.connect(self._on_port_lost)
             
             # 스레드 시작
             self.reader_thread.start_reading()
             
-            print("[SERIAL] 읽기 스레드 시작됨")
+            logger.info("읽기 스레드 시작됨")
             
         except Exception as e:
-            print(f"[SERIAL] 읽기 스레드 시작 실패: {e}")
+            logger.warning("읽기 스레드 시작 실패: %s", e)
     
+    def _start_writer_thread(self):
+        """쓰기 스레드 시작"""
+        try:
+            self._stop_writer_thread()
+
+            from .serial_writer_thread import SerialWriterThread
+            from config.config_manager import get_config_manager
+            serial_settings = get_config_manager().get_section("serial")
+            self.writer_thread = SerialWriterThread(self, max_queue=serial_settings.get("tx_queue_max", 256))
+            # 큐에 넣은 뒤의 쓰기 실패: 명령 큐 재시도 경로, 포트 오류면 끊김 처리(자동 재연결)
+            # (중지 시 폐기 알림은 _close_port() 도중 GUI 스레드에서 발생하므로 포트를 다 닫은 뒤 전달)
+            self.writer_thread.write_failed.connect(self.write_failed, Qt.QueuedConnection)
+            self.writer_thread.port_lost.connect(self._on_port_lost)
+            self.writer_thread.start_writing()
+
+        except Exception as e:
+            self.writer_thread = None
+            logger.warning("쓰기 스레드 시작 실패, 직접 쓰기 사용: %s", e)
+
+    def _stop_writer_thread(self):
+        """쓰기 스레드 중지"""
+        if self.writer_thread:
+            self.writer_thread.stop_writing()
+            self.writer_thread = None
+
+    def get_tx_stats(self) -> dict:
+        """송신 통계 반환 (쓰기 지연, bytes/s 등)"""
+        if self.writer_thread:
+            return self.writer_thread.get_stats()
+        return {}
+
     def _stop_reader_thread(self):
         """읽기 스레드 중지"""
         try:
             if self.reader_thread:
                 self.reader_thread.stop_reading()
                 self.reader_thread = None
-                print("[SERIAL] 읽기 스레드 중지됨")
+                logger.info("읽기 스레드 중지됨")
         except Exception as e:
-            print(f"[SERIAL] 읽기 스레드 중지 실패: {e}")
+            logger.warning("읽기 스레드 중지 실패: %s", e)
     
+    def _on_thread_lines_received(self, lines):
+        """
+        읽기 스레드에서 라인 묶음 수신 시 호출
+
+        Args:
+            lines: 디코딩 전 bytes 라인 목록 (LineFramer 출력) 또는 문자열 라인 목록
+        """
+        raw = bool(lines) and isinstance(lines[0], bytes)
+        try:
+            # 접두어 분배기로 등록된 핸들러만 호출 (레거시 센서 콜백 포함)
+            # bytes 라인은 등록된 경로가 있는 라인만 디코딩
+            if raw:
+                self.line_router.dispatch_raw_lines(lines)
+            else:
+                self.line_router.dispatch_lines(lines)
+        except Exception as e:
+            logger.error("묶음 데이터 처리 오류: %s", e)
+
+        # 문자열 소비자(lines_received, data_received 슬롯)가 있을 때만 전체 디코딩
+        has_batch_receivers = self.receivers(self.lines_received) > 0
+        has_line_receivers = self.receivers(self.data_received) > 0
+        if not (has_batch_receivers or has_line_receivers):
+            return
+        if raw:
+            lines = [line for line in map(decode_line, lines) if line]
+
+        try:
+            # 묶음 시그널 발생 (묶음 단위 소비자)
+            if has_batch_receivers:
+                self.lines_received.emit(lines)
+        except Exception as e:
+            logger.error("묶음 데이터 처리 오류: %s", e)
+
+        # 라인 단위 호환 처리 (기존 data_received 슬롯)
+        if has_line_receivers:
+            for data in lines:
+                self._on_thread_data_received(data)
+
+    # ==================== 핫플러그 / 자동 재연결 ====================
+    def is_reconnecting(self) -> bool:
+        """자동 재연결 대기 중인지 여부"""
+        return self._reconnect_target is not None
+
+    def _on_ports_changed(self, ports):
+        """포트 목록 변경 (포트 감시자, GUI 스레드)"""
+        devices = {port["device"] for port in ports}
+
+        # 연결 중인 USB 포트가 목록에서 사라지면 읽기 오류를 기다리지 않고 끊김 처리
+        port = self.current_port
+        if (self.is_connected() and port and port not in self.virtual_ports
+                and port not in devices and os.path.realpath(port) not in devices):
+            self._on_port_lost("장치 제거됨")
+            return
+
+        # 재연결 대상 장치가 다시 나타나면 백오프 대기 없이 바로 시도
+        if self._reconnect_target and self._reconnect_target[0] in devices:
+            self._reconnect_timer.start(self._reconnect_initial_ms())
+
+    def _on_port_lost(self, reason: str):
+        """예기치 않은 연결 끊김 처리 (읽기/쓰기 스레드 오류 또는 장치 제거)"""
+        port = self.current_port
+        if not port or self._reconnect_target is not None:
+            return
+
+        logger.warning("연결 끊김 감지: %s (%s)", port, reason)
+        baudrate = self.current_baudrate
+        self.connection_healthy = False
+        self._close_port()
+
+        settings = self._serial_settings()
+        if settings.get("auto_reconnect", True):
+            self._reconnect_target = (port, baudrate)
+            self._reconnect_delay_ms = self._reconnect_initial_ms()
+            self.reconnect_attempts = 0
+            self._reconnect_timer.start(self._reconnect_delay_ms)
+            logger.info("자동 재연결 대기: %s (%sms 후 시도)", port, self._reconnect_delay_ms)
+        else:
+            self.current_port = None
+        self.connection_lost.emit(port)
+
+    def _attempt_reconnect(self):
+        """재연결 시도, 실패 시 대기 시간을 두 배로 늘려 다시 예약"""
+        if self._reconnect_target is None:
+            return
+        port, baudrate = self._reconnect_target
+        self._reconnect_target = None
+        self.reconnect_attempts += 1
+
+        if os.path.exists(port) and self.connect_serial(port, baudrate):
+            self.total_reconnects += 1
+            logger.info("자동 재연결 성공: %s (%s회 시도)", port, self.reconnect_attempts)
+            self.connection_restored.emit(port)
+            return
+
+        self._reconnect_target = (port, baudrate)
+        self.current_port = port
+        max_delay = self._serial_settings().get("reconnect_max_ms", 10000)
+        self._reconnect_delay_ms = min(self._reconnect_delay_ms * 2, max_delay)
+        self._reconnect_timer.start(self._reconnect_delay_ms)
+        logger.info("재연결 실패 (%s회), %sms 후 재시도", self.reconnect_attempts, self._reconnect_delay_ms)
+
+    def _cancel_reconnect(self):
+        """자동 재연결 취소"""
+        if self._reconnect_target is not None:
+            logger.info("자동 재연결 취소: %s", self._reconnect_target[0])
+        self._reconnect_target = None
+        self._reconnect_timer.stop()
+
+    def _reconnect_initial_ms(self) -> int:
+        return self._serial_settings().get("reconnect_initial_ms", 500)
+
+    @staticmethod
+    def _serial_settings() -> dict:
+        from config.config_manager import get_config_manager
+        return get_config_manager().get_section("serial")
+
     def _on_thread_data_received(self, data):
-        """읽기 스레드에서 데이터 수신 시 호출"""
+        """라인 단위 데이터 처리 (기존 슬롯 호환)"""
         try:
             # 메인 data_received 시그널 발생
             self.data_received.emit(data)
-            
-            # 레거시 콜백 호출 (기존 코드와의 호환성)
-            if self.sensor_data_callback and '[DSCT]' in data:
-                self.sensor_data_callback(data)
-            elif self.air_sensor_data_callback and ('[AIR]' in data or '[AIRCON]' in data):
-                self.air_sensor_data_callback(data)
-                
         except Exception as e:
-            print(f"[SERIAL] 스레드 데이터 처리 오류: {e}")
\ No newline at end of file
+            logger.error("스레드 데이터 처리 오류: %s", e)
\ No newline at end of file
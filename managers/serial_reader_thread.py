@@ -1,65 +1,267 @@
 """
 시리얼 데이터 읽기 전용 스레드
 메인 스레드 블로킹 방지를 위한 별도 스레드에서 시리얼 데이터 읽기 처리
+
+읽기 방식:
+- select: 포트 fd에서 select()로 대기하다가 수신 버퍼 전체를 한 번에 읽기 (POSIX 전용, 기본값)
+- poll:   read_interval 간격으로 깨어나 대기 중인 바이트 전체를 읽기
+
+두 방식 모두 읽은 바이트를 LineFramer에 넣어 줄바꿈 경계에서만 라인을 잘라내므로
+읽기가 라인 중간에서 끝나도 반쪽 라인이 전달되지 않습니다.
+
+수신 라인은 디코딩 전 bytes 묶음(lines_received(list))으로 GUI 스레드에 전달합니다.
+첫 라인 수신 후 batch_window_ms가 지나거나 batch_max_lines개가 모이면 전송합니다.
 """
 
 from PyQt5.QtCore import QThread, pyqtSignal
+import os
+import select
 import time
+from .line_framer import LineFramer
+from utils.log_manager import get_logger
+
+logger = get_logger("SERIAL", "READER_THREAD")
+rx_logger = get_logger("RX")
+
+# 읽기 방식
+READ_MODE_SELECT = "select"
+READ_MODE_POLL = "poll"
 
 class SerialReaderThread(QThread):
     """시리얼 데이터 읽기 전용 스레드"""
-    
-    # 데이터 수신 시그널
-    data_received = pyqtSignal(str)
-    
-    def __init__(self, serial_manager):
+
+    # 라인 묶음 수신 시그널 (디코딩 전 bytes 목록, 스레드 경계를 넘는 큐 이벤트를 묶음당 1회로 줄임)
+    lines_received = pyqtSignal(list)
+    # 포트 읽기 불가 시그널 (장치 분리 등, 사유) - 스레드당 1회만 발생
+    port_lost = pyqtSignal(str)
+
+    # select 방식 설정
+    READ_CHUNK_SIZE = 4096      # 한 번에 읽을 최대 바이트 (재사용 버퍼 크기)
+    SELECT_TIMEOUT = 0.1        # select 대기 시간 (종료 플래그 확인 주기)
+    MAX_PENDING_BYTES = 65536   # 줄바꿈 없이 쌓이는 데이터 상한 (쓰레기 데이터 방지)
+
+    def __init__(self, serial_manager, read_mode: str = READ_MODE_SELECT,
+                 batch_window_ms: int = 10, batch_max_lines: int = 64):
         super().__init__()
         self.serial_manager = serial_manager
         self.is_running = False
-        self.read_interval = 0.01  # 10ms 간격
-        
+        self.read_interval = 0.01  # 10ms 간격 (poll 방식)
+        self.read_mode = read_mode
+
+        # 라인 묶음 전송 설정
+        self.batch_window = max(0, batch_window_ms) / 1000.0
+        self.batch_max_lines = max(1, batch_max_lines)
+        self._batch = []
+        self._batch_started = 0.0
+
+        # select 방식용 재사용 버퍼
+        self._read_buffer = bytearray(self.READ_CHUNK_SIZE)
+
+        # 부분 라인 재조립
+        self.framer = LineFramer(max_pending=self.MAX_PENDING_BYTES)
+
+        self._port_lost_reported = False
+
+        # RX 로그 형식 (여러 장비 연결 시 장비 ID 표시)
+        unit_id = getattr(serial_manager, 'unit_id', None)
+        self._rx_format = f"[{unit_id}] %s" if unit_id else "%s"
+
+        # 통계
+        self.total_lines = 0
+        self.total_bytes = 0
+        self.total_batches = 0
+
     def start_reading(self):
         """읽기 스레드 시작"""
         if not self.is_running:
             self.is_running = True
             self.start()
-            print("[READER_THREAD] 시리얼 읽기 스레드 시작")
-            
+            logger.info("시리얼 읽기 스레드 시작 (방식: %s)", self.read_mode)
+
     def stop_reading(self):
         """읽기 스레드 중지"""
         self.is_running = False
         if self.isRunning():
             self.quit()
             self.wait()
-            print("[READER_THREAD] 시리얼 읽기 스레드 중지")
-            
+            logger.info("시리얼 읽기 스레드 중지")
+
     def run(self):
         """스레드 실행 메인 루프"""
-        print("[READER_THREAD] 읽기 스레드 시작됨")
-        
+        logger.info("읽기 스레드 시작됨")
+
+        if self.read_mode == READ_MODE_SELECT and self._get_port_fd() is not None:
+            self._run_select_loop()
+        else:
+            if self.read_mode == READ_MODE_SELECT:
+                logger.info("select 방식 사용 불가, 폴링 방식으로 전환")
+                self.read_mode = READ_MODE_POLL
+            self._run_poll_loop()
+
+        # 남은 묶음 전송
+        self._flush_batch()
+        logger.info("읽기 스레드 종료됨")
+
+    def _run_poll_loop(self):
+        """폴링 방식 루프 (read_interval 마다 대기 중인 바이트 전체 읽기)"""
         while self.is_running:
             try:
                 # 시리얼 연결 확인
                 if not self.serial_manager or not self.serial_manager.is_connected():
                     self.msleep(100)  # 100ms 대기
                     continue
-                
-                # 데이터 읽기 시도
-                data = self.serial_manager.read_data()
-                if data:
-                    print(f"[READER_THREAD] 수신된 데이터: '{data}'")
-                    self.data_received.emit(data)
-                    
+
+                # 대기 중인 바이트만 읽기 (readline() 타임아웃으로 반쪽 라인이 나오지 않음)
+                connection = self.serial_manager.shinho_serial_connection
+                waiting = connection.in_waiting
+                if waiting:
+                    data = connection.read(waiting)
+                    self.total_bytes += len(data)
+                    self._feed(data)
+                self._flush_batch_if_due()
+
                 # 짧은 대기 (CPU 사용량 조절)
                 self.msleep(int(self.read_interval * 1000))
-                
+
+            except OSError as e:
+                # SerialException 포함 (장치 분리 시 in_waiting/read에서 발생)
+                if not self.is_running:
+                    break
+                logger.error("%s", e)
+                self._report_port_lost(str(e))
+                break
             except Exception as e:
-                print(f"[READER_THREAD ERROR] {e}")
+                logger.error("%s", e)
                 self.msleep(100)  # 에러 시 100ms 대기
-                
-        print("[READER_THREAD] 읽기 스레드 종료됨")
-        
+
+    def _run_select_loop(self):
+        """select 방식 루프 (수신 가능할 때만 깨어나 버퍼 전체를 읽기)"""
+        read_buffer = self._read_buffer
+        view = memoryview(read_buffer)
+
+        while self.is_running:
+            try:
+                fd = self._get_port_fd()
+                if fd is None:
+                    self.msleep(100)  # 연결 대기
+                    continue
+
+                readable, _, _ = select.select([fd], [], [], self._select_timeout())
+                if not readable or not self.is_running:
+                    self._flush_batch_if_due()
+                    continue
+
+                # 수신 버퍼가 비워질 때까지 재사용 버퍼로 읽기
+                end_of_file = False
+                while True:
+                    try:
+                        n = os.readv(fd, [view])
+                    except BlockingIOError:
+                        break
+                    if n <= 0:
+                        end_of_file = True
+                        break
+                    self.total_bytes += n
+                    self._feed(view[:n])
+                    if n < len(read_buffer):
+                        break
+
+                self._flush_batch_if_due()
+
+                if end_of_file:
+                    # 읽기 가능인데 0바이트 = 장치 분리/상대편 종료
+                    self._report_port_lost("end of file")
+                    break
+
+            except (OSError, ValueError) as e:
+                # 포트가 닫히는 중(EBADF 등)이면 조용히 재확인
+                if not self.is_running:
+                    break
+                logger.error("%s", e)
+                if isinstance(e, OSError):
+                    self._report_port_lost(str(e))
+                    break
+                self.msleep(100)
+            except Exception as e:
+                logger.error("%s", e)
+                self.msleep(100)
+
+    def _feed(self, data):
+        """읽은 바이트를 프레이머에 넣고 완성된 라인을 묶음에 추가"""
+        discarded = self.framer.discarded_bytes
+        lines = self.framer.feed(data)
+        if self.framer.discarded_bytes != discarded:
+            logger.info("줄바꿈 없는 데이터 %s바이트 폐기", self.framer.discarded_bytes - discarded)
+        if not lines:
+            return
+        rx_format = self._rx_format
+        for raw in lines:
+            # 포맷팅(디코딩)은 로그 싱크 스레드에서 수행
+            rx_logger.info(rx_format, raw)
+        if not self._batch:
+            self._batch_started = time.monotonic()
+        self._batch.extend(lines)
+        self.total_lines += len(lines)
+
+    def _report_port_lost(self, reason: str):
+        """포트 읽기 불가를 GUI 스레드에 알림 (읽기 루프는 종료, 재연결 판단은 SerialManager)"""
+        if not self._port_lost_reported:
+            self._port_lost_reported = True
+            self.port_lost.emit(reason)
+
+    def _select_timeout(self) -> float:
+        """select 대기 시간 (묶음이 쌓여 있으면 전송 시각까지만 대기)"""
+        if not self._batch:
+            return self.SELECT_TIMEOUT
+        remaining = self._batch_started + self.batch_window - time.monotonic()
+        return max(0.0, min(self.SELECT_TIMEOUT, remaining))
+
+    def _flush_batch_if_due(self):
+        """묶음 시간이 지났거나 최대 라인 수에 도달하면 전송"""
+        if not self._batch:
+            return
+        if (len(self._batch) >= self.batch_max_lines or
+                time.monotonic() - self._batch_started >= self.batch_window):
+            self._flush_batch()
+
+    def _flush_batch(self):
+        """현재 묶음을 lines_received 시그널로 전송"""
+        if not self._batch:
+            return
+        batch = self._batch
+        self._batch = []
+        self.total_batches += 1
+        self.lines_received.emit(batch)
+
+    def _get_port_fd(self):
+        """연결된 포트의 파일 디스크립터 반환 (사용 불가 시 None)"""
+        if not hasattr(select, 'select') or not hasattr(os, 'readv'):
+            return None
+        if not self.serial_manager or not self.serial_manager.is_connected():
+            return None
+        try:
+            return self.serial_manager.shinho_serial_connection.fileno()
+        except Exception:
+            return None
+
     def set_read_interval(self, interval_ms: int):
         """읽기 간격 설정 (밀리초)"""
         self.read_interval = max(1, min(1000, interval_ms)) / 1000.0
-        print(f"[READER_THREAD] 읽기 간격 설정: {self.read_interval * 1000:.0f}ms")
\ No newline at end of file
+        logger.info("읽기 간격 설정: %.0fms", self.read_interval * 1000)
+
+    def set_batching(self, window_ms: int, max_lines: int):
+        """라인 묶음 전송 설정 (window_ms=0이면 읽을 때마다 즉시 전송)"""
+        self.batch_window = max(0, min(1000, window_ms)) / 1000.0
+        self.batch_max_lines = max(1, max_lines)
+        logger.info("묶음 전송 설정: %.0fms / %s줄", self.batch_window * 1000, self.batch_max_lines)
+
+    def get_stats(self) -> dict:
+        """수신 통계 반환"""
+        return {
+            'read_mode': self.read_mode,
+            'lines_received': self.total_lines,
+            'bytes_received': self.total_bytes,
+            'batches_sent': self.total_batches,
+            'pending_bytes': self.framer.pending_bytes(),
+            'discarded_bytes': self.framer.discarded_bytes,
+        }
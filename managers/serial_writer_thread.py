@@ -0,0 +1,179 @@
+"""
+시리얼 데이터 쓰기 전용 스레드
+포트 출력은 이 스레드만 수행하여, 혼잡한 USB 어댑터에서 write()가 블로킹되어도 GUI 스레드가 멈추지 않도록 합니다.
+
+- 송신 데이터는 호출 스레드에서 한 번만 bytes로 인코딩하여 스레드 안전 큐(queue.Queue)에 넣습니다
+- 스레드는 큐에서 꺼낸 순서대로 write() 수행
+- 큐 추가 → write() 완료까지의 지연과 바이트 처리량을 통계로 제공합니다
+- write() 실패는 write_failed(명령, 오류)로, 포트 쓰기 오류(장치 분리 등)는 port_lost로 알림
+  (포트가 이미 닫혀 있던 경우는 write_failed만 - 끊김 처리는 읽기 스레드/연결 해제가 담당)
+- 중지 시 큐에 남아 있던 송신 데이터도 write_failed(명령, WRITER_STOPPED)로 알림 (명령 큐가 재전송)
+"""
+
+from PyQt5.QtCore import QThread, pyqtSignal
+import queue
+import time
+from collections import deque
+from utils.log_manager import get_logger
+
+logger = get_logger("SERIAL", "WRITER_THREAD")
+tx_logger = get_logger("TX")
+
+# 스레드 종료 요청 표시
+_STOP = object()
+
+# 중지로 폐기한 송신 데이터의 write_failed 오류 메시지
+WRITER_STOPPED = "writer stopped"
+
+
+class SerialWriterThread(QThread):
+    """시리얼 데이터 쓰기 전용 스레드"""
+
+    # 쓰기 실패 시그널 (명령 문자열, 오류 메시지)
+    write_failed = pyqtSignal(str, str)
+    # 포트 쓰기 불가 시그널 (장치 분리 등, 사유) - 스레드당 1회만 발생
+    port_lost = pyqtSignal(str)
+
+    QUEUE_TIMEOUT = 0.1         # 큐 대기 시간 (종료 플래그 확인 주기)
+    SLOW_WRITE_SEC = 0.1        # 이 시간 이상 걸린 write()는 경고
+    RATE_WINDOW_SEC = 1.0       # 최근 bytes/s 계산 구간
+
+    def __init__(self, serial_manager, max_queue: int = 256):
+        super().__init__()
+        self.serial_manager = serial_manager
+        self.is_running = False
+        self._queue = queue.Queue(maxsize=max(0, max_queue))
+
+        # 통계
+        self.total_writes = 0
+        self.total_bytes = 0
+        self.total_failed = 0
+        self.total_rejected = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._latency_sum = 0.0
+        self._recent = deque()  # (완료 시각, 바이트 수) - 최근 bytes/s 계산용
+        self._port_lost_reported = False
+
+    def start_writing(self):
+        """쓰기 스레드 시작"""
+        if not self.is_running:
+            self.is_running = True
+            self.start()
+            logger.info("시리얼 쓰기 스레드 시작")
+
+    def stop_writing(self, timeout_ms: int = 1000):
+        """
+        쓰기 스레드 중지 (남은 송신 데이터는 폐기하고 건마다 write_failed 발생)
+
+        호출 스레드(GUI)에서 발생하므로 받는 쪽은 QueuedConnection으로 연결해야 포트를 닫는 도중에
+        재전송을 시도하지 않음 (SerialManager._start_writer_thread)
+        """
+        self.is_running = False
+        dropped = self._discard_pending()
+        try:
+            self._queue.put_nowait(_STOP)
+        except queue.Full:
+            pass
+        if self.isRunning():
+            self.wait(timeout_ms)
+        # 스레드가 멈춘 뒤 남은 데이터 (대기 중 스레드가 꺼내지 않은 것)
+        dropped.extend(self._discard_pending())
+        if dropped:
+            logger.info("미전송 데이터 %s건 폐기", len(dropped))
+            for payload in dropped:
+                self.write_failed.emit(payload.decode('ascii', errors='replace').rstrip(), WRITER_STOPPED)
+        logger.info("시리얼 쓰기 스레드 중지")
+
+    def enqueue(self, data) -> bool:
+        """
+        송신 데이터 추가 (모든 스레드에서 호출 가능)
+
+        Args:
+            data: str(ASCII로 인코딩) 또는 bytes
+
+        Returns:
+            큐에 추가되었는지 여부 (큐가 가득 차거나 스레드가 중지 상태면 False)
+        """
+        if not self.is_running:
+            return False
+        payload = data.encode('ascii') if isinstance(data, str) else bytes(data)
+        try:
+            self._queue.put_nowait((payload, time.monotonic()))
+            return True
+        except queue.Full:
+            self.total_rejected += 1
+            tx_logger.warning("송신 큐 가득 참 (%s건), 전송 거부: %s", self._queue.qsize(), payload.rstrip())
+            return False
+
+    def run(self):
+        """스레드 실행 메인 루프"""
+        while self.is_running:
+            try:
+                item = self._queue.get(timeout=self.QUEUE_TIMEOUT)
+            except queue.Empty:
+                continue
+            if item is _STOP:
+                break
+            self._write(*item)
+
+    def _write(self, payload: bytes, enqueued_at: float):
+        """실제 포트 쓰기 (이 스레드에서만 호출)"""
+        connection = self.serial_manager.shinho_serial_connection
+        try:
+            if not connection or not connection.is_open:
+                raise Exception("Serial port is not connected")
+            connection.write(payload)
+        except Exception as e:
+            self.total_failed += 1
+            command = payload.decode('ascii', errors='replace').rstrip()
+            tx_logger.error("전송 실패: %s (%s)", command, e)
+            self.write_failed.emit(command, str(e))
+            # 열린 포트에 쓰다 실패 = 장치 분리/포트 오류 (write_timeout이 없으므로 시간 초과는 아님)
+            if connection and connection.is_open and not self._port_lost_reported:
+                self._port_lost_reported = True
+                self.port_lost.emit(str(e))
+            return
+
+        now = time.monotonic()
+        latency = now - enqueued_at
+        self.total_writes += 1
+        self.total_bytes += len(payload)
+        self.last_latency = latency
+        self._latency_sum += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+        if latency >= self.SLOW_WRITE_SEC:
+            tx_logger.warning("전송 지연 %.0fms: %s", latency * 1000, payload.rstrip())
+
+        recent = self._recent
+        recent.append((now, len(payload)))
+        while recent and now - recent[0][0] > self.RATE_WINDOW_SEC:
+            recent.popleft()
+
+    def _discard_pending(self) -> list:
+        """큐에 남은 송신 데이터 폐기, 폐기한 데이터(bytes) 목록 반환"""
+        dropped = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return dropped
+            if item is not _STOP:
+                dropped.append(item[0])
+
+    def get_stats(self) -> dict:
+        """송신 통계 반환"""
+        now = time.monotonic()
+        recent_bytes = sum(size for t, size in list(self._recent) if now - t <= self.RATE_WINDOW_SEC)
+        return {
+            'writes': self.total_writes,
+            'bytes_written': self.total_bytes,
+            'failed': self.total_failed,
+            'rejected': self.total_rejected,
+            'queued': self._queue.qsize(),
+            'last_latency_ms': round(self.last_latency * 1000, 2),
+            'avg_latency_ms': round(self._latency_sum / self.total_writes * 1000, 2) if self.total_writes else 0.0,
+            'max_latency_ms': round(self.max_latency * 1000, 2),
+            'bytes_per_s': round(recent_bytes / self.RATE_WINDOW_SEC, 1),
+        }
@@ -4,6 +4,9 @@ from ui.constants import (CMD_PREFIX, TERMINATOR, AIR_SYSTEM, DSCT_SYSTEM, FSPD_
                          DMP3_OPEN_CMD, DMP3_CLOSE_CMD, DMP4_OPEN_CMD, DMP4_CLOSE_CMD,
                          PUMP1_CMD, PUMP2_CMD, BUTTON_ON_STYLE, BUTTON_OFF_STYLE,
                          ALTDMP_OPEN_1_CMD, ALTDMP_CLOSE_1_CMD, ARTDMP_OPEN_1_CMD, ARTDMP_CLOSE_1_CMD)
+from utils.log_manager import get_logger
+
+logger = get_logger("SPEED")
 
 class SpeedButtonManager:
     def __init__(self, serial_manager, SendData_textEdit):
@@ -103,7 +106,7 @@ class SpeedButtonManager:
         """감소 버튼 핸들러 (< 버튼)"""
         # 의존성 확인
         if speed_var_name == "current_fan_speed" and not self._can_operate_fan_speed_buttons():
-            print("FAN이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Fan SPD 버튼 동작 차단")
+            logger.warning("FAN이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Fan SPD 버튼 동작 차단")
             if self.SendData_textEdit:
                 self.SendData_textEdit.append("FAN이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Fan SPD 버튼 동작 차단")
                 self.SendData_textEdit.verticalScrollBar().setValue(
@@ -112,7 +115,7 @@ class SpeedButtonManager:
             return
             
         if speed_var_name == "current_con_fan_speed" and not self._can_operate_con_fan_speed_buttons():
-            print("Con Fan이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Con Fan SPD 버튼 동작 차단")
+            logger.warning("Con Fan이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Con Fan SPD 버튼 동작 차단")
             if self.SendData_textEdit:
                 self.SendData_textEdit.append("Con Fan이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Con Fan SPD 버튼 동작 차단")
                 self.SendData_textEdit.verticalScrollBar().setValue(
@@ -144,7 +147,7 @@ class SpeedButtonManager:
         """증가 버튼 핸들러 (> 버튼)"""
         # 의존성 확인
         if speed_var_name == "current_fan_speed" and not self._can_operate_fan_speed_buttons():
-            print("FAN이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Fan SPD 버튼 동작 차단")
+            logger.warning("FAN이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Fan SPD 버튼 동작 차단")
             if self.SendData_textEdit:
                 self.SendData_textEdit.append("FAN이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Fan SPD 버튼 동작 차단")
                 self.SendData_textEdit.verticalScrollBar().setValue(
@@ -153,7 +156,7 @@ class SpeedButtonManager:
             return
             
         if speed_var_name == "current_con_fan_speed" and not self._can_operate_con_fan_speed_buttons():
-            print("Con Fan이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Con Fan SPD 버튼 동작 차단")
+            logger.warning("Con Fan이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Con Fan SPD 버튼 동작 차단")
             if self.SendData_textEdit:
                 self.SendData_textEdit.append("Con Fan이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Con Fan SPD 버튼 동작 차단")
                 self.SendData_textEdit.verticalScrollBar().setValue(
@@ -184,7 +187,7 @@ class SpeedButtonManager:
         """중앙 버튼 핸들러 (값 버튼) - FAN이 ON인 상태에서는 1로 리셋"""
         # 의존성 확인
         if speed_var_name == "current_fan_speed" and not self._can_operate_fan_speed_buttons():
-            print("FAN이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Fan SPD 버튼 동작 차단")
+            logger.warning("FAN이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Fan SPD 버튼 동작 차단")
             if self.SendData_textEdit:
                 self.SendData_textEdit.append("FAN이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Fan SPD 버튼 동작 차단")
                 self.SendData_textEdit.verticalScrollBar().setValue(
@@ -193,7 +196,7 @@ class SpeedButtonManager:
             return
             
         if speed_var_name == "current_con_fan_speed" and not self._can_operate_con_fan_speed_buttons():
-            print("Con Fan이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Con Fan SPD 버튼 동작 차단")
+            logger.warning("Con Fan이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Con Fan SPD 버튼 동작 차단")
             if self.SendData_textEdit:
                 self.SendData_textEdit.append("Con Fan이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - Con Fan SPD 버튼 동작 차단")
                 self.SendData_textEdit.verticalScrollBar().setValue(
@@ -215,11 +218,24 @@ class SpeedButtonManager:
         if speed_var_name == "current_fan_speed":
             self.sync_to_auto_tab(1)
     
+    def _write_command(self, command):
+        """
+        명령 큐가 있으면 큐 경유 (연타로 쌓인 같은 장치 명령은 마지막 값만 전송), 없으면 바로 쓰기
+
+        ON/OFF 버튼(ButtonManager)과 같은 HIGH 우선순위로 넣음 - 병합/같은 장치 순서 유지는 한 우선순위
+        대기열 안에서만 동작하므로, NORMAL로 넣으면 뒤에 누른 OFF가 앞의 속도 명령을 앞질러 나감
+        """
+        command_queue = getattr(self.serial_manager, 'command_queue', None)
+        if command_queue is not None:
+            from .command_queue_manager import CommandPriority
+            return command_queue.add_command(command.rstrip(), CommandPriority.HIGH, origin="speed")
+        return self.serial_manager.send_data(command)
+
     def send_command(self, command):
         """명령어 전송"""
         if self.serial_manager.is_connected():
-            self.serial_manager.shinho_serial_connection.write(command.encode())
-            print(f"스피드 명령 전송: {command}")
+            self._write_command(command)
+            logger.info("스피드 명령 전송: %s", command)
             
             if self.SendData_textEdit:
                 self.SendData_textEdit.append(f"{command.rstrip()}")
@@ -227,7 +243,7 @@ class SpeedButtonManager:
                     self.SendData_textEdit.verticalScrollBar().maximum()
                 )
         else:
-            print("시리얼 포트 연결되지 않음.")
+            logger.info("시리얼 포트 연결되지 않음.")
             if self.SendData_textEdit:
                 self.SendData_textEdit.append("시리얼 포트 연결되지 않음.")
                 self.SendData_textEdit.verticalScrollBar().setValue(
@@ -321,7 +337,7 @@ class SpeedButtonManager:
     def _log_dsct_blocked_message(self, fan_num):
         """DSCT FAN 버튼 차단 메시지 로깅"""
         message = f"FAN{fan_num}이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - FAN{fan_num} SPD 버튼 동작 차단"
-        print(message)
+        logger.info("%s", message)
         if self.SendData_textEdit:
             self.SendData_textEdit.append(message)
             self.SendData_textEdit.verticalScrollBar().setValue(
@@ -341,7 +357,7 @@ class SpeedButtonManager:
             button = getattr(self.main_window, button_name)
             button.setText("0")
             
-        print(f"DSCT FAN{fan_num} 스피드 버튼 초기화됨")
+        logger.info("DSCT FAN%s 스피드 버튼 초기화됨", fan_num)
     
     def set_dsct_fan_speed_to_one(self, fan_num):
         """DSCT FAN이 ON될 때 스피드 버튼을 1로 설정"""
@@ -370,7 +386,7 @@ class SpeedButtonManager:
             command = f"{command_prefix}1{TERMINATOR}"
             self.send_command(command)
             
-        print(f"DSCT FAN{fan_num} 스피드 버튼을 1로 설정됨")
+        logger.info("DSCT FAN%s 스피드 버튼을 1로 설정됨", fan_num)
 
     def create_damper_position_buttons(self, parent, dmp_num, left_button, center_button, right_button):
         """DAMPER 위치 버튼 설정"""
@@ -456,7 +472,7 @@ class SpeedButtonManager:
     def _log_damper_blocked_message(self, dmp_num):
         """DAMPER 버튼 차단 메시지 로깅"""
         message = f"시리얼 포트가 연결되지 않음 - DMP{dmp_num} 위치값 버튼 동작 차단"
-        print(message)
+        logger.info("%s", message)
         if self.SendData_textEdit:
             self.SendData_textEdit.append(message)
             self.SendData_textEdit.verticalScrollBar().setValue(
@@ -470,7 +486,7 @@ class SpeedButtonManager:
             return
             
         if self.auto_speed_manager and hasattr(self.auto_speed_manager, 'update_from_manual'):
-            print(f"Manual -> Auto 동기화: {fan_speed}")
+            logger.info("Manual -> Auto 동기화: %s", fan_speed)
             self.is_updating = True
             self.auto_speed_manager.update_from_manual(fan_speed)
             self.is_updating = False
@@ -494,7 +510,7 @@ class SpeedButtonManager:
     
     def set_fan_speed_to_one(self):
         """FAN이 ON될 때 스피드 버튼을 1로 설정"""
-        print("FAN이 ON되어 Fan SPD 버튼을 1로 설정합니다.")
+        logger.info("FAN이 ON되어 Fan SPD 버튼을 1로 설정합니다.")
         
         # 속도 값을 1로 설정
         self.current_fan_speed = 1
@@ -506,8 +522,8 @@ class SpeedButtonManager:
         # 1 명령어 전송
         command = f"{CMD_PREFIX},{AIR_SYSTEM},{FSPD_CMD},1{TERMINATOR}"
         if self.serial_manager.is_connected():
-            self.serial_manager.shinho_serial_connection.write(command.encode())
-            print(f"Fan SPD 1 명령 전송: {command}")
+            self._write_command(command)
+            logger.info("Fan SPD 1 명령 전송: %s", command)
             
             if self.SendData_textEdit:
                 self.SendData_textEdit.append(f"{command}")
@@ -520,7 +536,7 @@ class SpeedButtonManager:
 
     def reset_fan_speed_buttons(self):
         """FAN이 OFF될 때 Fan SPD 버튼들 초기화"""
-        print("FAN이 OFF되어 Fan SPD 버튼들을 초기화합니다.")
+        logger.info("FAN이 OFF되어 Fan SPD 버튼들을 초기화합니다.")
         
         # 속도 값 초기화
         self.current_fan_speed = 0
@@ -532,8 +548,8 @@ class SpeedButtonManager:
         # 0 명령어 전송
         command = f"{CMD_PREFIX},{AIR_SYSTEM},{FSPD_CMD},0{TERMINATOR}"
         if self.serial_manager.is_connected():
-            self.serial_manager.shinho_serial_connection.write(command.encode())
-            print(f"Fan SPD 초기화 명령 전송: {command}")
+            self._write_command(command)
+            logger.info("Fan SPD 초기화 명령 전송: %s", command)
             
             if self.SendData_textEdit:
                 self.SendData_textEdit.append(f"{command}")
@@ -627,7 +643,7 @@ class SpeedButtonManager:
     def _log_pumper_blocked_message(self, pump_num):
         """PUMP 버튼 차단 메시지 로깅"""
         message = f"PUMP{pump_num}이 OFF 상태이거나 시리얼 포트가 연결되지 않음 - PUMP{pump_num} SPD 버튼 동작 차단"
-        print(message)
+        logger.info("%s", message)
         if self.SendData_textEdit:
             self.SendData_textEdit.append(message)
             self.SendData_textEdit.verticalScrollBar().setValue(
@@ -647,11 +663,11 @@ class SpeedButtonManager:
             button = getattr(self.main_window, button_name)
             button.setText("0")
             
-        print(f"PUMP{pump_num} 스피드 버튼 초기화됨")
+        logger.info("PUMP%s 스피드 버튼 초기화됨", pump_num)
     
     def set_con_fan_speed_to_one(self):
         """Con Fan이 ON될 때 스피드 버튼을 1로 설정"""
-        print("Con Fan이 ON되어 Con Fan SPD 버튼을 1로 설정합니다.")
+        logger.info("Con Fan이 ON되어 Con Fan SPD 버튼을 1로 설정합니다.")
         
         # 속도 값을 1로 설정
         self.current_con_fan_speed = 1
@@ -664,8 +680,8 @@ class SpeedButtonManager:
         # 1 명령어 전송
         command = f"{CMD_PREFIX},{AIR_SYSTEM},{CON_SPD_CMD},1{TERMINATOR}"
         if self.serial_manager.is_connected():
-            self.serial_manager.shinho_serial_connection.write(command.encode())
-            print(f"Con Fan SPD 1 명령 전송: {command}")
+            self._write_command(command)
+            logger.info("Con Fan SPD 1 명령 전송: %s", command)
             
             if self.SendData_textEdit:
                 self.SendData_textEdit.append(f"{command}")
@@ -675,7 +691,7 @@ class SpeedButtonManager:
 
     def reset_con_fan_speed_buttons(self):
         """Con Fan이 OFF될 때 Con Fan SPD 버튼들 초기화"""
-        print("Con Fan이 OFF되어 Con Fan SPD 버튼들을 초기화합니다.")
+        logger.info("Con Fan이 OFF되어 Con Fan SPD 버튼들을 초기화합니다.")
         
         # 속도 값 초기화
         self.current_con_fan_speed = 0
@@ -688,8 +704,8 @@ class SpeedButtonManager:
         # OFF 명령어 전송
         command = f"{CMD_PREFIX},{AIR_SYSTEM},{CON_SPD_CMD},{OFF_STATE}{TERMINATOR}"
         if self.serial_manager.is_connected():
-            self.serial_manager.shinho_serial_connection.write(command.encode())
-            print(f"Con Fan SPD 초기화 명령 전송: {command}")
+            self._write_command(command)
+            logger.info("Con Fan SPD 초기화 명령 전송: %s", command)
             
             if self.SendData_textEdit:
                 self.SendData_textEdit.append(f"{command}")
@@ -705,7 +721,7 @@ class SpeedButtonManager:
         def cyclic_click():
             # 시리얼 연결 상태 확인
             if not self.serial_manager or not self.serial_manager.is_connected():
-                print(f"시리얼 포트가 연결되지 않음 - FAN{fan_num} 동작 차단")
+                logger.warning("시리얼 포트가 연결되지 않음 - FAN%s 동작 차단", fan_num)
                 if self.SendData_textEdit:
                     self.SendData_textEdit.append(f"시리얼 포트가 연결되지 않음 - FAN{fan_num} 동작 차단")
                     self.SendData_textEdit.verticalScrollBar().setValue(
@@ -732,7 +748,7 @@ class SpeedButtonManager:
                 setattr(self, speed_var_name, new_speed)
                 speed_button.setText(str(new_speed))
                 
-                print(f"FAN{fan_num} OFF->ON 변경, 스피드 {new_speed}로 설정")
+                logger.info("FAN%s OFF->ON 변경, 스피드 %s로 설정", fan_num, new_speed)
             else:
                 # FAN이 ON일 때: 0~8 순환
                 new_speed = (current_speed + 1) % 9
@@ -742,7 +758,7 @@ class SpeedButtonManager:
                 if new_speed == 0:
                     # 숫자가 0이 되면 FAN을 OFF로 변경
                     fan_button.click()  # button_manager의 토글 로직으로 OFF 처리
-                    print(f"FAN{fan_num} 스피드 0 - 자동으로 OFF로 변경")
+                    logger.info("FAN%s 스피드 0 - 자동으로 OFF로 변경", fan_num)
                 else:
                     # SPD 명령 전송 (0이 아닐 때만)
                     fan_commands = {1: FAN1_CMD, 2: FAN2_CMD, 3: FAN3_CMD, 4: FAN4_CMD}
@@ -826,7 +842,7 @@ class SpeedButtonManager:
             button = getattr(self.main_window, button_name)
             button.setText("0")
             
-        print(f"DSCT FAN{fan_num} 새로운 스피드 버튼 초기화됨")
+        logger.info("DSCT FAN%s 새로운 스피드 버튼 초기화됨", fan_num)
     
     def set_new_dsct_fan_speed_to_one(self, fan_num):
         """새로운 DSCT FAN이 ON될 때 스피드 버튼을 1로 설정"""
@@ -849,7 +865,7 @@ class SpeedButtonManager:
             command = f"{command_prefix}1{TERMINATOR}"
             self.send_command(command)
             
-        print(f"DSCT FAN{fan_num} 새로운 스피드 버튼을 1로 설정됨")
+        logger.info("DSCT FAN%s 새로운 스피드 버튼을 1로 설정됨", fan_num)
     
     def set_pump_speed_to_one(self, pump_num):
         """PUMP이 ON될 때 스피드 버튼을 1로 설정"""
@@ -872,7 +888,7 @@ class SpeedButtonManager:
             command = f"{command_prefix}1{TERMINATOR}"
             self.send_command(command)
             
-        print(f"PUMP{pump_num} 스피드 버튼을 1로 설정됨")
+        logger.info("PUMP%s 스피드 버튼을 1로 설정됨", pump_num)
     
     def create_cyclic_pump_button(self, pump_num, speed_button):
         """PUMP 순환 스피드 버튼 설정 (0~8 순환) - DESICCANT FAN과 동일한 동작"""
@@ -880,7 +896,7 @@ class SpeedButtonManager:
         
         def cyclic_click():
             if not self.serial_manager or not self.serial_manager.is_connected():
-                print(f"PUMP{pump_num} 시리얼 포트 연결되지 않음 - 버튼 동작 차단")
+                logger.warning("PUMP%s 시리얼 포트 연결되지 않음 - 버튼 동작 차단", pump_num)
                 if self.SendData_textEdit:
                     self.SendData_textEdit.append(f"PUMP{pump_num} 시리얼 포트 연결되지 않음 - 버튼 동작 차단")
                 return
@@ -909,7 +925,7 @@ class SpeedButtonManager:
                 if new_speed == 0:
                     # 숫자가 0이 되면 PUMP를 OFF로 변경
                     pump_button.click()  # button_manager의 토글 로직으로 OFF 처리
-                    print(f"PUMP{pump_num} 스피드 0 - 자동으로 OFF로 변경")
+                    logger.info("PUMP%s 스피드 0 - 자동으로 OFF로 변경", pump_num)
                 else:
                     # SPD 명령 전송 (0이 아닐 때만)
                     pump_commands = {1: PUMP1_CMD, 2: PUMP2_CMD}
@@ -922,7 +938,7 @@ class SpeedButtonManager:
             # 버튼 텍스트 및 내부 변수 업데이트
             setattr(self, speed_var_name, new_speed)
             speed_button.setText(str(new_speed))
-            print(f"PUMP{pump_num} 스피드 변경: {new_speed}")
+            logger.info("PUMP%s 스피드 변경: %s", pump_num, new_speed)
         
         speed_button.clicked.connect(cyclic_click)
     
@@ -946,14 +962,14 @@ class SpeedButtonManager:
             button = getattr(self.main_window, button_name)
             button.setText("0")
             
-        print(f"PUMP{pump_num} 새로운 스피드 버튼 초기화됨")
+        logger.info("PUMP%s 새로운 스피드 버튼 초기화됨", pump_num)
     
     def create_eva_fan_cycle_button(self, fan_type, button):
         """EVA FAN 순환 버튼 설정 (OFF,1,2,3,4,5,6,7,8)"""
         
         def cycle_click():
             if not self.serial_manager or not self.serial_manager.is_connected():
-                print(f"{fan_type} 시리얼 포트 연결되지 않음 - 버튼 동작 차단")
+                logger.warning("%s 시리얼 포트 연결되지 않음 - 버튼 동작 차단", fan_type)
                 if self.SendData_textEdit:
                     self.SendData_textEdit.append(f"{fan_type} 시리얼 포트 연결되지 않음 - 버튼 동작 차단")
                 return
@@ -1014,7 +1030,7 @@ class SpeedButtonManager:
                     
                     self.send_command(speed_command)
             
-            print(f"{fan_type} 값 변경: {button.text()}")
+            logger.info("%s 값 변경: %s", fan_type, button.text())
         
         button.clicked.connect(cycle_click)
     
@@ -1030,7 +1046,7 @@ class SpeedButtonManager:
         def number_click():
             # 시리얼 연결 상태 확인
             if not self.serial_manager or not self.serial_manager.is_connected():
-                print(f"OA.DAMP({damper_side}) 숫자 버튼 - 시리얼 포트가 연결되지 않음")
+                logger.info("OA.DAMP(%s) 숫자 버튼 - 시리얼 포트가 연결되지 않음", damper_side)
                 if self.SendData_textEdit:
                     self.SendData_textEdit.append(f"OA.DAMP({damper_side}) 숫자 버튼 - 시리얼 포트가 연결되지 않음")
                     self.SendData_textEdit.verticalScrollBar().setValue(
@@ -1069,7 +1085,7 @@ class SpeedButtonManager:
             
             # 명령어 전송
             self.send_command(command)
-            print(f"OA.DAMP({damper_side}) 숫자 버튼 클릭: {new_number} (명령어: {command.strip()})")
+            logger.info("OA.DAMP(%s) 숫자 버튼 클릭: %s (명령어: %s)", damper_side, new_number, command.strip())
         
         number_button.clicked.connect(number_click)
     
@@ -1096,7 +1112,7 @@ class SpeedButtonManager:
                 self.main_window.aircon_oa_damper_right_open_button.setStyleSheet("font-size: 14px; font-weight: bold;")
                 self.main_window.aircon_oa_damper_right_close_button.setStyleSheet("font-size: 14px; font-weight: bold;")
         
-        print("OA DAMPER 숫자 버튼들 초기화됨")
+        logger.info("OA DAMPER 숫자 버튼들 초기화됨")
     
     def create_new_oa_damper_controls(self, damper_side, open_button, number_button, close_button):
         """새로운 OA DAMPER 3버튼 컨트롤 설정"""
@@ -1115,7 +1131,7 @@ class SpeedButtonManager:
             """OPEN 버튼 클릭 - 숫자 +1 증가, Green 색상"""
             # 시리얼 연결 상태 확인
             if not self.serial_manager or not self.serial_manager.is_connected():
-                print(f"OA.DAMP({damper_side}) OPEN 버튼 - 시리얼 포트가 연결되지 않음")
+                logger.info("OA.DAMP(%s) OPEN 버튼 - 시리얼 포트가 연결되지 않음", damper_side)
                 if self.SendData_textEdit:
                     self.SendData_textEdit.append(f"OA.DAMP({damper_side}) OPEN 버튼 - 시리얼 포트가 연결되지 않음")
                     self.SendData_textEdit.verticalScrollBar().setValue(
@@ -1145,13 +1161,13 @@ class SpeedButtonManager:
                 command = f"{CMD_PREFIX},{AIR_SYSTEM},ARTDMP,OPEN,1{TERMINATOR}"
             
             self.send_command(command)
-            print(f"OA.DAMP({damper_side}) OPEN 클릭: {new_number} (명령어: {command.strip()})")
+            logger.info("OA.DAMP(%s) OPEN 클릭: %s (명령어: %s)", damper_side, new_number, command.strip())
         
         def close_click():
             """CLOSE 버튼 클릭 - 숫자 -1 감소, Green 색상"""
             # 시리얼 연결 상태 확인
             if not self.serial_manager or not self.serial_manager.is_connected():
-                print(f"OA.DAMP({damper_side}) CLOSE 버튼 - 시리얼 포트가 연결되지 않음")
+                logger.info("OA.DAMP(%s) CLOSE 버튼 - 시리얼 포트가 연결되지 않음", damper_side)
                 if self.SendData_textEdit:
                     self.SendData_textEdit.append(f"OA.DAMP({damper_side}) CLOSE 버튼 - 시리얼 포트가 연결되지 않음")
                     self.SendData_textEdit.verticalScrollBar().setValue(
@@ -1182,13 +1198,13 @@ class SpeedButtonManager:
                     command = f"{CMD_PREFIX},{AIR_SYSTEM},ARTDMP,CLOSE,1{TERMINATOR}"
                 
                 self.send_command(command)
-                print(f"OA.DAMP({damper_side}) CLOSE 클릭: {new_number} (명령어: {command.strip()})")
+                logger.info("OA.DAMP(%s) CLOSE 클릭: %s (명령어: %s)", damper_side, new_number, command.strip())
             else:
-                print(f"OA.DAMP({damper_side}) CLOSE 클릭: {new_number} (숫자가 0이므로 명령어 전송 안함)")
+                logger.info("OA.DAMP(%s) CLOSE 클릭: %s (숫자가 0이므로 명령어 전송 안함)", damper_side, new_number)
         
         # 이벤트 연결
         open_button.clicked.connect(open_click)
         close_button.clicked.connect(close_click)
         # 숫자 버튼은 아무 이벤트도 연결하지 않음 (요구사항 1번)
         
-        print(f"새로운 OA.DAMP({damper_side}) 컨트롤 설정 완료")
\ No newline at end of file
+        logger.info("새로운 OA.DAMP(%s) 컨트롤 설정 완료", damper_side)
\ No newline at end of file
@@ -0,0 +1,564 @@
+"""
+AIRCON/DSCT/PT02 펌웨어 시뮬레이터 (Linux 가상 터미널 기반)
+
+실제 장비 없이 SerialManager/읽기 스레드를 포함한 전체 시리얼 스택을 시험하기 위한 도구입니다.
+pty 쌍을 열고 slave 경로를 시리얼 포트처럼 제공하며, master 쪽에서 펌웨어 역할을 합니다.
+
+지원 명령 (ref/aircon_dsct_cmd.txt 문법):
+- $CMD,DSCT,FAN1~4,ON|OFF / $CMD,DSCT,FAN1~4,SPD,n
+- $CMD,DSCT,PUMP1~2,ON|OFF / SPD,n, DMP1~4_OPEN|_CLOSE,n, SOL1~4,ON|OFF
+- $CMD,DSCT,SEMIAUTO,RUN,n|STOP, $CMD,DSCT,DMPTEST,...
+- $CMD,AIR,FAN|CON_F|INVERTER|CLUCH|PUMP,ON|OFF, FSPD|CON_SPD,n, ALTDMP 등 댐퍼
+- $CMD,AIR,TEMPSET|CO2SET|PM25SET|SEMITIME,..., $CMD,AIR,GETSET, $CMD,AIR,AUTOMODE,...
+- $CMD,DSCT,TH / $CMD,AIR,TH → [DSCT]/[AIRCON] 센서 스캔 라인 + SEQUENTIAL SCAN COMPLETE
+- $CMD,DSCT,RELOAD / $CMD,AIR,RELOAD → EEPROM_ACK,RELOAD,START ~ *_ACK,RELOAD,COMPLETE
+- PT02 라인 주기 전송 (PT02 CO2,PM2.5,온도,습도)
+
+응답 지연, 출력 라인 속도/보레이트, 라인 손실·손상, NAK 응답 비율, 시스템별 명령 처리 한계를 설정할 수 있습니다.
+
+사용법 (단독 실행):
+    python -m test.firmware_simulator --latency-ms 20 --pt02-interval 5
+    → 출력된 pty 경로를 main.py --virtual-port <경로> 로 연결
+"""
+
+import argparse
+import heapq
+import os
+import random
+import select
+import sys
+import threading
+import time
+import tty
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.log_manager import get_logger
+
+logger = get_logger("SIM")
+
+
+@dataclass
+class SimulatorConfig:
+    """시뮬레이터 설정"""
+    latency_ms: float = 20.0            # 명령 수신 → 첫 응답 라인까지 지연
+    line_interval_ms: float = 5.0       # 응답 라인 사이 간격 (ACK, RELOAD 상태 라인 등)
+    scan_line_interval_ms: float = 50.0  # TH 스캔 센서 라인 사이 간격
+    line_rate: float = 0.0              # 최대 출력 라인/s (0이면 제한 없음)
+    baudrate: int = 0                   # 출력 바이트 속도 제한 (0이면 제한 없음, 115200 → 약 11.5KB/s)
+    pt02_interval_sec: float = 60.0     # PT02 주기 전송 간격 (0이면 전송 안 함)
+    sol_delay_sec: float = 15.0         # SOL 밸브 동작 완료까지 시간
+    drop_rate: float = 0.0              # 출력 라인 손실 비율 (0~1)
+    corrupt_rate: float = 0.0           # 출력 라인 손상 비율 (0~1)
+    nak_rate: float = 0.0               # 명령에 NAK 응답 비율 (0~1)
+    busy_gap_ms: Optional[Dict[str, float]] = None  # 시스템별 명령 처리 최소 간격 (더 빨리 오면 NAK BUSY, 예: {'AIR': 40})
+    sensor_timeout_rate: float = 0.0    # 스캔 시 센서 타임아웃 비율 (0~1)
+    dsct_sensor_count: int = 12
+    air_sensor_count: int = 6
+    seed: Optional[int] = None
+    link_path: Optional[str] = None     # slave 경로를 가리키는 심볼릭 링크 (재시작해도 같은 경로, /dev/serial/by-id 역할)
+
+
+class FirmwareSimulator:
+    """pty 기반 펌웨어 시뮬레이터"""
+
+    def __init__(self, config: Optional[SimulatorConfig] = None):
+        self.config = config or SimulatorConfig()
+        self.random = random.Random(self.config.seed)
+
+        self.master_fd: Optional[int] = None
+        self.slave_fd: Optional[int] = None
+        self.port: Optional[str] = None
+
+        # 출력 대기열: (전송 시각, 순번, 라인)
+        self._outbox: List[Tuple[float, int, str]] = []
+        self._outbox_cond = threading.Condition()
+        self._seq = 0
+        # master 쓰기 잠금 (write_raw 호출 스레드와 송신 스레드의 부분 쓰기가 라인 중간에 섞이지 않도록)
+        self._write_lock = threading.Lock()
+
+        self._running = False
+        self._rx_thread: Optional[threading.Thread] = None
+        self._tx_thread: Optional[threading.Thread] = None
+        self._next_pt02 = 0.0
+
+        # 명령 수신 알림 (time.monotonic(), 명령) - 벤치마크의 송신 지연 측정용, SimRX 스레드에서 호출
+        self.command_listener = None
+
+        # 시스템별 마지막 명령 처리 시각 (busy_gap_ms 판정)
+        self._last_handled: Dict[str, float] = {}
+
+        # 장비 상태
+        self.dsct_state: Dict[str, object] = {}
+        self.air_state: Dict[str, object] = {}
+        self.settings = {
+            'TEMPSET': ['250', '20'],
+            'CO2SET': ['1000', '100'],
+            'PM25SET': ['35', '5'],
+            'SEMITIME': ['30'],
+        }
+        self._reset_state()
+
+        # 센서 기준값
+        self._sensor_base = {}
+        for prefix, count in (("DSCT", self.config.dsct_sensor_count), ("AIRCON", self.config.air_sensor_count)):
+            for i in range(count):
+                self._sensor_base[(prefix, i + 1)] = (self.random.uniform(20.0, 28.0), self.random.uniform(40.0, 70.0))
+        self._pt02_base = [self.random.uniform(600, 900), self.random.uniform(10, 30), self.random.uniform(20.0, 26.0), self.random.uniform(35.0, 55.0)]
+
+        # 통계
+        self.stats = {
+            'commands_received': 0,
+            'lines_sent': 0,
+            'bytes_sent': 0,
+            'lines_dropped': 0,
+            'lines_corrupted': 0,
+            'naks_sent': 0,
+        }
+
+    def _reset_state(self):
+        for n in range(1, 5):
+            self.dsct_state[f"FAN{n}"] = "OFF"
+            self.dsct_state[f"FAN{n}_SPD"] = 0
+            self.dsct_state[f"DMP{n}"] = "CLOSE"
+            self.dsct_state[f"SOL{n}"] = "OFF"
+        for n in range(1, 3):
+            self.dsct_state[f"PUMP{n}"] = "OFF"
+            self.dsct_state[f"PUMP{n}_SPD"] = 0
+        self.dsct_state["SEMIAUTO"] = "STOP"
+        self.dsct_state["DMPTEST"] = "STOP"
+
+        for key in ("FAN", "CON_F", "INVERTER", "CLUCH", "PUMP"):
+            self.air_state[key] = "OFF"
+        self.air_state["FSPD"] = 0
+        self.air_state["CON_SPD"] = 0
+        for key in ("ALTDMP", "ALBDMP", "ARTDMP", "ARBDMP"):
+            self.air_state[key] = 0
+        self.air_state["AUTOMODE"] = "OFF"
+
+    # ==================== 시작/중지 ====================
+    def start(self) -> str:
+        """pty를 열고 송수신 스레드 시작, 시리얼 포트로 사용할 경로 반환 (link_path가 있으면 링크 경로)"""
+        if self._running:
+            return self.config.link_path or self.port
+
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        self.port = os.ttyname(self.slave_fd)
+        os.set_blocking(self.master_fd, False)
+
+        # stop() → start()를 장치 분리 → 재삽입처럼 쓸 수 있도록 같은 링크 경로를 새 pty로 교체
+        link_path = self.config.link_path
+        if link_path:
+            temp_path = f"{link_path}.tmp"
+            if os.path.lexists(temp_path):
+                os.unlink(temp_path)
+            os.symlink(self.port, temp_path)
+            os.replace(temp_path, link_path)
+
+        self._running = True
+        self._next_pt02 = time.monotonic() + self.config.pt02_interval_sec
+        self._rx_thread = threading.Thread(target=self._rx_loop, name="SimRX", daemon=True)
+        self._tx_thread = threading.Thread(target=self._tx_loop, name="SimTX", daemon=True)
+        self._rx_thread.start()
+        self._tx_thread.start()
+        logger.info("시뮬레이터 시작: %s%s", self.port, f" ({link_path})" if link_path else "")
+        return link_path or self.port
+
+    def stop(self):
+        """송수신 스레드 중지 및 pty 닫기"""
+        if not self._running:
+            return
+        self._running = False
+        with self._outbox_cond:
+            self._outbox_cond.notify_all()
+        for thread in (self._rx_thread, self._tx_thread):
+            if thread:
+                thread.join(timeout=1.0)
+        for fd in (self.master_fd, self.slave_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.master_fd = self.slave_fd = None
+        if self.config.link_path:
+            try:
+                os.unlink(self.config.link_path)
+            except OSError:
+                pass
+        logger.info("시뮬레이터 중지 (전송 %s줄)", self.stats['lines_sent'])
+
+    # ==================== 출력 ====================
+    def send_lines(self, lines: List[str], delay: float = 0.0, interval: float = 0.0):
+        """라인 목록을 전송 대기열에 추가 (delay 후부터 interval 간격)"""
+        now = time.monotonic()
+        with self._outbox_cond:
+            for i, line in enumerate(lines):
+                self._seq += 1
+                heapq.heappush(self._outbox, (now + delay + i * interval, self._seq, line))
+            self._outbox_cond.notify()
+
+    def write_raw(self, data: bytes):
+        """대기열을 거치지 않고 바로 전송 (부하 시험용, 호출 스레드에서 블로킹 가능 - 다 쓸 때까지 다른 출력은 대기)"""
+        self._write(data)
+        self.stats['bytes_sent'] += len(data)
+
+    def pending_lines(self) -> int:
+        """전송 대기 중인 라인 수"""
+        with self._outbox_cond:
+            return len(self._outbox)
+
+    def _tx_loop(self):
+        next_allowed = 0.0
+
+        while self._running:
+            # 실행 중 속도 변경을 반영하도록 매번 계산
+            line_gap = 1.0 / self.config.line_rate if self.config.line_rate > 0 else 0.0
+            byte_gap = 10.0 / self.config.baudrate if self.config.baudrate > 0 else 0.0
+            self._schedule_pt02()
+            with self._outbox_cond:
+                now = time.monotonic()
+                timeout = 0.1
+                if self._outbox:
+                    timeout = min(timeout, max(0.0, self._outbox[0][0] - now), max(0.0, next_allowed - now))
+                if timeout > 0:
+                    self._outbox_cond.wait(timeout)
+                    continue
+
+                now = time.monotonic()
+                if not self._outbox or self._outbox[0][0] > now or next_allowed > now:
+                    continue
+                _, _, line = heapq.heappop(self._outbox)
+
+            # 오류 주입
+            if self.config.drop_rate and self.random.random() < self.config.drop_rate:
+                self.stats['lines_dropped'] += 1
+                continue
+            if self.config.corrupt_rate and self.random.random() < self.config.corrupt_rate:
+                line = self._corrupt(line)
+                self.stats['lines_corrupted'] += 1
+
+            data = (line + "\r\n").encode('ascii', errors='replace')
+            self._write(data)
+            self.stats['lines_sent'] += 1
+            self.stats['bytes_sent'] += len(data)
+            next_allowed = time.monotonic() + max(line_gap, len(data) * byte_gap)
+
+    def _write(self, data: bytes):
+        view = memoryview(data)
+        # pty는 큰 데이터를 여러 번에 나눠 받으므로 전체를 쓸 때까지 잠금 유지
+        with self._write_lock:
+            while view and self._running:
+                try:
+                    written = os.write(self.master_fd, view)
+                    view = view[written:]
+                except BlockingIOError:
+                    # 상대편이 읽지 않아 버퍼가 찬 경우 대기
+                    select.select([], [self.master_fd], [], 0.1)
+                except OSError:
+                    return
+
+    def _corrupt(self, line: str) -> str:
+        """라인 손상: 일부 문자 치환 또는 잘림"""
+        if not line:
+            return line
+        if self.random.random() < 0.5:
+            return line[:self.random.randint(0, len(line) - 1)]
+        chars = list(line)
+        for _ in range(max(1, len(chars) // 10)):
+            chars[self.random.randrange(len(chars))] = self.random.choice("#?~\x7f")
+        return "".join(chars)
+
+    def _schedule_pt02(self):
+        interval = self.config.pt02_interval_sec
+        if interval <= 0 or time.monotonic() < self._next_pt02:
+            return
+        self._next_pt02 = time.monotonic() + interval
+        self.send_lines([self.make_pt02_line()])
+
+    def make_pt02_line(self) -> str:
+        """PT02 샘플 라인 생성 (PT02 CO2,PM2.5,온도,습도)"""
+        base = self._pt02_base
+        co2 = int(base[0] + self.random.uniform(-50, 50))
+        pm25 = int(max(0, base[1] + self.random.uniform(-5, 5)))
+        temp = base[2] + self.random.uniform(-0.5, 0.5)
+        humi = base[3] + self.random.uniform(-2, 2)
+        return f"PT02 {co2},{pm25},{temp:.1f},{humi:.1f}"
+
+    # ==================== 입력 ====================
+    def _rx_loop(self):
+        pending = bytearray()
+        while self._running:
+            try:
+                readable, _, _ = select.select([self.master_fd], [], [], 0.1)
+                if not readable:
+                    continue
+                chunk = os.read(self.master_fd, 4096)
+            except BlockingIOError:
+                continue
+            except OSError:
+                time.sleep(0.1)
+                continue
+            if not chunk:
+                continue
+            pending += chunk
+            while True:
+                newline = pending.find(b'\n')
+                if newline < 0:
+                    break
+                raw = bytes(pending[:newline])
+                del pending[:newline + 1]
+                line = raw.decode('ascii', errors='ignore').strip()
+                if line:
+                    self._on_command(line)
+
+    def _on_command(self, line: str):
+        self.stats['commands_received'] += 1
+        if self.command_listener:
+            self.command_listener(time.monotonic(), line)
+        responses = self.handle_command(line)
+        latency = self.config.latency_ms / 1000.0
+        now = time.monotonic()
+        with self._outbox_cond:
+            for offset, response in responses:
+                self._seq += 1
+                heapq.heappush(self._outbox, (now + latency + offset, self._seq, response))
+            self._outbox_cond.notify()
+
+    # ==================== 명령 처리 ====================
+    def handle_command(self, line: str) -> List[Tuple[float, str]]:
+        """
+        명령 1개 처리
+
+        Returns:
+            [(응답 지연(초), 응답 라인), ...] - 지연은 latency_ms 이후 기준
+        """
+        parts = [p.strip() for p in line.split(',')]
+        if len(parts) < 3 or parts[0] != "$CMD":
+            return [(0.0, "CMD_NAK,FORMAT")]
+
+        system, function, args = parts[1], parts[2], parts[3:]
+        if system == "DSCT":
+            ack, nak = "DSCT_ACK", "DSCT_NAK"
+        elif system == "AIR":
+            ack, nak = "AIRCON_ACK", "AIRCON_NAK"
+        else:
+            return [(0.0, f"CMD_NAK,{system},UNKNOWN")]
+
+        step = self.config.line_interval_ms / 1000.0
+
+        if function == "TH":
+            return self._scan_lines(system)
+        if function == "RELOAD":
+            return self._reload_lines(system, ack, step)
+        if function == "GETSET" and system == "AIR":
+            return [(i * step, f"AIRCON,{key},{','.join(values)}") for i, (key, values) in enumerate(self.settings.items())]
+
+        # 처리 한계 (직전 명령 처리 중이면 NAK, 처리 시각은 갱신하지 않음)
+        busy_gap = (self.config.busy_gap_ms or {}).get(system, 0.0) / 1000.0
+        if busy_gap:
+            now = time.monotonic()
+            if now - self._last_handled.get(system, float('-inf')) < busy_gap:
+                self.stats['naks_sent'] += 1
+                return [(0.0, f"{nak},{function},BUSY")]
+            self._last_handled[system] = now
+
+        # NAK 주입
+        if self.config.nak_rate and self.random.random() < self.config.nak_rate:
+            self.stats['naks_sent'] += 1
+            return [(0.0, f"{nak},{function},BUSY")]
+
+        if system == "DSCT":
+            result = self._apply_dsct(function, args, ack, nak, step)
+        else:
+            result = self._apply_air(function, args, ack, nak, step)
+        if result and result[0][1].startswith(nak):
+            self.stats['naks_sent'] += 1
+        return result
+
+    def _ack_with_eeprom(self, system: str, ack: str, function: str, args: List[str], ack_value: str, step: float):
+        saved = ",".join([function] + args)
+        return [
+            (0.0, f"{ack},{function},{ack_value}"),
+            (step, f"[EEPROM] Saving {system} command: {saved}"),
+            (2 * step, "EEPROM save OK"),
+        ]
+
+    def _apply_dsct(self, function, args, ack, nak, step):
+        state = self.dsct_state
+        value = args[0] if args else ""
+
+        if function.startswith("SOL") and value in ("ON", "OFF"):
+            # SOL1 명령으로 SOL1~4 전체 제어, 밸브 동작에 sol_delay_sec 소요
+            for n in range(1, 5):
+                state[f"SOL{n}"] = value
+            if value == "ON":
+                return [(0.0, "DSCT,SOL,All Opening!"), (self.config.sol_delay_sec, "DSCT,SOL All Open OK!")]
+            return [(0.0, "DSCT,SOL,All Closing!"), (self.config.sol_delay_sec, "DSCT,SOL All Close OK!")]
+
+        if function in [f"FAN{n}" for n in range(1, 5)] + ["PUMP1", "PUMP2"]:
+            if value in ("ON", "OFF"):
+                state[function] = value
+                return self._ack_with_eeprom("DSCT", ack, function, args, f"{value},OK", step)
+            if value == "SPD" and len(args) > 1 and args[1].isdigit():
+                speed = int(args[1])
+                state[f"{function}_SPD"] = speed
+                return self._ack_with_eeprom("DSCT", ack, function, args, f"SPD,{1000 + speed * 500} mV", step)
+            return [(0.0, f"{nak},{function},INVALID")]
+
+        if function.startswith("DMP") and "_" in function:
+            # DMP1_OPEN,n / DMP1_CLOSE,n
+            device, action = function.split("_", 1)
+            state[device] = action
+            return self._ack_with_eeprom("DSCT", ack, function, args, f"{value},OK" if value else "OK", step)
+
+        if function.startswith("DMP") and value in ("OPEN", "CLOSE"):
+            state[function] = value
+            return self._ack_with_eeprom("DSCT", ack, function, args, f"{value},OK", step)
+
+        if function in ("SEMIAUTO", "DMPTEST"):
+            state[function] = value or "STOP"
+            return self._ack_with_eeprom("DSCT", ack, function, args, ",".join(args + ["OK"]), step)
+
+        return [(0.0, f"{nak},{function},UNKNOWN")]
+
+    def _apply_air(self, function, args, ack, nak, step):
+        state = self.air_state
+        value = args[0] if args else ""
+
+        if function in ("FAN", "CON_F", "INVERTER", "CLUCH", "PUMP", "AUTOMODE") and value in ("ON", "OFF"):
+            state[function] = value
+            return self._ack_with_eeprom("AIR", ack, function, args, f"{value},OK", step)
+
+        if function in ("FSPD", "CON_SPD") and value.isdigit():
+            state[function] = int(value)
+            return self._ack_with_eeprom("AIR", ack, function, args, f"{value},OK", step)
+
+        if function in ("ALTDMP", "ALBDMP", "ARTDMP", "ARBDMP") and value in ("OPEN", "CLOSE"):
+            # 상대 이동: OPEN,n → +n, CLOSE,n → -n (0~10)
+            amount = int(args[1]) if len(args) > 1 and args[1].isdigit() else 10
+            delta = amount if value == "OPEN" else -amount
+            state[function] = max(0, min(10, state[function] + delta))
+            return self._ack_with_eeprom("AIR", ack, function, args, f"{value},{state[function]},OK", step)
+
+        if function in self.settings and args:
+            self.settings[function] = args
+            return [(0.0, f"{ack},{function},{','.join(args)},OK")]
+
+        return [(0.0, f"{nak},{function},UNKNOWN")]
+
+    def _scan_lines(self, system):
+        """TH 스캔 응답 (센서별 라인 + SEQUENTIAL SCAN COMPLETE)"""
+        prefix = "DSCT" if system == "DSCT" else "AIRCON"
+        count = self.config.dsct_sensor_count if system == "DSCT" else self.config.air_sensor_count
+        step = self.config.scan_line_interval_ms / 1000.0
+
+        lines = [(0.0, f"[{prefix}] Temp/Humi SCAN START!")]
+        success = error = 0
+        for i in range(1, count + 1):
+            if self.config.sensor_timeout_rate and self.random.random() < self.config.sensor_timeout_rate:
+                lines.append((i * step, f"[{prefix}] ID{i:02d},Sensor Check TIMEOUT!"))
+                error += 1
+                continue
+            temp_base, humi_base = self._sensor_base[(prefix, i)]
+            temp = temp_base + self.random.uniform(-0.5, 0.5)
+            humi = humi_base + self.random.uniform(-2.0, 2.0)
+            lines.append((i * step, f"[{prefix}] ID{i:02d},TEMP: {temp:.1f},HUMI: {humi:.1f}"))
+            success += 1
+
+        elapsed_ms = int(count * step * 1000)
+        lines.append(((count + 1) * step,
+                      f"[{prefix}] SEQUENTIAL SCAN COMPLETE: Total: {count}, Success: {success}, "
+                      f"Error: {error}, Time: {elapsed_ms}ms"))
+        return lines
+
+    def _reload_lines(self, system, ack, step):
+        """RELOAD 응답 (저장된 상태 라인 전체)"""
+        if system == "DSCT":
+            state = self.dsct_state
+            body = []
+            for n in range(1, 5):
+                body.append(f"DSCT,FAN{n},{state[f'FAN{n}']}")
+                body.append(f"DSCT,FAN{n},SPD,{state[f'FAN{n}_SPD']}")
+            for n in range(1, 5):
+                body.append(f"DSCT,DMP{n},{state[f'DMP{n}']}")
+            for n in range(1, 3):
+                body.append(f"DSCT,PUMP{n},{state[f'PUMP{n}']}")
+                body.append(f"DSCT,PUMP{n},SPD,{state[f'PUMP{n}_SPD']}")
+            for n in range(1, 5):
+                body.append(f"DSCT,SOL{n},{state[f'SOL{n}']}")
+            body.append(f"DSCT,SEMIAUTO,{state['SEMIAUTO']}")
+            body.append(f"DSCT,DMPTEST,{state['DMPTEST']}")
+        else:
+            state = self.air_state
+            body = [
+                f"AIR,FAN,{state['FAN']}",
+                f"AIR,FSPD,{state['FSPD']}",
+                f"AIR,CON_F,{state['CON_F']}",
+                f"AIR,CON_SPD,{state['CON_SPD']}",
+            ]
+            for key in ("ALTDMP", "ALBDMP", "ARTDMP", "ARBDMP"):
+                position = state[key]
+                body.append(f"AIR,{key},{'OPEN' if position else 'CLOSE'},{position}")
+            body.append(f"AIR,PUMP,{state['PUMP']}")
+            body.append(f"AIR,CLUCH,{state['CLUCH']}")
+
+        lines = ["EEPROM_ACK,RELOAD,START"] + body + ["EEPROM_ACK,RELOAD,END", f"{ack},RELOAD,COMPLETE"]
+        return [(i * step, line) for i, line in enumerate(lines)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AIRCON/DSCT/PT02 펌웨어 시뮬레이터 (pty)')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='명령 응답 지연')
+    parser.add_argument('--line-interval-ms', type=float, default=5.0, help='응답 라인 간격')
+    parser.add_argument('--scan-interval-ms', type=float, default=50.0, help='TH 스캔 라인 간격')
+    parser.add_argument('--line-rate', type=float, default=0.0, help='최대 출력 라인/s (0=제한 없음)')
+    parser.add_argument('--baudrate', type=int, default=0, help='출력 바이트 속도 제한 (0=제한 없음)')
+    parser.add_argument('--pt02-interval', type=float, default=60.0, help='PT02 전송 주기 (초, 0=끔)')
+    parser.add_argument('--sol-delay', type=float, default=15.0, help='SOL 동작 완료 시간 (초)')
+    parser.add_argument('--drop-rate', type=float, default=0.0, help='라인 손실 비율')
+    parser.add_argument('--corrupt-rate', type=float, default=0.0, help='라인 손상 비율')
+    parser.add_argument('--nak-rate', type=float, default=0.0, help='NAK 응답 비율')
+    parser.add_argument('--busy-gap-ms', type=float, nargs=2, metavar=('AIR', 'DSCT'), default=None,
+                        help='시스템별 명령 처리 최소 간격 (더 빨리 오면 NAK)')
+    parser.add_argument('--sensor-timeout-rate', type=float, default=0.0, help='센서 타임아웃 비율')
+    parser.add_argument('--seed', type=int, default=None, help='난수 시드')
+    parser.add_argument('--link', default=None, help='pty를 가리키는 고정 링크 경로 (예: /tmp/ttySIM0)')
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        latency_ms=args.latency_ms,
+        line_interval_ms=args.line_interval_ms,
+        scan_line_interval_ms=args.scan_interval_ms,
+        line_rate=args.line_rate,
+        baudrate=args.baudrate,
+        pt02_interval_sec=args.pt02_interval,
+        sol_delay_sec=args.sol_delay,
+        drop_rate=args.drop_rate,
+        corrupt_rate=args.corrupt_rate,
+        nak_rate=args.nak_rate,
+        busy_gap_ms={'AIR': args.busy_gap_ms[0], 'DSCT': args.busy_gap_ms[1]} if args.busy_gap_ms else None,
+        sensor_timeout_rate=args.sensor_timeout_rate,
+        seed=args.seed,
+        link_path=args.link,
+    )
+    simulator = FirmwareSimulator(config)
+    port = simulator.start()
+    print(f"시뮬레이터 포트: {port}")
+    print(f"앱 실행: python main.py --virtual-port {port}")
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
+        print(f"통계: {simulator.stats}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+가상 시간 asyncio 이벤트 루프 (asyncio 코어 시험용)
+
+loop.time()이 가상 시계를 반환하고, 준비된 I/O가 없으면 다음 타이머 시각까지 시계를 즉시 앞당깁니다.
+asyncio.sleep()/wait_for() 타임아웃이 실제로 기다리지 않으므로, 30초 주기 스케줄링 하루치를
+몇 초 안에 돌려 보거나 응답 타임아웃 경로를 바로 확인할 수 있습니다.
+
+- 소켓/파이프 I/O는 실제로 처리 (준비된 fd가 있으면 시계를 움직이지 않음)
+- 타이머도 I/O도 없으면 실제로 대기 (다른 스레드의 call_soon_threadsafe 용)
+
+사용 예:
+    loop = VirtualTimeEventLoop()
+    loop.run_until_complete(asyncio.sleep(3600))   # 즉시 끝남
+    print(loop.time())                              # 3600.0
+"""
+
+import asyncio
+import selectors
+
+
+class _VirtualTimeSelector(selectors.DefaultSelector):
+    """기다리는 대신 가상 시계를 앞당기는 셀렉터"""
+
+    def __init__(self):
+        super().__init__()
+        self.now = 0.0
+
+    def select(self, timeout=None):
+        events = super().select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            return super().select(None)
+        self.now += timeout
+        return []
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """가상 시간 이벤트 루프"""
+
+    def __init__(self):
+        self._virtual_selector = _VirtualTimeSelector()
+        super().__init__(self._virtual_selector)
+
+    def time(self) -> float:
+        return self._virtual_selector.now
+
+    def advance(self, seconds: float):
+        """가상 시계를 수동으로 앞당김 (다음 루프 단계에서 만기 타이머 실행)"""
+        self._virtual_selector.now += seconds
@@ -17,7 +17,8 @@ from managers.sensor_manager import SensorManager
 from managers.air_sensor_manager import AirSensorManager
 from managers.pt02_sensor_manager import PT02SensorManager
 from managers.sensor_scheduler import SensorScheduler
-from managers.command_queue_manager import CommandQueueManager, CommandPriority
+from managers.command_queue_manager import CommandQueueManager, CommandPriority, DROP_REJECTED
+from utils.csv_writer import close_all_writers
 
 from ui.constants import BUTTON_ON_STYLE, BUTTON_OFF_STYLE, BUTTON_DEFAULT_STYLE, BUTTON_SPEED_STYLE, BUTTON_PUMP_STYLE, BUTTON_STANDARD_STYLE
 from ui.helpers import get_file_path, configure_display_settings
@@ -27,6 +28,7 @@ from ui.ui_components import (create_group_box, create_button_row, create_port_s
 from ui.setup_buttons import setup_button_groups, setup_reload_buttons
 from ui.sensor_tab import SensorTab
 from ui.aircon_sensor_tab import AirconSensorTab
+from ui.queue_diagnostics_tab import QueueDiagnosticsTab
 
 class ControlWindow(QtWidgets.QMainWindow):
     def __init__(self, test_mode=False):
@@ -94,11 +96,11 @@ class ControlWindow(QtWidgets.QMainWindow):
             test_mode=self.test_mode
         )
 
-        # RELOAD 기능을 위한 시그널 연결
-        self.serial_manager.data_received.connect(self.button_manager.parse_reload_response)
+        # RELOAD/SOL 응답 핸들러를 수신 라인 분배기에 등록
+        self.button_manager.register_routes(self.serial_manager.line_router)
 
-        # PT02 센서 데이터 수신 핸들러 연결 (AUTO 모드와 관계없이 항상 CSV 저장)
-        self.serial_manager.data_received.connect(self._handle_pt02_data)
+        # PT02 센서 데이터 수신 핸들러 등록 (AUTO 모드와 관계없이 항상 CSV 저장, 묶음 단위)
+        self.serial_manager.line_router.subscribe("PT02", self._handle_pt02_lines, batch=True)
 
         # 스피드 버튼 매니저 초기화
         self.speed_button_manager = SpeedButtonManager(
@@ -123,10 +125,25 @@ class ControlWindow(QtWidgets.QMainWindow):
         # AUTO 탭 컨트롤 연결
         self.connect_auto_controls()
         
-        # 포트 스캔 타이머
-        self.port_scan_timer = QTimer(self)
-        self.port_scan_timer.timeout.connect(self.scan_ports_periodically)
-        self.port_scan_timer.start(1000)  # 1초마다 실행 (1000 = 1초 단위)
+        # 포트 목록 갱신 (핫플러그 이벤트 시에만, 주기 스캔 없음)
+        self.serial_manager.port_watcher.ports_changed.connect(self.on_ports_changed)
+
+        # 예기치 않은 연결 끊김 / 자동 재연결
+        self.serial_manager.connection_lost.connect(self.on_connection_lost)
+        self.serial_manager.connection_restored.connect(self.on_connection_restored)
+
+        # 명령 송신 간격 표시 (펌웨어 응답에 따라 자동 조절되는 AIR/DSCT 간격)
+        self.pacing_label = QLabel()
+        self.statusBar().addPermanentWidget(self.pacing_label)
+        self.command_queue.pacing_changed.connect(self.on_pacing_changed)
+        self.on_pacing_changed()
+
+        # 대기열이 가득 차서 거부된 명령 알림 (LOW 센서 요청 삭제/만료는 로그만)
+        self.command_queue.command_dropped.connect(self.on_command_dropped)
+
+        # 진단 탭 - 명령 큐 우선순위별 지연 (HIGH 명령이 LOW 센서 요청 뒤에 밀리지 않는지 확인)
+        self.diagnostics_tab = QueueDiagnosticsTab(self.command_queue)
+        self.tab_widget.addTab(self.diagnostics_tab, "DIAG")
 
         # 종료 버튼 연결
         self.exitButton.clicked.connect(self.close)
@@ -1053,29 +1070,64 @@ class ControlWindow(QtWidgets.QMainWindow):
         for port in ports:
             self.port_combobox.addItem(f"{port['device']} - {port['description']}")
 
-    def scan_ports_periodically(self):
-        """주기적으로 포트 목록 갱신"""
-        current_ports = {self.port_combobox.itemText(i) for i in range(self.port_combobox.count())}
-        detected_ports = set()
-
+    def on_ports_changed(self, _ports):
+        """포트 목록 변경 시 콤보박스 갱신 (포트 감시자 시그널)"""
         ports = self.serial_manager.get_available_ports()
-        for port in ports:
-            text = f"{port['device']} - {port['description']}"
-            detected_ports.add(text)
-            # Port 폰트 크기 조절
-            self.port_combobox.setStyleSheet("font-size: 12px;")
+        current_ports = [self.port_combobox.itemText(i) for i in range(self.port_combobox.count())]
+        detected_ports = [f"{port['device']} - {port['description']}" for port in ports]
 
         if current_ports != detected_ports:
+            selected = self.port_combobox.currentText()
             self.port_combobox.blockSignals(True)
             self.port_combobox.clear()
-            for port in ports:
-                self.port_combobox.addItem(f"{port['device']} - {port['description']}")                
+            self.port_combobox.addItems(detected_ports)
+            # 선택 유지 (사라진 포트면 첫 항목)
+            if selected in detected_ports:
+                self.port_combobox.setCurrentText(selected)
             self.port_combobox.blockSignals(False)
 
+    def on_connection_lost(self, port):
+        """예기치 않은 연결 끊김 (자동 재연결 대기 중)"""
+        self.connection_error_count = 0
+        if self.serial_manager.is_reconnecting():
+            self.update_status_indicator("reconnecting")
+            self.statusBar().showMessage(f"{port} 연결 끊김 - 자동 재연결 대기 중")
+        else:
+            self.was_connected = False
+            self.update_status_indicator("disconnected")
+            self.update_connect_button("disconnected")
+            self.update_button_states()
+
+    def on_connection_restored(self, port):
+        """자동 재연결 성공 (큐/스케줄러는 연결 상태에 따라 자동 재개)"""
+        self.was_connected = True
+        self.connection_error_count = 0
+        self.last_connection_check = time.time()
+        self.update_status_indicator("connected")
+        self.update_connect_button("connected")
+        self.statusBar().showMessage(f"{port} 재연결됨")
+
+    def on_pacing_changed(self, *_):
+        """송신 간격 표시 갱신 (툴팁에 계열별 속도와 마지막 변경 사유)"""
+        pacing = self.command_queue.get_queue_info().get('pacing')
+        if not pacing:
+            self.pacing_label.setText("")
+            return
+        self.pacing_label.setText("송신 간격 " + " / ".join(
+            f"{name} {info['interval_ms']:.0f}ms" for name, info in pacing.items()))
+        self.pacing_label.setToolTip("\n".join(
+            f"{name}: {info['rate_per_s']}개/s, 응답 {info['srtt_ms']}ms, 감속 {info['backoffs']}회 ({info['reason']})"
+            for name, info in pacing.items()))
+
+    def on_command_dropped(self, command, reason):
+        """대기열 가득 참으로 거부된 명령 표시"""
+        if reason == DROP_REJECTED:
+            self.statusBar().showMessage(f"명령 대기열 가득 참 - 전송 안 됨: {command}", 5000)
+
     def connect_serial(self):
         """시리얼 연결/해제 토글"""
-        if self.serial_manager.is_connected():
-            # 현재 연결되어 있으면 해제
+        if self.serial_manager.is_connected() or self.serial_manager.is_reconnecting():
+            # 현재 연결되어 있거나 재연결 대기 중이면 해제
             self.disconnect_serial()
         else:
             # 현재 연결되지 않았으면 연결 시도
@@ -1138,8 +1190,8 @@ class ControlWindow(QtWidgets.QMainWindow):
     def disconnect_serial(self):
         """시리얼 연결 해제"""
         try:
-            # 연결 상태 확인
-            if not self.serial_manager.is_connected():
+            # 연결 상태 확인 (재연결 대기 중이면 재연결 취소)
+            if not self.serial_manager.is_connected() and not self.serial_manager.is_reconnecting():
                 QMessageBox.information(self, "알림", "현재 연결된 포트가 없습니다.")
                 return
 
@@ -1192,6 +1244,9 @@ class ControlWindow(QtWidgets.QMainWindow):
         if status == "connected":
             self.status_label.setStyleSheet("background-color: rgb(43, 179, 43); color: rgb(0,0,0); font-weight: normal;")
             self.status_label.setText("Connected")
+        elif status == "reconnecting":
+            self.status_label.setStyleSheet("background-color: rgb(255, 170, 0); color: rgb(0,0,0); font-weight: normal;")
+            self.status_label.setText("Reconnecting")
         else:
             self.status_label.setStyleSheet("background-color: rgb(250, 0, 25); color: rgb(0,0,0); font-weight: normal;")
             self.status_label.setText("Disconnected")
@@ -1445,6 +1500,8 @@ class ControlWindow(QtWidgets.QMainWindow):
         if self.serial_manager.is_connected():
             self.serial_manager.disconnect_serial()
             print("종료 시 시리얼 포트 연결 해제")
+        # 모아 둔 센서 CSV 행 기록 후 파일 닫기
+        close_all_writers()
         event.accept()
 
     def keyPressEvent(self, event):
@@ -1558,7 +1615,15 @@ class ControlWindow(QtWidgets.QMainWindow):
             new_value = current_value + 1
             self.semi_auto_period_value_button.setText(str(new_value))
 
-    def _handle_pt02_data(self, data):
+    def _handle_pt02_lines(self, lines):
+        """PT02 라인 묶음 처리 (모든 라인은 CSV 저장, UI 갱신은 묶음당 1회)"""
+        updated = False
+        for data in lines:
+            updated = self._handle_pt02_data(data, update_display=False) or updated
+        if updated:
+            self._update_pt02_display()
+
+    def _handle_pt02_data(self, data, update_display=True):
         """PT02 센서 데이터 수신 핸들러 (AUTO 모드와 관계없이 항상 CSV 저장)
 
         수신 형식: PT02 CO2,PM2.5,온도,습도 (예: PT02 587,0,13.3,10.9)
@@ -1569,14 +1634,22 @@ class ControlWindow(QtWidgets.QMainWindow):
                 # PT02 센서 매니저를 통해 파싱 및 CSV 저장
                 if self.pt02_sensor_manager:
                     self.pt02_sensor_manager.parse_pt02_response(data)
+                    if update_display:
+                        self._update_pt02_display()
+                    return True
+        except Exception as e:
+            print(f"[MAIN] PT02 데이터 처리 오류: {e}")
+        return False
 
-                    # AUTO 탭 UI 업데이트 (연결되어 있다면)
-                    sensor_data = self.pt02_sensor_manager.get_sensor_data()
-                    if sensor_data and self.auto_speed_manager:
-                        self.auto_speed_manager.update_pt02_sensor_display(
-                            temp=sensor_data.get('temp'),
-                            co2=sensor_data.get('co2'),
-                            pm25=sensor_data.get('pm25')
-                        )
+    def _update_pt02_display(self):
+        """AUTO 탭의 PT02 표시 갱신 (연결되어 있다면)"""
+        try:
+            sensor_data = self.pt02_sensor_manager.get_sensor_data()
+            if sensor_data and self.auto_speed_manager:
+                self.auto_speed_manager.update_pt02_sensor_display(
+                    temp=sensor_data.get('temp'),
+                    co2=sensor_data.get('co2'),
+                    pm25=sensor_data.get('pm25')
+                )
         except Exception as e:
-            print(f"[MAIN] PT02 데이터 처리 오류: {e}")
\ No newline at end of file
+            print(f"[MAIN] PT02 표시 갱신 오류: {e}")
\ No newline at end of file
@@ -0,0 +1,136 @@
+# 명령 큐 지연 진단 탭 (우선순위별 대기/쓰기/ACK 지연 p50/p95/p99/최대, 출처별 마감 초과)
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont
+
+PRIORITIES = ('HIGH', 'NORMAL', 'LOW')
+METRIC_LABELS = (('wait', '큐 대기'), ('send', '쓰기'), ('ack', 'ACK 왕복'))
+COLUMNS = ('우선순위', '구간', '건수', 'p50', 'p95', 'p99', '최대')
+
+
+class QueueDiagnosticsTab(QWidget):
+    """명령 큐 지연 진단 탭 (탭이 보일 때만 1초마다 갱신)"""
+
+    def __init__(self, command_queue=None, parent=None):
+        super().__init__(parent)
+        self.command_queue = command_queue
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """UI 설정"""
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(10, 5, 10, 5)
+        main_layout.setSpacing(4)
+
+        # 상단: 제목, 큐 상태, 초기화 버튼
+        control_layout = QHBoxLayout()
+        title_label = QLabel("명령 큐 지연")
+        title_font = QFont()
+        title_font.setPointSize(12)
+        title_font.setBold(True)
+        title_label.setFont(title_font)
+        control_layout.addWidget(title_label)
+
+        self.summary_label = QLabel()
+        control_layout.addWidget(self.summary_label)
+        control_layout.addStretch()
+
+        self.reset_button = QPushButton("초기화")
+        self.reset_button.clicked.connect(self.reset_metrics)
+        control_layout.addWidget(self.reset_button)
+        main_layout.addLayout(control_layout)
+
+        # 우선순위 × 구간 표 (ms)
+        self.table = QTableWidget(len(PRIORITIES) * len(METRIC_LABELS), len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
+        for row, (priority, (_, label)) in enumerate(
+                (priority, metric) for priority in PRIORITIES for metric in METRIC_LABELS):
+            self.table.setItem(row, 0, QTableWidgetItem(priority))
+            self.table.setItem(row, 1, QTableWidgetItem(label))
+            for column in range(2, len(COLUMNS)):
+                item = QTableWidgetItem("-")
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+        main_layout.addWidget(self.table, 1)
+
+        # 출처별 마감 초과 (첫 전송이 마감 시각을 넘긴 수 / 전송 수, 버린 수)
+        self.deadline_label = QLabel()
+        self.deadline_label.setWordWrap(True)
+        main_layout.addWidget(self.deadline_label)
+
+        self.window_label = QLabel()
+        main_layout.addWidget(self.window_label)
+        self.setLayout(main_layout)
+
+    def set_command_queue(self, command_queue):
+        """명령 큐 설정"""
+        self.command_queue = command_queue
+        self.refresh()
+
+    def refresh(self):
+        """get_queue_info()['latency']로 표 갱신"""
+        if not self.command_queue:
+            return
+        info = self.command_queue.get_queue_info()
+        latency = info.get('latency') or {}
+        row = 0
+        for priority in PRIORITIES:
+            for metric, _ in METRIC_LABELS:
+                stats = latency.get(priority, {}).get(metric)
+                if stats:
+                    values = [str(stats['count'])] + [self._format_ms(stats[key]) for key in
+                                                      ('p50_ms', 'p95_ms', 'p99_ms', 'max_ms')]
+                else:
+                    values = ["0", "-", "-", "-", "-"]
+                for column, text in enumerate(values, start=2):
+                    self.table.item(row, column).setText(text)
+                row += 1
+
+        self.summary_label.setText(
+            f"대기 HIGH {info['high_queue_size']} / NORMAL {info['normal_queue_size']} / "
+            f"LOW {info['low_queue_size']}, 응답 대기 {info.get('in_flight', 0)}, "
+            f"만료 {info.get('expired', 0)}, 초과 {info.get('dropped', 0)}")
+        deadlines = info.get('deadlines') or {}
+        if deadlines:
+            parts = [f"{origin} {stats['missed']}/{stats['sent']}"
+                     + (f" (최대 +{stats['max_late_ms']:.0f}ms)" if stats['missed'] else "")
+                     + (f", 버림 {stats['dropped']}" if stats['dropped'] else "")
+                     for origin, stats in deadlines.items()]
+            self.deadline_label.setText(f"마감 초과 [{info.get('scheduling', '')}]: " + " · ".join(parts))
+        else:
+            self.deadline_label.setText("마감 초과: -")
+        window = getattr(getattr(self.command_queue, 'metrics', None), 'window_sec', None)
+        if window:
+            self.window_label.setText(f"최근 {window:.0f}초 기준 (ms)")
+
+    def reset_metrics(self):
+        """지연/마감 통계 초기화"""
+        for name in ('metrics', 'deadline_stats'):
+            stats = getattr(self.command_queue, name, None)
+            if stats:
+                stats.reset()
+        self.refresh()
+
+    @staticmethod
+    def _format_ms(value):
+        if value is None:
+            return "-"
+        return f"{value:.2f}" if value < 10 else f"{value:.1f}"
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start(1000)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
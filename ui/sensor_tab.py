@@ -4,6 +4,7 @@ from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtGui import QFont
 from ui.sensor_widget import SensorWidget
 from utils.usb_detector import USBDetector
+from utils.csv_writer import flush_all_writers
 from config.config_manager import get_config_manager
 
 class SensorTab(QWidget):
@@ -366,7 +367,8 @@ class SensorTab(QWidget):
             QMessageBox.warning(self, "경고", "/data 폴더가 존재하지 않습니다.")
             return
             
-        # CSV 파일 찾기
+        # CSV 파일 찾기 (모아 둔 센서 행을 먼저 기록)
+        flush_all_writers()
         csv_files = []
         for filename in os.listdir(data_folder):
             if filename.endswith('.csv'):
@@ -55,6 +55,7 @@ def create_port_selection_section():
     
     port_combobox = QComboBox()
     port_combobox.setFixedWidth(150)
+    port_combobox.setStyleSheet("font-size: 12px;")
     
     baudrate_label = QLabel("Baudrate")
     baudrate_label.setAlignment(Qt.AlignCenter)
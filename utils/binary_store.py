@@ -0,0 +1,358 @@
+"""
+센서 이력 바이너리 저장소 (고정 길이 레코드, 날짜별 append-only 파일 + numpy.memmap 읽기)
+
+CSV는 분석할 때마다 텍스트를 다시 파싱해야 합니다. 바이너리 저장소는 같은 값을 고정 길이 레코드로
+{prefix}_YYYY-MM-DD.bin에 덧붙이고, 읽을 때는 파일을 numpy.memmap으로 열어 시각으로 잘라냅니다.
+
+레코드 (리틀 엔디언, 패딩 없음, 헤더 없음):
+- DSCT/AIRCON: float64 ts, uint8 sensor, float32 temp, float32 humi   (17 bytes, sensor = ID 번호)
+- PT02:        float64 ts, float32 temp, float32 co2, float32 pm25, float32 humi   (24 bytes, 습도 없으면 nan)
+ts는 epoch 초 (datetime.timestamp(), 로컬 시각 기준 날짜로 파일 결정)
+
+기록 (BinaryLogWriter, 센서 매니저 GUI 스레드):
+- numpy 없이 struct로 기록, CsvLogWriter와 같은 방식으로 모았다가 write 1회 (flush_all_writers/close_all_writers 대상)
+- 파일을 열 때 끝에 잘린 레코드(전원 차단 등)가 있으면 잘라냄
+- csv_logging.binary_store: "off" (기본) / "alongside" (CSV와 함께) / "only" (CSV 대신)
+  (센서 매니저에는 utils.sensor_storage.BinaryStorage로 연결)
+
+읽기 (numpy 필요):
+- open_day(): 날짜 파일 memmap (읽기 전용, 파싱 없음)
+- query(): 기간 [start, end) 레코드 - 레코드는 시각 순으로 덧붙으므로 searchsorted로 범위를 찾음
+  (구조체 배열의 ts 필드는 strided view라 그대로 searchsorted하면 열 전체를 복사하므로,
+   SEARCH_BLOCK개마다 뽑은 ts로 블록을 찾은 뒤 블록 안에서 다시 searchsorted)
+- 시계가 뒤로 조정되어 순서가 어긋난 날은 import_csv(overwrite=True)로 CSV에서 정렬해 다시 만들 수 있음
+
+CSV 가져오기:
+    python -m utils.binary_store import data            # data/DSCT_*.csv, AIRCON_*.csv, PT02_*.csv (long/wide)
+    python -m utils.binary_store import data --force    # 이미 있는 .bin도 다시 만듦
+"""
+
+import argparse
+import csv
+import glob
+import math
+import os
+import struct
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.csv_layout import TIMESTAMP_FORMAT, wide_sensor_ids
+from utils.csv_writer import DEFAULT_FLUSH_INTERVAL_SEC, DEFAULT_FLUSH_ROWS, register_writer
+from utils.log_manager import get_logger
+
+logger = get_logger("CSV", "BINARY_STORE")
+
+BINARY_OFF = "off"
+BINARY_ALONGSIDE = "alongside"
+BINARY_ONLY = "only"
+BINARY_MODES = (BINARY_OFF, BINARY_ALONGSIDE, BINARY_ONLY)
+
+BINARY_EXT = ".bin"
+SEARCH_BLOCK = 4096
+
+TH_FIELDS = [('ts', '<f8'), ('sensor', 'u1'), ('temp', '<f4'), ('humi', '<f4')]
+PT02_FIELDS = [('ts', '<f8'), ('temp', '<f4'), ('co2', '<f4'), ('pm25', '<f4'), ('humi', '<f4')]
+STREAM_FIELDS = {"DSCT": TH_FIELDS, "AIRCON": TH_FIELDS, "PT02": PT02_FIELDS}
+
+_STRUCT_CODES = {'<f8': 'd', 'u1': 'B', '<f4': 'f'}
+
+
+def normalize_binary_mode(mode: Optional[str]) -> str:
+    """설정값 → BINARY_OFF/BINARY_ALONGSIDE/BINARY_ONLY (알 수 없는 값은 off)"""
+    mode = str(mode or BINARY_OFF).lower()
+    return mode if mode in BINARY_MODES else BINARY_OFF
+
+
+def record_struct(prefix: str) -> struct.Struct:
+    """스트림 레코드의 struct 형식 (numpy dtype과 같은 배치)"""
+    return struct.Struct('<' + ''.join(_STRUCT_CODES[code] for _, code in STREAM_FIELDS[prefix]))
+
+
+def sensor_number(sensor_id: str) -> int:
+    """'ID07' → 7"""
+    return int(sensor_id[2:])
+
+
+def day_path(data_dir: str, prefix: str, day: str) -> str:
+    """날짜 파일 경로 ({prefix}_YYYY-MM-DD.bin)"""
+    return os.path.join(data_dir, f'{prefix}_{day}{BINARY_EXT}')
+
+
+# ==================== 기록 ====================
+class BinaryLogWriter:
+    """바이너리 로그 스트림 하나 ({prefix}_YYYY-MM-DD.bin)"""
+
+    def __init__(self, data_dir: str, prefix: str,
+                 flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC, flush_rows: int = DEFAULT_FLUSH_ROWS):
+        self.data_dir = data_dir
+        self.prefix = prefix
+        self.flush_interval_sec = flush_interval_sec
+        self.flush_rows = max(1, flush_rows)
+        self._struct = record_struct(prefix)
+
+        self._file = None
+        self._path: Optional[str] = None
+        self._day: Optional[str] = None
+
+        # 아직 기록하지 않은 레코드
+        self._buffer = bytearray()
+        self.pending = 0
+        self._first_pending: Optional[float] = None
+
+        # 통계
+        self.rows_written = 0
+        self.flush_count = 0
+
+        register_writer(self)
+
+    def write_record(self, values: Iterable, timestamp: datetime):
+        """
+        레코드 추가 (ts를 뺀 필드 순서의 값, None은 nan)
+
+        Args:
+            timestamp: 레코드 시각 (ts, 날짜로 파일 결정)
+        """
+        day = timestamp.strftime('%Y-%m-%d')
+        if day != self._day:
+            # 자정: 남은 레코드는 이전 날짜 파일에
+            self.flush()
+            self._close_file()
+            self._day = day
+
+        values = [math.nan if value is None else value for value in values]
+        self._buffer += self._struct.pack(timestamp.timestamp(), *values)
+        self.pending += 1
+        now = time.monotonic()
+        if self._first_pending is None:
+            self._first_pending = now
+        if (self.pending >= self.flush_rows or self.flush_interval_sec <= 0
+                or now - self._first_pending >= self.flush_interval_sec):
+            self.flush()
+
+    def flush(self):
+        """모은 레코드를 파일에 기록 (write 1회)"""
+        if not self.pending:
+            return
+        data = bytes(self._buffer)
+        rows = self.pending
+        self._buffer.clear()
+        self.pending = 0
+        self._first_pending = None
+
+        try:
+            if self._file is None:
+                self._open_file()
+            self._file.write(data)
+            self.rows_written += rows
+            self.flush_count += 1
+        except OSError as e:
+            logger.error("바이너리 기록 오류 (%s, %s레코드 버림): %s", self._path, rows, e)
+            self._close_file()
+
+    def close(self):
+        """남은 레코드 기록 후 파일 닫기 (다음 레코드가 오면 다시 열림)"""
+        self.flush()
+        self._close_file()
+
+    def current_path(self) -> str:
+        """지금 기록 중인(또는 다음에 기록할) 파일 경로"""
+        return self._path or day_path(self.data_dir, self.prefix, self._day or datetime.now().strftime('%Y-%m-%d'))
+
+    def _open_file(self):
+        if self._day is None:
+            self._day = datetime.now().strftime('%Y-%m-%d')
+        os.makedirs(self.data_dir, exist_ok=True)
+        self._path = day_path(self.data_dir, self.prefix, self._day)
+        self._file = open(self._path, 'ab', buffering=0)
+        size = os.fstat(self._file.fileno()).st_size
+        torn = size % self._struct.size
+        if torn:
+            # 끝에 잘린 레코드 (기록 중 전원 차단 등) → 레코드 경계로 맞춤
+            logger.warning("바이너리 파일 끝 잘린 레코드 %s bytes 제거: %s", torn, self._path)
+            os.ftruncate(self._file.fileno(), size - torn)
+        elif not size:
+            logger.info("새 바이너리 파일 생성: %s", self._path)
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                logger.error("바이너리 파일 닫기 오류 (%s): %s", self._path, e)
+        self._file = None
+        self._path = None
+
+
+# ==================== 읽기 (numpy) ====================
+def record_dtype(prefix: str):
+    """스트림 레코드의 numpy dtype"""
+    import numpy as np
+    return np.dtype(STREAM_FIELDS[prefix])
+
+
+def open_day(data_dir: str, prefix: str, day: str):
+    """날짜 파일을 읽기 전용 memmap으로 (파일이 없거나 비었으면 빈 배열, 끝의 잘린 레코드는 제외)"""
+    import numpy as np
+    dtype = record_dtype(prefix)
+    path = day_path(data_dir, prefix, day)
+    count = os.path.getsize(path) // dtype.itemsize if os.path.exists(path) else 0
+    if not count:
+        return np.empty(0, dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(count,))
+
+
+def search_ts(records, value: float, side: str = 'left') -> int:
+    """시각 순 레코드에서 ts 위치 (numpy.searchsorted, 블록 단위로 ts 필드 복사 최소화)"""
+    import numpy as np
+    ts = records['ts']
+    block = int(np.searchsorted(ts[::SEARCH_BLOCK], value, side))
+    lo = max(block - 1, 0) * SEARCH_BLOCK
+    hi = min(block * SEARCH_BLOCK + 1, len(ts))
+    return lo + int(np.searchsorted(ts[lo:hi], value, side))
+
+
+def query(data_dir: str, prefix: str, start: datetime, end: datetime, sensor_id: Optional[str] = None):
+    """
+    기간 [start, end) 레코드 (날짜 파일을 넘나드는 기간 가능)
+
+    Args:
+        sensor_id: DSCT/AIRCON 센서 ('ID07'), None이면 전체
+    Returns:
+        레코드 구조체 배열 (memmap이 아닌 복사본)
+    """
+    import numpy as np
+    start_ts, end_ts = start.timestamp(), end.timestamp()
+    parts = []
+    day = start.date()
+    while day <= end.date():
+        records = open_day(data_dir, prefix, day.isoformat())
+        part = records[search_ts(records, start_ts):search_ts(records, end_ts)]
+        if sensor_id is not None:
+            part = part[part['sensor'] == sensor_number(sensor_id)]
+        if len(part):
+            parts.append(np.array(part))
+        day += timedelta(days=1)
+    return np.concatenate(parts) if parts else np.empty(0, record_dtype(prefix))
+
+
+def available_days(data_dir: str, prefix: str) -> List[str]:
+    """바이너리 파일이 있는 날짜 목록 (YYYY-MM-DD, 정렬)"""
+    days = []
+    for path in glob.glob(os.path.join(data_dir, f'{prefix}_*{BINARY_EXT}')):
+        day = os.path.basename(path)[len(prefix) + 1:-len(BINARY_EXT)]
+        try:
+            date.fromisoformat(day)
+        except ValueError:
+            continue
+        days.append(day)
+    return sorted(days)
+
+
+# ==================== CSV 가져오기 ====================
+def _csv_stream(path: str) -> Optional[str]:
+    """CSV 파일명 → 스트림 (DSCT_..., DSCT_WIDE_... → DSCT)"""
+    prefix = os.path.basename(path).split('_', 1)[0]
+    return prefix if prefix in STREAM_FIELDS else None
+
+
+def _float(text: str) -> float:
+    return float(text) if text != '' else math.nan
+
+
+def _csv_records(path: str, prefix: str):
+    """CSV 파일 → (날짜, 레코드 튜플) (long/wide/PT02 헤더로 구분)"""
+    epoch: Dict[str, float] = {}  # 같은 시각 문자열은 한 번만 변환
+
+    def to_ts(text):
+        if text not in epoch:
+            epoch[text] = datetime.strptime(text, TIMESTAMP_FORMAT).timestamp()
+        return epoch[text]
+
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        if prefix == "PT02":
+            for row in reader:
+                if row:
+                    yield row[0][:10], (to_ts(row[0]), _float(row[1]), _float(row[2]), _float(row[3]),
+                                        _float(row[4]) if len(row) > 4 else math.nan)
+        elif 'sensor_id' in header:
+            for row in reader:
+                if row:
+                    yield row[0][:10], (to_ts(row[0]), sensor_number(row[1]), _float(row[2]), _float(row[3]))
+        else:
+            columns = [(sensor_number(sensor_id), header.index(f'{sensor_id}_T'), header.index(f'{sensor_id}_H'))
+                       for sensor_id in wide_sensor_ids(header)]
+            for row in reader:
+                if not row:
+                    continue
+                for number, temp_index, humi_index in columns:
+                    if row[temp_index] != '':
+                        yield row[0][:10], (to_ts(row[0]), number, _float(row[temp_index]), _float(row[humi_index]))
+
+
+def import_csv(paths: Iterable[str], out_dir: Optional[str] = None, overwrite: bool = False) -> Dict[str, int]:
+    """
+    센서 CSV (DSCT/AIRCON long·wide, PT02) → 날짜별 .bin (시각 순 정렬)
+
+    Args:
+        out_dir: .bin 저장 폴더 (None이면 CSV와 같은 폴더)
+        overwrite: 이미 있는 .bin을 다시 만듦 (False면 그 날짜는 건너뜀 - 기록 중인 오늘 파일 보호)
+    Returns:
+        {만든 .bin 경로: 레코드 수}
+    """
+    import numpy as np
+    groups: Dict[Tuple[str, str, str], list] = defaultdict(list)
+    for path in sorted(paths):
+        prefix = _csv_stream(path)
+        if prefix is None:
+            continue
+        target_dir = out_dir or os.path.dirname(path)
+        for day, record in _csv_records(path, prefix):
+            groups[(target_dir, prefix, day)].append(record)
+
+    created = {}
+    for (target_dir, prefix, day), records in sorted(groups.items()):
+        target = day_path(target_dir, prefix, day)
+        if os.path.exists(target) and not overwrite:
+            logger.info("이미 있음, 건너뜀: %s", target)
+            continue
+        array = np.array(records, dtype=record_dtype(prefix))
+        array = array[np.argsort(array['ts'], kind='stable')]
+        os.makedirs(target_dir, exist_ok=True)
+        array.tofile(target)
+        created[target] = len(array)
+    return created
+
+
+def csv_files(data_dir: str) -> List[str]:
+    """data 폴더의 센서 CSV 파일 (DSCT/AIRCON/PT02, wide 포함)"""
+    paths = []
+    for prefix in STREAM_FIELDS:
+        paths += glob.glob(os.path.join(data_dir, f'{prefix}_*.csv'))
+    return sorted(paths)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='센서 이력 바이너리 저장소')
+    sub = parser.add_subparsers(dest='command', required=True)
+    importer = sub.add_parser('import', help='CSV → 날짜별 .bin')
+    importer.add_argument('data_dir', help='CSV 폴더 (예: data)')
+    importer.add_argument('--out-dir', default=None, help='.bin 저장 폴더 (기본값: CSV 폴더)')
+    importer.add_argument('--force', action='store_true', help='이미 있는 .bin도 다시 만듦')
+    args = parser.parse_args(argv)
+
+    created = import_csv(csv_files(args.data_dir), args.out_dir, args.force)
+    for path, count in created.items():
+        print(f"{path}: {count}레코드")
+    print(f"{len(created)}개 파일 생성")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
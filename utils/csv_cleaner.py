@@ -9,6 +9,9 @@ import os
 import glob
 from datetime import datetime, timedelta
 from typing import List, Tuple
+from utils.log_manager import get_logger
+
+logger = get_logger("CSV", "CSV_CLEANER")
 
 
 class CSVCleaner:
@@ -52,9 +55,9 @@ class CSVCleaner:
                 file_size = os.path.getsize(file_path)
                 os.remove(file_path)
                 deleted_files.append(filename)
-                print(f"[CSV_CLEANER] 파일 삭제: {filename} ({file_size} bytes)")
+                logger.info("파일 삭제: %s (%s bytes)", filename, file_size)
             except Exception as e:
-                print(f"[CSV_CLEANER] 파일 삭제 실패: {file_path}, 오류: {e}")
+                logger.error("파일 삭제 실패: %s, 오류: %s", file_path, e)
                 
         return deleted_files
     
@@ -90,10 +93,10 @@ class CSVCleaner:
                     os.remove(file_path)
                     deleted_files.append(filename)
                     days_old = (datetime.now() - file_mtime).days
-                    print(f"[CSV_CLEANER] 오래된 파일 삭제: {filename} ({days_old}일 전, {file_size} bytes)")
+                    logger.info("오래된 파일 삭제: %s (%s일 전, %s bytes)", filename, days_old, file_size)
                     
             except Exception as e:
-                print(f"[CSV_CLEANER] 파일 삭제 실패: {file_path}, 오류: {e}")
+                logger.error("파일 삭제 실패: %s, 오류: %s", file_path, e)
                 
         return deleted_files
     
@@ -139,10 +142,10 @@ class CSVCleaner:
                 os.remove(file_path)
                 deleted_files.append(filename)
                 total_size -= file_size
-                print(f"[CSV_CLEANER] 크기 제한으로 파일 삭제: {filename} ({file_size} bytes)")
+                logger.info("크기 제한으로 파일 삭제: %s (%s bytes)", filename, file_size)
                 
             except Exception as e:
-                print(f"[CSV_CLEANER] 파일 삭제 실패: {file_path}, 오류: {e}")
+                logger.error("파일 삭제 실패: %s, 오류: %s", file_path, e)
                 
         return deleted_files
     
@@ -156,7 +159,7 @@ class CSVCleaner:
         Returns:
             (DSCT 삭제 파일 목록, AIRCON 삭제 파일 목록)
         """
-        print(f"[CSV_CLEANER] 자동 정리 시작 - 각 타입당 최대 {max_files}개 파일 유지")
+        logger.info("자동 정리 시작 - 각 타입당 최대 %s개 파일 유지", max_files)
         
         # DSCT 파일 정리 (개수 기반만)
         dsct_deleted = self.cleanup_by_count(max_files, "DSCT_*.csv")
@@ -166,9 +169,9 @@ class CSVCleaner:
         
         total_deleted = len(dsct_deleted) + len(aircon_deleted)
         if total_deleted > 0:
-            print(f"[CSV_CLEANER] 정리 완료 - DSCT: {len(dsct_deleted)}개, AIRCON: {len(aircon_deleted)}개 삭제")
+            logger.info("정리 완료 - DSCT: %s개, AIRCON: %s개 삭제", len(dsct_deleted), len(aircon_deleted))
         else:
-            print("[CSV_CLEANER] 정리할 파일 없음")
+            logger.info("정리할 파일 없음")
             
         return dsct_deleted, aircon_deleted
     
@@ -0,0 +1,164 @@
+"""
+센서 CSV 레이아웃 (long: 센서마다 1행 / wide: 스캔마다 1행) 및 변환기
+
+- long (기존): timestamp,sensor_id,temperature,humidity
+  DSCT 스캔 1회 = 12행, 행마다 시각과 ID가 반복됨
+- wide: timestamp,ID01_T,ID01_H,...,ID12_T,ID12_H,scan_ms,errors
+  스캔 완료(SEQUENTIAL SCAN COMPLETE) 시 그 스캔에서 받은 값으로 1행
+  타임아웃 등으로 값이 없는 센서는 빈 칸, scan_ms/errors는 펌웨어 스캔 완료 메시지의 Time/Error
+  파일 이름은 {prefix}_WIDE_YYYY-MM-DD[_NNN].csv (long 파일과 섞이지 않도록)
+
+변환 (파일 → 파일):
+    python -m utils.csv_layout to-wide data/DSCT_2026-10-18.csv DSCT_WIDE_2026-10-18.csv
+    python -m utils.csv_layout to-long data/DSCT_WIDE_2026-10-18.csv DSCT_2026-10-18.csv
+
+long → wide는 연속한 행을 스캔 하나로 묶습니다 (펌웨어는 ID01부터 순서대로 스캔하므로 센서 ID가 앞 행보다
+커지지 않거나 행 시각 간격이 gap_sec를 넘으면 새 스캔).
+스캔 시각은 그 스캔의 마지막 행 시각, scan_ms는 알 수 없으므로 빈 칸, errors는 값이 없는 센서 수입니다.
+wide → long은 값이 있는 센서만 스캔 시각으로 행을 만듭니다 (센서별 시각 차이(1초 이내)는 보존되지 않음).
+"""
+
+import argparse
+import csv
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+LAYOUT_LONG = "long"
+LAYOUT_WIDE = "wide"
+LAYOUTS = (LAYOUT_LONG, LAYOUT_WIDE)
+
+LONG_FIELDNAMES = ['timestamp', 'sensor_id', 'temperature', 'humidity']
+WIDE_PREFIX_SUFFIX = "_WIDE"
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_GAP_SEC = 5.0
+
+
+def normalize_layout(layout: Optional[str]) -> str:
+    """설정값 → LAYOUT_LONG/LAYOUT_WIDE (알 수 없는 값은 long)"""
+    layout = str(layout or LAYOUT_LONG).lower()
+    return layout if layout in LAYOUTS else LAYOUT_LONG
+
+
+def wide_fieldnames(sensor_ids: Iterable[str]) -> List[str]:
+    """wide 헤더: timestamp, IDxx_T, IDxx_H ..., scan_ms, errors"""
+    names = ['timestamp']
+    for sensor_id in sensor_ids:
+        names += [f'{sensor_id}_T', f'{sensor_id}_H']
+    return names + ['scan_ms', 'errors']
+
+
+def layout_stream(prefix: str, layout: str, sensor_ids: Iterable[str]) -> Tuple[str, List[str]]:
+    """레이아웃별 CSV 파일 접두어와 헤더 → (prefix, fieldnames)"""
+    if layout == LAYOUT_WIDE:
+        return prefix + WIDE_PREFIX_SUFFIX, wide_fieldnames(sensor_ids)
+    return prefix, list(LONG_FIELDNAMES)
+
+
+def wide_row(timestamp: str, readings: Dict[str, Tuple], sensor_ids: Sequence[str],
+             scan_ms='', errors='') -> list:
+    """스캔 1회 값 {sensor_id: (temp, humi)} → wide 행 (값이 없는 센서는 빈 칸)"""
+    row = [timestamp]
+    for sensor_id in sensor_ids:
+        row.extend(readings.get(sensor_id, ('', '')))
+    row += [scan_ms, errors]
+    return row
+
+
+def wide_sensor_ids(fieldnames: Sequence[str]) -> List[str]:
+    """wide 헤더에서 센서 ID 목록 (IDxx_T 순서)"""
+    return [name[:-2] for name in fieldnames if name.endswith('_T')]
+
+
+# ==================== 변환 ====================
+def _group_scans(rows: Iterable[dict], gap_sec: float):
+    """long 행 → 스캔별 (마지막 시각 문자열, {sensor_id: (temp, humi)})"""
+    readings: Dict[str, Tuple] = {}
+    timestamp = last_time = last_sensor = None
+    for row in rows:
+        row_time = datetime.strptime(row['timestamp'], TIMESTAMP_FORMAT)
+        sensor_id = row['sensor_id']
+        if readings and (sensor_id <= last_sensor or (row_time - last_time).total_seconds() > gap_sec):
+            yield timestamp, readings
+            readings = {}
+        readings[sensor_id] = (row['temperature'], row['humidity'])
+        timestamp, last_time, last_sensor = row['timestamp'], row_time, sensor_id
+    if readings:
+        yield timestamp, readings
+
+
+def long_to_wide(src: str, dst: str, sensor_ids: Optional[Sequence[str]] = None,
+                 gap_sec: float = DEFAULT_GAP_SEC) -> int:
+    """
+    long CSV → wide CSV
+
+    Args:
+        sensor_ids: wide 열 순서 (None이면 파일에 나온 ID 정렬)
+    Returns:
+        기록한 스캔 행 수
+    """
+    with open(src, newline='', encoding='utf-8') as f:
+        scans = list(_group_scans(csv.DictReader(f), gap_sec))
+    if sensor_ids is None:
+        sensor_ids = sorted({sensor_id for _, readings in scans for sensor_id in readings})
+
+    with open(dst, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(wide_fieldnames(sensor_ids))
+        for timestamp, readings in scans:
+            missing = sum(1 for sensor_id in sensor_ids if sensor_id not in readings)
+            writer.writerow(wide_row(timestamp, readings, sensor_ids, '', missing))
+    return len(scans)
+
+
+def wide_to_long(src: str, dst: str) -> int:
+    """
+    wide CSV → long CSV (값이 있는 센서만)
+
+    Returns:
+        기록한 센서 행 수
+    """
+    count = 0
+    with open(src, newline='', encoding='utf-8') as f_in, open(dst, 'w', newline='', encoding='utf-8') as f_out:
+        reader = csv.reader(f_in)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"빈 CSV 파일: {src}")
+        sensor_ids = wide_sensor_ids(header)
+        columns = [(sensor_id, header.index(f'{sensor_id}_T'), header.index(f'{sensor_id}_H'))
+                   for sensor_id in sensor_ids]
+        writer = csv.writer(f_out)
+        writer.writerow(LONG_FIELDNAMES)
+        for row in reader:
+            if not row:
+                continue
+            for sensor_id, temp_index, humi_index in columns:
+                if row[temp_index] != '':
+                    writer.writerow([row[0], sensor_id, row[temp_index], row[humi_index]])
+                    count += 1
+    return count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='센서 CSV 레이아웃 변환 (long ↔ wide)')
+    parser.add_argument('mode', choices=['to-wide', 'to-long'], help='to-wide: long → wide, to-long: wide → long')
+    parser.add_argument('src', help='입력 CSV')
+    parser.add_argument('dst', help='출력 CSV')
+    parser.add_argument('--sensors', type=int, default=0,
+                        help='to-wide: 센서 열 수 (예: DSCT 12, AIRCON 6 → ID01~IDnn, 0이면 파일에 나온 ID)')
+    parser.add_argument('--gap-sec', type=float, default=DEFAULT_GAP_SEC,
+                        help='to-wide: 행 시각 간격이 이보다 크면 새 스캔')
+    args = parser.parse_args(argv)
+
+    if args.mode == 'to-wide':
+        sensor_ids = [f"ID{i:02d}" for i in range(1, args.sensors + 1)] if args.sensors else None
+        count = long_to_wide(args.src, args.dst, sensor_ids, args.gap_sec)
+        print(f"{args.src} → {args.dst}: 스캔 {count}행")
+    else:
+        count = wide_to_long(args.src, args.dst)
+        print(f"{args.src} → {args.dst}: 센서 {count}행")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
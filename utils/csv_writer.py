@@ -0,0 +1,194 @@
+"""
+센서 CSV 로그 기록기 (스트림별 파일 핸들 유지 + 묶음 기록)
+
+기존 센서 매니저는 행마다 파일을 열고 닫으면서 _get_csv_filename()의 exists/getsize 확인
+(_001, _002 ... 분할 파일마다)과 헤더 확인용 exists를 반복했습니다 (DSCT 스캔 1회에 12번, GUI 스레드).
+CsvLogWriter는:
+- 스트림(DSCT/AIRCON/PT02, 장비별 data_dir)마다 파일 핸들 하나를 열어 두고 파일 크기는 메모리에서 셈
+  → max_bytes(10MB) 이상이면 다음 분할 파일(_001, _002 ...)로
+- 행은 메모리에 모았다가 flush_rows개가 쌓이거나 첫 행 뒤 flush_interval_sec가 지나면 write 1회로 기록
+  (행이 더 오지 않으면 호출하는 쪽이 flush_interval_sec 뒤 flush() - 센서 매니저는 단발 QTimer)
+- 행 시각의 날짜가 바뀌면(자정) 남은 행을 이전 날짜 파일에 기록하고 새 날짜 파일로
+- 파일을 찾는 exists/getsize 확인은 파일을 새로 열 때만
+- flush_all_writers(): USB 복사 전 등 모든 스트림 기록, close_all_writers(): 종료 시 (atexit에도 등록)
+
+파일 이름/헤더/행 형식(csv 모듈 기본 \\r\\n 줄바꿈)은 기존과 같습니다.
+GUI 스레드(센서 매니저)에서만 사용합니다.
+
+사용 예:
+    writer = CsvLogWriter(data_dir, "DSCT", ['timestamp', 'sensor_id', 'temperature', 'humidity'])
+    writer.write_row(['2026-10-18 12:00:00', 'ID01', 25.1, 40.2], timestamp)
+    writer.close()
+"""
+
+import atexit
+import csv
+import io
+import os
+import time
+import weakref
+from datetime import datetime
+from typing import Iterable, Optional
+
+from utils.log_manager import get_logger
+
+logger = get_logger("CSV", "CSV_WRITER")
+
+DEFAULT_FLUSH_INTERVAL_SEC = 5.0
+DEFAULT_FLUSH_ROWS = 50
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+# 열려 있는 기록기 (flush_all_writers/close_all_writers 대상)
+_writers = weakref.WeakSet()
+
+
+class CsvLogWriter:
+    """CSV 로그 스트림 하나 ({prefix}_YYYY-MM-DD[_NNN].csv)"""
+
+    def __init__(self, data_dir: str, prefix: str, fieldnames: Iterable[str],
+                 flush_interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+                 flush_rows: int = DEFAULT_FLUSH_ROWS, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.data_dir = data_dir
+        self.prefix = prefix
+        self.fieldnames = list(fieldnames)
+        self.flush_interval_sec = flush_interval_sec
+        self.flush_rows = max(1, flush_rows)
+        self.max_bytes = max_bytes
+
+        self._file = None
+        self._path: Optional[str] = None
+        self._day: Optional[str] = None
+        self._index = 0
+        self._size = 0
+
+        # 아직 기록하지 않은 행 (csv 형식 문자열)
+        self._buffer = io.StringIO()
+        self._csv = csv.writer(self._buffer)
+        self.pending = 0
+        self._first_pending: Optional[float] = None
+
+        # 통계
+        self.rows_written = 0
+        self.flush_count = 0
+
+        register_writer(self)
+
+    # ==================== 기록 ====================
+    def write_row(self, values: Iterable, timestamp: datetime):
+        """
+        행 추가 (fieldnames 순서의 값)
+
+        Args:
+            timestamp: 행 시각 (날짜로 파일 결정)
+        """
+        day = timestamp.strftime('%Y-%m-%d')
+        if day != self._day:
+            # 자정: 남은 행은 이전 날짜 파일에
+            self.flush()
+            self._close_file()
+            self._day = day
+            self._index = 0
+
+        self._csv.writerow(values)
+        self.pending += 1
+        now = time.monotonic()
+        if self._first_pending is None:
+            self._first_pending = now
+        if (self.pending >= self.flush_rows or self.flush_interval_sec <= 0
+                or now - self._first_pending >= self.flush_interval_sec):
+            self.flush()
+
+    def flush(self):
+        """모은 행을 파일에 기록 (write 1회, 필요하면 새 파일 열기/분할)"""
+        if not self.pending:
+            return
+        data = self._buffer.getvalue().encode('utf-8')
+        rows = self.pending
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self.pending = 0
+        self._first_pending = None
+
+        try:
+            if self._file is None or self._size >= self.max_bytes:
+                data = self._open_file() + data
+            self._file.write(data)
+            self._size += len(data)
+            self.rows_written += rows
+            self.flush_count += 1
+        except OSError as e:
+            logger.error("CSV 기록 오류 (%s, %s행 버림): %s", self._path, rows, e)
+            self._close_file()
+
+    def close(self):
+        """남은 행 기록 후 파일 닫기 (다음 행이 오면 다시 열림)"""
+        self.flush()
+        self._close_file()
+
+    # ==================== 파일 ====================
+    def current_path(self) -> str:
+        """지금 기록 중인(또는 다음에 기록할) 파일 경로"""
+        if self._path:
+            return self._path
+        day = self._day or datetime.now().strftime('%Y-%m-%d')
+        return self._find_path(day, 0)[0]
+
+    def _shard_path(self, day: str, index: int) -> str:
+        base = f'{self.prefix}_{day}'
+        name = f'{base}.csv' if index == 0 else f'{base}_{index:03d}.csv'
+        return os.path.join(self.data_dir, name)
+
+    def _find_path(self, day: str, index: int):
+        """index번째 분할 파일부터 max_bytes 미만인 파일 찾기 → (경로, 번호)"""
+        while True:
+            path = self._shard_path(day, index)
+            if not os.path.exists(path) or os.path.getsize(path) < self.max_bytes:
+                return path, index
+            index += 1
+
+    def _open_file(self) -> bytes:
+        """기록할 파일 열기 (가득 찼으면 다음 분할 파일), 새 파일이면 헤더 반환"""
+        if self._file is not None:
+            self._close_file()
+            self._index += 1
+        if self._day is None:
+            self._day = datetime.now().strftime('%Y-%m-%d')
+        os.makedirs(self.data_dir, exist_ok=True)
+        self._path, self._index = self._find_path(self._day, self._index)
+        self._file = open(self._path, 'ab', buffering=0)
+        self._size = os.fstat(self._file.fileno()).st_size
+        if self._size:
+            return b''
+        logger.info("새 CSV 파일 생성: %s", self._path)
+        header = io.StringIO()
+        csv.writer(header).writerow(self.fieldnames)
+        return header.getvalue().encode('utf-8')
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                logger.error("CSV 파일 닫기 오류 (%s): %s", self._path, e)
+        self._file = None
+        self._path = None
+
+
+def register_writer(writer):
+    """flush_all_writers/close_all_writers 대상에 추가 (flush()/close()가 있는 다른 기록기, 예: BinaryLogWriter)"""
+    _writers.add(writer)
+
+
+def flush_all_writers():
+    """열린 모든 CSV 기록기의 남은 행 기록 (USB 복사 등 파일을 읽기 전)"""
+    for writer in list(_writers):
+        writer.flush()
+
+
+def close_all_writers():
+    """열린 모든 CSV 기록기 닫기 (프로그램 종료 시)"""
+    for writer in list(_writers):
+        writer.close()
+
+
+atexit.register(close_all_writers)
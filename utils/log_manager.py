@@ -0,0 +1,314 @@
+"""
+비동기 로그 관리 모듈
+- 카테고리별 로그 레벨 (SERIAL, RX, TX, QUEUE, RELOAD, DSCT ...)
+- 호출 스레드는 메모리 링 버퍼(deque)에 기록만 하고 즉시 반환 (stdout 대기 없음)
+- 백그라운드 싱크 스레드가 묶어서 출력
+- 카테고리별 초당 출력 제한 + 주기적 생략 요약
+  ("[LOG] RX: 최근 10초간 4,812줄 생략")
+
+사용 예:
+    from utils.log_manager import get_logger
+    logger = get_logger("SERIAL")
+    logger.info("연결 성공: %s @ %dbps", port, baudrate)   # 포맷팅은 싱크 스레드에서 수행
+
+출력 형식은 기존 print 형식을 유지합니다: "[TAG] 메시지", 경고/오류는 "[TAG WARNING]", "[TAG ERROR]"
+"""
+
+import atexit
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+# 로그 레벨
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+_LEVEL_NAMES = {
+    "DEBUG": DEBUG,
+    "INFO": INFO,
+    "WARNING": WARNING,
+    "ERROR": ERROR,
+    "OFF": OFF,
+}
+
+# 경고/오류 출력 시 태그 뒤에 붙는 접미사
+_LEVEL_SUFFIX = {
+    WARNING: " WARNING",
+    ERROR: " ERROR",
+}
+
+# 기본 카테고리
+CATEGORIES = (
+    "SERIAL", "RX", "TX", "QUEUE", "SCHEDULER", "RELOAD", "SOL", "BUTTON",
+    "SPEED", "AUTO", "DSCT", "AIRCON", "PT02", "CSV",
+)
+
+
+class _TokenBucket:
+    """카테고리별 초당 출력 제한 (호출 스레드에서 잠금 없이 사용)"""
+
+    __slots__ = ("rate", "tokens", "updated", "suppressed")
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.suppressed = 0
+
+    def allow(self, now: float) -> bool:
+        # GIL 하에서의 경합은 카운트 오차만 발생하므로 잠금 사용 안 함
+        tokens = self.tokens + (now - self.updated) * self.rate
+        if tokens > self.rate:
+            tokens = self.rate
+        self.updated = now
+        if tokens >= 1.0:
+            self.tokens = tokens - 1.0
+            return True
+        self.tokens = tokens
+        self.suppressed += 1
+        return False
+
+
+class LogManager:
+    """로그 링 버퍼 + 백그라운드 싱크 관리 클래스"""
+
+    def __init__(self, buffer_size: int = 8192, flush_interval: float = 0.2,
+                 summary_interval: float = 10.0, default_level: int = INFO, stream=None):
+        # collections.deque의 append/popleft는 원자적이므로 잠금 없는 링 버퍼로 사용
+        self._buffer = deque(maxlen=buffer_size)
+        self.flush_interval = flush_interval
+        self.summary_interval = summary_interval
+        self.default_level = default_level
+        self.stream = stream
+
+        self._levels: Dict[str, int] = {}
+        self._buckets: Dict[str, _TokenBucket] = {}
+
+        # 통계 (링 버퍼 넘침 계산용)
+        self.total_enqueued = 0
+        self.total_written = 0
+        self._overflow_reported = 0
+
+        self._wakeup = threading.Event()
+        self._sink_thread: Optional[threading.Thread] = None
+        self._running = False
+        self._last_summary = time.monotonic()
+        self._start_lock = threading.Lock()
+
+    # ==================== 설정 ====================
+    def configure(self, settings: dict):
+        """설정 딕셔너리 적용 (config/settings.json의 logging 섹션)"""
+        self.default_level = _parse_level(settings.get("level"), self.default_level)
+        self.flush_interval = float(settings.get("flush_interval_sec", self.flush_interval))
+        self.summary_interval = float(settings.get("summary_interval_sec", self.summary_interval))
+
+        buffer_size = int(settings.get("buffer_size", self._buffer.maxlen))
+        if buffer_size != self._buffer.maxlen:
+            self._buffer = deque(self._buffer, maxlen=max(256, buffer_size))
+
+        for category, level in (settings.get("categories") or {}).items():
+            self.set_level(category, level)
+        for category, rate in (settings.get("rate_limits") or {}).items():
+            self.set_rate_limit(category, rate)
+
+    def set_level(self, category: str, level):
+        """카테고리 로그 레벨 설정 ('DEBUG', 'INFO', ... 또는 숫자)"""
+        self._levels[category] = _parse_level(level, self.default_level)
+
+    def get_level(self, category: str) -> int:
+        return self._levels.get(category, self.default_level)
+
+    def set_rate_limit(self, category: str, lines_per_sec):
+        """카테고리 초당 최대 출력 라인 수 설정 (0 또는 None이면 제한 없음)"""
+        if not lines_per_sec:
+            self._buckets.pop(category, None)
+        else:
+            self._buckets[category] = _TokenBucket(float(lines_per_sec))
+
+    def is_enabled(self, category: str, level: int) -> bool:
+        return level >= self._levels.get(category, self.default_level)
+
+    # ==================== 기록 (호출 스레드) ====================
+    def log(self, category: str, tag: str, level: int, msg: str, args: tuple):
+        """로그 기록 - 레벨/속도 제한 검사 후 링 버퍼에 추가하고 즉시 반환"""
+        if level < self._levels.get(category, self.default_level):
+            return
+
+        now = time.monotonic()
+        # 오류는 속도 제한 없이 항상 기록
+        if level < ERROR:
+            bucket = self._buckets.get(category)
+            if bucket is not None and not bucket.allow(now):
+                return
+
+        self._buffer.append((time.time(), tag, level, msg, args))
+        self.total_enqueued += 1
+
+        if self._sink_thread is None:
+            self._start_sink()
+
+    # ==================== 싱크 스레드 ====================
+    def _start_sink(self):
+        with self._start_lock:
+            if self._sink_thread is not None:
+                return
+            self._running = True
+            self._sink_thread = threading.Thread(target=self._sink_loop, name="LogSink", daemon=True)
+            self._sink_thread.start()
+
+    def _sink_loop(self):
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+            now = time.monotonic()
+            if now - self._last_summary >= self.summary_interval:
+                self._write_summary(now)
+
+    def _drain(self):
+        """링 버퍼의 모든 레코드를 포맷팅해 한 번에 출력"""
+        buffer = self._buffer
+        lines = []
+        while True:
+            try:
+                _, tag, level, msg, args = buffer.popleft()
+            except IndexError:
+                break
+            if args:
+                # 수신 라인은 디코딩 전 bytes로 전달되므로 출력 시에만 디코딩
+                if any(isinstance(arg, (bytes, bytearray)) for arg in args):
+                    args = tuple(arg.decode('ascii', errors='replace') if isinstance(arg, (bytes, bytearray)) else arg
+                                 for arg in args)
+                try:
+                    msg = msg % args
+                except Exception:
+                    msg = f"{msg} {args}"
+            lines.append(f"[{tag}{_LEVEL_SUFFIX.get(level, '')}] {msg}")
+
+        if lines:
+            self.total_written += len(lines)
+            self._write("\n".join(lines) + "\n")
+
+    def _write_summary(self, now: float):
+        """속도 제한/버퍼 넘침으로 생략된 로그 요약 출력"""
+        elapsed = now - self._last_summary
+        self._last_summary = now
+        lines = []
+        for category, bucket in self._buckets.items():
+            suppressed = bucket.suppressed
+            if suppressed:
+                bucket.suppressed = 0
+                lines.append(f"[LOG] {category}: 최근 {elapsed:.0f}초간 {suppressed:,}줄 생략")
+
+        overflow = self.total_enqueued - self.total_written - len(self._buffer)
+        if overflow > self._overflow_reported:
+            lines.append(f"[LOG] 버퍼 넘침으로 {overflow - self._overflow_reported:,}줄 유실")
+            self._overflow_reported = overflow
+
+        if lines:
+            self._write("\n".join(lines) + "\n")
+
+    def _write(self, text: str):
+        stream = self.stream or sys.stdout
+        try:
+            stream.write(text)
+            stream.flush()
+        except Exception:
+            pass
+
+    def flush(self):
+        """남은 로그 즉시 출력 (호출 스레드에서 실행)"""
+        self._drain()
+
+    def shutdown(self):
+        """싱크 스레드 중지 및 남은 로그 출력"""
+        self._running = False
+        self._wakeup.set()
+        if self._sink_thread is not None and self._sink_thread is not threading.current_thread():
+            self._sink_thread.join(timeout=1.0)
+        self._drain()
+        self._write_summary(time.monotonic())
+
+    def get_stats(self) -> dict:
+        """로그 통계 반환"""
+        return {
+            'enqueued': self.total_enqueued,
+            'written': self.total_written,
+            'buffered': len(self._buffer),
+            'suppressed': {c: b.suppressed for c, b in self._buckets.items() if b.suppressed},
+        }
+
+
+class CategoryLogger:
+    """카테고리 로거 - 메시지는 '%' 포맷 문자열 + 인자로 전달 (포맷팅은 싱크에서 수행)"""
+
+    __slots__ = ("category", "tag", "_manager")
+
+    def __init__(self, manager: LogManager, category: str, tag: str):
+        self._manager = manager
+        self.category = category
+        self.tag = tag
+
+    def debug(self, msg: str, *args):
+        self._manager.log(self.category, self.tag, DEBUG, msg, args)
+
+    def info(self, msg: str, *args):
+        self._manager.log(self.category, self.tag, INFO, msg, args)
+
+    def warning(self, msg: str, *args):
+        self._manager.log(self.category, self.tag, WARNING, msg, args)
+
+    def error(self, msg: str, *args):
+        self._manager.log(self.category, self.tag, ERROR, msg, args)
+
+    def is_enabled(self, level: int = DEBUG) -> bool:
+        """레벨 활성 여부 (비싼 인자 계산 전에 확인용)"""
+        return self._manager.is_enabled(self.category, level)
+
+
+def _parse_level(level, default: int) -> int:
+    if isinstance(level, int):
+        return level
+    if isinstance(level, str):
+        return _LEVEL_NAMES.get(level.upper(), default)
+    return default
+
+
+# 전역 로그 관리자 인스턴스
+_log_manager = None
+_loggers: Dict[tuple, CategoryLogger] = {}
+
+
+def get_log_manager() -> LogManager:
+    """전역 로그 관리자 반환 (최초 호출 시 설정 파일의 logging 섹션 적용)"""
+    global _log_manager
+    if _log_manager is None:
+        _log_manager = LogManager()
+        try:
+            from config.config_manager import get_config_manager
+            _log_manager.configure(get_config_manager().get_section("logging"))
+        except Exception as e:
+            sys.stdout.write(f"[LOG] 로그 설정 로드 실패, 기본값 사용: {e}\n")
+        atexit.register(_log_manager.shutdown)
+    return _log_manager
+
+
+def get_logger(category: str, tag: Optional[str] = None) -> CategoryLogger:
+    """
+    카테고리 로거 반환
+
+    Args:
+        category: 레벨/속도 제한 단위 (예: 'SERIAL', 'RX', 'DSCT')
+        tag: 출력 태그 (기본값: category) - 예: get_logger("SERIAL", "READER_THREAD")
+    """
+    key = (category, tag or category)
+    logger = _loggers.get(key)
+    if logger is None:
+        logger = CategoryLogger(get_log_manager(), category, tag or category)
+        _loggers[key] = logger
+    return logger
@@ -0,0 +1,139 @@
+"""
+Qt 이벤트 루프에서 asyncio 이벤트 루프 구동 (qasync 방식 브리지)
+
+GUI 스레드 하나에서 Qt 위젯과 asyncio 코어(managers/async_core.py)를 함께 실행하기 위한 최소 브리지입니다.
+asyncio 루프를 별도 스레드로 돌리지 않고, 필요한 순간에만 Qt가 asyncio 루프를 한 단계씩 실행합니다.
+
+- I/O: asyncio 셀렉터(epoll) fd를 QSocketNotifier로 감시 → 등록된 fd 중 하나라도 준비되면 한 단계 실행
+  (call_soon_threadsafe의 self-pipe도 셀렉터에 등록되어 있으므로 다른 스레드 호출도 바로 깨움)
+- 타이머: 다음 asyncio 타이머 시각에 맞춘 단발 QTimer (주기 폴링 없음)
+- 한 단계 실행은 BaseEventLoop._run_once()를 셀렉터 대기 없이(timeout=0) 호출
+
+CPython 3.8~3.12의 BaseEventLoop 내부(_run_once, _ready, _scheduled)를 사용합니다.
+셀렉터에 fileno()가 없는 플랫폼(Windows 등)은 FALLBACK_POLL_MS 간격 폴링으로 동작합니다.
+
+사용 예:
+    app = QtWidgets.QApplication(sys.argv)
+    bridge = QtAsyncioBridge()
+    bridge.start()
+    bridge.create_task(unit.run())
+    app.exec_()
+    bridge.stop()
+"""
+
+import asyncio
+import selectors
+import threading
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QSocketNotifier, QTimer
+from utils.log_manager import get_logger
+
+logger = get_logger("SYSTEM", "QT_ASYNCIO")
+
+
+class _NonBlockingSelector(selectors.DefaultSelector):
+    """Qt가 대기를 맡으므로 asyncio 셀렉터는 기다리지 않음 (브리지 중지 후 정리 단계에서는 대기)"""
+
+    blocking = False
+
+    def select(self, timeout=None):
+        return super().select(timeout if self.blocking else 0)
+
+
+class QtAsyncioBridge(QObject):
+    """Qt 이벤트 루프에서 asyncio 루프를 구동하는 브리지"""
+
+    FALLBACK_POLL_MS = 10
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        super().__init__()
+        self.loop = loop or asyncio.SelectorEventLoop(_NonBlockingSelector())
+        if not hasattr(self.loop, '_run_once'):
+            raise RuntimeError("지원하지 않는 asyncio 이벤트 루프: %r" % (self.loop,))
+
+        self._notifier: Optional[QSocketNotifier] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._step)
+        self._running = False
+        self._in_step = False
+
+        # 통계
+        self.total_steps = 0
+
+    def start(self):
+        """브리지 시작 (이후 asyncio 루프는 Qt 이벤트 루프가 도는 동안 실행됨)"""
+        if self._running:
+            return
+        self._running = True
+        asyncio.set_event_loop(self.loop)
+        self.loop._thread_id = threading.get_ident()  # is_running() 판정용
+
+        fileno = getattr(self.loop._selector, 'fileno', None)
+        if fileno is not None:
+            self._notifier = QSocketNotifier(fileno(), QSocketNotifier.Read, self)
+            self._notifier.activated.connect(self._step)
+        self._schedule()
+        logger.info("asyncio 브리지 시작 (%s)", "셀렉터 fd 감시" if self._notifier else
+                    f"{self.FALLBACK_POLL_MS}ms 폴링")
+
+    def stop(self):
+        """브리지 중지 (남은 태스크 취소 후 루프 닫기)"""
+        if not self._running:
+            return
+        self._running = False
+        self._timer.stop()
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier = None
+
+        # 남은 태스크를 취소하고 정리 코드(finally)가 끝날 때까지 실행
+        self.loop._thread_id = None
+        tasks = [task for task in asyncio.all_tasks(self.loop) if not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            if isinstance(self.loop._selector, _NonBlockingSelector):
+                self.loop._selector.blocking = True
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+        logger.info("asyncio 브리지 중지")
+
+    def create_task(self, coro) -> asyncio.Task:
+        """코루틴을 태스크로 예약 (Qt 스레드에서 호출)"""
+        task = self.loop.create_task(coro)
+        self._schedule()
+        return task
+
+    def _step(self, *_):
+        """asyncio 루프 한 단계 실행 후 다음 깨울 시각 예약"""
+        if not self._running or self._in_step:
+            return
+        self._in_step = True
+        asyncio.events._set_running_loop(self.loop)
+        try:
+            self.loop._run_once()
+            self.total_steps += 1
+        finally:
+            asyncio.events._set_running_loop(None)
+            self._in_step = False
+        self._schedule()
+
+    def _schedule(self):
+        """준비된 콜백이 있으면 즉시, 아니면 다음 asyncio 타이머 시각에 단발 타이머"""
+        if not self._running:
+            return
+        loop = self.loop
+        if loop._ready:
+            delay_ms = 0
+        elif loop._scheduled:
+            delay_ms = max(0, int((loop._scheduled[0].when() - loop.time()) * 1000) + 1)
+        elif self._notifier is None:
+            delay_ms = self.FALLBACK_POLL_MS
+        else:
+            self._timer.stop()
+            return
+        if self._notifier is None:
+            delay_ms = min(delay_ms, self.FALLBACK_POLL_MS)
+        self._timer.start(delay_ms)
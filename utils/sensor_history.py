@@ -0,0 +1,210 @@
+"""
+센서 최근 이력 메모리 링 버퍼 (스트림별 고정 크기 numpy 배열)
+
+센서 매니저의 sensor_data는 센서마다 최신값 1개뿐이라 "ID07 최근 6시간"을 보려면 CSV를 다시 읽어야 합니다.
+SensorHistoryBuffer는 스트림(DSCT/AIRCON/PT02)마다 한 번 할당한 배열에 센서별 최근 값을 돌려 가며 기록합니다.
+- 배치: ts[sensor, 2 * capacity] (float64, POSIX 초), values[field, sensor, 2 * capacity] (float32, 값 없음은 nan)
+- 같은 값을 i와 i + capacity 두 곳에 기록 (미러 링) → 최근 n개는 항상 [head + capacity - n, head + capacity)
+  한 구간이라 복사 없이 연속 view로 꺼낼 수 있음 (차트에 그대로 전달, numpy 축소 연산 그대로 적용)
+- append(): 인덱스 계산 + 배열 두 곳 대입, 크기와 무관하게 O(1) (할당 없음)
+- window(): 연속 구간의 ts에서 searchsorted로 최근 N분 시작 위치 → ts/값 view
+- window_stats(): 센서별 최근 N분 최소/최대/평균 (센서 전체를 배열 하나로 모아 numpy 연산 몇 번)
+
+view는 버퍼를 그대로 가리키므로 capacity번 더 기록하면 내용이 바뀝니다 (오래 들고 있을 값은 .copy()).
+메모리 상한은 history_buffer.max_memory_mb (버퍼 1개 = 스트림 1개, 미러 포함):
+    capacity = max_memory_mb / (센서 수 x 2 x (8 + 4 x 측정값 수))
+    예) 4MB: DSCT 12센서 10,922개 (10초 간격 약 30시간), AIRCON 6센서 21,845개, PT02 87,381개 (1분 주기 약 60일)
+
+사용 예:
+    history = manager.history
+    ts, temp = history.window("ID07", minutes=360, field="temp")   # 최근 6시간 (view)
+    history.window_stats(minutes=10)                               # {sensor_id: (min, max, mean, count)}
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from utils.log_manager import get_logger
+from utils.sensor_storage import STREAM_VALUES
+
+logger = get_logger("CSV", "HISTORY")
+
+DEFAULT_MAX_MEMORY_MB = 4
+
+
+class SensorHistoryBuffer:
+    """스트림 1개의 센서별 최근 이력 (미리 할당한 미러 링 버퍼)"""
+
+    def __init__(self, stream: str, sensor_ids: Iterable[Optional[str]], capacity: int,
+                 fields: Optional[Sequence[str]] = None):
+        import numpy as np
+
+        self.stream = stream
+        self.fields = tuple(fields or STREAM_VALUES[stream])
+        self.sensor_ids = list(sensor_ids)
+        self.capacity = max(1, int(capacity))
+        self._sensor_index = {sensor_id: index for index, sensor_id in enumerate(self.sensor_ids)}
+        self._field_index = {field: index for index, field in enumerate(self.fields)}
+
+        size = 2 * self.capacity
+        self._ts = np.zeros((len(self.sensor_ids), size), dtype=np.float64)
+        self._values = np.full((len(self.fields), len(self.sensor_ids), size), np.nan, dtype=np.float32)
+        # 센서별 다음 기록 위치 / 기록된 개수 (numpy 스칼라보다 빠른 list)
+        self._head = [0] * len(self.sensor_ids)
+        self._count = [0] * len(self.sensor_ids)
+
+    @classmethod
+    def for_memory(cls, stream: str, sensor_ids: Iterable[Optional[str]], max_memory_mb: float,
+                   fields: Optional[Sequence[str]] = None) -> "SensorHistoryBuffer":
+        """메모리 상한(MB, 미러 포함)에 맞는 capacity로 생성"""
+        sensor_ids = list(sensor_ids)
+        fields = tuple(fields or STREAM_VALUES[stream])
+        sample_bytes = len(sensor_ids) * 2 * (8 + 4 * len(fields))
+        return cls(stream, sensor_ids, int(max_memory_mb * 1024 * 1024) // sample_bytes, fields)
+
+    @property
+    def nbytes(self) -> int:
+        """할당한 배열 크기 (bytes)"""
+        return self._ts.nbytes + self._values.nbytes
+
+    def __len__(self) -> int:
+        return sum(self._count)
+
+    def count(self, sensor_id: Optional[str] = None) -> int:
+        """센서에 기록된 값 개수 (최대 capacity)"""
+        return self._count[self._sensor_index[sensor_id]]
+
+    def append(self, sensor_id: Optional[str], timestamp, values: Sequence):
+        """
+        측정값 1개 기록 (가장 오래된 값을 덮어씀)
+
+        Args:
+            sensor_id: 센서 ID (PT02는 None)
+            timestamp: datetime 또는 POSIX 초
+            values: fields 순서의 측정값 (None은 nan)
+        """
+        sensor = self._sensor_index.get(sensor_id)
+        if sensor is None:
+            return
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        index = self._head[sensor]
+        mirror = index + self.capacity
+        self._ts[sensor, index] = self._ts[sensor, mirror] = timestamp
+        for field, value in enumerate(values):
+            if value is None:
+                value = float('nan')
+            self._values[field, sensor, index] = self._values[field, sensor, mirror] = value
+        self._head[sensor] = index + 1 if index + 1 < self.capacity else 0
+        if self._count[sensor] < self.capacity:
+            self._count[sensor] += 1
+
+    def _span(self, sensor: int) -> Tuple[int, int]:
+        """센서의 기록된 값 전체가 시각 순으로 놓인 [start, end)"""
+        end = self._head[sensor] + self.capacity
+        return end - self._count[sensor], end
+
+    def series(self, sensor_id: Optional[str] = None, field: Optional[str] = None):
+        """
+        기록된 전체 이력 (시각 순, 복사 없는 view)
+
+        Returns:
+            (ts, values): field를 주면 values는 1차원, 없으면 (측정값 수, n) 배열
+        """
+        sensor = self._sensor_index[sensor_id]
+        start, end = self._span(sensor)
+        return self._view(sensor, start, end, field)
+
+    def window(self, sensor_id: Optional[str] = None, minutes: float = 10, field: Optional[str] = None,
+               now: Optional[float] = None):
+        """
+        최근 minutes분 이력 (시각 순, 복사 없는 view)
+
+        Args:
+            field: 측정값 이름 (None이면 values는 (측정값 수, n) 배열)
+            now: 기준 시각 (POSIX 초, 기본 현재)
+        Returns:
+            (ts, values)
+        """
+        import numpy as np
+
+        sensor = self._sensor_index[sensor_id]
+        start, end = self._span(sensor)
+        since = (time.time() if now is None else now) - minutes * 60
+        start += int(np.searchsorted(self._ts[sensor, start:end], since, 'left'))
+        return self._view(sensor, start, end, field)
+
+    def _view(self, sensor: int, start: int, end: int, field: Optional[str]):
+        ts = self._ts[sensor, start:end]
+        if field is None:
+            return ts, self._values[:, sensor, start:end]
+        return ts, self._values[self._field_index[field], sensor, start:end]
+
+    def window_stats(self, minutes: float, field: Optional[str] = None,
+                     now: Optional[float] = None) -> Dict[Optional[str], Optional[Tuple[float, float, float, int]]]:
+        """
+        센서별 최근 minutes분 (최소, 최대, 평균, 개수) - nan은 제외, 값이 없으면 None
+
+        센서마다 시작 위치만 searchsorted로 찾고, 센서 전체 구간을 (센서 수, 가장 긴 구간) 배열 하나로 모아
+        numpy 연산 몇 번으로 계산 (센서마다 축소 연산을 따로 부르면 짧은 구간에서 호출 비용이 값보다 큼)
+
+        Args:
+            field: 측정값 이름 (기본 첫 측정값 temp)
+        """
+        import numpy as np
+
+        since = (time.time() if now is None else now) - minutes * 60
+        ends = np.array(self._head) + self.capacity
+        starts = np.empty_like(ends)
+        for sensor, end in enumerate(ends.tolist()):
+            start = end - self._count[sensor]
+            starts[sensor] = start + int(np.searchsorted(self._ts[sensor, start:end], since, 'left'))
+        width = int((ends - starts).max()) if len(ends) else 0
+        if not width:
+            return {sensor_id: None for sensor_id in self.sensor_ids}
+
+        # 구간은 모두 end에서 끝나므로 끝을 맞춰 width개씩 모으고, 구간 밖/nan은 valid로 제외
+        index = ends[:, None] - width + np.arange(width)
+        values = np.take_along_axis(self._values[self._field_index[field or self.fields[0]]], index, axis=1)
+        valid = (index >= starts[:, None]) & ~np.isnan(values)
+        counts = valid.sum(axis=1)
+        lows = np.where(valid, values, np.inf).min(axis=1)
+        highs = np.where(valid, values, -np.inf).max(axis=1)
+        totals = np.where(valid, values, 0).sum(axis=1, dtype=np.float64)
+
+        stats = {}
+        for sensor, sensor_id in enumerate(self.sensor_ids):
+            count = int(counts[sensor])
+            stats[sensor_id] = (float(lows[sensor]), float(highs[sensor]), float(totals[sensor]) / count,
+                                count) if count else None
+        return stats
+
+    def latest(self, sensor_id: Optional[str] = None) -> Optional[Tuple[float, tuple]]:
+        """센서의 마지막 (ts, 측정값 tuple), 기록이 없으면 None"""
+        sensor = self._sensor_index[sensor_id]
+        if not self._count[sensor]:
+            return None
+        index = self._head[sensor] + self.capacity - 1
+        return float(self._ts[sensor, index]), tuple(float(v) for v in self._values[:, sensor, index])
+
+    def clear(self):
+        """기록 초기화 (배열은 그대로 재사용)"""
+        self._head = [0] * len(self.sensor_ids)
+        self._count = [0] * len(self.sensor_ids)
+
+
+def create_history_buffer(stream: str, sensor_ids: Iterable[Optional[str]]) -> Optional[SensorHistoryBuffer]:
+    """history_buffer 설정으로 스트림 버퍼 생성 (꺼져 있거나 numpy가 없으면 None)"""
+    from config.config_manager import get_config_manager
+    settings = get_config_manager().get_section("history_buffer")
+    if not settings.get("enabled", True):
+        return None
+    try:
+        buffer = SensorHistoryBuffer.for_memory(stream, sensor_ids, settings.get("max_memory_mb", DEFAULT_MAX_MEMORY_MB))
+    except ImportError:
+        logger.warning("numpy가 없어 %s 최근 이력 버퍼를 사용하지 않습니다", stream)
+        return None
+    logger.info("%s 최근 이력 버퍼: 센서 %s개 x %s개 (%.1fMB)",
+                stream, len(buffer.sensor_ids), buffer.capacity, buffer.nbytes / 1024 / 1024)
+    return buffer
@@ -0,0 +1,363 @@
+"""
+센서 이력 저장 백엔드 (센서 매니저 저장 경로에 CSV 외에 붙이는 저장소)
+
+센서 매니저는 측정값마다 add_reading(), 스캔이 끝나면 end_scan()을 호출합니다 (PT02는 측정마다 1회).
+- binary: utils.binary_store.BinaryLogWriter ({prefix}_YYYY-MM-DD.bin, numpy.memmap 읽기)
+- sqlite: data 폴더의 SQLite DB (SqliteHistoryDB)
+  - WAL 모드 + synchronous=NORMAL: 커밋은 WAL에 덧붙이기만 하고 fsync 없음
+  - 스캔마다 트랜잭션 1회 (sqlite_scans_per_commit, 스캔 완료 줄이 오지 않으면 flush 타이머/max_pending_rows에서 커밋)
+    (stream, sensor_id, ts) 인덱스 때문에 스캔 1회가 센서 수만큼 다른 인덱스 페이지를 고치므로, 쓰기 증폭을 더 줄이려면
+    여러 스캔을 한 트랜잭션으로 (flush 타이머가 flush_interval_sec 안에 커밋)
+  - 인덱스 (stream, sensor_id, ts): 센서별 기간/최신값, (stream, ts): 전체 센서 기간
+  - 자동 체크포인트는 끄고 별도 스레드가 checkpoint_sec마다 PASSIVE 체크포인트 (WAL → DB 복사와 fsync가 GUI 스레드 밖에서)
+  - 질의: query_range(), latest(), aggregate() (호출한 스레드마다 읽기 연결)
+
+설정 (config/settings.json):
+- csv_logging.binary_store: off / alongside / only (only면 CSV 파일 기록 안 함)
+- storage.backends: 추가 백엔드 목록 (예: ["sqlite"]), storage.csv_files: false면 CSV 파일 기록 안 함
+- storage.sqlite_file, storage.sqlite_checkpoint_sec, storage.sqlite_scans_per_commit, storage.sqlite_max_pending_rows
+
+사용 예:
+    db = open_history_db("data/sensor_history.db")
+    db.latest("DSCT")                                              # {sensor_id: (ts, temp, humi, co2, pm25)}
+    db.query_range("DSCT", start, end, "ID07")                     # [(ts, sensor_id, temp, humi, co2, pm25), ...]
+    db.aggregate("DSCT", start, end, bucket_sec=3600)              # 1시간 평균/최소/최대
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from utils.binary_store import BINARY_OFF, BINARY_ONLY, BinaryLogWriter, normalize_binary_mode, sensor_number
+from utils.csv_writer import DEFAULT_FLUSH_INTERVAL_SEC, DEFAULT_FLUSH_ROWS, register_writer
+from utils.log_manager import get_logger
+
+logger = get_logger("CSV", "SQLITE_STORE")
+
+DEFAULT_SQLITE_FILE = "sensor_history.db"
+DEFAULT_CHECKPOINT_SEC = 60.0
+DEFAULT_SCANS_PER_COMMIT = 1
+DEFAULT_MAX_PENDING_ROWS = 500
+
+# 스트림별 측정값 순서 (add_reading의 values)
+STREAM_VALUES = {
+    "DSCT": ("temp", "humi"),
+    "AIRCON": ("temp", "humi"),
+    "PT02": ("temp", "co2", "pm25", "humi"),
+}
+VALUE_COLUMNS = ("temp", "humi", "co2", "pm25")
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS readings (
+        stream TEXT NOT NULL,
+        sensor_id TEXT NOT NULL,
+        ts REAL NOT NULL,
+        temp REAL,
+        humi REAL,
+        co2 REAL,
+        pm25 REAL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_readings_stream_sensor_ts ON readings (stream, sensor_id, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_readings_stream_ts ON readings (stream, ts)",
+)
+
+
+# ==================== 백엔드 ====================
+class SensorStorage:
+    """센서 이력 저장 백엔드 (스트림 하나, GUI 스레드에서 호출)"""
+
+    pending = 0
+
+    def add_reading(self, timestamp: datetime, sensor_id: Optional[str], values: Sequence):
+        """
+        측정값 추가
+
+        Args:
+            sensor_id: DSCT/AIRCON 센서 ('ID07'), PT02는 None
+            values: STREAM_VALUES 순서의 값 (없는 값은 None)
+        """
+        raise NotImplementedError
+
+    def end_scan(self):
+        """스캔 완료 (모은 측정값을 한 번에 기록할 수 있는 경계)"""
+
+    def flush(self):
+        """모은 측정값 기록"""
+
+    def close(self):
+        """남은 측정값 기록 후 닫기 (다음 측정값이 오면 다시 열림)"""
+        self.flush()
+
+
+class BinaryStorage(SensorStorage):
+    """binary 백엔드 (BinaryLogWriter)"""
+
+    def __init__(self, data_dir: str, stream: str, settings: dict):
+        self.stream = stream
+        self.writer = BinaryLogWriter(data_dir, stream,
+                                      flush_interval_sec=settings.get("flush_interval_sec", DEFAULT_FLUSH_INTERVAL_SEC),
+                                      flush_rows=settings.get("flush_rows", DEFAULT_FLUSH_ROWS))
+
+    @property
+    def pending(self):
+        return self.writer.pending
+
+    def add_reading(self, timestamp, sensor_id, values):
+        if sensor_id is not None:
+            values = (sensor_number(sensor_id), *values)
+        self.writer.write_record(values, timestamp)
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        self.writer.close()
+
+
+class SqliteStorage(SensorStorage):
+    """sqlite 백엔드 (data 폴더의 DB 하나를 DSCT/AIRCON/PT02가 함께 사용)"""
+
+    def __init__(self, data_dir: str, stream: str, settings: dict):
+        self.stream = stream
+        self.db = open_history_db(os.path.join(data_dir, settings.get("sqlite_file", DEFAULT_SQLITE_FILE)),
+                                  settings.get("sqlite_checkpoint_sec", DEFAULT_CHECKPOINT_SEC))
+        self.scans_per_commit = max(1, settings.get("sqlite_scans_per_commit", DEFAULT_SCANS_PER_COMMIT))
+        self.max_pending_rows = max(1, settings.get("sqlite_max_pending_rows", DEFAULT_MAX_PENDING_ROWS))
+        self._columns = STREAM_VALUES[stream]
+        self._rows: List[tuple] = []
+        self._scans = 0
+        register_writer(self)
+
+    @property
+    def pending(self):
+        return len(self._rows)
+
+    def add_reading(self, timestamp, sensor_id, values):
+        named = dict(zip(self._columns, values))
+        self._rows.append((self.stream, sensor_id or "", timestamp.timestamp(),
+                           *(named.get(column) for column in VALUE_COLUMNS)))
+        if len(self._rows) >= self.max_pending_rows:
+            self.flush()
+
+    def end_scan(self):
+        self._scans += 1
+        if self._scans >= self.scans_per_commit:
+            self.flush()
+
+    def flush(self):
+        """모은 행을 트랜잭션 1회로 기록"""
+        self._scans = 0
+        if not self._rows:
+            return
+        rows, self._rows = self._rows, []
+        self.db.insert(rows)
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+
+STORAGE_BACKENDS = {
+    "binary": BinaryStorage,
+    "sqlite": SqliteStorage,
+}
+
+
+def storage_settings() -> Tuple[dict, dict]:
+    """(csv_logging, storage) 설정 섹션"""
+    from config.config_manager import get_config_manager
+    config = get_config_manager()
+    return config.get_section("csv_logging"), config.get_section("storage")
+
+
+def csv_files_enabled(csv_settings: dict, settings: dict) -> bool:
+    """CSV 파일도 기록하는지 (binary_store: only 또는 storage.csv_files: false면 기록 안 함)"""
+    return settings.get("csv_files", True) and normalize_binary_mode(csv_settings.get("binary_store")) != BINARY_ONLY
+
+
+def create_storages(data_dir: str, stream: str, csv_settings: dict, settings: dict) -> List[SensorStorage]:
+    """설정된 백엔드 목록 생성 (binary_store가 off가 아니면 binary, storage.backends 순서대로)"""
+    names = [] if normalize_binary_mode(csv_settings.get("binary_store")) == BINARY_OFF else ["binary"]
+    names += [name for name in settings.get("backends", []) if name not in names]
+    storages = []
+    for name in names:
+        backend = STORAGE_BACKENDS.get(name)
+        if backend is None:
+            logger.error("알 수 없는 저장 백엔드: %s", name)
+            continue
+        storages.append(backend(data_dir, stream, {**csv_settings, **settings}))
+    return storages
+
+
+# ==================== SQLite DB ====================
+class SqliteHistoryDB:
+    """센서 이력 SQLite DB (쓰기: GUI 스레드 연결 하나, 체크포인트: 전용 스레드, 읽기: 스레드별 연결)"""
+
+    def __init__(self, path: str, checkpoint_sec: float = DEFAULT_CHECKPOINT_SEC):
+        self.path = path
+        self.checkpoint_sec = checkpoint_sec
+        self._conn: Optional[sqlite3.Connection] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._checkpoint_thread: Optional[threading.Thread] = None
+
+        # 통계
+        self.rows_written = 0
+        self.transactions = 0
+        self.checkpoints = 0
+        self.checkpointed_pages = 0
+
+    # ==================== 쓰기 ====================
+    def insert(self, rows: List[tuple]):
+        """행 (stream, sensor_id, ts, temp, humi, co2, pm25) 목록을 트랜잭션 1회로 기록"""
+        try:
+            conn = self._writer()
+            with conn:
+                conn.executemany("INSERT INTO readings VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self.rows_written += len(rows)
+            self.transactions += 1
+        except sqlite3.Error as e:
+            logger.error("SQLite 기록 오류 (%s, %s행 버림): %s", self.path, len(rows), e)
+
+    def _writer(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = self._connect()
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            if self.checkpoint_sec > 0:
+                # 커밋 중 자동 체크포인트(fsync) 대신 전용 스레드에서
+                self._conn.execute("PRAGMA wal_autocheckpoint=0")
+                self._start_checkpointer()
+        return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ==================== 체크포인트 ====================
+    def _start_checkpointer(self):
+        self._stop.clear()
+        self._checkpoint_thread = threading.Thread(target=self._checkpoint_loop, name="SqliteCheckpoint", daemon=True)
+        self._checkpoint_thread.start()
+
+    def _checkpoint_loop(self):
+        while not self._stop.wait(self.checkpoint_sec):
+            self.checkpoint()
+        self._close_reader()
+
+    def checkpoint(self, mode: str = "PASSIVE") -> Optional[Tuple[int, int, int]]:
+        """WAL 체크포인트 (호출한 스레드의 연결로) → (busy, WAL 페이지, 옮긴 페이지)"""
+        try:
+            result = self._reader().execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        except sqlite3.Error as e:
+            logger.error("SQLite 체크포인트 오류 (%s): %s", self.path, e)
+            return None
+        with self._lock:
+            self.checkpoints += 1
+            self.checkpointed_pages += max(result[2], 0)
+        return result
+
+    def close(self):
+        """체크포인트 스레드 종료, WAL을 DB에 모두 옮기고 닫기 (다음 기록 시 다시 열림)"""
+        if self._checkpoint_thread is not None:
+            self._stop.set()
+            self._checkpoint_thread.join(timeout=5.0)
+            self._checkpoint_thread = None
+        if self._conn is not None:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._conn.close()
+            except sqlite3.Error as e:
+                logger.error("SQLite 닫기 오류 (%s): %s", self.path, e)
+            self._conn = None
+        self._close_reader()
+
+    # ==================== 읽기 ====================
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _close_reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def query_range(self, stream: str, start: datetime, end: datetime,
+                    sensor_id: Optional[str] = None) -> List[tuple]:
+        """기간 [start, end) 측정값 → [(ts, sensor_id, temp, humi, co2, pm25), ...] (sensor_id, ts 순)"""
+        sql = "SELECT ts, sensor_id, temp, humi, co2, pm25 FROM readings WHERE stream = ? AND ts >= ? AND ts < ?"
+        params = [stream, start.timestamp(), end.timestamp()]
+        if sensor_id is not None:
+            sql += " AND sensor_id = ?"
+            params.append(sensor_id)
+        return self._reader().execute(sql + " ORDER BY sensor_id, ts", params).fetchall()
+
+    def latest(self, stream: str, sensor_id: Optional[str] = None) -> Dict[str, tuple]:
+        """센서별 최신값 → {sensor_id: (ts, temp, humi, co2, pm25)} (PT02는 sensor_id '')"""
+        conn = self._reader()
+        if sensor_id is None:
+            sensor_ids = self._sensor_ids(conn, stream)
+        else:
+            sensor_ids = [sensor_id]
+        result = {}
+        for sid in sensor_ids:
+            row = conn.execute(
+                "SELECT ts, temp, humi, co2, pm25 FROM readings WHERE stream = ? AND sensor_id = ? "
+                "ORDER BY ts DESC LIMIT 1", (stream, sid)).fetchone()
+            if row:
+                result[sid] = row
+        return result
+
+    @staticmethod
+    def _sensor_ids(conn, stream: str) -> List[str]:
+        """스트림의 센서 ID (인덱스에서 다음 ID로 건너뛰며 찾기, 행 수와 무관)"""
+        sensor_ids = []
+        row = conn.execute("SELECT MIN(sensor_id) FROM readings WHERE stream = ?", (stream,)).fetchone()
+        while row and row[0] is not None:
+            sensor_ids.append(row[0])
+            row = conn.execute("SELECT MIN(sensor_id) FROM readings WHERE stream = ? AND sensor_id > ?",
+                               (stream, row[0])).fetchone()
+        return sensor_ids
+
+    def aggregate(self, stream: str, start: datetime, end: datetime, bucket_sec: float,
+                  sensor_id: Optional[str] = None) -> List[tuple]:
+        """
+        기간 [start, end)를 bucket_sec 간격(로컬 시각 기준)으로 묶은 통계
+
+        Returns:
+            [(구간 시작 ts, sensor_id, 개수, temp 평균, temp 최소, temp 최대, humi 평균, co2 평균, pm25 평균), ...]
+        """
+        offset = start.astimezone().utcoffset().total_seconds()
+        sql = ("SELECT CAST((ts + :offset) / :bucket AS INTEGER) * :bucket - :offset AS bucket, sensor_id, COUNT(*), "
+               "AVG(temp), MIN(temp), MAX(temp), AVG(humi), AVG(co2), AVG(pm25) "
+               "FROM readings WHERE stream = :stream AND ts >= :start AND ts < :end")
+        params = {"offset": offset, "bucket": bucket_sec, "stream": stream,
+                  "start": start.timestamp(), "end": end.timestamp()}
+        if sensor_id is not None:
+            sql += " AND sensor_id = :sensor_id"
+            params["sensor_id"] = sensor_id
+        return self._reader().execute(sql + " GROUP BY sensor_id, bucket ORDER BY sensor_id, bucket", params).fetchall()
+
+
+_databases: Dict[str, SqliteHistoryDB] = {}
+_databases_lock = threading.Lock()
+
+
+def open_history_db(path: str, checkpoint_sec: float = DEFAULT_CHECKPOINT_SEC) -> SqliteHistoryDB:
+    """경로별 SqliteHistoryDB (같은 파일은 같은 객체 - 센서 매니저들이 쓰기 연결 하나를 함께 사용)"""
+    path = os.path.abspath(path)
+    with _databases_lock:
+        db = _databases.get(path)
+        if db is None:
+            db = _databases[path] = SqliteHistoryDB(path, checkpoint_sec)
+        return db
+